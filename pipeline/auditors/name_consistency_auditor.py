@@ -7,7 +7,9 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from modules.fuzzy_name_index import FuzzyNameIndex
 
 
 @dataclass
@@ -93,22 +95,30 @@ class NameConsistencyAuditor:
 
     def find_variants(self, occurrences: Dict[str, int]) -> List[NameVariantGroup]:
         names = sorted(occurrences.keys())
+        rank = {name: i for i, name in enumerate(names)}
         visited: Set[str] = set()
         groups: List[NameVariantGroup] = []
 
+        # Only names seen 3+ times can pair up; index them by normalized form
+        by_norm: Dict[str, List[str]] = {}
+        for name in names:
+            if occurrences.get(name, 0) >= 3 and self._looks_like_name(name):
+                name_norm = self._normalize_name(name)
+                if name_norm:
+                    by_norm.setdefault(name_norm, []).append(name)
+        index = self._index_by_initial(by_norm)
+
         for i, base in enumerate(names):
             if occurrences.get(base, 0) < 3:
                 continue
             if base in visited:
                 continue
             cluster = {base}
-            for candidate in names[i + 1:]:
-                if candidate in visited:
-                    continue
-                if occurrences.get(candidate, 0) < 3:
-                    continue
-                if self._is_variant_pair(base, candidate):
-                    cluster.add(candidate)
+            if self._looks_like_name(base):
+                for candidate_norm, _ in self._nearby_names(index, self._normalize_name(base)):
+                    for candidate in by_norm[candidate_norm]:
+                        if rank[candidate] > i and candidate not in visited:
+                            cluster.add(candidate)
 
             if len(cluster) < 2:
                 continue
@@ -134,6 +144,16 @@ class NameConsistencyAuditor:
         if not canonical_set:
             return []
 
+        # Ties go to the canonical name met first in set order
+        canonical_rank: Dict[str, int] = {}
+        by_norm: Dict[str, List[str]] = {}
+        for canonical in canonical_set:
+            canonical_rank[canonical] = len(canonical_rank)
+            canonical_norm = self._normalize_name(canonical)
+            if canonical_norm:
+                by_norm.setdefault(canonical_norm, []).append(canonical)
+        index = self._index_by_initial(by_norm)
+
         groups: Dict[str, NameVariantGroup] = {
             canonical: NameVariantGroup(
                 canonical=canonical,
@@ -154,22 +174,12 @@ class NameConsistencyAuditor:
             token_norm = self._normalize_name(token)
             if not token_norm:
                 continue
-            best_canonical = None
-            best_distance = 999
-            for canonical in canonical_set:
-                canonical_norm = self._normalize_name(canonical)
-                if not canonical_norm:
-                    continue
-                if canonical_norm == token_norm:
-                    continue
-                if canonical_norm[0] != token_norm[0]:
-                    continue
-                if len(canonical_norm) >= 4 and len(token_norm) >= 4 and canonical_norm[:2] != token_norm[:2]:
-                    continue
-                distance = self._levenshtein(token_norm, canonical_norm)
-                if 1 <= distance <= 2 and distance < best_distance:
-                    best_distance = distance
-                    best_canonical = canonical
+            matches = [
+                (distance, canonical_rank[canonical], canonical)
+                for canonical_norm, distance in self._nearby_names(index, token_norm)
+                for canonical in by_norm[canonical_norm]
+            ]
+            best_canonical = min(matches)[2] if matches else None
 
             if best_canonical:
                 group = groups[best_canonical]
@@ -178,21 +188,26 @@ class NameConsistencyAuditor:
 
         return [group for group in groups.values() if len(group.variants) > 1]
 
-    def _is_variant_pair(self, a: str, b: str) -> bool:
-        a_norm = self._normalize_name(a)
-        b_norm = self._normalize_name(b)
-        if not a_norm or not b_norm:
-            return False
-        if a_norm == b_norm:
-            return False
+    @staticmethod
+    def _index_by_initial(name_norms: Iterable[str]) -> Dict[str, FuzzyNameIndex]:
+        index: Dict[str, FuzzyNameIndex] = {}
+        for name_norm in name_norms:
+            index.setdefault(name_norm[0], FuzzyNameIndex()).add(name_norm)
+        return index
+
+    def _nearby_names(self, index: Dict[str, FuzzyNameIndex], name_norm: str) -> Iterator[Tuple[str, int]]:
+        """Indexed normalized names 1-2 edits from `name_norm` with a matching prefix."""
+        if not name_norm or name_norm[0] not in index:
+            return
+        for candidate_norm, distance in index[name_norm[0]].within(name_norm, 2):
+            if distance >= 1 and self._same_prefix(name_norm, candidate_norm):
+                yield candidate_norm, distance
+
+    @staticmethod
+    def _same_prefix(a_norm: str, b_norm: str) -> bool:
         if a_norm[0] != b_norm[0]:
             return False
-        if len(a_norm) >= 4 and len(b_norm) >= 4 and a_norm[:2] != b_norm[:2]:
-            return False
-        if not self._looks_like_name(a) or not self._looks_like_name(b):
-            return False
-        distance = self._levenshtein(a_norm, b_norm)
-        return 1 <= distance <= 2
+        return len(a_norm) < 4 or len(b_norm) < 4 or a_norm[:2] == b_norm[:2]
 
     def _looks_like_name(self, token: str) -> bool:
         if len(token) < 4:
@@ -206,26 +221,3 @@ class NameConsistencyAuditor:
         if lowered.endswith("'s"):
             lowered = lowered[:-2]
         return re.sub(r"[^a-z]", "", lowered)
-
-    def _levenshtein(self, a: str, b: str) -> int:
-        if a == b:
-            return 0
-        if not a:
-            return len(b)
-        if not b:
-            return len(a)
-
-        prev = list(range(len(b) + 1))
-        for i, ca in enumerate(a, start=1):
-            curr = [i]
-            for j, cb in enumerate(b, start=1):
-                cost = 0 if ca == cb else 1
-                curr.append(
-                    min(
-                        prev[j] + 1,      # deletion
-                        curr[j - 1] + 1,  # insertion
-                        prev[j - 1] + cost,
-                    )
-                )
-            prev = curr
-        return prev[-1]
@@ -25,6 +25,8 @@ try:
 except ImportError:
     EnglishGrammarRAG = None
 
+from modules.pattern_scanner import get_pattern_scanner
+
 
 class ProseIssueType(Enum):
     AI_ISM = "AI_ISM"
@@ -394,41 +396,39 @@ class ProseAuditor:
     def _check_ai_isms(self, text: str, chapter_num: int) -> List[Dict]:
         """Check for AI-ism patterns."""
         issues = []
-        text_lower = text.lower()
         lines = text.split('\n')
         
-        # Check each pattern
-        all_patterns = self.ai_ism_patterns.get("critical", [])
-        
-        for pattern_info in all_patterns:
-            pattern = pattern_info.get("pattern", "").lower()
-            if not pattern:
-                continue
+        # One scan finds every pattern on every line
+        all_patterns = [p for p in self.ai_ism_patterns.get("critical", []) if p.get("pattern", "")]
+        scanner = get_pattern_scanner(re.escape(p["pattern"].lower()) for p in all_patterns)
+        hit_lines = sorted({(pattern_idx, line_idx) for line_idx, pattern_idx, _ in scanner.scan_lines(lines)})
+        
+        # Report pattern by pattern, at most once per line
+        for pattern_idx, line_idx in hit_lines:
+            pattern_info = all_patterns[pattern_idx]
+            pattern = pattern_info["pattern"].lower()
+            i, line = line_idx + 1, lines[line_idx]
+            issue_id = f"PRO-AI-{chapter_num:02d}-{len(issues)+1:03d}"
+            issues.append({
+                "issue_id": issue_id,
+                "chapter": f"{chapter_num:02d}",
+                "line": i,
+                "severity": pattern_info.get("severity", "MINOR"),
+                "pattern": pattern,
+                "context": line.strip()[:80],
+                "suggestion": pattern_info.get("fix", "Rephrase"),
+                "category": self._categorize_ai_ism(pattern)
+            })
             
-            # Find all occurrences
-            for i, line in enumerate(lines, 1):
-                if pattern in line.lower():
-                    issue_id = f"PRO-AI-{chapter_num:02d}-{len(issues)+1:03d}"
-                    issues.append({
-                        "issue_id": issue_id,
-                        "chapter": f"{chapter_num:02d}",
-                        "line": i,
-                        "severity": pattern_info.get("severity", "MINOR"),
-                        "pattern": pattern,
-                        "context": line.strip()[:80],
-                        "suggestion": pattern_info.get("fix", "Rephrase"),
-                        "category": self._categorize_ai_ism(pattern)
-                    })
-                    
-                    self._add_issue(
-                        issue_type=ProseIssueType.AI_ISM,
-                        severity=pattern_info.get("severity", "MINOR"),
-                        chapter=f"{chapter_num:02d}",
-                        line=i,
-                        found=pattern,
-                        suggestion=pattern_info.get("fix", "Rephrase"),
-                        context=line.strip()[:80]
-                    )
+            self._add_issue(
+                issue_type=ProseIssueType.AI_ISM,
+                severity=pattern_info.get("severity", "MINOR"),
+                chapter=f"{chapter_num:02d}",
+                line=i,
+                found=pattern,
+                suggestion=pattern_info.get("fix", "Rephrase"),
+                context=line.strip()[:80]
+            )
         
         return issues
     
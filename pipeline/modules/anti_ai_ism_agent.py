@@ -31,7 +31,7 @@ import json
 import time
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pipeline.common.genai_factory import create_genai_client, resolve_api_key
@@ -48,6 +48,13 @@ try:
 except ImportError:
     CHROMADB_AVAILABLE = False
 
+# NumPy for the batched cosine-similarity pass (falls back to Chroma queries)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Gemini for embeddings + LLM correction
 try:
     from google.genai import types
@@ -55,6 +62,9 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+from modules.embedding_cache import cached_embed
+from modules.pattern_scanner import get_pattern_scanner
+
 logger = logging.getLogger(__name__)
 
 
@@ -174,6 +184,11 @@ class AntiAIismAgent:
     # Vector thresholds
     VECTOR_FLAG_THRESHOLD = 0.80   # Flag sentence if cosine sim ≥ 0.80 to bad prose
     VECTOR_WARN_THRESHOLD = 0.70   # Log for review if ≥ 0.70
+    VECTOR_MIN_LINE_CHARS = 20     # Skip very short lines in Layer 2
+    EMBED_BATCH_SIZE = 100         # Max texts per embed_content request
+    
+    # Layer 1 pattern tiers, in scan order
+    REGEX_TIERS = ("CRITICAL", "MAJOR", "MINOR", "VIETNAMESE_CRITICAL")
     
     # Psychic distance filter words (Layer 3 regex pre-filter before LLM)
     FILTER_WORDS = re.compile(
@@ -239,10 +254,12 @@ class AntiAIismAgent:
         
         # ── Layer 1: Load regex patterns ──
         self.regex_patterns = self._load_regex_patterns()
+        self._build_regex_scanner()
         logger.info(f"[HEAL] Layer 1: {sum(len(v) for v in self.regex_patterns.values())} regex patterns loaded")
         
         # ── Layer 2: Initialize Vector Bad Prose DB ──
         self.vector_store = None
+        self._bad_prose_matrix = None  # (normalized embeddings, documents, metadatas)
         self.gemini_client = None
         api_key = resolve_api_key(api_key=gemini_api_key, required=False)
         
@@ -347,6 +364,15 @@ class AntiAIismAgent:
         
         return patterns
     
+    def _build_regex_scanner(self):
+        """One shared scanner over every tier; scanner indices follow REGEX_TIERS order."""
+        self._regex_offsets: Dict[str, int] = {}
+        sources: List[str] = []
+        for severity in self.REGEX_TIERS:
+            self._regex_offsets[severity] = len(sources)
+            sources.extend(p["regex"].pattern for p in self.regex_patterns.get(severity, []))
+        self._regex_scanner = get_pattern_scanner(sources)
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Layer 2: Vector Bad Prose DB
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -372,11 +398,7 @@ class AntiAIismAgent:
         
         # Batch embed
         try:
-            result = self.gemini_client.models.embed_content(
-                model=self._embedding_model,
-                contents=texts
-            )
-            embeddings = [list(e.values) for e in result.embeddings]
+            embeddings = self._embed_texts(texts)
             
             self.vector_store.add(
                 ids=ids,
@@ -384,10 +406,22 @@ class AntiAIismAgent:
                 documents=texts,
                 metadatas=metadatas
             )
+            self._bad_prose_matrix = None
             logger.info(f"[HEAL] ✓ Seeded {len(seeds)} bad prose vectors ({len(embeddings[0])}D)")
         except Exception as e:
             logger.error(f"[HEAL] Failed to seed Bad Prose DB: {e}")
     
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed via the shared embedding cache; only misses hit the API."""
+        def request(missing: List[str]) -> List[List[float]]:
+            result = self.gemini_client.models.embed_content(
+                model=self._embedding_model,
+                contents=missing
+            )
+            return [list(e.values) for e in result.embeddings]
+        
+        return cached_embed(self._embedding_model, texts, request)
+    
     def _check_vector_similarity(self, sentence: str) -> Optional[Tuple[float, str, str]]:
         """
         Check a sentence against the Bad Prose DB.
@@ -395,39 +429,82 @@ class AntiAIismAgent:
         Returns:
             (similarity, matched_text, fix_guidance) if ≥ threshold, else None
         """
-        if not self.vector_store or not self.gemini_client:
-            return None
+        return self._check_vector_similarity_batch([sentence])[0]
+    
+    def _check_vector_similarity_batch(
+        self, sentences: List[str]
+    ) -> List[Optional[Tuple[float, str, str]]]:
+        """
+        Check many sentences against the Bad Prose DB at once.
+        
+        Sentences are embedded in chunks of EMBED_BATCH_SIZE, then scored in a
+        single cosine-similarity pass against the full bad-prose matrix.
+        
+        Returns:
+            One (similarity, matched_text, fix_guidance) or None per sentence
+        """
+        results: List[Optional[Tuple[float, str, str]]] = [None] * len(sentences)
+        if not sentences or not self.vector_store or not self.gemini_client:
+            return results
         
         try:
-            result = self.gemini_client.models.embed_content(
-                model=self._embedding_model,
-                contents=sentence
-            )
-            query_embedding = list(result.embeddings[0].values)
-            
+            embeddings: List[List[float]] = []
+            for start in range(0, len(sentences), self.EMBED_BATCH_SIZE):
+                embeddings.extend(self._embed_texts(sentences[start:start + self.EMBED_BATCH_SIZE]))
+            best = self._nearest_bad_prose(embeddings)
+        except Exception as e:
+            logger.debug(f"[HEAL] Vector check failed: {e}")
+            return results
+        
+        for idx, (similarity, matched, meta) in enumerate(best):
+            if similarity >= self.VECTOR_FLAG_THRESHOLD:
+                results[idx] = (similarity, matched, (meta or {}).get("fix", "Rephrase naturally"))
+            elif similarity >= self.VECTOR_WARN_THRESHOLD:
+                logger.debug(f"[HEAL] Vector WARN (sim={similarity:.3f}): {sentences[idx][:60]}...")
+        return results
+    
+    def _load_bad_prose_matrix(self):
+        """Row-normalized bad-prose embeddings with their documents/metadata (cached)."""
+        if self._bad_prose_matrix is None:
+            data = self.vector_store.get(include=["embeddings", "documents", "metadatas"])
+            matrix = np.asarray(data["embeddings"], dtype=np.float32)
+            if matrix.size:
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix = matrix / np.where(norms == 0, 1.0, norms)
+            self._bad_prose_matrix = (matrix, data["documents"], data["metadatas"])
+        return self._bad_prose_matrix
+    
+    def _nearest_bad_prose(self, embeddings: List[List[float]]) -> List[Tuple[float, str, Dict]]:
+        """(cosine similarity, document, metadata) of the closest bad-prose example per embedding."""
+        if not NUMPY_AVAILABLE:
+            # One batched Chroma query instead of one per sentence.
             results = self.vector_store.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=embeddings,
                 n_results=1,
                 include=["documents", "metadatas", "distances"]
             )
-            
-            if results and results["distances"] and results["distances"][0]:
-                # ChromaDB returns distance; cosine similarity = 1 - distance
-                distance = results["distances"][0][0]
-                similarity = 1.0 - distance
-                
-                if similarity >= self.VECTOR_FLAG_THRESHOLD:
-                    matched = results["documents"][0][0]
-                    meta = results["metadatas"][0][0]
-                    return (similarity, matched, meta.get("fix", "Rephrase naturally"))
-                elif similarity >= self.VECTOR_WARN_THRESHOLD:
-                    matched = results["documents"][0][0]
-                    logger.debug(f"[HEAL] Vector WARN (sim={similarity:.3f}): {sentence[:60]}...")
+            # ChromaDB returns distance; cosine similarity = 1 - distance
+            return [
+                (1.0 - dists[0], docs[0], metas[0]) if dists else (0.0, "", {})
+                for dists, docs, metas in zip(
+                    results["distances"], results["documents"], results["metadatas"]
+                )
+            ]
         
-        except Exception as e:
-            logger.debug(f"[HEAL] Vector check failed: {e}")
+        matrix, documents, metadatas = self._load_bad_prose_matrix()
+        if not matrix.size:
+            return [(0.0, "", {})] * len(embeddings)
         
-        return None
+        queries = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1.0, norms)
+        similarities = queries @ matrix.T
+        best_idx = similarities.argmax(axis=1)
+        best_sim = similarities[np.arange(len(best_idx)), best_idx]
+        return [
+            (float(sim), documents[i], metadatas[i])
+            for sim, i in zip(best_sim, best_idx)
+        ]
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Layer 3: Psychic Distance Filter
@@ -579,6 +656,10 @@ RULES:
         """
         Scan a text through all three detection layers.
         
+        Layer 1 runs first over every line to select Layer 2 candidates, which
+        are then checked against the Bad Prose DB in one batched pass. Issues
+        are emitted per line in layer order, as if scanned line by line.
+        
         Args:
             text: Full chapter text
             filename: Source filename for reporting
@@ -589,75 +670,73 @@ RULES:
         issues = []
         lines = text.split('\n')
         
-        # Track which lines already have issues (avoid duplicates across layers)
-        flagged_lines: Dict[int, str] = {}  # line_num → highest severity
-        
-        severity_rank = {"CRITICAL": 3, "MAJOR": 2, "MINOR": 1}
-        
+        scan_lines: List[Tuple[int, str]] = []
         for line_num, line in enumerate(lines, 1):
             stripped = line.strip()
             if not stripped or stripped.startswith('#') or stripped.startswith('[ILLUSTRATION'):
                 continue
+            scan_lines.append((line_num, stripped))
+        
+        # ── Layer 1: Regex scan (all lines) ──
+        # One scanner pass selects the regexes worth running on each line
+        regex_candidates = self._regex_scanner.candidates_by_line([s for _, s in scan_lines])
+        regex_hits: Dict[int, List[Tuple[str, str, Dict]]] = {}
+        vector_candidates: List[Tuple[int, str]] = []
+        for (line_num, stripped), candidates in zip(scan_lines, regex_candidates):
+            hits = self._regex_hits(stripped, set(candidates))
+            if hits:
+                regex_hits[line_num] = hits
             
-            # ── Layer 1: Regex scan ──
-            severities_to_check = ["CRITICAL", "MAJOR", "MINOR"]
-            if self.target_language == "vn":
-                severities_to_check.append("VIETNAMESE_CRITICAL")
-            
-            for severity in severities_to_check:
-                effective_sev = "CRITICAL" if severity == "VIETNAMESE_CRITICAL" else severity
-                for pattern in self.regex_patterns.get(severity, []):
-                    match = pattern["regex"].search(stripped)
-                    if match:
-                        # Check exceptions
-                        exceptions = pattern.get("exceptions", [])
-                        if any(exc.lower() in stripped.lower() for exc in exceptions):
-                            continue
-                        
-                        # Only keep highest severity per line
-                        existing = flagged_lines.get(line_num)
-                        if existing and severity_rank.get(existing, 0) >= severity_rank.get(effective_sev, 0):
-                            continue
-                        
-                        flagged_lines[line_num] = effective_sev
-                        issues.append(AIismIssue(
-                            issue_id=self._next_id(),
-                            layer="regex",
-                            severity=effective_sev,
-                            category=pattern.get("category", severity.lower()),
-                            line_number=line_num,
-                            sentence=stripped,
-                            matched_pattern=pattern["display"],
-                            fix_guidance=pattern["fix"],
-                            confidence=1.0,  # Regex = exact match
-                        ))
-                        break  # One hit per severity tier per line
+            # Layer 2 candidates: skip lines already CRITICAL from regex
+            top_severity = hits[-1][0] if hits else None
+            if top_severity != "CRITICAL" and len(stripped) > self.VECTOR_MIN_LINE_CHARS:
+                vector_candidates.append((line_num, stripped))
+        
+        # ── Layer 2: Vector similarity (one batched pass) ──
+        vector_results: Dict[int, Tuple[float, str, str]] = {}
+        if vector_candidates and self.vector_store:
+            batch = self._check_vector_similarity_batch([s for _, s in vector_candidates])
+            for (line_num, _), result in zip(vector_candidates, batch):
+                if result:
+                    vector_results[line_num] = result
+        
+        # ── Merge layers in line order ──
+        for line_num, stripped in scan_lines:
+            flagged = False
+            for effective_sev, severity, pattern in regex_hits.get(line_num, []):
+                flagged = True
+                issues.append(AIismIssue(
+                    issue_id=self._next_id(),
+                    layer="regex",
+                    severity=effective_sev,
+                    category=pattern.get("category", severity.lower()),
+                    line_number=line_num,
+                    sentence=stripped,
+                    matched_pattern=pattern["display"],
+                    fix_guidance=pattern["fix"],
+                    confidence=1.0,  # Regex = exact match
+                ))
             
-            # ── Layer 2: Vector similarity (skip if already CRITICAL from regex) ──
-            if line_num not in flagged_lines or flagged_lines[line_num] != "CRITICAL":
-                if len(stripped) > 20:  # Skip very short lines
-                    vector_result = self._check_vector_similarity(stripped)
-                    if vector_result:
-                        sim, matched_text, fix = vector_result
-                        # Don't override existing regex hits of same or higher severity
-                        if line_num not in flagged_lines:
-                            sev = "MAJOR" if sim >= 0.88 else "MINOR"
-                            flagged_lines[line_num] = sev
-                            issues.append(AIismIssue(
-                                issue_id=self._next_id(),
-                                layer="vector",
-                                severity=sev,
-                                category="bad_prose_match",
-                                line_number=line_num,
-                                sentence=stripped,
-                                matched_pattern=f"sim={sim:.3f} → {matched_text[:60]}...",
-                                fix_guidance=fix,
-                                confidence=sim,
-                                vector_similarity=sim,
-                            ))
+            # Don't override existing regex hits
+            vector_result = vector_results.get(line_num)
+            if vector_result and not flagged:
+                sim, matched_text, fix = vector_result
+                flagged = True
+                issues.append(AIismIssue(
+                    issue_id=self._next_id(),
+                    layer="vector",
+                    severity="MAJOR" if sim >= 0.88 else "MINOR",
+                    category="bad_prose_match",
+                    line_number=line_num,
+                    sentence=stripped,
+                    matched_pattern=f"sim={sim:.3f} → {matched_text[:60]}...",
+                    fix_guidance=fix,
+                    confidence=sim,
+                    vector_similarity=sim,
+                ))
             
             # ── Layer 3: Psychic distance (skip if already flagged) ──
-            if line_num not in flagged_lines:
+            if not flagged:
                 pd_result = self._check_psychic_distance(stripped)
                 if pd_result:
                     category, fix = pd_result
@@ -675,6 +754,42 @@ RULES:
         
         return issues
     
+    def _regex_hits(self, stripped: str, candidates: Optional[Set[int]] = None) -> List[Tuple[str, str, Dict]]:
+        """
+        Layer 1 matches for one line as (effective_severity, tier, pattern).
+        
+        At most one hit per tier, and only hits that raise the line's
+        severity are kept, so the last entry carries the highest severity.
+        `candidates` (scanner indices) limits the regexes that are run.
+        """
+        severity_rank = {"CRITICAL": 3, "MAJOR": 2, "MINOR": 1}
+        severities_to_check = ["CRITICAL", "MAJOR", "MINOR"]
+        if self.target_language == "vn":
+            severities_to_check.append("VIETNAMESE_CRITICAL")
+        
+        hits: List[Tuple[str, str, Dict]] = []
+        for severity in severities_to_check:
+            effective_sev = "CRITICAL" if severity == "VIETNAMESE_CRITICAL" else severity
+            offset = self._regex_offsets[severity]
+            for idx, pattern in enumerate(self.regex_patterns.get(severity, [])):
+                if candidates is not None and offset + idx not in candidates:
+                    continue
+                match = pattern["regex"].search(stripped)
+                if match:
+                    # Check exceptions
+                    exceptions = pattern.get("exceptions", [])
+                    if any(exc.lower() in stripped.lower() for exc in exceptions):
+                        continue
+                    
+                    # Only keep highest severity per line
+                    existing = hits[-1][0] if hits else None
+                    if existing and severity_rank.get(existing, 0) >= severity_rank.get(effective_sev, 0):
+                        continue
+                    
+                    hits.append((effective_sev, severity, pattern))
+                    break  # One hit per severity tier per line
+        return hits
+    
     def heal_file(self, file_path: Path) -> Tuple[List[AIismIssue], int]:
         """
         Scan and optionally heal a single file.
@@ -0,0 +1,389 @@
+"""
+Compiled Corpus Format for MTL Studio config corpora
+
+The large config corpora (sino_vietnamese_rag*.json, japanese_patterns_auto.json,
+sarcasm_patterns_corpus.json, emotion_action_corpus.json) are edited as JSON and
+stay the source of truth. Parsing them in full on every run is wasteful when a
+consumer only needs a handful of records, so this module compiles each one into
+a binary file that is memory-mapped and indexed:
+
+    MAGIC (8 bytes) | header length (u64) | header JSON
+    | padding to 8 | offsets table ((n + 1) x u64) | record JSON blobs | meta JSON
+
+The header carries the source fingerprint (size, mtime, sha256), the record
+groups (section + category -> record range) and indexes by pattern id, hanzi
+and category. Records are decoded one at a time on access; everything that is
+not a record list (descriptions, negative_vectors, genre_mapping, ...) lives in
+the meta blob, decoded on first use.
+
+Compile with:
+
+    python -m modules.compiled_corpus config/sino_vietnamese_rag_v2.json ...
+
+Consumers call `load_corpus(json_path)`, which returns None when no compiled
+file exists or it is stale, in which case they fall back to the JSON.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MTLCORP1"
+FORMAT_VERSION = 1
+COMPILED_SUFFIX = ".mtlc"
+COMPILED_DIRNAME = "compiled"
+
+# Sections whose values are {category: {..., "patterns": [records]}}
+NESTED_PATTERN_SECTIONS = ("pattern_categories", "advanced_patterns")
+# Record fields used for the hanzi / category indexes, first present wins
+HANZI_FIELDS = ("hanzi", "zh")
+CATEGORY_FIELDS = ("category", "pattern_type", "context_type")
+
+_U64 = struct.Struct("<Q")
+
+
+def compiled_path_for(json_path: Path) -> Path:
+    """Default compiled location: config/compiled/<stem>.mtlc next to the JSON."""
+    json_path = Path(json_path)
+    return json_path.parent / COMPILED_DIRNAME / f"{json_path.stem}{COMPILED_SUFFIX}"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_fingerprint(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    return {
+        "name": path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _file_sha256(path),
+    }
+
+
+def _first_field(record: Any, fields: Tuple[str, ...]) -> Optional[str]:
+    if not isinstance(record, dict):
+        return None
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _extract_records(data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Any]]:
+    """
+    Split a corpus into (meta, groups, records).
+
+    Record lists are replaced by None in `meta` so `to_dict()` can put them
+    back in their original key order. Recognized layouts:
+      - {section: {category: {"patterns": [...]}}} for NESTED_PATTERN_SECTIONS
+      - {"categories": {category: [...]}}
+      - {"patterns": [...]}
+    """
+    meta = dict(data)
+    groups: List[Dict[str, Any]] = []
+    records: List[Any] = []
+
+    def add_group(section: str, category: Optional[str], items: List[Any]) -> None:
+        groups.append({"section": section, "category": category,
+                       "start": len(records), "end": len(records) + len(items)})
+        records.extend(items)
+
+    for section in NESTED_PATTERN_SECTIONS:
+        categories = data.get(section)
+        if not isinstance(categories, dict):
+            continue
+        meta[section] = {}
+        for category, cat_data in categories.items():
+            if isinstance(cat_data, dict) and isinstance(cat_data.get("patterns"), list):
+                add_group(section, category, cat_data["patterns"])
+                meta[section][category] = {**cat_data, "patterns": None}
+            else:
+                meta[section][category] = cat_data
+
+    categories = data.get("categories")
+    if isinstance(categories, dict) and categories and all(isinstance(v, list) for v in categories.values()):
+        meta["categories"] = {category: None for category in categories}
+        for category, items in categories.items():
+            add_group("categories", category, items)
+
+    if isinstance(data.get("patterns"), list):
+        meta["patterns"] = None
+        add_group("patterns", None, data["patterns"])
+
+    return meta, groups, records
+
+
+def compile_corpus(json_path: Path, output_path: Optional[Path] = None) -> Path:
+    """
+    Compile a JSON corpus to the binary format.
+
+    Args:
+        json_path: Source JSON (remains the source of truth)
+        output_path: Destination; defaults to compiled_path_for(json_path)
+
+    Returns:
+        Path of the written compiled file
+    """
+    json_path = Path(json_path)
+    output_path = Path(output_path) if output_path else compiled_path_for(json_path)
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{json_path}: top-level JSON must be an object")
+
+    meta, groups, records = _extract_records(data)
+
+    index: Dict[str, Dict[str, List[int]]] = {"id": {}, "hanzi": {}, "category": {}}
+    for group in groups:
+        for i in range(group["start"], group["end"]):
+            record = records[i]
+            record_id = _first_field(record, ("id",))
+            if record_id:
+                index["id"].setdefault(record_id, []).append(i)
+            hanzi = _first_field(record, HANZI_FIELDS)
+            if hanzi:
+                index["hanzi"].setdefault(hanzi, []).append(i)
+            category = group["category"] or _first_field(record, CATEGORY_FIELDS)
+            if category:
+                index["category"].setdefault(category, []).append(i)
+
+    blobs = [json.dumps(r, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for r in records]
+    meta_blob = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source": _source_fingerprint(json_path),
+        "record_count": len(records),
+        "groups": groups,
+        "index": index,
+        "meta_length": len(meta_blob),
+    }
+    header_blob = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    padding = b"\0" * (-(len(MAGIC) + _U64.size + len(header_blob)) % 8)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_U64.pack(len(header_blob)))
+        f.write(header_blob)
+        f.write(padding)
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for blob in blobs:
+            f.write(blob)
+        f.write(meta_blob)
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"[CORPUS] Compiled {json_path.name}: {len(records)} records -> {output_path}")
+    return output_path
+
+
+class CompiledCorpus:
+    """
+    Read-only, memory-mapped view of a compiled corpus.
+
+    Records are addressed by their position in the source (0..len-1) and are
+    decoded from the mapping on each access; callers cache what they keep.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"{self.path}: empty compiled corpus")
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path}: not a compiled corpus")
+        (header_len,) = _U64.unpack_from(self._mm, len(MAGIC))
+        header_start = len(MAGIC) + _U64.size
+        header = json.loads(self._mm[header_start:header_start + header_len].decode("utf-8"))
+        if header.get("format_version") != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{self.path}: unsupported format version {header.get('format_version')}")
+
+        self.source: Dict[str, Any] = header["source"]
+        self.groups: List[Dict[str, Any]] = header["groups"]
+        self._index: Dict[str, Dict[str, List[int]]] = header["index"]
+        self._count: int = header["record_count"]
+
+        offsets_start = header_start + header_len
+        offsets_start += -offsets_start % 8
+        self._offsets_start = offsets_start
+        self._data_start = offsets_start + (self._count + 1) * _U64.size
+        data_end = self._data_start + self._offset(self._count)
+        self._meta_span = (data_end, data_end + header["meta_length"])
+        self._meta: Optional[Dict[str, Any]] = None
+
+    def close(self) -> None:
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, i: int) -> int:
+        return _U64.unpack_from(self._mm, self._offsets_start + i * _U64.size)[0]
+
+    # ------------------------------------------------------------------
+    # Freshness
+    # ------------------------------------------------------------------
+
+    def is_fresh(self, json_path: Path) -> bool:
+        """True if `json_path` is the file this corpus was compiled from."""
+        json_path = Path(json_path)
+        try:
+            stat = json_path.stat()
+        except OSError:
+            return False
+        if stat.st_size != self.source["size"]:
+            return False
+        if stat.st_mtime_ns == self.source["mtime_ns"]:
+            return True
+        # Touched but maybe unchanged (checkout, copy): fall back to the content hash.
+        return _file_sha256(json_path) == self.source["sha256"]
+
+    # ------------------------------------------------------------------
+    # Record access
+    # ------------------------------------------------------------------
+
+    def record(self, i: int) -> Any:
+        """Decode record `i`."""
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        start = self._data_start + self._offset(i)
+        end = self._data_start + self._offset(i + 1)
+        return json.loads(self._mm[start:end].decode("utf-8"))
+
+    def location(self, i: int) -> Tuple[str, Optional[str]]:
+        """(section, category) of the group holding record `i`."""
+        for group in self.groups:
+            if group["start"] <= i < group["end"]:
+                return group["section"], group["category"]
+        raise IndexError(i)
+
+    def ids(self, field: str, value: str) -> List[int]:
+        """Record positions indexed under `field` ("id", "hanzi" or "category")."""
+        return list(self._index[field].get(value, ()))
+
+    def keys(self, field: str) -> List[str]:
+        """All indexed values of `field`."""
+        return list(self._index[field])
+
+    def get(self, pattern_id: str) -> Optional[Any]:
+        """First record with this pattern id, or None."""
+        ids = self._index["id"].get(pattern_id)
+        return self.record(ids[0]) if ids else None
+
+    def by_hanzi(self, hanzi: str) -> List[Any]:
+        return [self.record(i) for i in self._index["hanzi"].get(hanzi, ())]
+
+    def by_category(self, category: str) -> List[Any]:
+        return [self.record(i) for i in self._index["category"].get(category, ())]
+
+    def iter_records(self, section: Optional[str] = None) -> Iterator[Tuple[str, Optional[str], Any]]:
+        """Yield (section, category, record) in source order."""
+        for group in self.groups:
+            if section is not None and group["section"] != section:
+                continue
+            for i in range(group["start"], group["end"]):
+                yield group["section"], group["category"], self.record(i)
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Everything except the record lists (those keys hold None)."""
+        if self._meta is None:
+            start, end = self._meta_span
+            self._meta = json.loads(self._mm[start:end].decode("utf-8"))
+        return self._meta
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the full source document (equal to json.load of the source)."""
+        data = json.loads(json.dumps(self.meta, ensure_ascii=False))
+        for group in self.groups:
+            items = [self.record(i) for i in range(group["start"], group["end"])]
+            section, category = group["section"], group["category"]
+            if section in NESTED_PATTERN_SECTIONS:
+                data[section][category]["patterns"] = items
+            elif section == "categories":
+                data[section][category] = items
+            else:
+                data[section] = items
+        return data
+
+
+def load_corpus(json_path: Path, compiled_path: Optional[Path] = None) -> Optional[CompiledCorpus]:
+    """
+    Open the compiled form of `json_path` if it exists and is up to date.
+
+    Returns None (caller falls back to JSON) when it is missing, stale or
+    unreadable.
+    """
+    json_path = Path(json_path)
+    compiled_path = Path(compiled_path) if compiled_path else compiled_path_for(json_path)
+    if not compiled_path.exists():
+        return None
+    try:
+        corpus = CompiledCorpus(compiled_path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"[CORPUS] Ignoring unreadable compiled corpus {compiled_path}: {e}")
+        return None
+    if not corpus.is_fresh(json_path):
+        logger.warning(
+            f"[CORPUS] {compiled_path.name} is stale (source {json_path.name} changed); "
+            f"using JSON. Recompile with: python -m modules.compiled_corpus {json_path}"
+        )
+        corpus.close()
+        return None
+    return corpus
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile JSON config corpora to the memory-mapped binary format")
+    parser.add_argument("sources", nargs="+", type=Path, help="JSON corpus files")
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help=f"Output directory (default: <json dir>/{COMPILED_DIRNAME})")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    failed = 0
+    for source in args.sources:
+        output = args.output_dir / f"{source.stem}{COMPILED_SUFFIX}" if args.output_dir else None
+        try:
+            path = compile_corpus(source, output)
+        except (OSError, ValueError) as e:
+            logger.error(f"[CORPUS] {source}: {e}")
+            failed += 1
+            continue
+        print(f"{source} -> {path} ({path.stat().st_size / 1024:.0f} KB)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""
+Persistent Embedding Cache for MTL Studio
+
+Content-addressed, on-disk cache for Gemini embedding vectors, shared by
+every vector store (SinoVietnameseStore, EnglishPatternStore,
+VietnamesePatternStore, MangaVectorStore) and the AntiAIismAgent Bad Prose
+DB. Re-indexing a RAG file or re-scanning a chapter only pays for texts that
+were never embedded before.
+
+Layout (under `gemini.embedding_cache.path`):
+    index.sqlite3       key -> (dimension, row slot, last_used)
+    vectors_<dim>.f32   float32 rows, memory-mapped, one file per dimension
+
+Keys are sha256(model + NUL + normalized text), where normalization is NFC
+plus whitespace collapsing. Each dimension file is capped at `max_mb`; once
+full, the least recently used row is overwritten.
+
+Usage:
+    vectors = cached_embed("gemini-embedding-001", texts, request_batch)
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 256
+_MIN_GROW_ROWS = 256
+_SQLITE_BATCH = 500
+
+EmbedFn = Callable[[List[str]], List[List[float]]]
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys (NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def cache_key(model: str, text: str) -> str:
+    """Content address for one (model, text) pair."""
+    payload = f"{model}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-indexed, memmap-backed embedding store with LRU eviction.
+
+    Thread-safe within a process. Several processes may share one cache
+    directory: slot allocation happens inside a SQLite write transaction and
+    an index row is only committed after its vector has been flushed.
+    """
+
+    def __init__(self, cache_dir, max_mb: float = DEFAULT_MAX_MB):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy required for EmbeddingCache. Install: pip install numpy")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max(1.0, float(max_mb)) * 1024 * 1024)
+
+        self._lock = threading.RLock()
+        self._arrays: Dict[int, "np.memmap"] = {}
+        self.hits = 0
+        self.misses = 0
+        self._last_stamp = 0.0
+
+        self._db = sqlite3.connect(
+            str(self.cache_dir / "index.sqlite3"),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,  # explicit BEGIN/COMMIT below
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " dim INTEGER NOT NULL,"
+            " slot INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE UNIQUE INDEX IF NOT EXISTS entries_slot ON entries(dim, slot)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries(dim, last_used)")
+
+    # ------------------------------------------------------------------
+    # Vector file management
+    # ------------------------------------------------------------------
+
+    def capacity(self, dim: int) -> int:
+        """Maximum rows kept for vectors of dimension `dim`."""
+        return max(1, self.max_bytes // (dim * 4))
+
+    def _stamp(self) -> float:
+        """Strictly increasing LRU timestamp (wall clock may repeat)."""
+        self._last_stamp = max(time.time(), self._last_stamp + 1e-6)
+        return self._last_stamp
+
+    def _vector_path(self, dim: int) -> Path:
+        return self.cache_dir / f"vectors_{dim}.f32"
+
+    def _rows_on_disk(self, dim: int) -> int:
+        path = self._vector_path(dim)
+        return path.stat().st_size // (dim * 4) if path.exists() else 0
+
+    def _array(self, dim: int, min_rows: int = 0) -> Optional["np.memmap"]:
+        """Memmap for `dim`, grown (and remapped) to hold at least `min_rows`."""
+        array = self._arrays.get(dim)
+        if array is not None and array.shape[0] >= min_rows:
+            return array
+
+        rows = self._rows_on_disk(dim)
+        if rows < min_rows:
+            target = min(self.capacity(dim), max(min_rows, rows * 2, _MIN_GROW_ROWS))
+            if array is not None:
+                array.flush()
+            with open(self._vector_path(dim), "ab") as f:
+                f.truncate(target * dim * 4)
+            rows = target
+        if rows == 0:
+            return None
+
+        array = np.memmap(self._vector_path(dim), dtype=np.float32, mode="r+", shape=(rows, dim))
+        self._arrays[dim] = array
+        return array
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Cached vectors for `texts` (None where missing), refreshing LRU stamps."""
+        keys = [cache_key(model, t) for t in texts]
+        found: Dict[str, tuple] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(keys))
+            for start in range(0, len(unique), _SQLITE_BATCH):
+                chunk = unique[start:start + _SQLITE_BATCH]
+                marks = ",".join("?" * len(chunk))
+                for key, dim, slot in self._db.execute(
+                    f"SELECT key, dim, slot FROM entries WHERE key IN ({marks})", chunk
+                ):
+                    found[key] = (dim, slot)
+
+            results: List[Optional[List[float]]] = []
+            for key in keys:
+                entry = found.get(key)
+                array = self._array(entry[0], entry[1] + 1) if entry else None
+                results.append(array[entry[1]].tolist() if array is not None else None)
+
+            if found:
+                now = self._stamp()
+                self._db.executemany(
+                    "UPDATE entries SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+
+            hit_count = sum(1 for r in results if r is not None)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+        return results
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store vectors, evicting least recently used rows when at capacity."""
+        if len(texts) != len(vectors):
+            raise ValueError(f"Got {len(texts)} texts but {len(vectors)} vectors")
+
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                dirty = set()
+                for text, vector in zip(texts, vectors):
+                    row = np.asarray(vector, dtype=np.float32)
+                    dim = int(row.shape[0])
+                    if dim == 0:
+                        continue
+                    slot = self._allocate_slot(cache_key(model, text), dim)
+                    self._array(dim, slot + 1)[slot] = row
+                    dirty.add(dim)
+                for dim in dirty:
+                    self._arrays[dim].flush()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _allocate_slot(self, key: str, dim: int) -> int:
+        """Slot for `key` (existing, next free, or LRU victim). Caller holds a write txn."""
+        now = self._stamp()
+        row = self._db.execute("SELECT dim, slot FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None and row[0] == dim:
+            self._db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+            return row[1]
+        if row is not None:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+        next_slot = self._db.execute(
+            "SELECT COALESCE(MAX(slot) + 1, 0) FROM entries WHERE dim = ?", (dim,)
+        ).fetchone()[0]
+        if next_slot < self.capacity(dim):
+            slot = next_slot
+        else:
+            victim, slot = self._db.execute(
+                "SELECT key, slot FROM entries WHERE dim = ? ORDER BY last_used LIMIT 1", (dim,)
+            ).fetchone()
+            self._db.execute("DELETE FROM entries WHERE key = ?", (victim,))
+        self._db.execute(
+            "INSERT INTO entries (key, dim, slot, last_used) VALUES (?, ?, ?, ?)",
+            (key, dim, slot, now),
+        )
+        return slot
+
+    def embed(self, model: str, texts: Sequence[str], embed_fn: EmbedFn) -> List[List[float]]:
+        """
+        Return embeddings for `texts`, calling `embed_fn` only for cache misses.
+
+        `embed_fn` receives the distinct missing texts in input order and must
+        return one vector per text.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        results = self.get_many(model, texts)
+
+        missing: Dict[str, str] = {}
+        for text, vector in zip(texts, results):
+            if vector is None:
+                missing.setdefault(cache_key(model, text), text)
+        if not missing:
+            return results
+
+        fresh = embed_fn(list(missing.values()))
+        fresh = [list(v) for v in fresh]
+        if len(fresh) != len(missing):
+            raise ValueError(f"embed_fn returned {len(fresh)} vectors for {len(missing)} texts")
+        self.put_many(model, list(missing.values()), fresh)
+
+        by_key = dict(zip(missing.keys(), fresh))
+        logger.debug(f"[EMBED-CACHE] {len(texts) - len(missing)}/{len(texts)} hits, {len(missing)} embedded")
+        return [
+            vector if vector is not None else by_key[cache_key(model, text)]
+            for text, vector in zip(texts, results)
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process and rows stored on disk."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        with self._lock:
+            for array in self._arrays.values():
+                array.flush()
+            self._arrays.clear()
+            self._db.close()
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_loaded = False
+_shared_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Process-wide cache configured from `gemini.embedding_cache`.
+
+    Returns None when the cache is disabled or cannot be opened; callers then
+    embed directly.
+    """
+    global _shared_cache, _shared_cache_loaded
+    with _shared_cache_lock:
+        if _shared_cache_loaded:
+            return _shared_cache
+        _shared_cache_loaded = True
+        try:
+            from pipeline.config import PIPELINE_ROOT, get_config_section
+
+            cfg = (get_config_section("gemini") or {}).get("embedding_cache", {}) or {}
+            if not cfg.get("enabled", True):
+                return None
+            path = Path(cfg.get("path", "cache/embeddings"))
+            if not path.is_absolute():
+                path = PIPELINE_ROOT / path
+            _shared_cache = EmbeddingCache(path, max_mb=cfg.get("max_mb", DEFAULT_MAX_MB))
+            logger.debug(f"[EMBED-CACHE] Using {path} (cap {cfg.get('max_mb', DEFAULT_MAX_MB)} MB per dimension)")
+        except Exception as e:
+            logger.warning(f"[EMBED-CACHE] Disabled: {e}")
+            _shared_cache = None
+        return _shared_cache
+
+
+def set_embedding_cache(cache: Optional[EmbeddingCache]) -> None:
+    """Replace the process-wide cache (tests, CLI overrides)."""
+    global _shared_cache, _shared_cache_loaded
+    with _shared_cache_lock:
+        _shared_cache = cache
+        _shared_cache_loaded = True
+
+
+def cached_embed(model: str, texts: Sequence[str], embed_fn: EmbedFn) -> List[List[float]]:
+    """Embed through the shared cache, or call `embed_fn` directly if it is disabled."""
+    cache = get_embedding_cache()
+    if cache is None:
+        return [list(v) for v in embed_fn(list(texts))] if texts else []
+    return cache.embed(model, texts, embed_fn)
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 import re
 
+from modules.indicator_matcher import IndicatorIndex
+
 class EnglishGrammarRAG:
     """RAG system for retrieving English grammar restructuring patterns."""
     
@@ -21,6 +23,11 @@ class EnglishGrammarRAG:
             self.config = json.load(f)
         
         self.patterns = self._flatten_patterns()
+        
+        # Multi-pattern automaton over all japanese_indicators (built once)
+        self._indicator_index = IndicatorIndex(
+            [p.get("japanese_indicators", []) for p in self.patterns]
+        )
     
     def _flatten_patterns(self) -> List[Dict]:
         """Flatten nested pattern structure for easier searching."""
@@ -56,16 +63,10 @@ class EnglishGrammarRAG:
         """
         matches = []
         
-        for pattern in self.patterns:
-            indicators = pattern.get("japanese_indicators", [])
-            score = 0
-            matched_indicators = []
-            
-            # Check for indicator presence
-            for indicator in indicators:
-                if indicator in japanese_text:
-                    score += 1
-                    matched_indicators.append(indicator)
+        # One linear pass finds every indicator present in the text
+        for pattern_idx, matched_indicators in self._indicator_index.detect(japanese_text):
+            pattern = self.patterns[pattern_idx]
+            score = len(matched_indicators)
             
             if score > 0:
                 # Adjust score by priority
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
 from modules.vector_search import PatternVectorStore
+from modules.negative_anchors import CACHE_FILENAME as NEGATIVE_ANCHOR_CACHE, NegativeAnchorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -98,9 +99,9 @@ class EnglishPatternStore:
             "by_priority": {}
         }
 
-        # Negative anchor cache: {category: [np.array(embedding), ...]}
-        # Lazily built on first get_bulk_guidance() call
-        self._negative_anchor_cache: Optional[Dict[str, List[np.ndarray]]] = None
+        # Negative anchors: one normalized matrix, row range per category.
+        # Lazily built on first get_bulk_guidance() call, persisted next to Chroma.
+        self._negative_anchor_cache: Optional[NegativeAnchorIndex] = None
 
         logger.info(f"EnglishPatternStore initialized with persist_directory={persist_directory}")
 
@@ -139,6 +140,14 @@ class EnglishPatternStore:
         logger.info(f"Loaded RAG data from {self.rag_file_path}")
         return self._rag_cache
 
+    def warm(self) -> None:
+        """
+        Load the RAG data and build the negative anchor cache up front, so
+        later get_bulk_guidance() calls only read them.
+        """
+        self.load_rag_data()
+        self._build_negative_anchor_cache()
+
     def build_index(self, force_rebuild: bool = False) -> Dict[str, int]:
         """
         Build vector index from english_grammar_rag.json.
@@ -302,17 +311,18 @@ class EnglishPatternStore:
 
         return indexed_count
 
-    def _build_negative_anchor_cache(self) -> Dict[str, List[np.ndarray]]:
+    def _build_negative_anchor_cache(self) -> NegativeAnchorIndex:
         """
         Build and cache negative anchor embeddings from RAG JSON.
 
-        Reads negative_vectors from each category, batch-embeds them,
-        and stores as numpy arrays for fast cosine similarity computation.
+        Reads negative_vectors from each category and keeps them as one
+        pre-normalized float32 matrix (row range per category), persisted in
+        persist_directory and only re-embedded when the anchor texts change.
 
         Called lazily on first get_bulk_guidance() invocation.
 
         Returns:
-            Dict mapping category name → list of numpy embedding arrays
+            NegativeAnchorIndex with one row range per category
         """
         if self._negative_anchor_cache is not None:
             return self._negative_anchor_cache
@@ -333,38 +343,40 @@ class EnglishPatternStore:
 
         if not negative_texts_by_category:
             logger.info("[GRAMMAR] No negative_vectors found in RAG data")
-            self._negative_anchor_cache = {}
+            self._negative_anchor_cache = NegativeAnchorIndex.empty()
             return self._negative_anchor_cache
 
-        # Batch embed all negative texts in one API call
-        all_texts = []
-        text_to_category_map = []  # (category, index_in_category)
-
-        for cat_name, texts in negative_texts_by_category.items():
-            for i, text in enumerate(texts):
-                all_texts.append(text)
-                text_to_category_map.append((cat_name, i))
-
-        logger.info(f"[GRAMMAR] Embedding {len(all_texts)} negative anchors across {len(negative_texts_by_category)} categories...")
+        total = sum(len(texts) for texts in negative_texts_by_category.values())
+        logger.info(f"[GRAMMAR] Loading {total} negative anchors across {len(negative_texts_by_category)} categories...")
 
         try:
-            embeddings = self.vector_store.embed_texts_batch(all_texts)
+            # Batch embeds all negative texts in one API call on a cache miss
+            index = NegativeAnchorIndex.build(
+                negative_texts_by_category,
+                self.vector_store.embed_texts_batch,
+                model=self.vector_store._embedding_model,
+                cache_path=Path(self.persist_directory) / NEGATIVE_ANCHOR_CACHE,
+            )
         except Exception as e:
             logger.warning(f"[GRAMMAR] Failed to embed negative anchors: {e}")
-            self._negative_anchor_cache = {}
+            self._negative_anchor_cache = NegativeAnchorIndex.empty()
             return self._negative_anchor_cache
 
-        # Organize into cache
-        cache: Dict[str, List[np.ndarray]] = {}
-        for (cat_name, _), embedding in zip(text_to_category_map, embeddings):
-            if cat_name not in cache:
-                cache[cat_name] = []
-            cache[cat_name].append(np.array(embedding, dtype=np.float32))
-
-        self._negative_anchor_cache = cache
-        logger.info(f"[GRAMMAR] ✓ Negative anchor cache built: {len(cache)} categories, {len(all_texts)} vectors")
+        self._negative_anchor_cache = index
+        logger.info(f"[GRAMMAR] ✓ Negative anchor cache built: {len(index)} categories, {index.total_vectors} vectors")
         return self._negative_anchor_cache
 
+    def _compute_negative_penalties(self, query_embeddings: List[List[float]]) -> Dict[str, np.ndarray]:
+        """
+        Negative anchor penalties for many queries at once (one matrix multiply).
+
+        Returns:
+            {category: penalty per query}; categories without anchors are absent
+        """
+        return self._build_negative_anchor_cache().penalties(
+            query_embeddings, self.NEGATIVE_ANCHOR_THRESHOLD, self.NEGATIVE_ANCHOR_PENALTY
+        )
+
     def _compute_negative_penalty(
         self,
         query_embedding: List[float],
@@ -383,37 +395,10 @@ class EnglishPatternStore:
         Returns:
             Penalty value (0.0 = no penalty, up to NEGATIVE_ANCHOR_PENALTY)
         """
-        cache = self._build_negative_anchor_cache()
-
-        if category not in cache:
+        penalties = self._compute_negative_penalties([query_embedding])
+        if category not in penalties:
             return 0.0
-
-        query_vec = np.array(query_embedding, dtype=np.float32)
-        query_norm = np.linalg.norm(query_vec)
-        if query_norm == 0:
-            return 0.0
-        query_vec = query_vec / query_norm
-
-        max_neg_similarity = 0.0
-        for neg_vec in cache[category]:
-            neg_norm = np.linalg.norm(neg_vec)
-            if neg_norm == 0:
-                continue
-            cos_sim = float(np.dot(query_vec, neg_vec / neg_norm))
-            if cos_sim > max_neg_similarity:
-                max_neg_similarity = cos_sim
-
-        # If max negative similarity exceeds threshold, apply proportional penalty
-        if max_neg_similarity >= self.NEGATIVE_ANCHOR_THRESHOLD:
-            # Scale penalty: at threshold → 0, at 1.0 → full penalty
-            overshoot = (max_neg_similarity - self.NEGATIVE_ANCHOR_THRESHOLD) / (1.0 - self.NEGATIVE_ANCHOR_THRESHOLD)
-            penalty = overshoot * self.NEGATIVE_ANCHOR_PENALTY
-            logger.debug(
-                f"[NEG-ANCHOR] {category}: neg_sim={max_neg_similarity:.3f} → penalty={penalty:.3f}"
-            )
-            return penalty
-
-        return 0.0
+        return float(penalties[category][0])
 
     def search(
         self,
@@ -528,8 +513,8 @@ class EnglishPatternStore:
             query_embeddings = [self.vector_store.embed_text(q) for q in queries]
 
         # === Search ChromaDB with pre-computed embeddings ===
-        # Pre-build negative anchor cache (lazy, only on first call)
-        self._build_negative_anchor_cache()
+        # Negative anchor penalties for all queries: one matrix multiply
+        neg_penalties = self._compute_negative_penalties(query_embeddings)
         neg_penalties_applied = 0
 
         for idx, (embedding, meta) in enumerate(zip(query_embeddings, query_metadata)):
@@ -548,7 +533,7 @@ class EnglishPatternStore:
             )
 
             # === NEGATIVE ANCHOR: compute penalty for this query ===
-            neg_penalty = self._compute_negative_penalty(embedding, category)
+            neg_penalty = float(neg_penalties[category][idx]) if category in neg_penalties else 0.0
             if neg_penalty > 0:
                 neg_penalties_applied += 1
 
@@ -0,0 +1,164 @@
+"""
+Fuzzy Name Index
+
+GlossaryLock compares every capitalized token of a chapter against every
+locked name, and the name consistency auditor compares every pair of names
+seen in a volume. FuzzyNameIndex keeps names bucketed by length with a
+bigram inverted index: a bounded edit-distance search only looks at lengths
+within its radius (distance ≥ length difference) and, by the q-gram lemma,
+only at names sharing enough bigrams with the query, so a token is compared
+against a handful of names instead of all of them. Survivors are checked
+with the bit-parallel Levenshtein of Myers / Hyyrö, one pass of integer
+operations per character.
+
+`closest_by_ratio()` answers the GlossaryLock question ("which name has the
+best difflib ratio, if it reaches the threshold?") through the same index:
+a ratio of r needs 2·M ≥ r·(|a|+|b|) matching characters, and since matching
+blocks form a common subsequence, Levenshtein(a, b) ≤ (1-r)·(|a|+|b|). Names
+outside that radius cannot reach the threshold, so the result equals a
+SequenceMatcher scan over every name.
+"""
+
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Levenshtein distance (insert, delete, substitute), bit-parallel."""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    # Bit i of peq[c] is set where b[i] == c
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = mask, 0, len(b)
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def _bigrams(text: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for i in range(len(text) - 1):
+        gram = text[i:i + 2]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+class FuzzyNameIndex:
+    """
+    Names bucketed by length, with a bigram inverted index. Results come back
+    in insertion order, so callers that break ties by "first name wins" keep
+    their behaviour.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._by_length: Dict[int, List[int]] = {}
+        # bigram -> [(name id, occurrences of the bigram in that name)]
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def add(self, name: str) -> None:
+        if name in self._ids:
+            return
+        name_id = len(self._names)
+        self._ids[name] = name_id
+        self._names.append(name)
+        self._by_length.setdefault(len(name), []).append(name_id)
+        for gram, count in _bigrams(name).items():
+            self._postings.setdefault(gram, []).append((name_id, count))
+
+    def _candidates(self, query: str, radius_for_length) -> List[Tuple[str, int]]:
+        """
+        (name, distance) for every name within radius_for_length(len(name))
+        edits of `query` (a None radius skips that length), in insertion order.
+
+        q-gram lemma: within k edits, two strings share at least
+        max(len) - 1 - 2k bigrams, so names below that count are never
+        compared.
+        """
+        radii: Dict[int, int] = {}
+        for length in self._by_length:
+            radius = radius_for_length(length)
+            if radius is not None and abs(length - len(query)) <= radius:
+                radii[length] = radius
+
+        shared: Dict[int, int] = {}
+        for gram, count in _bigrams(query).items():
+            for name_id, name_count in self._postings.get(gram, ()):
+                shared[name_id] = shared.get(name_id, 0) + min(count, name_count)
+
+        checked: List[int] = []
+        for length, radius in radii.items():
+            needed = max(length, len(query)) - 1 - 2 * radius
+            if needed <= 0:
+                checked.extend(self._by_length[length])
+            else:
+                checked.extend(i for i in self._by_length[length] if shared.get(i, 0) >= needed)
+
+        hits = []
+        for name_id in sorted(checked):
+            name = self._names[name_id]
+            distance = levenshtein(query, name)
+            if distance <= radii[len(name)]:
+                hits.append((name, distance))
+        return hits
+
+    def within(self, query: str, max_distance: int) -> List[Tuple[str, int]]:
+        """(name, distance) for every name within `max_distance` of `query`."""
+        return self._candidates(query, lambda length: max_distance)
+
+    def closest_by_ratio(self, query: str, min_ratio: float) -> Tuple[Optional[str], float]:
+        """
+        First-inserted name with the highest SequenceMatcher(None, query, name)
+        ratio, provided it is at least `min_ratio`; (None, 0.0) otherwise.
+        """
+        if min_ratio <= 0:
+            raise ValueError("min_ratio must be positive")
+
+        def radius(length: int) -> Optional[int]:
+            # Too short or too long to reach min_ratio whatever the content
+            if 2 * min(len(query), length) < min_ratio * (len(query) + length) - 1e-9:
+                return None
+            return int((1 - min_ratio) * (len(query) + length) + 1e-9)
+
+        best_name: Optional[str] = None
+        best_score = 0.0
+        for name, _ in self._candidates(query, radius):
+            score = SequenceMatcher(None, query, name).ratio()
+            if score > best_score:
+                best_score = score
+                best_name = name
+
+        if best_score < min_ratio:
+            return None, 0.0
+        return best_name, best_score
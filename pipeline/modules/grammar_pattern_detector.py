@@ -12,8 +12,11 @@ And returns structured data for vector search matching.
 """
 
 import re
+import bisect
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from modules.indicator_matcher import AhoCorasick, required_literals
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +163,65 @@ HIGH_PRIORITY_PATTERNS = {
 }
 
 
+class _IndicatorScanner:
+    """
+    GRAMMAR_INDICATORS compiled once: every regex plus an Aho–Corasick
+    automaton over literal triggers derived from them. One pass of the
+    automaton over a chapter tells which regexes can match on which line;
+    regexes without a derivable trigger run on every line.
+    """
+
+    def __init__(self, indicators: Dict[str, List[Tuple[str, str]]]):
+        # (category, indicator name, compiled regex) in declaration order
+        self.entries: List[Tuple[str, str, "re.Pattern"]] = []
+        self.always_run: Set[int] = set()
+        trigger_owners: Dict[str, Set[int]] = {}
+
+        for category, category_indicators in indicators.items():
+            for pattern_regex, pattern_name in category_indicators:
+                try:
+                    compiled = re.compile(pattern_regex, re.IGNORECASE)
+                except re.error as e:
+                    logger.warning(f"Regex error for pattern '{pattern_regex}': {e}")
+                    continue
+                entry_idx = len(self.entries)
+                self.entries.append((category, pattern_name, compiled))
+                triggers = required_literals(pattern_regex)
+                if triggers is None:
+                    self.always_run.add(entry_idx)
+                    continue
+                for trigger in triggers:
+                    trigger_owners.setdefault(trigger, set()).add(entry_idx)
+
+        self._triggers = list(trigger_owners)
+        self._owners = [trigger_owners[t] for t in self._triggers]
+        self.automaton = AhoCorasick(self._triggers)
+
+    def candidates_by_line(self, text: str) -> Dict[int, Set[int]]:
+        """Map 0-based line index -> entry indices whose trigger occurs on that line."""
+        line_starts = [0]
+        pos = text.find('\n')
+        while pos >= 0:
+            line_starts.append(pos + 1)
+            pos = text.find('\n', pos + 1)
+
+        by_line: Dict[int, Set[int]] = {}
+        for start, _end, trigger_idx in self.automaton.iter_matches(text):
+            line_idx = bisect.bisect_right(line_starts, start) - 1
+            by_line.setdefault(line_idx, set()).update(self._owners[trigger_idx])
+        return by_line
+
+
+_scanner: Optional[_IndicatorScanner] = None
+
+
+def _get_scanner() -> _IndicatorScanner:
+    global _scanner
+    if _scanner is None:
+        _scanner = _IndicatorScanner(GRAMMAR_INDICATORS)
+    return _scanner
+
+
 def detect_grammar_patterns(
     japanese_text: str,
     top_n: int = 15,
@@ -193,37 +255,36 @@ def detect_grammar_patterns(
     patterns = []
     lines = japanese_text.split('\n')
 
+    # One automaton pass over the whole text selects the regexes to run per line
+    scanner = _get_scanner()
+    candidates = scanner.candidates_by_line(japanese_text)
+
     for line_num, line in enumerate(lines, start=1):
         # Skip empty lines and lines with only punctuation
         if not line.strip() or len(line.strip()) < 3:
             continue
 
-        for category, indicators in GRAMMAR_INDICATORS.items():
-            for pattern_regex, pattern_name in indicators:
-                try:
-                    matches = re.finditer(pattern_regex, line, re.IGNORECASE)
-                    for match in matches:
-                        # Determine priority
-                        priority = "high" if category in HIGH_PRIORITY_PATTERNS else "normal"
-
-                        pattern_entry = {
-                            "category": category,
-                            "indicator": pattern_name,
-                            "context": line.strip(),
-                            "match": match.group(0),
-                            "priority": priority,
-                            "match_start": match.start(),
-                            "match_end": match.end()
-                        }
-
-                        if include_line_numbers:
-                            pattern_entry["line_number"] = line_num
-
-                        patterns.append(pattern_entry)
-
-                except re.error as e:
-                    logger.warning(f"Regex error for pattern '{pattern_regex}': {e}")
-                    continue
+        line_entries = candidates.get(line_num - 1, set()) | scanner.always_run
+        for entry_idx in sorted(line_entries):
+            category, pattern_name, regex = scanner.entries[entry_idx]
+            for match in regex.finditer(line):
+                # Determine priority
+                priority = "high" if category in HIGH_PRIORITY_PATTERNS else "normal"
+
+                pattern_entry = {
+                    "category": category,
+                    "indicator": pattern_name,
+                    "context": line.strip(),
+                    "match": match.group(0),
+                    "priority": priority,
+                    "match_start": match.start(),
+                    "match_end": match.end()
+                }
+
+                if include_line_numbers:
+                    pattern_entry["line_number"] = line_num
+
+                patterns.append(pattern_entry)
 
     # Sort by priority (high first), then by line number
     patterns.sort(key=lambda x: (
@@ -0,0 +1,159 @@
+"""
+Guidance Service - One warm RAG store per kind for the whole process.
+
+SinoVietnameseStore, EnglishPatternStore and VietnamesePatternStore each open
+a Chroma PersistentClient, check the collection and build lazy caches (direct
+lookup, negative anchor matrix) on first use. Built per chapter, that setup
+is paid again for every chapter. GuidanceService builds each store once,
+warms its caches before publishing it, and then serves get_bulk_guidance()
+from any thread without locking: after warm() the stores only read their
+caches.
+
+Usage:
+    from modules.guidance_service import get_guidance_service, SINO_VN
+
+    guidance = get_guidance_service().get_bulk_guidance(SINO_VN, terms=terms)
+"""
+
+import importlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+SINO_VN = "sino_vn"
+EN_PATTERNS = "en_patterns"
+VN_PATTERNS = "vn_patterns"
+
+# kind -> (module, class); imported on first use so chromadb stays optional
+_STORE_CLASSES = {
+    SINO_VN: ("modules.sino_vietnamese_store", "SinoVietnameseStore"),
+    EN_PATTERNS: ("modules.english_pattern_store", "EnglishPatternStore"),
+    VN_PATTERNS: ("modules.vietnamese_pattern_store", "VietnamesePatternStore"),
+}
+
+# kind -> default RAG source file of the store (under config/)
+_RAG_FILES = {
+    SINO_VN: "sino_vietnamese_rag_v2.json",
+    EN_PATTERNS: "english_grammar_rag.json",
+    VN_PATTERNS: "vietnamese_grammar_rag_v2.json",
+}
+
+# Stores ChapterProcessor queries for each target language
+LANGUAGE_STORES = {
+    "en": (EN_PATTERNS,),
+    "vi": (SINO_VN,),
+    "vn": (SINO_VN, VN_PATTERNS),
+}
+
+
+def rag_file(kind: str) -> Path:
+    """Default RAG source file behind the `kind` store, without opening it."""
+    return Path(__file__).parent.parent / "config" / _RAG_FILES[kind]
+
+
+def _default_factory(kind: str) -> Callable[[], Any]:
+    module_name, class_name = _STORE_CLASSES[kind]
+
+    def factory() -> Any:
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    return factory
+
+
+class GuidanceService:
+    """Process-scoped holder of warm guidance stores, one per kind."""
+
+    def __init__(self, factories: Optional[Dict[str, Callable[[], Any]]] = None):
+        """
+        Args:
+            factories: kind -> zero-argument store constructor (defaults to
+                the stores in _STORE_CLASSES with their default settings)
+        """
+        if factories is None:
+            factories = {kind: _default_factory(kind) for kind in _STORE_CLASSES}
+        self._factories = dict(factories)
+        self._locks = {kind: threading.Lock() for kind in self._factories}
+        self._stores: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+
+    def store(self, kind: str) -> Any:
+        """
+        The warm store for `kind`, built on first request. A store that failed
+        to build is not retried in this process; RuntimeError is raised instead.
+        """
+        store = self._stores.get(kind)
+        if store is not None:
+            return store
+        if kind not in self._factories:
+            raise ValueError(f"Unknown guidance store: {kind}")
+
+        with self._locks[kind]:
+            store = self._stores.get(kind)
+            if store is not None:
+                return store
+            if kind in self._errors:
+                raise RuntimeError(f"{kind} guidance store unavailable: {self._errors[kind]}")
+
+            try:
+                store = self._factories[kind]()
+            except Exception as e:
+                self._errors[kind] = str(e)
+                logger.warning(f"[GUIDANCE] Could not open {kind} store, disabled for this run: {e}")
+                raise RuntimeError(f"{kind} guidance store unavailable: {e}") from e
+
+            # A store that fails to warm still works; it builds its caches lazily
+            try:
+                store.warm()
+            except Exception as e:
+                logger.warning(f"[GUIDANCE] Could not warm {kind} store: {e}")
+
+            self._stores[kind] = store
+            logger.info(f"[GUIDANCE] {kind} store ready")
+            return store
+
+    def get_bulk_guidance(self, kind: str, **kwargs) -> Dict[str, Any]:
+        """`get_bulk_guidance(**kwargs)` on the warm store for `kind`."""
+        return self.store(kind).get_bulk_guidance(**kwargs)
+
+    def warm(self, kinds: Iterable[str]) -> Dict[str, bool]:
+        """Build and warm the given stores now; kind -> whether it is available."""
+        ready = {}
+        for kind in kinds:
+            try:
+                self.store(kind)
+                ready[kind] = True
+            except Exception:
+                ready[kind] = False
+        return ready
+
+    def close(self) -> None:
+        """Drop every store (and remembered failure)."""
+        for kind, lock in self._locks.items():
+            with lock:
+                self._stores.pop(kind, None)
+                self._errors.pop(kind, None)
+
+
+_shared_service: Optional[GuidanceService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_guidance_service() -> GuidanceService:
+    """Process-wide guidance service (created on first use)."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = GuidanceService()
+        return _shared_service
+
+
+def set_guidance_service(service: Optional[GuidanceService]) -> None:
+    """Replace the process-wide service (tests, CLI overrides); None resets it."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is not None and _shared_service is not service:
+            _shared_service.close()
+        _shared_service = service
@@ -0,0 +1,327 @@
+"""
+Multi-Pattern Indicator Matcher
+
+Aho–Corasick automaton for finding every occurrence of many literal
+indicators (e.g. the `japanese_indicators` of the grammar RAG files) in one
+linear pass over a chapter, instead of one substring scan per indicator.
+
+Also provides `required_literals()`, which derives literal "trigger" strings
+from simple regexes (GRAMMAR_INDICATORS) so the automaton can pre-select
+which regexes are worth running on which line, and `fold_case()`, the
+length-preserving case fold that lets IGNORECASE regexes use them too.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AhoCorasick:
+    """
+    Aho–Corasick automaton over a fixed list of literal keywords.
+
+    Keywords are identified by their index in the constructor list. Empty
+    keywords never match (callers treat them specially if needed).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for idx, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] = self._out[node] + (idx,)
+
+        # Breadth-first failure links; outputs inherit from the failure state.
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, keyword_index) for every occurrence, overlapping included."""
+        goto, fail, out, keywords = self._goto, self._fail, self._out, self.keywords
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for idx in out[node]:
+                yield pos + 1 - len(keywords[idx]), pos + 1, idx
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """All occurrences as (start, end, keyword_index), ordered by end position."""
+        return list(self.iter_matches(text))
+
+    def present(self, text: str) -> Set[int]:
+        """Indices of keywords that occur at least once in `text`."""
+        return {idx for _, _, idx in self.iter_matches(text)}
+
+
+class IndicatorIndex:
+    """
+    Automaton over the literal indicators of a list of RAG patterns.
+
+    `detect(text)` returns, for each pattern with at least one indicator
+    present, the indicators found (in the pattern's own order).
+    """
+
+    def __init__(self, indicator_lists: Sequence[Sequence[str]]):
+        self._indicator_lists = [list(indicators or []) for indicators in indicator_lists]
+        keywords = sorted({ind for indicators in self._indicator_lists for ind in indicators if ind})
+        self.automaton = AhoCorasick(keywords)
+
+    def occurrences(self, text: str) -> List[Tuple[int, int, str]]:
+        """Every indicator occurrence in `text` as (start, end, indicator)."""
+        keywords = self.automaton.keywords
+        return [(start, end, keywords[idx]) for start, end, idx in self.automaton.iter_matches(text)]
+
+    def detect(self, text: str) -> List[Tuple[int, List[str]]]:
+        """(pattern_index, matched_indicators) for every pattern with a hit, in pattern order."""
+        present = {self.automaton.keywords[idx] for idx in self.automaton.present(text)}
+        present.add("")  # `"" in text` is always true
+        results = []
+        for pattern_idx, indicators in enumerate(self._indicator_lists):
+            matched = [ind for ind in indicators if ind in present]
+            if matched:
+                results.append((pattern_idx, matched))
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Regex trigger extraction
+# ---------------------------------------------------------------------------
+
+_ZERO_WIDTH_OR_ANY = set(".^$")
+# Payload-free escapes (classes, anchors, control characters) only end a
+# literal run. Any other letter or digit escape (\x41, \u3042, \N{...},
+# octal, backreferences) has a payload that is not literal text: give up.
+_CLASS_ESCAPES = set("bBdDsSwWAZ")
+_CONTROL_ESCAPES = set("afnrtv")
+
+# Characters that `re.IGNORECASE` treats as equal to a letter whose
+# lowercase/casefold form differs from theirs (see re._casefix).
+_FOLD_OVERRIDES = {
+    0x0130: "i",        # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    0x0131: "i",        # LATIN SMALL LETTER DOTLESS I
+    0x1FD3: "\u0390",   # GREEK SMALL LETTER IOTA WITH DIALYTIKA AND OXIA
+    0x1FE3: "\u03b0",   # GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND OXIA
+    0xFB06: "\ufb05",   # LATIN SMALL LIGATURE ST
+}
+
+
+class _FoldTable(dict):
+    """str.translate() table built lazily, one code point at a time."""
+
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        folded = _FOLD_OVERRIDES.get(codepoint)
+        if folded is None:
+            folded = ch.casefold()
+            if len(folded) != 1:
+                folded = ch.lower() if len(ch.lower()) == 1 else ch
+        self[codepoint] = folded
+        return folded
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+def fold_case(text: str) -> str:
+    """
+    Length-preserving case fold.
+
+    Two characters that `re.IGNORECASE` considers equal fold to the same
+    character, and offsets into the folded text are offsets into `text`.
+    """
+    return text.translate(_FOLD_TABLE)
+
+
+def _class_end(pattern: str, start: int) -> int:
+    """Index of the ']' closing the class opened at `start` (-1 if none)."""
+    i = start + 1
+    if pattern[i:i + 1] == "^":
+        i += 1
+    if pattern[i:i + 1] == "]":
+        i += 1  # a leading ']' is a member, not the end
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            i += 2
+            continue
+        if pattern[i] == "]":
+            return i
+        i += 1
+    return -1
+
+
+def _split_top_level(pattern: str) -> Optional[List[str]]:
+    """Split on top-level '|'; None if brackets/parentheses are unbalanced."""
+    parts, depth, current, i = [], 0, [], 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern):
+            current.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if ch == "[":
+            end = _class_end(pattern, i)
+            if end < 0:
+                return None
+            current.append(pattern[i:end + 1])
+            i = end + 1
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif ch == "|" and depth == 0:
+            parts.append("".join(current))
+            current = []
+            i += 1
+            continue
+        current.append(ch)
+        i += 1
+    if depth:
+        return None
+    parts.append("".join(current))
+    return parts
+
+
+def _literal_runs(alternative: str) -> Optional[List[str]]:
+    """Runs of mandatory literal characters in one regex alternative."""
+    runs: List[str] = []
+    run: List[str] = []
+    last_was_literal = False
+    i = 0
+
+    def close_run():
+        if run:
+            runs.append("".join(run))
+            run.clear()
+
+    while i < len(alternative):
+        ch = alternative[i]
+        if ch in "?*+{":
+            # Quantifier applies to the previous atom.
+            if ch == "{":
+                end = alternative.find("}", i)
+                if end < 0:
+                    return None
+                optional = alternative[i + 1:end].split(",")[0].strip() in ("", "0")
+                i = end + 1
+            else:
+                optional = ch in "?*"
+                i += 1
+            if i < len(alternative) and alternative[i] in "?+":
+                i += 1  # lazy / possessive modifier
+            if last_was_literal and optional:
+                run.pop()
+            close_run()
+            last_was_literal = False
+            continue
+
+        if ch == "\\":
+            if i + 1 >= len(alternative):
+                return None
+            escaped = alternative[i + 1]
+            i += 2
+            if escaped in _CLASS_ESCAPES or escaped in _CONTROL_ESCAPES:
+                close_run()  # \d, \w, \b, \n, ... are not literals
+                last_was_literal = False
+            elif escaped.isalnum():
+                return None  # payload escapes and backreferences
+            else:
+                run.append(escaped)
+                last_was_literal = True
+            continue
+
+        if ch == "[":
+            end = _class_end(alternative, i)
+            if end < 0:
+                return None
+            i = end + 1
+        elif ch == "(":
+            depth, j = 1, i + 1
+            while j < len(alternative) and depth:
+                if alternative[j] == "\\":
+                    j += 1
+                elif alternative[j] == "[":
+                    j = _class_end(alternative, j)
+                    if j < 0:
+                        return None
+                elif alternative[j] == "(":
+                    depth += 1
+                elif alternative[j] == ")":
+                    depth -= 1
+                j += 1
+            i = j
+        elif ch in _ZERO_WIDTH_OR_ANY:
+            i += 1
+        else:
+            run.append(ch)
+            last_was_literal = True
+            i += 1
+            continue
+
+        # Non-literal atom: ends the current run.
+        close_run()
+        last_was_literal = False
+
+    close_run()
+    return runs
+
+
+def required_literals(pattern: str, folded: bool = False) -> Optional[List[str]]:
+    """
+    Literal strings such that every match of `pattern` contains at least one.
+
+    Returns the longest mandatory literal of each top-level alternative, or
+    None when some alternative has no mandatory literal (or the syntax is
+    beyond this simple analysis) and the regex must always be run.
+
+    Cased literals make the result None unless `folded` is set, in which
+    case every trigger is returned through fold_case() and must be looked
+    up in fold_case()d text.
+    """
+    alternatives = _split_top_level(pattern)
+    if alternatives is None:
+        return None
+    triggers = []
+    for alternative in alternatives:
+        runs = _literal_runs(alternative)
+        if not runs:
+            return None
+        best = max(runs, key=len)
+        if folded:
+            best = fold_case(best)
+        elif best.lower() != best.upper():
+            return None  # cased literal: IGNORECASE matching is not literal
+        triggers.append(best)
+    return triggers
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from pipeline.common.genai_factory import create_genai_client, resolve_api_key
+from modules.embedding_cache import cached_embed
 
 logger = logging.getLogger(__name__)
 
@@ -98,9 +99,9 @@ class MangaVectorStore:
 
         # Gemini embedding client
         api_key = resolve_api_key(api_key=gemini_api_key, required=False) if GEMINI_AVAILABLE else None
+        self._embedding_model = "gemini-embedding-001"
         if GEMINI_AVAILABLE and api_key:
             self.gemini_client = create_genai_client(api_key=api_key)
-            self._embedding_model = "gemini-embedding-001"
         else:
             self.gemini_client = None
             logger.warning("[MANGA] Gemini client not initialized — embeddings unavailable")
@@ -113,17 +114,15 @@ class MangaVectorStore:
     # ─── Embedding ───────────────────────────────────────────────────
 
     def _embed(self, text: str) -> List[float]:
-        """Generate embedding for a text string."""
-        if not self.gemini_client:
-            raise RuntimeError("Gemini client not initialized for embeddings")
-        result = self.gemini_client.models.embed_content(
-            model=self._embedding_model,
-            contents=text,
-        )
-        return result.embeddings[0].values
+        """Generate embedding for a text string (via the shared embedding cache)."""
+        return self._embed_batch([text])[0]
 
     def _embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Batch embed multiple texts."""
+        """Batch embed multiple texts, requesting only cache misses."""
+        return cached_embed(self._embedding_model, texts, self._request_embeddings)
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Call the embedding API for a list of texts."""
         if not self.gemini_client:
             raise RuntimeError("Gemini client not initialized for embeddings")
         result = self.gemini_client.models.embed_content(
@@ -16,6 +16,7 @@ Pipeline Flow:
 Key Modules:
   - integrity_checker:  Pre-flight validation of JP tags vs asset files vs manifest
   - asset_processor:    Phase 1.6 "Art Director" (Gemini 3 Pro Vision + ThinkingConfig)
+  - vision_input:       Downsampled vision uploads + perceptual-hash dedupe of reused art
   - cache_manager:      Load/save/query visual_cache.json
   - prompt_injector:    Build Art Director's Notes for translation prompts
   - segment_classifier: Detect illustration markers in chapter text
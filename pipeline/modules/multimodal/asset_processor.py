@@ -11,7 +11,9 @@ narrative interpretations of each illustration.
 Features:
   - Cache invalidation via prompt+image+model hash
   - Dynamic per-image thinking routing (conservative, text-first)
+  - Vision input downsampling + perceptual-hash dedupe of reused art
   - Retry with exponential backoff for transient API errors (429/503)
+  - Bounded worker pool for Vision calls; results applied in volume order
   - Configurable timeout, rate limit, and max retries
   - Safety block handling with meaningful fallback text
   - Thought logging for editorial review
@@ -24,13 +26,23 @@ import json
 import time
 import logging
 import re
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 
 from modules.multimodal.cache_manager import VisualCacheManager
 from modules.multimodal.thought_logger import ThoughtLogger, VisualAnalysisLog
+from modules.multimodal.vision_input import (
+    DEFAULT_DEDUPE_DISTANCE,
+    DEFAULT_JPEG_QUALITY,
+    DEFAULT_MAX_EDGE,
+    PerceptualIndex,
+    VisionInput,
+    prepare_vision_input,
+)
 from pipeline.common.genai_factory import create_genai_client, resolve_api_key, resolve_genai_backend
+from pipeline.translator.chapter_scheduler import ChapterJob, ChapterScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +81,7 @@ class VisualAssetProcessor:
         max_retries: int = 3,
         timeout_seconds: float = 120.0,
         force_override: bool = False,
+        max_workers: Optional[int] = None,
     ):
         self.volume_path = volume_path
         self.model = model
@@ -79,6 +92,9 @@ class VisualAssetProcessor:
         self.max_retries = max_retries
         self.timeout_seconds = timeout_seconds
         self.force_override = force_override
+        self.max_workers = max(1, int(max_workers or self._load_max_workers()))
+        self._call_slot_lock = threading.Lock()
+        self._next_call_at = 0.0
 
         if not self.api_key and self.backend == "developer":
             raise ValueError(
@@ -95,6 +111,7 @@ class VisualAssetProcessor:
         }
         self.routing_policy = self._load_thinking_routing_policy()
         self.routing_version = str(self.routing_policy.get("version", "v1")).strip() or "v1"
+        self.vision_input_policy = self._load_vision_input_policy()
         self.analysis_prompt = self._build_analysis_prompt()
 
         # Deferred Gemini client initialization
@@ -149,6 +166,75 @@ class VisualAssetProcessor:
             logger.debug(f"[PHASE 1.6] Could not load thinking routing policy; using defaults: {e}")
             return defaults
 
+    def _load_vision_input_policy(self) -> Dict[str, Any]:
+        """Load vision input preprocessing/dedupe settings from config.yaml with safe defaults."""
+        defaults: Dict[str, Any] = {
+            "max_edge": DEFAULT_MAX_EDGE,
+            "jpeg_quality": DEFAULT_JPEG_QUALITY,
+            "dedupe": True,
+            "dedupe_max_distance": DEFAULT_DEDUPE_DISTANCE,
+        }
+        try:
+            from pipeline.config import get_config_section
+
+            multimodal_cfg = get_config_section("multimodal")
+            input_cfg = multimodal_cfg.get("vision_input", {}) if isinstance(multimodal_cfg, dict) else {}
+            if not isinstance(input_cfg, dict):
+                input_cfg = {}
+            return {
+                "max_edge": max(0, int(input_cfg.get("max_edge", defaults["max_edge"]))),
+                "jpeg_quality": min(95, max(30, int(input_cfg.get("jpeg_quality", defaults["jpeg_quality"])))),
+                "dedupe": bool(input_cfg.get("dedupe", defaults["dedupe"])),
+                "dedupe_max_distance": max(0, int(input_cfg.get("dedupe_max_distance", defaults["dedupe_max_distance"]))),
+            }
+        except Exception as e:
+            logger.debug(f"[PHASE 1.6] Could not load vision input policy; using defaults: {e}")
+            return defaults
+
+    @staticmethod
+    def _load_max_workers() -> int:
+        """Concurrent Vision calls from multimodal.concurrency.max_workers (default 4)."""
+        try:
+            from pipeline.config import get_config_section
+
+            multimodal_cfg = get_config_section("multimodal")
+            concurrency_cfg = multimodal_cfg.get("concurrency", {}) if isinstance(multimodal_cfg, dict) else {}
+            if isinstance(concurrency_cfg, dict):
+                return max(1, int(concurrency_cfg.get("max_workers", 4)))
+        except Exception as e:
+            logger.debug(f"[PHASE 1.6] Could not load concurrency settings; using defaults: {e}")
+        return 4
+
+    def _prepare_vision_input(self, img_path: Path) -> Optional[VisionInput]:
+        """Downsampled upload bytes + perceptual hash, or None if the image cannot be decoded."""
+        try:
+            vision_input = prepare_vision_input(
+                img_path,
+                max_edge=self.vision_input_policy["max_edge"],
+                jpeg_quality=self.vision_input_policy["jpeg_quality"],
+            )
+        except Exception as e:
+            logger.warning(f"  [VISION] {img_path.name}: preprocessing failed, sending original ({e})")
+            return None
+        logger.debug(
+            f"  [VISION] {img_path.name}: "
+            f"{vision_input.source_size[0]}x{vision_input.source_size[1]} {vision_input.source_bytes // 1024}KB -> "
+            f"{vision_input.size[0]}x{vision_input.size[1]} {len(vision_input.data) // 1024}KB "
+            f"(phash={vision_input.phash_hex})"
+        )
+        return vision_input
+
+    @staticmethod
+    def _analysis_from_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild an _analyze_illustration() result from a cached entry (for dedupe reuse)."""
+        return {
+            "status": "cached",
+            "visual_ground_truth": entry.get("visual_ground_truth", {}),
+            "spoiler_prevention": entry.get("spoiler_prevention", {}),
+            "identity_resolution": entry.get("identity_resolution", {}),
+            "thoughts": [],
+        }
+
     def _build_analysis_prompt(self) -> str:
         """
         Build visual analysis prompt with identity lock context.
@@ -1031,8 +1117,17 @@ class VisualAssetProcessor:
             )
         else:
             logger.warning("[PHASE 1.6] Identity lock unavailable before analysis (base prompt fallback)")
-        stats = {"total": len(illustrations), "cached": 0, "generated": 0, "blocked": 0}
-
+        stats = {"total": len(illustrations), "cached": 0, "generated": 0, "blocked": 0, "deduplicated": 0}
+        dedupe_index: Optional[PerceptualIndex] = None
+        if self.vision_input_policy.get("dedupe", True):
+            dedupe_index = PerceptualIndex(self.vision_input_policy["dedupe_max_distance"])
+
+        # Pass 1 (ordered): routing, cache keys and vision inputs. Decide which
+        # images need a Vision call, assuming every earlier call succeeds.
+        items: List[Dict[str, Any]] = []
+        planned_index: Optional[PerceptualIndex] = None
+        if dedupe_index is not None:
+            planned_index = PerceptualIndex(dedupe_index.max_distance)
         for img_path in illustrations:
             illust_id = img_path.stem
             chapter = self._chapter_for_illustration(img_path.name)
@@ -1054,6 +1149,23 @@ class VisualAssetProcessor:
                 routing_version=self.routing_version,
             )
 
+            vision_input = self._prepare_vision_input(img_path) if dedupe_index is not None else None
+            item = {
+                "img_path": img_path,
+                "illust_id": illust_id,
+                "scene_prompt": scene_prompt,
+                "allowed_candidates": allowed_candidates,
+                "scene_multi_expected": scene_multi_expected,
+                "source_anchor": source_anchor,
+                "candidate_policy": candidate_policy,
+                "thinking_level": thinking_level_used,
+                "routing_reason": routing_reason,
+                "routing_features": routing_features,
+                "cache_key": current_key,
+                "vision_input": vision_input,
+            }
+            items.append(item)
+
             # Check if regeneration needed
             existing_entry = self.cache_manager.cache.get(illust_id)
             if not VisualCacheManager.should_regenerate(
@@ -1064,22 +1176,77 @@ class VisualAssetProcessor:
                 status = existing_entry.get("status", "cached")
                 logger.info(f"  [SKIP] {illust_id}: Using existing cache (status={status})")
                 stats["cached"] += 1
+                item["existing_entry"] = existing_entry
+                if vision_input is not None and status == "cached":
+                    planned_index.add(vision_input, illust_id)
                 continue
 
-            # Process illustration
-            logger.info(
-                f"  [ANALYZE] {illust_id}: Running visual analysis "
-                f"(thinking={thinking_level_used}, reason={routing_reason})..."
+            # Same art as an earlier image: resolved in pass 3 without a call
+            if vision_input is not None and planned_index.match(vision_input) is not None:
+                continue
+            item["dispatch"] = True
+            if vision_input is not None:
+                planned_index.add(vision_input, illust_id)
+
+        # Pass 2 (concurrent): Gemini Vision calls, bounded by max_workers and
+        # spaced by rate_limit_seconds.
+        results: Dict[int, Tuple[Any, float]] = {}
+        jobs = [
+            ChapterJob(index=index, chapter_id=item["illust_id"], payload=item)
+            for index, item in enumerate(items)
+            if item.get("dispatch")
+        ]
+        if jobs:
+            workers = min(self.max_workers, len(jobs))
+            logger.info(f"[PHASE 1.6] Analyzing {len(jobs)} illustration(s) with {workers} worker(s)")
+            self.genai_client  # create the shared client before fan-out
+            ChapterScheduler(max_workers=workers).run(
+                jobs,
+                self._run_analysis_job,
+                lambda job, outcome: results.__setitem__(job.index, outcome),
             )
-            start_time = time.time()
+
+        # Pass 3 (ordered): dedupe, identity lock validation and cache writes,
+        # exactly as a one-at-a-time run would make them.
+        for index, item in enumerate(items):
+            illust_id = item["illust_id"]
+            vision_input = item["vision_input"]
+            existing_entry = item.get("existing_entry")
+            if existing_entry is not None:
+                if vision_input is not None and existing_entry.get("status", "cached") == "cached":
+                    dedupe_index.add(vision_input, (illust_id, self._analysis_from_entry(existing_entry)))
+                continue
+
+            allowed_candidates = item["allowed_candidates"]
+            scene_multi_expected = item["scene_multi_expected"]
+            source_anchor = item["source_anchor"]
+            candidate_policy = item["candidate_policy"]
+            thinking_level_used = item["thinking_level"]
+            routing_reason = item["routing_reason"]
+            routing_features = item["routing_features"]
+            current_key = item["cache_key"]
+
+            # Reuse the analysis of the same art analyzed earlier in this volume
+            donor = None
+            if vision_input is not None:
+                donor = dedupe_index.match(vision_input)
 
             try:
-                analysis = self._analyze_illustration(
-                    img_path,
-                    prompt_override=scene_prompt,
-                    thinking_level_override=thinking_level_used,
-                )
-                elapsed = time.time() - start_time
+                if donor is not None:
+                    donor_id, analysis = donor
+                    elapsed = 0.0
+                    stats["deduplicated"] += 1
+                    logger.info(f"  [DEDUPE] {illust_id}: Same art as {donor_id}, reusing its analysis")
+                else:
+                    outcome = results.get(index)
+                    if outcome is None:
+                        # Planned reuse fell through (the earlier image failed): analyze now
+                        outcome = self._run_analysis_job(ChapterJob(index=index, chapter_id=illust_id, payload=item))
+                    analysis, elapsed = outcome
+                    if isinstance(analysis, Exception):
+                        raise analysis
+                    if vision_input is not None and analysis.get("status") == "cached":
+                        dedupe_index.add(vision_input, (illust_id, analysis))
 
                 visual_ground_truth = analysis.get("visual_ground_truth", {})
                 identity_resolution = analysis.get("identity_resolution", {})
@@ -1116,7 +1283,8 @@ class VisualAssetProcessor:
                     stats["blocked"] += 1
                     logger.warning(f"  [BLOCKED] {illust_id}: Safety filter ({elapsed:.1f}s)")
                 else:
-                    stats["generated"] += 1
+                    if donor is None:
+                        stats["generated"] += 1
                     logger.info(f"  [DONE] {illust_id}: Analysis complete ({elapsed:.1f}s, status={final_status})")
 
                 # Save to cache
@@ -1142,6 +1310,8 @@ class VisualAssetProcessor:
                     "source_anchor": source_anchor,
                     "multi_character_expected": multi_expected,
                     "validation": validation,
+                    "perceptual_hash": vision_input.phash_hex if vision_input is not None else None,
+                    "reused_from": donor[0] if donor is not None else None,
                 })
 
                 # Log thoughts
@@ -1174,9 +1344,6 @@ class VisualAssetProcessor:
                     },
                 })
 
-            # Rate limiting
-            time.sleep(self.rate_limit_seconds)
-
         # Save cache to disk
         self.cache_manager.save_cache()
         
@@ -1188,6 +1355,7 @@ class VisualAssetProcessor:
         logger.info(f"  Total: {stats['total']}")
         logger.info(f"  Cached (skipped): {stats['cached']}")
         logger.info(f"  Generated (new): {stats['generated']}")
+        logger.info(f"  Reused (duplicate art): {stats['deduplicated']}")
         logger.info(f"  Blocked/Error: {stats['blocked']}")
 
         return stats
@@ -1230,11 +1398,46 @@ class VisualAssetProcessor:
         except Exception as e:
             logger.warning(f"[PHASE 1.6] Failed to inject canon names: {e}")
 
+    def _wait_for_call_slot(self) -> None:
+        """Space Vision call starts at least rate_limit_seconds apart across workers."""
+        with self._call_slot_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_call_at)
+            self._next_call_at = start_at + self.rate_limit_seconds
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _run_analysis_job(self, job: ChapterJob) -> Tuple[Any, float]:
+        """
+        Pool worker: one Vision analysis.
+
+        Returns (analysis, elapsed_seconds); a failure is returned as the
+        exception in place of the analysis so pass 3 can record it in order.
+        """
+        item = job.payload
+        self._wait_for_call_slot()
+        logger.info(
+            f"  [ANALYZE] {item['illust_id']}: Running visual analysis "
+            f"(thinking={item['thinking_level']}, reason={item['routing_reason']})..."
+        )
+        start_time = time.time()
+        try:
+            analysis = self._analyze_illustration(
+                item["img_path"],
+                prompt_override=item["scene_prompt"],
+                thinking_level_override=item["thinking_level"],
+                vision_input=item["vision_input"],
+            )
+        except Exception as e:
+            return e, time.time() - start_time
+        return analysis, time.time() - start_time
+
     def _analyze_illustration(
         self,
         img_path: Path,
         prompt_override: str = "",
         thinking_level_override: Optional[str] = None,
+        vision_input: Optional[VisionInput] = None,
     ) -> Dict[str, Any]:
         """
         Analyze a single illustration using Gemini 3 Pro Vision + Thinking.
@@ -1247,11 +1450,17 @@ class VisualAssetProcessor:
         """
         from google.genai import types
 
-        # Load image
-        image_bytes = img_path.read_bytes()
-        mime_type = "image/jpeg"
-        if img_path.suffix.lower() == ".png":
-            mime_type = "image/png"
+        # Load image (downsampled for the model's input resolution when possible)
+        if vision_input is None:
+            vision_input = self._prepare_vision_input(img_path)
+        if vision_input is not None:
+            image_bytes = vision_input.data
+            mime_type = vision_input.mime_type
+        else:
+            image_bytes = img_path.read_bytes()
+            mime_type = "image/jpeg"
+            if img_path.suffix.lower() == ".png":
+                mime_type = "image/png"
 
         image_part = types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
 
@@ -0,0 +1,58 @@
+import random
+
+from PIL import Image, ImageDraw
+
+from modules.multimodal.vision_input import PerceptualIndex, hamming_distance, prepare_vision_input
+
+
+def _art(seed: int, size=(1400, 2000)) -> Image.Image:
+    rng = random.Random(seed)
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x, y = rng.randrange(size[0]), rng.randrange(size[1])
+        r = rng.randrange(50, 400)
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randrange(256) for _ in range(3)))
+    return image
+
+
+def _title_page(text_seed: int) -> Image.Image:
+    # Same frame, different "title" strokes: these share a 64-bit hash.
+    image = Image.new("RGB", (277, 2048), "white")
+    draw = ImageDraw.Draw(image)
+    draw.polygon([(120, 0), (277, 0), (277, 90)], fill="gray")
+    draw.polygon([(0, 1900), (140, 2048), (0, 2048)], fill="gray")
+    rng = random.Random(text_seed)
+    for y in range(300, 1300, 60):
+        draw.rectangle((110, y, 110 + rng.choice((30, 50)), y + 40), fill="black")
+    return image
+
+
+def test_downsample_and_reencode(tmp_path):
+    path = tmp_path / "kuchie-001.jpg"
+    _art(1).save(path, quality=98)
+
+    vision_input = prepare_vision_input(path, max_edge=1024, jpeg_quality=80)
+
+    assert vision_input.source_size == (1400, 2000)
+    assert max(vision_input.size) == 1024
+    assert vision_input.mime_type == "image/jpeg"
+    assert len(vision_input.data) < vision_input.source_bytes
+
+
+def test_index_matches_reused_art_only(tmp_path):
+    _art(1).save(tmp_path / "kuchie-001.jpg", quality=95)
+    _art(1).resize((700, 1000)).save(tmp_path / "illust-005.jpg", quality=60)
+    _art(2).save(tmp_path / "illust-006.jpg", quality=95)
+    _title_page(1).save(tmp_path / "P040.jpg")
+    _title_page(2).save(tmp_path / "P075.jpg")
+
+    index = PerceptualIndex()
+    for name in ("kuchie-001", "P040"):
+        index.add(prepare_vision_input(tmp_path / f"{name}.jpg"), name)
+
+    assert index.match(prepare_vision_input(tmp_path / "illust-005.jpg")) == "kuchie-001"
+    assert index.match(prepare_vision_input(tmp_path / "illust-006.jpg")) is None
+    title = prepare_vision_input(tmp_path / "P075.jpg")
+    assert hamming_distance(title.phash, prepare_vision_input(tmp_path / "P040.jpg").phash) <= index.max_distance
+    assert index.match(title) is None
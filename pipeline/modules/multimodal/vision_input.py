@@ -0,0 +1,156 @@
+"""
+Vision input preprocessing for Phase 1.6.
+
+Light novel illustrations ship as 1-4 MB scans well above the resolution
+Gemini Vision actually looks at. prepare_vision_input() downsamples each
+image so its long edge fits `max_edge`, re-encodes it (JPEG at
+`jpeg_quality`, PNG when the image has transparency) and computes a 64-bit
+difference hash plus a small grayscale thumbnail. PerceptualIndex matches
+hashes within a small Hamming distance and confirms each candidate on the
+thumbnails block by block (chapter title pages that differ only in their
+text share a hash), so the same art reused as kuchie, inline insert or
+omnibus act page is analyzed once.
+"""
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+from PIL import Image, ImageOps
+
+DEFAULT_MAX_EDGE = 1536
+DEFAULT_JPEG_QUALITY = 85
+DEFAULT_DEDUPE_DISTANCE = 6
+
+_HASH_SIZE = 8
+_THUMB_SIZE = 64
+_THUMB_BLOCK = 8
+# Max mean absolute grayscale difference of any 8x8 thumbnail block. Re-encoded
+# or rescaled copies stay under ~5; distinct pages with the same layout exceed 35.
+_MAX_BLOCK_DIFF = 12.0
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class VisionInput:
+    """Bytes to upload for one illustration, plus its perceptual hash."""
+    data: bytes
+    mime_type: str
+    size: Tuple[int, int]           # uploaded (width, height)
+    source_size: Tuple[int, int]    # original (width, height)
+    source_bytes: int
+    phash: int
+    thumbnail: bytes                # 64x64 grayscale pixels, for match verification
+
+    @property
+    def phash_hex(self) -> str:
+        return f"{self.phash:016x}"
+
+
+def perceptual_hash(image: Image.Image) -> int:
+    """64-bit difference hash (dHash) of an image."""
+    gray = image.convert("L").resize((_HASH_SIZE + 1, _HASH_SIZE), Image.LANCZOS)
+    pixels = gray.tobytes()
+    value = 0
+    for row in range(_HASH_SIZE):
+        offset = row * (_HASH_SIZE + 1)
+        for col in range(_HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def thumbnail_bytes(image: Image.Image) -> bytes:
+    return image.convert("L").resize((_THUMB_SIZE, _THUMB_SIZE), Image.LANCZOS).tobytes()
+
+
+def max_block_difference(a: bytes, b: bytes) -> float:
+    """Largest mean absolute difference over the 8x8 blocks of two thumbnails."""
+    worst = 0.0
+    area = _THUMB_BLOCK * _THUMB_BLOCK
+    for by in range(0, _THUMB_SIZE, _THUMB_BLOCK):
+        for bx in range(0, _THUMB_SIZE, _THUMB_BLOCK):
+            total = 0
+            for y in range(by, by + _THUMB_BLOCK):
+                row = y * _THUMB_SIZE
+                for x in range(row + bx, row + bx + _THUMB_BLOCK):
+                    total += abs(a[x] - b[x])
+            worst = max(worst, total / area)
+    return worst
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def prepare_vision_input(
+    img_path: Path,
+    max_edge: int = DEFAULT_MAX_EDGE,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+) -> VisionInput:
+    """
+    Downsample and re-encode an illustration for Gemini Vision.
+
+    Images already within `max_edge` keep their original bytes unless the
+    re-encoded version is smaller. `max_edge <= 0` disables downsampling.
+    """
+    img_path = Path(img_path)
+    original = img_path.read_bytes()
+    original_mime = "image/png" if img_path.suffix.lower() == ".png" else "image/jpeg"
+
+    with Image.open(io.BytesIO(original)) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+    source_size = image.size
+    phash = perceptual_hash(image)
+    thumbnail = thumbnail_bytes(image)
+
+    resized = False
+    if max_edge > 0 and max(image.size) > max_edge:
+        image = image.copy()
+        image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+        resized = True
+
+    buffer = io.BytesIO()
+    if _has_alpha(image):
+        image.convert("RGBA").save(buffer, format="PNG", optimize=True)
+        mime_type = "image/png"
+    else:
+        image.convert("RGB").save(buffer, format="JPEG", quality=int(jpeg_quality), optimize=True)
+        mime_type = "image/jpeg"
+    encoded = buffer.getvalue()
+
+    if not resized and len(original) <= len(encoded):
+        return VisionInput(original, original_mime, source_size, source_size, len(original), phash, thumbnail)
+    return VisionInput(encoded, mime_type, image.size, source_size, len(original), phash, thumbnail)
+
+
+class PerceptualIndex(Generic[T]):
+    """Linear-scan index of vision inputs (a volume has at most a few dozen images)."""
+
+    def __init__(self, max_distance: int = DEFAULT_DEDUPE_DISTANCE, max_block_diff: float = _MAX_BLOCK_DIFF):
+        self.max_distance = max_distance
+        self.max_block_diff = max_block_diff
+        self._entries: List[Tuple[VisionInput, T]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, vision_input: VisionInput, value: T) -> None:
+        self._entries.append((vision_input, value))
+
+    def match(self, vision_input: VisionInput) -> Optional[T]:
+        """Closest stored value that is the same picture (earliest added wins ties)."""
+        best: Optional[Tuple[float, T]] = None
+        for stored, value in self._entries:
+            if hamming_distance(stored.phash, vision_input.phash) > self.max_distance:
+                continue
+            diff = max_block_difference(stored.thumbnail, vision_input.thumbnail)
+            if diff <= self.max_block_diff and (best is None or diff < best[0]):
+                best = (diff, value)
+        return best[1] if best else None
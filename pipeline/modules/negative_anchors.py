@@ -0,0 +1,221 @@
+"""
+Negative Anchor Index for MTL Studio vector stores
+
+Negative anchors are example texts that look like a category's patterns but
+must NOT match it (false positives). A query close to a category's negative
+anchors gets its match score reduced for that category.
+
+All anchors of all categories are kept in one pre-normalized float32 matrix,
+with a contiguous row range per category, so the penalties for every query
+of a chapter come from a single matrix multiply. The matrix is persisted
+next to the Chroma index and reused while the anchor texts and embedding
+model are unchanged.
+
+Used by SinoVietnameseStore, EnglishPatternStore and VietnamesePatternStore.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "negative_anchors.npz"
+
+
+def anchor_fingerprint(texts_by_category: Dict[str, List[str]], model: str) -> str:
+    """Hash of the anchor texts and embedding model; changes invalidate the cache."""
+    payload = json.dumps({"model": model, "anchors": texts_by_category}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class NegativeAnchorIndex:
+    """
+    Per-category negative anchor rows in one normalized matrix.
+
+    `segments[category] = (start, end)` is the category's row range. The
+    index also reads like the old ``{category: [vector, ...]}`` cache.
+    """
+
+    def __init__(self, matrix: np.ndarray, segments: Dict[str, Tuple[int, int]], fingerprint: str = ""):
+        self.matrix = matrix
+        self.segments = segments
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def empty(cls) -> "NegativeAnchorIndex":
+        return cls(np.zeros((0, 0), dtype=np.float32), {})
+
+    # Read-only mapping view: category -> normalized anchor rows
+    def __contains__(self, category: str) -> bool:
+        return category in self.segments
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def __iter__(self):
+        return iter(self.segments)
+
+    def __getitem__(self, category: str) -> np.ndarray:
+        return self.category_matrix(category)
+
+    def keys(self):
+        return self.segments.keys()
+
+    def values(self):
+        return [self.category_matrix(c) for c in self.segments]
+
+    def items(self):
+        return [(c, self.category_matrix(c)) for c in self.segments]
+
+    @property
+    def total_vectors(self) -> int:
+        return int(self.matrix.shape[0])
+
+    def category_matrix(self, category: str) -> np.ndarray:
+        """Normalized anchor rows for one category (a view, no copy)."""
+        start, end = self.segments[category]
+        return self.matrix[start:end]
+
+    # ------------------------------------------------------------------
+    # Construction / persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_embeddings(
+        cls,
+        categories: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        fingerprint: str = "",
+    ) -> "NegativeAnchorIndex":
+        """Group (category, embedding) pairs into one normalized matrix; zero vectors are dropped."""
+        grouped: Dict[str, List[np.ndarray]] = {}
+        for category, embedding in zip(categories, embeddings):
+            vec = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(vec)
+            if norm == 0:
+                continue
+            grouped.setdefault(category, []).append(vec / norm)
+
+        if not grouped:
+            return cls.empty()
+
+        rows: List[np.ndarray] = []
+        segments: Dict[str, Tuple[int, int]] = {}
+        for category, vectors in grouped.items():
+            segments[category] = (len(rows), len(rows) + len(vectors))
+            rows.extend(vectors)
+        return cls(np.vstack(rows).astype(np.float32), segments, fingerprint)
+
+    @classmethod
+    def build(
+        cls,
+        texts_by_category: Dict[str, List[str]],
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        model: str,
+        cache_path: Optional[Path] = None,
+    ) -> "NegativeAnchorIndex":
+        """
+        Load the persisted index if it matches `texts_by_category`, otherwise
+        embed all anchors in one batch and persist the result.
+        """
+        fingerprint = anchor_fingerprint(texts_by_category, model)
+        if cache_path is not None:
+            cached = cls.load(cache_path)
+            if cached is not None and cached.fingerprint == fingerprint:
+                logger.debug(f"[NEG-ANCHOR] Loaded {cached.total_vectors} anchors from {cache_path}")
+                return cached
+
+        categories: List[str] = []
+        texts: List[str] = []
+        for category, anchor_texts in texts_by_category.items():
+            for text in anchor_texts:
+                categories.append(category)
+                texts.append(text)
+
+        index = cls.from_embeddings(categories, embed_fn(texts), fingerprint)
+        if cache_path is not None:
+            index.save(cache_path)
+        return index
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        names = list(self.segments)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp.npz")
+            np.savez(
+                tmp_path,
+                matrix=self.matrix,
+                categories=np.array(names, dtype=str),
+                bounds=np.array([self.segments[n] for n in names], dtype=np.int64).reshape(-1, 2),
+                fingerprint=np.array(self.fingerprint),
+            )
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"[NEG-ANCHOR] Could not persist anchor matrix to {path}: {e}")
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["NegativeAnchorIndex"]:
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                segments = {
+                    str(name): (int(start), int(end))
+                    for name, (start, end) in zip(data["categories"], data["bounds"])
+                }
+                return cls(data["matrix"].astype(np.float32), segments, str(data["fingerprint"]))
+        except Exception as e:
+            logger.warning(f"[NEG-ANCHOR] Ignoring unreadable anchor cache {path}: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def max_similarities(self, query_embeddings: Sequence[Sequence[float]]) -> Dict[str, np.ndarray]:
+        """
+        Highest cosine similarity of each query to each category's anchors.
+
+        Returns:
+            {category: array of shape (n_queries,)}, clamped at 0.0
+        """
+        if not self.segments or len(query_embeddings) == 0:
+            return {}
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        zero = norms[:, 0] == 0
+        queries = queries / np.where(norms == 0, 1.0, norms)
+
+        similarities = queries @ self.matrix.T  # (n_queries, n_anchors)
+        names = list(self.segments)
+        starts = np.array([self.segments[n][0] for n in names])
+        per_category = np.maximum.reduceat(similarities, starts, axis=1)
+        per_category = np.maximum(per_category, 0.0)
+        per_category[zero] = 0.0
+        return {name: per_category[:, i] for i, name in enumerate(names)}
+
+    def penalties(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        threshold: float,
+        max_penalty: float,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score penalty per query and category: 0 below `threshold`, rising
+        linearly to `max_penalty` at similarity 1.0.
+        """
+        penalties = {}
+        for category, sims in self.max_similarities(query_embeddings).items():
+            overshoot = (sims - threshold) / (1.0 - threshold)
+            penalties[category] = np.where(sims >= threshold, overshoot * max_penalty, 0.0)
+        return penalties
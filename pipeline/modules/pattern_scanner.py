@@ -0,0 +1,124 @@
+"""
+Compiled Multi-Regex Scanner
+
+The prose auditor, the translation auditor, the Anti-AI-ism agent and the
+Phase 2.5 fixer each check a chapter against dozens of IGNORECASE regexes,
+one pattern (and usually one line) at a time. PatternScanner compiles a
+pattern list once and derives the mandatory literal of every regex (see
+`indicator_matcher.required_literals`). Locating those literals in the
+case-folded chapter tells which regexes can match on which line; only those
+regexes are run, and only there, while regexes without a derivable literal
+run everywhere. A regex is only skipped where one of its mandatory literals
+cannot occur, so hits are those of running every regex on every line; any
+syntax the literal analysis does not understand makes the regex always run.
+
+Literals are located with str.find rather than an Aho–Corasick automaton: a
+pattern file has a few dozen literals, and a C-speed search per literal
+beats one pure-Python pass over the chapter.
+
+`get_pattern_scanner()` caches scanners by pattern list, so a pattern file
+is compiled once per process however many auditors load it.
+"""
+
+import bisect
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from modules.indicator_matcher import fold_case, required_literals
+
+
+class PatternScanner:
+    """
+    A fixed list of regexes, identified by their index in the constructor list.
+
+    Raises re.error if a pattern does not compile.
+    """
+
+    def __init__(self, patterns: Sequence[str], flags: int = re.IGNORECASE):
+        self.patterns: List[str] = list(patterns)
+        self.compiled: List["re.Pattern"] = [re.compile(p, flags) for p in self.patterns]
+
+        always_run: List[int] = []
+        trigger_owners: Dict[str, Set[int]] = {}
+        for idx, compiled in enumerate(self.compiled):
+            triggers = None
+            if not compiled.flags & re.VERBOSE:
+                triggers = required_literals(compiled.pattern, folded=True)
+            if not triggers or any("\n" in t for t in triggers):
+                always_run.append(idx)
+                continue
+            for trigger in triggers:
+                trigger_owners.setdefault(trigger, set()).add(idx)
+
+        self.always_run: Tuple[int, ...] = tuple(always_run)
+        self.triggers = list(trigger_owners)
+        self._owners = [frozenset(trigger_owners[t]) for t in self.triggers]
+
+    def __len__(self) -> int:
+        return len(self.compiled)
+
+    def candidates(self, text: str) -> List[int]:
+        """Sorted indices of the patterns that may match somewhere in `text`."""
+        folded = fold_case(text)
+        found = set(self.always_run)
+        for trigger, owners in zip(self.triggers, self._owners):
+            if trigger in folded:
+                found |= owners
+        return sorted(found)
+
+    def candidates_by_line(self, lines: Sequence[str]) -> List[List[int]]:
+        """For each line, sorted indices of the patterns that may match on it."""
+        line_starts = []
+        pos = 0
+        for line in lines:
+            line_starts.append(pos)
+            pos += len(line) + 1
+
+        folded = fold_case("\n".join(lines))
+        found: List[Set[int]] = [set() for _ in lines]
+        for trigger, owners in zip(self.triggers, self._owners):
+            pos = folded.find(trigger)
+            while pos >= 0:
+                line_idx = bisect.bisect_right(line_starts, pos) - 1
+                found[line_idx] |= owners
+                # Skip to the next line: one occurrence per line is enough
+                next_line = line_idx + 1
+                if next_line >= len(line_starts):
+                    break
+                pos = folded.find(trigger, line_starts[next_line])
+        if self.always_run:
+            for line_found in found:
+                line_found.update(self.always_run)
+        return [sorted(line_found) for line_found in found]
+
+    def scan(self, text: str) -> List[Tuple[int, "re.Match"]]:
+        """Every match in `text` as (pattern_index, match), by pattern then position."""
+        return [
+            (idx, match)
+            for idx in self.candidates(text)
+            for match in self.compiled[idx].finditer(text)
+        ]
+
+    def scan_lines(self, lines: Sequence[str]) -> List[Tuple[int, int, "re.Match"]]:
+        """
+        Every match with each line searched on its own, as
+        (line_index, pattern_index, match) by line, pattern, then position.
+        """
+        hits = []
+        for line_idx, candidates in enumerate(self.candidates_by_line(lines)):
+            line = lines[line_idx]
+            for idx in candidates:
+                for match in self.compiled[idx].finditer(line):
+                    hits.append((line_idx, idx, match))
+        return hits
+
+
+@lru_cache(maxsize=32)
+def _cached_scanner(patterns: Tuple[str, ...], flags: int) -> PatternScanner:
+    return PatternScanner(patterns, flags)
+
+
+def get_pattern_scanner(patterns: Iterable[str], flags: int = re.IGNORECASE) -> PatternScanner:
+    """Shared scanner for a pattern list, compiled on first use."""
+    return _cached_scanner(tuple(patterns), flags)
@@ -24,17 +24,83 @@ This module provides:
 
 import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
 import numpy as np
 
 from modules.vector_search import PatternVectorStore
+from modules.compiled_corpus import CompiledCorpus, load_corpus
+from modules.negative_anchors import CACHE_FILENAME as NEGATIVE_ANCHOR_CACHE, NegativeAnchorIndex
 from modules.pinyin_helper import enhance_query_with_pinyin, enhance_document_with_pinyin, get_pinyin
 
 logger = logging.getLogger(__name__)
 
 
+def _direct_lookup_entry(pattern: Dict, cat_name: str) -> Dict:
+    """Direct lookup entry for one RAG pattern."""
+    # Extract context indicators for context-aware matching
+    zh_indicators = []
+    contexts = pattern.get("contexts", [])
+    if contexts:
+        for ctx in contexts:
+            zh_indicators.extend(ctx.get("zh_indicators", []))
+    
+    entry = {
+        "hanzi": pattern.get("hanzi", ""),
+        "vn": pattern.get("primary_reading", ""),
+        "avoid": "",
+        "meaning": cat_name,
+        "score": 1.0,
+        "category": cat_name,
+        "zh_indicators": zh_indicators
+    }
+    
+    # Get avoid from contexts if available
+    if contexts:
+        avoids = contexts[0].get("avoid", [])
+        if avoids:
+            entry["avoid"] = avoids[0] if isinstance(avoids, list) else avoids
+    return entry
+
+
+class _CorpusDirectLookup(Mapping):
+    """
+    Direct lookup backed by the compiled RAG corpus.
+    
+    Only the hanzi index is read up front; a pattern record is decoded the
+    first time its hanzi is looked up.
+    """
+    
+    def __init__(self, corpus: CompiledCorpus):
+        self._corpus = corpus
+        self._positions: Dict[str, Tuple[int, str]] = {}
+        self._entries: Dict[str, Dict] = {}
+        for hanzi in corpus.keys("hanzi"):
+            for i in corpus.ids("hanzi", hanzi):
+                section, category = corpus.location(i)
+                if section == "pattern_categories":
+                    self._positions[hanzi] = (i, category)
+                    break
+    
+    def __getitem__(self, hanzi: str) -> Dict:
+        entry = self._entries.get(hanzi)
+        if entry is None:
+            i, category = self._positions[hanzi]
+            entry = self._entries[hanzi] = _direct_lookup_entry(self._corpus.record(i), category)
+        return entry
+    
+    def __contains__(self, hanzi: object) -> bool:
+        return hanzi in self._positions
+    
+    def __iter__(self):
+        return iter(self._positions)
+    
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
 class SinoVietnameseStore:
     """
     Specialized vector store for Sino-Vietnamese disambiguation.
@@ -102,12 +168,16 @@ class SinoVietnameseStore:
         # Cache for loaded RAG data
         self._rag_cache: Optional[Dict] = None
         
-        # Negative anchor cache: {category: [np.array(embedding), ...]}
-        # Lazily built on first get_bulk_guidance() call
-        self._negative_anchor_cache: Optional[Dict[str, List[np.ndarray]]] = None
+        # Compiled (memory-mapped) form of the RAG file, if built and fresh
+        self._corpus: Optional[CompiledCorpus] = None
+        self._corpus_checked = False
+        
+        # Negative anchors: one normalized matrix, row range per category.
+        # Lazily built on first get_bulk_guidance() call, persisted next to Chroma.
+        self._negative_anchor_cache: Optional[NegativeAnchorIndex] = None
         
         # Direct lookup cache (built lazily)
-        self._direct_lookup_cache: Optional[Dict[str, Dict]] = None
+        self._direct_lookup_cache: Optional[Mapping] = None
         
         # Index statistics
         self._stats = {
@@ -151,6 +221,26 @@ class SinoVietnameseStore:
         logger.info(f"Loaded RAG data from {self.rag_file_path}")
         return self._rag_cache
     
+    def _compiled_corpus(self) -> Optional[CompiledCorpus]:
+        """
+        Compiled RAG corpus (see modules.compiled_corpus), or None if it has
+        not been built or is older than the JSON.
+        """
+        if not self._corpus_checked:
+            self._corpus_checked = True
+            if self._rag_cache is None:
+                self._corpus = load_corpus(self.rag_file_path)
+                if self._corpus is not None:
+                    logger.info(f"[SINO-VN] Using compiled corpus {self._corpus.path.name}")
+        return self._corpus
+    
+    def _rag_section(self, key: str) -> Any:
+        """One top-level non-pattern section of the RAG data."""
+        corpus = self._compiled_corpus()
+        if corpus is not None:
+            return corpus.meta.get(key)
+        return self.load_rag_data().get(key)
+    
     def build_index(self, force_rebuild: bool = False) -> Dict[str, int]:
         """
         Build vector index from sino_vietnamese_rag_v2.json.
@@ -351,62 +441,70 @@ class SinoVietnameseStore:
     # NEGATIVE ANCHOR SYSTEM (v2)
     # ========================================================================
     
-    def _build_negative_anchor_cache(self) -> Dict[str, List[np.ndarray]]:
+    def _build_negative_anchor_cache(self) -> NegativeAnchorIndex:
         """
         Build and cache negative anchor embeddings from RAG v2 JSON.
         
         Reads negative_vectors from the top-level key in the v2 schema.
-        Called lazily on first get_bulk_guidance() invocation.
+        Called lazily on first get_bulk_guidance() invocation. The
+        normalized anchor matrix is persisted in persist_directory and only
+        re-embedded when the anchor texts change.
         
         Returns:
-            Dict mapping category name to list of numpy embedding arrays
+            NegativeAnchorIndex with one row range per category
         """
         if self._negative_anchor_cache is not None:
             return self._negative_anchor_cache
         
-        rag_data = self.load_rag_data()
-        negative_vectors = rag_data.get("negative_vectors", {})
+        negative_vectors = self._rag_section("negative_vectors") or {}
         
         if not negative_vectors:
             logger.info("[SINO-VN] No negative_vectors found in RAG v2 data")
-            self._negative_anchor_cache = {}
+            self._negative_anchor_cache = NegativeAnchorIndex.empty()
             return self._negative_anchor_cache
         
-        # Collect all negative texts for batch embedding
-        all_texts = []
-        text_to_category_map = []  # (category, index_in_category)
-        
+        # Collect all negative texts per category
+        texts_by_category: Dict[str, List[str]] = {}
         for cat_name, vectors in negative_vectors.items():
-            for i, vec_data in enumerate(vectors):
+            for vec_data in vectors:
                 text = vec_data.get("text", "") if isinstance(vec_data, dict) else str(vec_data)
                 if text:
-                    all_texts.append(text)
-                    text_to_category_map.append((cat_name, i))
+                    texts_by_category.setdefault(cat_name, []).append(text)
         
-        if not all_texts:
-            self._negative_anchor_cache = {}
+        if not texts_by_category:
+            self._negative_anchor_cache = NegativeAnchorIndex.empty()
             return self._negative_anchor_cache
         
-        logger.info(f"[SINO-VN] Embedding {len(all_texts)} negative anchors across {len(negative_vectors)} categories...")
+        total = sum(len(texts) for texts in texts_by_category.values())
+        logger.info(f"[SINO-VN] Loading {total} negative anchors across {len(texts_by_category)} categories...")
         
         try:
-            embeddings = self.vector_store.embed_texts_batch(all_texts)
+            index = NegativeAnchorIndex.build(
+                texts_by_category,
+                self.vector_store.embed_texts_batch,
+                model=self.vector_store._embedding_model,
+                cache_path=Path(self.persist_directory) / NEGATIVE_ANCHOR_CACHE,
+            )
         except Exception as e:
             logger.warning(f"[SINO-VN] Failed to embed negative anchors: {e}")
-            self._negative_anchor_cache = {}
+            self._negative_anchor_cache = NegativeAnchorIndex.empty()
             return self._negative_anchor_cache
         
-        # Organize into cache
-        cache: Dict[str, List[np.ndarray]] = {}
-        for (cat_name, _), embedding in zip(text_to_category_map, embeddings):
-            if cat_name not in cache:
-                cache[cat_name] = []
-            cache[cat_name].append(np.array(embedding, dtype=np.float32))
-        
-        self._negative_anchor_cache = cache
-        logger.info(f"[SINO-VN] Negative anchor cache built: {len(cache)} categories, {len(all_texts)} vectors")
+        self._negative_anchor_cache = index
+        logger.info(f"[SINO-VN] Negative anchor cache built: {len(index)} categories, {index.total_vectors} vectors")
         return self._negative_anchor_cache
     
+    def _compute_negative_penalties(self, query_embeddings: List[List[float]]) -> Dict[str, np.ndarray]:
+        """
+        Negative anchor penalties for many queries at once.
+        
+        Returns:
+            {category: penalty per query}; categories without anchors are absent
+        """
+        return self._build_negative_anchor_cache().penalties(
+            query_embeddings, self.NEGATIVE_ANCHOR_THRESHOLD, self.NEGATIVE_ANCHOR_PENALTY
+        )
+    
     def _compute_negative_penalty(
         self,
         query_embedding: List[float],
@@ -425,52 +523,33 @@ class SinoVietnameseStore:
         Returns:
             Penalty value (0.0 = no penalty, up to NEGATIVE_ANCHOR_PENALTY)
         """
-        cache = self._build_negative_anchor_cache()
-        
-        if category not in cache:
+        penalties = self._compute_negative_penalties([query_embedding])
+        if category not in penalties:
             return 0.0
-        
-        query_vec = np.array(query_embedding, dtype=np.float32)
-        query_norm = np.linalg.norm(query_vec)
-        if query_norm == 0:
-            return 0.0
-        query_vec = query_vec / query_norm
-        
-        max_neg_similarity = 0.0
-        for neg_vec in cache[category]:
-            neg_norm = np.linalg.norm(neg_vec)
-            if neg_norm == 0:
-                continue
-            cos_sim = float(np.dot(query_vec, neg_vec / neg_norm))
-            if cos_sim > max_neg_similarity:
-                max_neg_similarity = cos_sim
-        
-        # If max negative similarity exceeds threshold, apply proportional penalty
-        if max_neg_similarity >= self.NEGATIVE_ANCHOR_THRESHOLD:
-            overshoot = (max_neg_similarity - self.NEGATIVE_ANCHOR_THRESHOLD) / (1.0 - self.NEGATIVE_ANCHOR_THRESHOLD)
-            penalty = overshoot * self.NEGATIVE_ANCHOR_PENALTY
-            logger.debug(
-                f"[NEG-ANCHOR] {category}: neg_sim={max_neg_similarity:.3f} penalty={penalty:.3f}"
-            )
-            return penalty
-        
-        return 0.0
+        return float(penalties[category][0])
     
     # ========================================================================
     # DIRECT LOOKUP CACHE (v2)
     # ========================================================================
     
-    def _build_direct_lookup(self) -> Dict[str, Dict]:
+    def _build_direct_lookup(self) -> Mapping:
         """
         Build direct lookup index from RAG data for O(1) exact hanzi matching.
-        Caches result for reuse across calls.
+        Caches result for reuse across calls. With a compiled corpus, patterns
+        are decoded on demand instead of parsing the whole JSON.
         
         Returns:
-            Dict mapping hanzi string to lookup data dict
+            Mapping of hanzi string to lookup data dict
         """
         if self._direct_lookup_cache is not None:
             return self._direct_lookup_cache
         
+        corpus = self._compiled_corpus()
+        if corpus is not None:
+            self._direct_lookup_cache = _CorpusDirectLookup(corpus)
+            logger.info(f"[SINO-VN] Direct lookup index mapped: {len(self._direct_lookup_cache)} entries")
+            return self._direct_lookup_cache
+        
         rag_data = self.load_rag_data()
         direct_lookup = {}
         
@@ -479,34 +558,20 @@ class SinoVietnameseStore:
                 hanzi = pattern.get("hanzi", "")
                 if not hanzi or hanzi in direct_lookup:
                     continue
-                
-                # Extract context indicators for context-aware matching
-                zh_indicators = []
-                contexts = pattern.get("contexts", [])
-                if contexts:
-                    for ctx in contexts:
-                        zh_indicators.extend(ctx.get("zh_indicators", []))
-                
-                direct_lookup[hanzi] = {
-                    "hanzi": hanzi,
-                    "vn": pattern.get("primary_reading", ""),
-                    "avoid": "",
-                    "meaning": cat_name,
-                    "score": 1.0,
-                    "category": cat_name,
-                    "zh_indicators": zh_indicators
-                }
-                
-                # Get avoid from contexts if available
-                if contexts:
-                    avoids = contexts[0].get("avoid", [])
-                    if avoids:
-                        direct_lookup[hanzi]["avoid"] = avoids[0] if isinstance(avoids, list) else avoids
+                direct_lookup[hanzi] = _direct_lookup_entry(pattern, cat_name)
         
         self._direct_lookup_cache = direct_lookup
         logger.info(f"[SINO-VN] Direct lookup cache built: {len(direct_lookup)} entries")
         return self._direct_lookup_cache
     
+    def warm(self) -> None:
+        """
+        Build the lazy caches (direct lookup, negative anchors) up front, so
+        later get_bulk_guidance() calls only read them.
+        """
+        self._build_direct_lookup()
+        self._build_negative_anchor_cache()
+    
     # ========================================================================
     # QUERY METHODS
     # ========================================================================
@@ -787,29 +852,30 @@ class SinoVietnameseStore:
                 logger.warning(f"[SINO-VN] Batch embedding failed, falling back to sequential: {e}")
                 query_embeddings = [self.vector_store.embed_text(q) for q in queries]
             
-            # Pre-build negative anchor cache (lazy, only on first call)
-            self._build_negative_anchor_cache()
+            # Negative anchor penalties for all queries: one matrix multiply
+            neg_penalties = self._compute_negative_penalties(query_embeddings)
             
-            # Search ChromaDB with pre-computed embeddings
-            for idx, (embedding, term) in enumerate(zip(query_embeddings, query_term_map)):
-                results = self.vector_store.collection.query(
-                    query_embeddings=[embedding],
-                    n_results=max_per_term
-                )
-                
-                if not results['ids'] or not results['ids'][0]:
+            # Search ChromaDB with pre-computed embeddings (one batched query)
+            all_results = self.vector_store.collection.query(
+                query_embeddings=query_embeddings,
+                n_results=max_per_term
+            )
+            
+            for idx, term in enumerate(query_term_map):
+                ids = all_results['ids'][idx] if all_results['ids'] else []
+                if not ids:
                     bulk_guidance["lookup_stats"]["not_found"] += 1
                     continue
                 
                 found_match = False
-                for i in range(len(results['ids'][0])):
-                    distance = results['distances'][0][i] if results['distances'] else 0
+                for i in range(len(ids)):
+                    distance = all_results['distances'][idx][i] if all_results['distances'] else 0
                     raw_similarity = 1 - distance
-                    metadata = results['metadatas'][0][i] if results['metadatas'] else {}
+                    metadata = all_results['metadatas'][idx][i] if all_results['metadatas'] else {}
                     
                     # Apply negative anchor penalty
                     category = metadata.get("category", "")
-                    neg_penalty = self._compute_negative_penalty(embedding, category)
+                    neg_penalty = float(neg_penalties[category][idx]) if category in neg_penalties else 0.0
                     if neg_penalty > 0:
                         bulk_guidance["lookup_stats"]["neg_penalties_applied"] += 1
                     
@@ -0,0 +1,79 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from modules.compiled_corpus import compile_corpus, load_corpus
+from modules.sino_vietnamese_store import _CorpusDirectLookup, _direct_lookup_entry
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@pytest.mark.parametrize("name", [
+    "sino_vietnamese_rag_v2.json",
+    "japanese_patterns_auto.json",
+    "emotion_action_corpus.json",
+])
+def test_compiled_corpus_round_trips_source(tmp_path, name):
+    source = CONFIG_DIR / name
+    corpus = load_corpus(source, compile_corpus(source, tmp_path / "c.mtlc"))
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+
+    assert corpus is not None
+    assert corpus.to_dict() == data
+    corpus.close()
+
+
+def test_indexes_fetch_individual_records(tmp_path):
+    source = tmp_path / "rag.json"
+    source.write_text(json.dumps({
+        "version": "2",
+        "pattern_categories": {
+            "a": {"description": "A", "patterns": [{"id": "p1", "hanzi": "修真"}, {"id": "p2", "hanzi": "道"}]},
+            "b": {"description": "B", "patterns": [{"id": "p3", "hanzi": "道"}]},
+        },
+        "negative_vectors": {"a": [{"text": "x"}]},
+    }), encoding="utf-8")
+    corpus = load_corpus(source, compile_corpus(source, tmp_path / "rag.mtlc"))
+
+    assert corpus.get("p3") == {"id": "p3", "hanzi": "道"}
+    assert [r["id"] for r in corpus.by_hanzi("道")] == ["p2", "p3"]
+    assert [r["id"] for r in corpus.by_category("a")] == ["p1", "p2"]
+    assert corpus.location(2) == ("pattern_categories", "b")
+    assert corpus.meta["negative_vectors"] == {"a": [{"text": "x"}]}
+    assert corpus.meta["pattern_categories"]["a"]["description"] == "A"
+    corpus.close()
+
+
+def test_stale_compiled_corpus_is_ignored(tmp_path):
+    source = tmp_path / "c.json"
+    source.write_text('{"patterns": [{"jp_text": "a"}]}', encoding="utf-8")
+    compiled = compile_corpus(source, tmp_path / "c.mtlc")
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))  # touched, same content
+    assert load_corpus(source, compiled) is not None
+
+    source.write_text('{"patterns": [{"jp_text": "b"}]}', encoding="utf-8")
+    assert load_corpus(source, compiled) is None
+    assert load_corpus(source, tmp_path / "missing.mtlc") is None
+
+
+def test_corpus_direct_lookup_matches_json_lookup(tmp_path):
+    source = CONFIG_DIR / "sino_vietnamese_rag_v2.json"
+    corpus = load_corpus(source, compile_corpus(source, tmp_path / "rag.mtlc"))
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+
+    expected = {}
+    for cat_name, cat_data in data["pattern_categories"].items():
+        for pattern in cat_data["patterns"]:
+            if pattern.get("hanzi") and pattern["hanzi"] not in expected:
+                expected[pattern["hanzi"]] = _direct_lookup_entry(pattern, cat_name)
+
+    lookup = _CorpusDirectLookup(corpus)
+    assert set(lookup) == set(expected)
+    assert all(lookup[hanzi] == entry for hanzi, entry in expected.items())
+    corpus.close()
@@ -0,0 +1,50 @@
+import pytest
+
+from modules.embedding_cache import EmbeddingCache, cache_key
+
+
+def _vector(seed, dim=4):
+    return [float(seed + i) for i in range(dim)]
+
+
+def test_embed_requests_only_misses_and_normalizes_keys(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    calls = []
+
+    def embed_fn(texts):
+        calls.append(list(texts))
+        return [_vector(len(t)) for t in texts]
+
+    first = cache.embed("m", ["alpha", "beta", "alpha"], embed_fn)
+    second = cache.embed("m", ["  alpha ", "gamma", "beta"], embed_fn)
+
+    assert calls == [["alpha", "beta"], ["gamma"]]
+    assert first[0] == first[2] == second[0] == _vector(5)
+    assert second[2] == _vector(4)
+    assert cache_key("m", "a  b") == cache_key("m", "a b") != cache_key("other", "a b")
+
+
+def test_vectors_persist_across_instances(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    cache.put_many("m", ["x", "y"], [_vector(1), _vector(2)])
+    cache.close()
+
+    reopened = EmbeddingCache(tmp_path)
+    assert reopened.get_many("m", ["y", "x", "z"]) == [_vector(2), _vector(1), None]
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    dim = 64 * 1024  # 256 KiB per row -> 4 rows in 1 MB
+    cache = EmbeddingCache(tmp_path, max_mb=1)
+    assert cache.capacity(dim) == 4
+
+    texts = [f"t{i}" for i in range(4)]
+    cache.put_many("m", texts, [[float(i)] * dim for i in range(4)])
+    cache.get_many("m", ["t0"])  # t1 is now least recently used
+    cache.put_many("m", ["t4"], [[4.0] * dim])
+
+    hits = cache.get_many("m", texts + ["t4"])
+    assert [h is not None for h in hits] == [True, False, True, True, True]
+    assert hits[4][0] == pytest.approx(4.0)
+    assert cache.stats()["entries"] == 4
+    assert (tmp_path / f"vectors_{dim}.f32").stat().st_size <= 1024 * 1024
@@ -0,0 +1,45 @@
+import random
+from difflib import SequenceMatcher
+
+from modules.fuzzy_name_index import FuzzyNameIndex, levenshtein
+
+NAMES = ["amamiya", "amamia", "kazuto", "kazuya", "kotone", "ren", "shirasaki", "shiroyama", ""]
+
+
+def _naive_levenshtein(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        curr = [i]
+        for j, cb in enumerate(b, start=1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = curr
+    return prev[-1]
+
+
+def test_levenshtein_matches_dynamic_programming():
+    rng = random.Random(0)
+    for _ in range(2000):
+        a = "".join(rng.choice("abc") for _ in range(rng.randrange(12)))
+        b = "".join(rng.choice("abc") for _ in range(rng.randrange(70)))
+        assert levenshtein(a, b) == _naive_levenshtein(a, b)
+
+
+def test_within_returns_insertion_order():
+    index = FuzzyNameIndex(NAMES)
+
+    assert index.within("kazuto", 2) == [("kazuto", 0), ("kazuya", 2)]
+    assert index.within("kotone", 2) == [("kotone", 0)]
+    assert index.within("amamiya", 1) == [("amamiya", 0), ("amamia", 1)]
+
+
+def test_closest_by_ratio_matches_sequence_matcher_scan():
+    index = FuzzyNameIndex(NAMES)
+
+    for query in ("kazuta", "amamya", "shirosaki", "rena", "because", "kotonee"):
+        best_name, best_score = None, 0.0
+        for name in NAMES:
+            score = SequenceMatcher(None, query, name).ratio()
+            if score > best_score:
+                best_name, best_score = name, score
+        expected = (best_name, best_score) if best_score >= 0.82 else (None, 0.0)
+        assert index.closest_by_ratio(query, 0.82) == expected
@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+
+from modules.guidance_service import GuidanceService
+
+
+class _FakeStore:
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.warm_calls = 0
+
+    def warm(self):
+        self.warm_calls += 1
+
+    def get_bulk_guidance(self, terms):
+        return {"high_confidence": list(terms), "warm_calls": self.warm_calls}
+
+
+def test_store_is_built_and_warmed_once_across_threads():
+    _FakeStore.created = 0
+    service = GuidanceService({"fake": _FakeStore})
+    results = []
+
+    def query():
+        results.append(service.get_bulk_guidance("fake", terms=["意外"]))
+
+    threads = [threading.Thread(target=query) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _FakeStore.created == 1
+    assert results == [{"high_confidence": ["意外"], "warm_calls": 1}] * 16
+
+
+def test_failed_store_is_not_retried():
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise OSError("chroma locked")
+
+    service = GuidanceService({"broken": broken, "fake": _FakeStore})
+
+    assert service.warm(["broken", "fake"]) == {"broken": False, "fake": True}
+    with pytest.raises(RuntimeError, match="chroma locked"):
+        service.get_bulk_guidance("broken", terms=[])
+    assert len(calls) == 1
+    with pytest.raises(ValueError):
+        service.store("missing")
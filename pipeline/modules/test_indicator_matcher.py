@@ -0,0 +1,93 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from modules.english_grammar_rag import EnglishGrammarRAG
+from modules.grammar_pattern_detector import GRAMMAR_INDICATORS, detect_grammar_patterns
+from modules.indicator_matcher import AhoCorasick, IndicatorIndex, required_literals
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+SAMPLE = """真理亜は変だが、如月さんも結構変だ。
+それはともかく、今日の授業はどうだった？
+彼女は美しいだけでなく、頭もいい。
+歩くどころか、立つこともできない。
+うん、やっぱりそうだよね。なんか気がするんだ。
+「ドキドキするって言ったじゃない？」と彼女はニヤリと笑った。
+まあ、とりあえず行ってみるしかないかな。"""
+
+
+def test_automaton_finds_overlapping_occurrences():
+    ac = AhoCorasick(["he", "she", "hers", "his"])
+    found = sorted((start, end, ac.keywords[idx]) for start, end, idx in ac.iter_matches("ushers"))
+    assert found == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_required_literals_cover_every_regex_match():
+    for indicators in GRAMMAR_INDICATORS.values():
+        for pattern_regex, _ in indicators:
+            triggers = required_literals(pattern_regex)
+            assert triggers, pattern_regex
+            for match in re.finditer(pattern_regex, SAMPLE):
+                assert any(t in match.group(0) for t in triggers), pattern_regex
+    assert required_literals(r"あ(い|う)?") == ["あ"]
+    assert required_literals(r"abc") is None  # cased: IGNORECASE is not literal
+    assert required_literals(r"あ?") is None
+
+
+@pytest.mark.parametrize("pattern, text", [
+    (r"\x41bc", "Abc"),
+    (r"\u3042いう", "あいう"),
+    (r"\N{HIRAGANA LETTER A}いう", "あいう"),
+    (r"\101bcd", "Abcd"),
+    (r"(a)\1bcd", "aabcd"),
+    (r"[\]x]abc", "]abc"),
+    (r"[]x]abc|def", "]abc"),
+    (r"(a[)]b)cd", "a)bcd"),
+])
+def test_required_literals_never_miss_a_regex_match(pattern, text):
+    assert re.search(pattern, text)
+    triggers = required_literals(pattern, folded=True)
+    assert triggers is None or any(t in text.lower() for t in triggers), triggers
+
+
+def _naive_detect(text):
+    patterns = []
+    for line_num, line in enumerate(text.split("\n"), start=1):
+        if not line.strip() or len(line.strip()) < 3:
+            continue
+        for category, indicators in GRAMMAR_INDICATORS.items():
+            for pattern_regex, name in indicators:
+                for match in re.finditer(pattern_regex, line, re.IGNORECASE):
+                    patterns.append((line_num, category, name, match.start(), match.end()))
+    return patterns
+
+
+def test_detect_grammar_patterns_matches_per_line_regex_scan():
+    detected = detect_grammar_patterns(SAMPLE, top_n=10_000)
+    naive = _naive_detect(SAMPLE)
+    assert len(detected) == len(naive)
+    assert sorted(
+        (p["line_number"], p["category"], p["indicator"], p["match_start"], p["match_end"])
+        for p in detected
+    ) == sorted(naive)
+
+
+@pytest.mark.parametrize("config_name", [
+    "english_grammar_rag_compressed.json",
+    "vietnamese_grammar_rag_v2.json",
+])
+def test_rag_detect_patterns_matches_substring_scan(config_name):
+    rag = EnglishGrammarRAG(str(CONFIG_DIR / config_name))
+    expected = [
+        (i, [ind for ind in p.get("japanese_indicators", []) if ind in SAMPLE])
+        for i, p in enumerate(rag.patterns)
+    ]
+    expected = [(i, inds) for i, inds in expected if inds]
+
+    index = IndicatorIndex([p.get("japanese_indicators", []) for p in rag.patterns])
+    assert index.detect(SAMPLE) == expected
+    assert {m["pattern"]["id"] for m in rag.detect_patterns(SAMPLE)} == {
+        rag.patterns[i]["id"] for i, _ in expected
+    }
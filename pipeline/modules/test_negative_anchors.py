@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from modules.negative_anchors import NegativeAnchorIndex
+
+
+def _loop_penalty(query, anchors, threshold, max_penalty):
+    """Reference: the original per-anchor Python loop."""
+    query = np.asarray(query, dtype=np.float32)
+    query = query / np.linalg.norm(query)
+    best = 0.0
+    for anchor in anchors:
+        anchor = np.asarray(anchor, dtype=np.float32)
+        best = max(best, float(np.dot(query, anchor / np.linalg.norm(anchor))))
+    if best < threshold:
+        return 0.0
+    return (best - threshold) / (1.0 - threshold) * max_penalty
+
+
+def test_batch_penalties_match_per_query_loop():
+    rng = np.random.default_rng(7)
+    anchors = {"a": rng.normal(size=(3, 8)), "b": rng.normal(size=(5, 8))}
+    queries = np.vstack([rng.normal(size=(6, 8)), anchors["a"][1] * 2.0, anchors["b"][4] + 0.05])
+
+    categories = [c for c, rows in anchors.items() for _ in rows]
+    embeddings = [row for rows in anchors.values() for row in rows]
+    index = NegativeAnchorIndex.from_embeddings(categories, embeddings)
+
+    penalties = index.penalties(queries.tolist(), threshold=0.72, max_penalty=0.15)
+
+    for category, rows in anchors.items():
+        expected = [_loop_penalty(q, rows, 0.72, 0.15) for q in queries]
+        assert penalties[category] == pytest.approx(expected, abs=1e-5)
+    assert penalties["a"][6] == pytest.approx(0.15, abs=1e-5)
+
+
+def test_build_persists_and_reuses_matrix(tmp_path):
+    calls = []
+
+    def embed_fn(texts):
+        calls.append(list(texts))
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+    anchors = {"x": ["one", "three"], "y": ["fifteen"]}
+    path = tmp_path / "negative_anchors.npz"
+
+    first = NegativeAnchorIndex.build(anchors, embed_fn, model="m", cache_path=path)
+    second = NegativeAnchorIndex.build(anchors, embed_fn, model="m", cache_path=path)
+    NegativeAnchorIndex.build({"x": ["changed"]}, embed_fn, model="m", cache_path=path)
+
+    assert len(calls) == 2
+    assert second.segments == first.segments == {"x": (0, 2), "y": (2, 3)}
+    assert np.allclose(second.matrix, first.matrix)
+    assert np.allclose(np.linalg.norm(second.matrix, axis=1), 1.0)
@@ -0,0 +1,70 @@
+import json
+import re
+from pathlib import Path
+
+from modules.indicator_matcher import fold_case, required_literals
+from modules.pattern_scanner import PatternScanner, get_pattern_scanner
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+SAMPLE = """# Chapter 1
+I couldn't help but smile. A Sense of dread crept in.
+She felt a sense of relief, a sense of purpose.
+Kindly, it cannot be helped. Needleſs to say, as expected of her.
+Một cách nhẹ nhàng, tôi được khen bởi cô ấy.
+İt cannot be helped
+"""
+
+
+def _anti_ai_ism_regexes():
+    data = json.loads((CONFIG_DIR / "anti_ai_ism_patterns.json").read_text(encoding="utf-8"))
+    regexes = []
+    for severity in ("CRITICAL", "MAJOR", "MINOR", "VIETNAMESE_CRITICAL"):
+        tier = data.get(severity, {})
+        regexes.extend(p["regex"] for p in tier.get("patterns", []))
+        for category in tier.get("categories", {}).values():
+            regexes.extend(p["regex"] for p in category.get("patterns", []))
+    return regexes
+
+
+def test_fold_case_keeps_offsets():
+    assert fold_case("İSTANBUL Straße K") == "istanbul straße k"
+    assert required_literals(r"\bI shall\b", folded=True) == ["i shall"]
+
+
+def test_scan_lines_matches_every_regex_on_every_line():
+    patterns = _anti_ai_ism_regexes() + [r"needless to say", r"\bkindly\b", r"^\w+ cannot"]
+    scanner = PatternScanner(patterns)
+    lines = SAMPLE.split("\n")
+
+    expected = [
+        (line_idx, idx, match.span())
+        for line_idx, line in enumerate(lines)
+        for idx, pattern in enumerate(patterns)
+        for match in re.finditer(pattern, line, re.IGNORECASE)
+    ]
+    found = [(line_idx, idx, match.span()) for line_idx, idx, match in scanner.scan_lines(lines)]
+
+    assert found == expected
+    assert len(patterns) - 2 in {idx for _, idx, _ in found}  # Kelvin sign matches "k"
+    assert scanner.always_run  # Vietnamese pronoun pattern has no literal
+    assert len(scanner.candidates(SAMPLE)) < len(patterns)
+
+
+def test_scanner_matches_plain_re_on_escapes_and_classes():
+    patterns = [r"\x41bc", r"\101bcd", r"(a)\1bcd", r"\u3042いう", r"[\]x]abc", r"[]x]yz|qq", r"needless"]
+    lines = ["Abc", "xAbcd", "aabcd!", "あいう", "]abc", "]yz", "Needless"]
+    expected = [
+        (line_idx, idx, match.span())
+        for line_idx, line in enumerate(lines)
+        for idx, pattern in enumerate(patterns)
+        for match in re.finditer(pattern, line, re.IGNORECASE)
+    ]
+    found = [(line_idx, idx, match.span()) for line_idx, idx, match in PatternScanner(patterns).scan_lines(lines)]
+    assert found == expected
+    assert {idx for _, idx, _ in expected} == set(range(len(patterns)))
+
+
+def test_scanner_is_shared_per_pattern_list():
+    assert get_pattern_scanner([r"a sense of", r"\bquite\b"]) is get_pattern_scanner((r"a sense of", r"\bquite\b"))
+    assert get_pattern_scanner([r"a sense of"]) is not get_pattern_scanner([r"a sense of"], flags=0)
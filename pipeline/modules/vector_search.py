@@ -33,12 +33,19 @@ except ImportError:
 
 # Gemini for embeddings
 try:
-    from pipeline.common.genai_factory import create_genai_client, resolve_api_key
+    from pipeline.common.genai_factory import get_shared_genai_client, resolve_api_key
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
     logging.warning("Google GenAI not installed.")
 
+# Persistent embedding cache shared by all vector stores
+try:
+    from modules.embedding_cache import cached_embed
+except ImportError:
+    def cached_embed(model, texts, embed_fn):
+        return embed_fn(list(texts)) if texts else []
+
 # Pinyin helper for Chinese text disambiguation
 try:
     from modules.pinyin_helper import enhance_query_with_pinyin
@@ -110,10 +117,10 @@ class PatternVectorStore:
         )
         
         # Initialize Gemini client for embeddings
+        self._embedding_model = "gemini-embedding-001"
         api_key = resolve_api_key(api_key=gemini_api_key, required=False) if GEMINI_AVAILABLE else None
         if GEMINI_AVAILABLE and api_key:
-            self.gemini_client = create_genai_client(api_key=api_key)
-            self._embedding_model = "gemini-embedding-001"
+            self.gemini_client = get_shared_genai_client(api_key=api_key)
         else:
             self.gemini_client = None
             logger.warning("Gemini client not initialized. Embedding functions will fail.")
@@ -125,12 +132,21 @@ class PatternVectorStore:
         """
         Generate embedding using Gemini text-embedding-004.
         
+        Served from the persistent embedding cache when this text was
+        embedded before.
+        
         Args:
             text: Text to embed (supports Chinese, Japanese, Vietnamese, English)
             
         Returns:
             768-dimensional embedding vector
         """
+        return cached_embed(
+            self._embedding_model, [text], lambda missing: [self._request_embedding(missing[0])]
+        )[0]
+
+    def _request_embedding(self, text: str) -> List[float]:
+        """Call the embedding API for one text (with retries)."""
         if not self.gemini_client:
             raise RuntimeError("Gemini client not initialized. Set GOOGLE_API_KEY (or GEMINI_API_KEY).")
         
@@ -165,11 +181,14 @@ class PatternVectorStore:
         Returns:
             List of 768-dimensional embedding vectors (one per input text)
         """
-        if not self.gemini_client:
-            raise RuntimeError("Gemini client not initialized. Set GOOGLE_API_KEY (or GEMINI_API_KEY).")
-
         if not texts:
             return []
+        return cached_embed(self._embedding_model, texts, self._request_embeddings_batch)
+
+    def _request_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Call the embedding API for a list of texts (with retries)."""
+        if not self.gemini_client:
+            raise RuntimeError("Gemini client not initialized. Set GOOGLE_API_KEY (or GEMINI_API_KEY).")
 
         import time
         max_retries = 3
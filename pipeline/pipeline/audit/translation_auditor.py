@@ -15,6 +15,8 @@ from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from modules.pattern_scanner import get_pattern_scanner
+
 logger = logging.getLogger(__name__)
 
 
@@ -618,18 +620,18 @@ class TranslationAuditor:
 
     def _check_en_ai_isms(self, content: str, lines: List[str], result: AuditResult):
         """Detect AI-ism patterns in English text."""
-        for pattern, name, suggestion in self.EN_AI_ISM_PATTERNS:
-            for i, line in enumerate(lines, 1):
-                matches = re.findall(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    result.add_issue(AuditIssue(
-                        category=IssueCategory.EN_AI_ISM,
-                        severity=Severity.MAJOR,
-                        message=f"AI-ism detected: '{name}'",
-                        line_number=i,
-                        context=line.strip()[:100],
-                        suggestion=suggestion,
-                    ))
+        scanner = get_pattern_scanner(pattern for pattern, _, _ in self.EN_AI_ISM_PATTERNS)
+        # One scan for all patterns; issues are reported pattern by pattern
+        for line_idx, pattern_idx, _ in sorted(scanner.scan_lines(lines), key=lambda hit: (hit[1], hit[0])):
+            _, name, suggestion = self.EN_AI_ISM_PATTERNS[pattern_idx]
+            result.add_issue(AuditIssue(
+                category=IssueCategory.EN_AI_ISM,
+                severity=Severity.MAJOR,
+                message=f"AI-ism detected: '{name}'",
+                line_number=line_idx + 1,
+                context=lines[line_idx].strip()[:100],
+                suggestion=suggestion,
+            ))
 
     def _check_en_formal_verbs(self, content: str, lines: List[str], result: AuditResult):
         """Check for overly formal verbs in casual dialogue."""
@@ -871,18 +873,18 @@ class TranslationAuditor:
 
     def _check_vn_translationese(self, content: str, lines: List[str], result: AuditResult):
         """Detect translationese patterns in Vietnamese text."""
-        for pattern, name, suggestion in self.VN_TRANSLATIONESE_PATTERNS:
-            for i, line in enumerate(lines, 1):
-                matches = re.findall(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    result.add_issue(AuditIssue(
-                        category=IssueCategory.VN_TRANSLATIONESE,
-                        severity=Severity.MAJOR,
-                        message=f"Translationese detected: '{name}'",
-                        line_number=i,
-                        context=line.strip()[:100],
-                        suggestion=suggestion,
-                    ))
+        scanner = get_pattern_scanner(pattern for pattern, _, _ in self.VN_TRANSLATIONESE_PATTERNS)
+        # One scan for all patterns; issues are reported pattern by pattern
+        for line_idx, pattern_idx, _ in sorted(scanner.scan_lines(lines), key=lambda hit: (hit[1], hit[0])):
+            _, name, suggestion = self.VN_TRANSLATIONESE_PATTERNS[pattern_idx]
+            result.add_issue(AuditIssue(
+                category=IssueCategory.VN_TRANSLATIONESE,
+                severity=Severity.MAJOR,
+                message=f"Translationese detected: '{name}'",
+                line_number=line_idx + 1,
+                context=lines[line_idx].strip()[:100],
+                suggestion=suggestion,
+            ))
 
     def _check_vn_pronouns(self, content: str, lines: List[str], result: AuditResult):
         """Check for pronoun consistency issues."""
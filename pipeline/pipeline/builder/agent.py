@@ -8,7 +8,6 @@ Assembles final EPUB from translated content following industry standards
 
 import json
 import shutil
-import tempfile
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -24,6 +23,8 @@ from .structure_builder import StructureBuilder
 from .xhtml_builder import XHTMLBuilder
 from .markdown_to_xhtml import MarkdownToXHTML
 from .epub_packager import EPUBPackager
+from .build_cache import BuildCache, link_or_copy
+from .config import is_incremental_build_enabled
 from .image_analyzer import get_image_dimensions, is_horizontal, analyze_kuchie_images
 import re
 
@@ -394,16 +395,19 @@ class BuilderAgent:
 
             # Step 2: Create build directory
             print("\n[STEP 2/8] Creating EPUB structure...")
-            build_dir = Path(tempfile.mkdtemp(prefix='epub_build_'))
+            build_cache = BuildCache(work_dir, enabled=is_incremental_build_enabled())
+            build_dir = build_cache.make_build_dir()
             paths = create_epub_structure(build_dir)
             print(f"     Build dir: {build_dir}")
 
             # Step 3: Convert chapters
             print("\n[STEP 3/8] Converting chapters to XHTML...")
             chapter_items, chapter_info = self._process_chapters(
-                manifest, work_dir, paths, actual_target_lang
+                manifest, work_dir, paths, actual_target_lang, build_cache
             )
             print(f"     Converted: {len(chapter_items)} chapters")
+            if build_cache.hits:
+                print(f"     [CACHE] Reused {build_cache.hits} unchanged chapter(s)")
 
             # Step 4: Process images
             print("\n[STEP 4/8] Processing images...")
@@ -474,7 +478,10 @@ class BuilderAgent:
             output_path = self.output_base / output_filename
 
             # Package EPUB
-            EPUBPackager.package_epub(build_dir, output_path)
+            entries = EPUBPackager.package_epub(
+                build_dir, output_path, build_cache.previous_entries(output_path)
+            )
+            build_cache.record_build(output_path, entries)
 
             # Validate
             EPUBPackager.validate_epub_structure(output_path)
@@ -549,7 +556,8 @@ class BuilderAgent:
         manifest: dict,
         work_dir: Path,
         paths: EPUBPaths,
-        target_language: str
+        target_language: str,
+        build_cache: Optional[BuildCache] = None
     ) -> tuple:
         """Convert all translated markdown chapters to XHTML."""
         # Support both v3.0 and v3.5 manifest schemas
@@ -639,10 +647,6 @@ class BuilderAgent:
 
             md_content = '\n\n'.join(chunk for chunk in merged_markdown_chunks if chunk)
 
-            # Convert to XHTML paragraphs
-            paragraphs = self._markdown_to_paragraphs(md_content)
-            xhtml_content = MarkdownToXHTML.convert_to_xhtml_string(paragraphs)
-
             # Build XHTML
             xhtml_filename = f"chapter{i+1:03d}.xhtml"
             xhtml_path = paths.text_dir / xhtml_filename
@@ -653,13 +657,32 @@ class BuilderAgent:
                 chapter_title_for_xhtml = ""  # No H1 header for unlisted content
                 print(f"     [INFO] Pre-TOC content: suppressing title header")
 
-            xhtml = XHTMLBuilder.build_chapter_xhtml(
-                content=xhtml_content,
-                chapter_title=chapter_title_for_xhtml,
-                chapter_id=chapter_id,
-                lang_code=lang_code,
-                book_title=book_title
-            )
+            cache_key = None
+            xhtml = None
+            if build_cache is not None:
+                cache_key = build_cache.chapter_key(
+                    md_content,
+                    chapter_title=chapter_title_for_xhtml,
+                    chapter_id=chapter_id,
+                    lang_code=lang_code,
+                    book_title=book_title,
+                )
+                xhtml = build_cache.get_xhtml(cache_key)
+
+            if xhtml is None:
+                # Convert to XHTML paragraphs
+                paragraphs = self._markdown_to_paragraphs(md_content)
+                xhtml_content = MarkdownToXHTML.convert_to_xhtml_string(paragraphs)
+
+                xhtml = XHTMLBuilder.build_chapter_xhtml(
+                    content=xhtml_content,
+                    chapter_title=chapter_title_for_xhtml,
+                    chapter_id=chapter_id,
+                    lang_code=lang_code,
+                    book_title=book_title
+                )
+                if build_cache is not None:
+                    build_cache.put_xhtml(cache_key, xhtml)
             xhtml_path.write_text(xhtml, encoding='utf-8')
 
             # Add to manifest
@@ -1114,7 +1137,8 @@ class BuilderAgent:
         paths: EPUBPaths
     ) -> tuple:
         """
-        Copy all images to Images/ directory and analyze kuchi-e dimensions.
+        Copy (hard-link where possible) all images to Images/ directory and
+        analyze kuchi-e dimensions.
         
         Returns:
             Tuple of (manifest_items, kuchie_metadata)
@@ -1148,7 +1172,7 @@ class BuilderAgent:
             if cover_path.exists():
                 dest = paths.images_dir / cover
                 print(f"     [COVER] Destination: {dest}")
-                shutil.copy2(cover_path, dest)
+                link_or_copy(cover_path, dest)
                 manifest_items.append(ManifestItem(
                     id="cover-image",
                     href=f"Images/{cover}",
@@ -1172,7 +1196,7 @@ class BuilderAgent:
             
             if kuchie_path.exists():
                 dest = paths.images_dir / kuchie
-                shutil.copy2(kuchie_path, dest)
+                link_or_copy(kuchie_path, dest)
                 manifest_items.append(ManifestItem(
                     id=f"kuchie-img-{i+1:03d}",  # Use 'kuchie-img' to avoid conflict with XHTML page IDs
                     href=f"Images/{kuchie}",
@@ -1220,7 +1244,7 @@ class BuilderAgent:
             
             if illust_path.exists():
                 dest = paths.images_dir / illust
-                shutil.copy2(illust_path, dest)
+                link_or_copy(illust_path, dest)
                 illust_counter += 1
                 manifest_items.append(ManifestItem(
                     id=f"illust-{illust_counter:03d}",
@@ -1275,7 +1299,7 @@ class BuilderAgent:
                 # Check if matches original filename patterns
                 if regex_module.match(combined_pattern, filename, regex_module.IGNORECASE):
                     dest = paths.images_dir / filename
-                    shutil.copy2(img_path, dest)
+                    link_or_copy(img_path, dest)
                     illust_counter += 1
                     manifest_items.append(ManifestItem(
                         id=f"illust-{illust_counter:03d}",
@@ -1291,7 +1315,7 @@ class BuilderAgent:
             additional_path = assets_dir / "additional" / additional
             if additional_path.exists():
                 dest = paths.images_dir / additional
-                shutil.copy2(additional_path, dest)
+                link_or_copy(additional_path, dest)
                 manifest_items.append(ManifestItem(
                     id=f"additional-{i+1:03d}",
                     href=f"Images/{additional}",
@@ -0,0 +1,194 @@
+"""
+Build Cache - Content-hash reuse between EPUB builds of the same volume.
+
+The QC loop rebuilds a volume many times while only a chapter or two change.
+BuildCache lives in WORK/<volume>/cache/epub_build/ and keeps:
+
+- rendered chapter XHTML, keyed by a hash of the chapter markdown, the
+  manifest fields that reach the page (id, title, language, book title),
+  the builder code that renders it and the settings it reads (EPUB version,
+  blank-line collapsing, scene-break and illustration markers);
+- the content hash of every entry of the last EPUB it packaged, so
+  EPUBPackager can copy unchanged, already-compressed entries out of that
+  EPUB instead of deflating them again.
+
+Build directories are created inside the cache so that assets can be
+hard-linked from WORK/<volume>/assets instead of copied.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+
+from ..config import ILLUSTRATION_PLACEHOLDER_PATTERN, MARKDOWN_IMAGE_PATTERN, SCENE_BREAK_MARKER
+from .config import BLANK_LINE_FREQUENCY, COLLAPSE_BLANK_LINES, get_epub_version
+
+CACHE_SUBDIR = Path("cache") / "epub_build"
+INDEX_FILENAME = "index.json"
+
+# Modules whose code decides what a chapter's XHTML looks like
+_RENDERER_MODULES = ("agent.py", "markdown_to_xhtml.py", "xhtml_builder.py")
+
+
+def content_hash(*parts: Union[str, bytes]) -> str:
+    """SHA-256 over length-prefixed parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def renderer_fingerprint() -> str:
+    """Hash of the builder code that renders chapter XHTML."""
+    here = Path(__file__).parent
+    return content_hash(*((here / name).read_bytes() for name in _RENDERER_MODULES))
+
+
+def renderer_settings() -> str:
+    """Configuration the chapter renderer reads, serialized for cache keys."""
+    return json.dumps(
+        {
+            "epub_version": get_epub_version(),
+            "collapse_blank_lines": COLLAPSE_BLANK_LINES,
+            "blank_line_frequency": BLANK_LINE_FREQUENCY,
+            "scene_break_marker": SCENE_BREAK_MARKER,
+            "illustration_pattern": ILLUSTRATION_PLACEHOLDER_PATTERN,
+            "markdown_image_pattern": MARKDOWN_IMAGE_PATTERN,
+        },
+        sort_keys=True,
+    )
+
+
+def link_or_copy(src: Path, dest: Path) -> None:
+    """Hard-link `src` to `dest`; copy when linking is not possible."""
+    if dest.exists():
+        # Same image listed twice in the manifest
+        if os.path.samefile(src, dest):
+            return
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+class BuildCache:
+    """Per-volume cache of rendered chapters and the last packaged EPUB."""
+
+    def __init__(self, work_dir: Path, enabled: bool = True):
+        self.enabled = enabled
+        self.cache_dir = work_dir / CACHE_SUBDIR
+        self.xhtml_dir = self.cache_dir / "xhtml"
+        self.index_path = self.cache_dir / INDEX_FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._used_keys: Set[str] = set()
+        self._index: Dict = self._load_index() if enabled else {}
+        self._settings = renderer_settings() if enabled else ""
+
+    def _load_index(self) -> Dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def make_build_dir(self) -> Path:
+        """Fresh build directory (next to the volume when caching is on)."""
+        if not self.enabled:
+            return Path(tempfile.mkdtemp(prefix="epub_build_"))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Leftovers of builds that failed before cleanup
+        for stale in self.cache_dir.glob("epub_build_*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        return Path(tempfile.mkdtemp(prefix="epub_build_", dir=self.cache_dir))
+
+    # ------------------------------------------------------------------
+    # Chapter XHTML
+    # ------------------------------------------------------------------
+
+    def chapter_key(self, markdown: str, **fields: str) -> str:
+        return content_hash(
+            renderer_fingerprint(),
+            self._settings,
+            markdown,
+            json.dumps(fields, sort_keys=True, ensure_ascii=False),
+        )
+
+    def get_xhtml(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        try:
+            xhtml = (self.xhtml_dir / f"{key}.xhtml").read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used_keys.add(key)
+        return xhtml
+
+    def put_xhtml(self, key: str, xhtml: str) -> None:
+        if not self.enabled:
+            return
+        self.xhtml_dir.mkdir(parents=True, exist_ok=True)
+        (self.xhtml_dir / f"{key}.xhtml").write_text(xhtml, encoding="utf-8")
+        self._used_keys.add(key)
+
+    # ------------------------------------------------------------------
+    # Packaged EPUB
+    # ------------------------------------------------------------------
+
+    def previous_entries(self, output_path: Path) -> Dict[str, str]:
+        """
+        Content hash per entry of the EPUB at `output_path`, if that file is
+        still the one this cache packaged; {} otherwise.
+        """
+        record = self._index.get("epub")
+        if not self.enabled or not isinstance(record, dict):
+            return {}
+        if record.get("path") != str(output_path):
+            return {}
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return {}
+        if stat.st_size != record.get("size") or stat.st_mtime_ns != record.get("mtime_ns"):
+            return {}
+        return dict(record.get("entries", {}))
+
+    def record_build(self, output_path: Path, entries: Dict[str, str]) -> None:
+        """Remember the packaged EPUB and drop chapters this build did not use."""
+        if not self.enabled:
+            return
+        stat = output_path.stat()
+        self._index["epub"] = {
+            "path": str(output_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "entries": entries,
+        }
+        if self.xhtml_dir.exists():
+            for cached in self.xhtml_dir.glob("*.xhtml"):
+                if cached.stem not in self._used_keys:
+                    cached.unlink(missing_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2, ensure_ascii=False)
@@ -107,6 +107,19 @@ def get_image_config() -> Dict[str, Any]:
     })
 
 
+# ============================================================================
+# INCREMENTAL BUILDS
+# ============================================================================
+
+def is_incremental_build_enabled() -> bool:
+    """
+    Whether builds reuse cached chapter XHTML, hard-linked assets and the
+    compressed entries of the previous EPUB (WORK/<volume>/cache/epub_build/).
+    """
+    config = load_config()
+    return bool(config.get('builder', {}).get('incremental', True))
+
+
 # ============================================================================
 # XHTML STRUCTURE SETTINGS
 # ============================================================================
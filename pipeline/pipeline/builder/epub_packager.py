@@ -5,29 +5,98 @@ Packages the working directory into a valid EPUB3/EPUB2 file with
 correct mimetype placement and compression.
 """
 
+import os
+import struct
+import sys
 import zipfile
+import zlib
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from .build_cache import file_hash
+
+# Copying compressed entries goes through ZipFile internals (fp, start_dir,
+# NameToInfo, _didModify, ZipInfo.FileHeader); it is only used on the
+# CPython versions it was checked against, and every EPUB built with it is
+# verified with testzip() before it replaces the previous one.
+_RAW_COPY_PYTHON = ((3, 8), (3, 14))
+
+
+def raw_copy_supported() -> bool:
+    """True when unchanged entries can be copied without recompressing them."""
+    low, high = _RAW_COPY_PYTHON
+    return (
+        low <= sys.version_info[:2] < high
+        and hasattr(zipfile, "sizeFileHeader")
+        and hasattr(zipfile, "stringFileHeader")
+        and hasattr(zipfile.ZipInfo, "FileHeader")
+    )
 
 
 class EPUBPackager:
     """Creates valid EPUB files from directory structure."""
 
     @staticmethod
-    def package_epub(working_dir: Path, output_epub_path: Path) -> None:
+    def package_epub(
+        working_dir: Path,
+        output_epub_path: Path,
+        previous_entries: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
         """
         Package a prepared EPUB directory into a .epub file.
 
         Args:
             working_dir: Directory containing EPUB structure
             output_epub_path: Path where to write the .epub file
+            previous_entries: Content hash per entry of the EPUB currently at
+                output_epub_path (see BuildCache). Entries whose content is
+                unchanged are copied from it still compressed.
+
+        Returns:
+            Content hash per entry (except mimetype) of the new EPUB
         """
         output_epub_path.parent.mkdir(parents=True, exist_ok=True)
 
         print(f"[INFO] Packaging EPUB: {output_epub_path.name}")
 
+        previous_zip = None
+        if previous_entries and output_epub_path.exists() and raw_copy_supported():
+            try:
+                previous_zip = zipfile.ZipFile(output_epub_path, 'r')
+            except zipfile.BadZipFile:
+                previous_zip = None
+
+        # Write next to the target: the previous EPUB is read while packaging
+        temp_path = output_epub_path.with_name(output_epub_path.name + '.tmp')
+        try:
+            entries, reused = EPUBPackager._write_epub(temp_path, working_dir, previous_zip, previous_entries)
+            if reused and not EPUBPackager._zip_is_intact(temp_path):
+                print("[WARNING] Reused entries failed verification; repackaging from scratch")
+                entries, reused = EPUBPackager._write_epub(temp_path, working_dir)
+        finally:
+            if previous_zip is not None:
+                previous_zip.close()
+        os.replace(temp_path, output_epub_path)
+
+        if not output_epub_path.exists():
+            raise IOError(f"Failed to create EPUB file: {output_epub_path}")
+
+        file_size_mb = output_epub_path.stat().st_size / (1024 * 1024)
+        print(f"[OK] EPUB created: {output_epub_path.name} ({file_size_mb:.2f} MB)")
+        if reused:
+            print(f"     - {reused}/{len(entries)} entries reused from previous build")
+        return entries
+
+    @staticmethod
+    def _write_epub(
+        path: Path,
+        working_dir: Path,
+        previous_zip: Optional[zipfile.ZipFile] = None,
+        previous_entries: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], int]:
+        """Write the EPUB archive to `path`; returns what _add_epub_contents does."""
         with zipfile.ZipFile(
-            output_epub_path,
+            path,
             'w',
             zipfile.ZIP_DEFLATED,
         ) as epub_zip:
@@ -35,13 +104,18 @@ class EPUBPackager:
             EPUBPackager._add_mimetype_first(epub_zip, working_dir)
 
             # Add all other files, compressed
-            EPUBPackager._add_epub_contents(epub_zip, working_dir)
-
-        if not output_epub_path.exists():
-            raise IOError(f"Failed to create EPUB file: {output_epub_path}")
+            return EPUBPackager._add_epub_contents(
+                epub_zip, working_dir, previous_zip, previous_entries
+            )
 
-        file_size_mb = output_epub_path.stat().st_size / (1024 * 1024)
-        print(f"[OK] EPUB created: {output_epub_path.name} ({file_size_mb:.2f} MB)")
+    @staticmethod
+    def _zip_is_intact(path: Path) -> bool:
+        """Central directory readable and every entry's CRC matches."""
+        try:
+            with zipfile.ZipFile(path, 'r') as epub_zip:
+                return epub_zip.testzip() is None
+        except (zipfile.BadZipFile, zlib.error, OSError, EOFError):
+            return False
 
     @staticmethod
     def _add_mimetype_first(epub_zip: zipfile.ZipFile, working_dir: Path) -> None:
@@ -66,8 +140,20 @@ class EPUBPackager:
             )
 
     @staticmethod
-    def _add_epub_contents(epub_zip: zipfile.ZipFile, working_dir: Path) -> None:
-        """Add all EPUB contents (except mimetype) to the ZIP."""
+    def _add_epub_contents(
+        epub_zip: zipfile.ZipFile,
+        working_dir: Path,
+        previous_zip: Optional[zipfile.ZipFile] = None,
+        previous_entries: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], int]:
+        """
+        Add all EPUB contents (except mimetype) to the ZIP.
+
+        Returns:
+            (content hash per entry, number of entries copied from previous_zip)
+        """
+        entries: Dict[str, str] = {}
+        reused = 0
         for file_path in working_dir.rglob('*'):
             # Skip mimetype (already added) and directories
             if file_path.name == 'mimetype' or file_path.is_dir():
@@ -75,8 +161,49 @@ class EPUBPackager:
 
             relative_path = file_path.relative_to(working_dir)
             arcname = str(relative_path).replace('\\', '/')
+            entries[arcname] = file_hash(file_path)
+
+            if previous_zip is not None and previous_entries.get(arcname) == entries[arcname]:
+                info = previous_zip.NameToInfo.get(arcname)
+                if info is not None and info.file_size == file_path.stat().st_size:
+                    EPUBPackager._copy_compressed_entry(previous_zip, info, epub_zip)
+                    reused += 1
+                    continue
 
             epub_zip.write(file_path, arcname, compress_type=zipfile.ZIP_DEFLATED)
+        return entries, reused
+
+    @staticmethod
+    def _copy_compressed_entry(
+        source_zip: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        epub_zip: zipfile.ZipFile,
+    ) -> None:
+        """Append an entry of source_zip to epub_zip without recompressing it."""
+        source_zip.fp.seek(info.header_offset)
+        header = source_zip.fp.read(zipfile.sizeFileHeader)
+        if header[:4] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        source_zip.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+        compressed = source_zip.fp.read(info.compress_size)
+
+        entry = zipfile.ZipInfo(info.filename, info.date_time)
+        entry.compress_type = info.compress_type
+        entry.external_attr = info.external_attr
+        entry.CRC = info.CRC
+        entry.file_size = info.file_size
+        entry.compress_size = info.compress_size
+
+        # Same bookkeeping ZipFile.write() does around a member
+        epub_zip.fp.seek(epub_zip.start_dir)
+        entry.header_offset = epub_zip.fp.tell()
+        epub_zip.fp.write(entry.FileHeader())
+        epub_zip.fp.write(compressed)
+        epub_zip.start_dir = epub_zip.fp.tell()
+        epub_zip.filelist.append(entry)
+        epub_zip.NameToInfo[entry.filename] = entry
+        epub_zip._didModify = True
 
     @staticmethod
     def validate_epub_structure(epub_path: Path) -> bool:
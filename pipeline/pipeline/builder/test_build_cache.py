@@ -0,0 +1,105 @@
+import copy
+import zipfile
+
+from pipeline.builder import build_cache, epub_packager
+from pipeline.builder.build_cache import BuildCache, link_or_copy
+from pipeline.builder.epub_packager import EPUBPackager
+
+
+def _write_book(root, chapter_text):
+    (root / "META-INF").mkdir(parents=True)
+    (root / "OEBPS" / "Text").mkdir(parents=True)
+    (root / "OEBPS" / "Images").mkdir(parents=True)
+    (root / "META-INF" / "container.xml").write_text("<container/>", encoding="utf-8")
+    (root / "OEBPS" / "package.opf").write_text("<package/>", encoding="utf-8")
+    (root / "OEBPS" / "Text" / "chapter001.xhtml").write_text(chapter_text, encoding="utf-8")
+    (root / "OEBPS" / "Text" / "chapter002.xhtml").write_text("<p>unchanged</p>" * 500, encoding="utf-8")
+
+
+def test_repackaging_reuses_unchanged_entries(tmp_path, capsys):
+    work_dir = tmp_path / "volume"
+    output = tmp_path / "out" / "book.epub"
+
+    cache = BuildCache(work_dir)
+    build_dir = cache.make_build_dir()
+    _write_book(build_dir, "<p>first</p>")
+    cache.record_build(output, EPUBPackager.package_epub(build_dir, output, cache.previous_entries(output)))
+
+    cache = BuildCache(work_dir)
+    build_dir = cache.make_build_dir()
+    _write_book(build_dir, "<p>second</p>")
+    image = tmp_path / "illust-001.jpg"
+    image.write_bytes(b"\xff\xd8" + bytes(range(256)) * 40)
+    link_or_copy(image, build_dir / "OEBPS" / "Images" / image.name)
+    link_or_copy(image, build_dir / "OEBPS" / "Images" / image.name)
+    capsys.readouterr()
+    entries = EPUBPackager.package_epub(build_dir, output, cache.previous_entries(output))
+
+    assert "3/5 entries reused" in capsys.readouterr().out
+    assert set(entries) == {
+        "META-INF/container.xml",
+        "OEBPS/package.opf",
+        "OEBPS/Text/chapter001.xhtml",
+        "OEBPS/Text/chapter002.xhtml",
+        "OEBPS/Images/illust-001.jpg",
+    }
+    with zipfile.ZipFile(output) as epub:
+        assert epub.testzip() is None
+        assert epub.namelist()[0] == "mimetype"
+        assert epub.read("OEBPS/Text/chapter001.xhtml") == b"<p>second</p>"
+        assert epub.read("OEBPS/Text/chapter002.xhtml") == b"<p>unchanged</p>" * 500
+        assert epub.read("OEBPS/Images/illust-001.jpg") == image.read_bytes()
+
+
+def test_chapter_xhtml_is_keyed_by_content(tmp_path):
+    cache = BuildCache(tmp_path)
+    key = cache.chapter_key("# Chapter 1\n\nText", chapter_id="chapter01", chapter_title="Chapter 1")
+    cache.put_xhtml(key, "<html/>")
+
+    assert BuildCache(tmp_path).get_xhtml(key) == "<html/>"
+    assert cache.chapter_key("# Chapter 1\n\nText", chapter_id="chapter01", chapter_title="Chapter One") != key
+    assert BuildCache(tmp_path, enabled=False).get_xhtml(key) is None
+
+
+def test_corrupt_raw_copies_fall_back_to_a_clean_repackage(tmp_path, monkeypatch, capsys):
+    work_dir = tmp_path / "volume"
+    output = tmp_path / "out" / "book.epub"
+    cache = BuildCache(work_dir)
+    build_dir = cache.make_build_dir()
+    _write_book(build_dir, "<p>first</p>")
+    cache.record_build(output, EPUBPackager.package_epub(build_dir, output, cache.previous_entries(output)))
+
+    copy_entry = EPUBPackager._copy_compressed_entry
+
+    def corrupting_copy(source_zip, info, epub_zip):
+        bad = copy.copy(info)
+        bad.CRC ^= 1
+        copy_entry(source_zip, bad, epub_zip)
+
+    monkeypatch.setattr(EPUBPackager, "_copy_compressed_entry", staticmethod(corrupting_copy))
+    capsys.readouterr()
+    EPUBPackager.package_epub(build_dir, output, cache.previous_entries(output))
+
+    out = capsys.readouterr().out
+    assert "repackaging from scratch" in out and "reused" not in out
+    with zipfile.ZipFile(output) as epub:
+        assert epub.testzip() is None
+        assert epub.read("OEBPS/Text/chapter002.xhtml") == b"<p>unchanged</p>" * 500
+
+    monkeypatch.setattr(epub_packager, "_RAW_COPY_PYTHON", ((3, 0), (3, 1)))
+    capsys.readouterr()
+    EPUBPackager.package_epub(build_dir, output, cache.previous_entries(output))
+    assert "reused" not in capsys.readouterr().out
+    with zipfile.ZipFile(output) as epub:
+        assert epub.testzip() is None
+
+
+def test_chapter_key_covers_renderer_settings(tmp_path, monkeypatch):
+    markdown = "# Chapter 1\n\nText"
+    key = BuildCache(tmp_path).chapter_key(markdown, chapter_id="chapter01")
+
+    monkeypatch.setattr(build_cache, "get_epub_version", lambda: "EPUB2")
+    assert BuildCache(tmp_path).chapter_key(markdown, chapter_id="chapter01") != key
+    monkeypatch.undo()
+    monkeypatch.setattr(build_cache, "SCENE_BREAK_MARKER", "◇")
+    assert BuildCache(tmp_path).chapter_key(markdown, chapter_id="chapter01") != key
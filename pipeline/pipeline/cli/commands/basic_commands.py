@@ -44,9 +44,15 @@ def handle_metadata(args: Any, controller: Any) -> CommandResult:
     return CommandResult(exit_code=0 if is_compatible else 1)
 
 
+def handle_stats(args: Any, controller: Any) -> CommandResult:
+    found = controller.show_stats(args.volume_id, run=args.run, as_json=args.json)
+    return CommandResult(exit_code=0 if found else 1)
+
+
 HANDLERS = {
     'status': handle_status,
     'list': handle_list,
     'config': handle_config,
     'metadata': handle_metadata,
+    'stats': handle_stats,
 }
@@ -52,6 +52,7 @@ Quality Control:
 Inspection and Debug:
   mtl.py list
   mtl.py status novel_v1
+  mtl.py stats novel_v1 --run all
   mtl.py cache-inspect novel_v1 --detail
   mtl.py visual-thinking novel_v1 --with-cache
 
@@ -294,6 +295,21 @@ Metadata Schema Auto-Transform:
     status_parser = subparsers.add_parser('status', parents=[parent_parser], help='Show pipeline status for a volume')
     status_parser.add_argument('volume_id', type=str, help='Volume ID')
 
+    # Stats
+    stats_parser = subparsers.add_parser(
+        'stats',
+        parents=[parent_parser],
+        help='Throughput, token and cost report from the volume event stream (events.jsonl)'
+    )
+    stats_parser.add_argument('volume_id', type=str, help='Volume ID')
+    stats_parser.add_argument(
+        '--run',
+        type=str,
+        default='last',
+        help="Run to report: 'last' (default), 'all', or a run id from events.jsonl"
+    )
+    stats_parser.add_argument('--json', action='store_true', help='Print the aggregated numbers as JSON')
+
     # List
     subparsers.add_parser('list', parents=[parent_parser], help='List all volumes')
 
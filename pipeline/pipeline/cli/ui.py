@@ -54,6 +54,9 @@ class _NullChapterTracker:
     def skip(self, _chapter_id: str) -> None:
         return None
 
+    def stream(self, _chapter_id: str, _label: str) -> None:
+        return None
+
 
 class _RichPhaseTracker:
     """Rich-backed phase tracker for visual pipeline progress."""
@@ -122,6 +125,12 @@ class _RichChapterTracker:
             description=f"{self._title} • skip {chapter_id}",
         )
 
+    def stream(self, chapter_id: str, label: str) -> None:
+        self._progress.update(
+            self._task_id,
+            description=f"{self._title} • {chapter_id} ({label})",
+        )
+
 
 class ModernCLIUI:
     """Modern UI helpers that degrade gracefully to plain text."""
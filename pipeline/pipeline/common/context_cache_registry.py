@@ -0,0 +1,259 @@
+"""
+Context Cache Registry - One record of a volume's remote Gemini caches.
+
+Phase 1.55 (RichMetadataCacheUpdater), Phase 2 (TranslatorAgent volume
+cache, CachedVolumeContextManager) and the continuity schema workflow all
+upload cached contents. The registry lives in WORK/<volume>/cache/
+gemini_caches.json and records every cache by
+
+    (model, system-instruction hash, corpus hash, tools hash)
+
+so an identical cache requested again - by another phase, or by a re-run of
+the same phase for a few failed chapters - is reused with its TTL extended
+instead of being uploaded again. Finished phases `release()` their caches:
+the TTL is cut to `gemini.cache_registry.retain_minutes` rather than the
+cache being deleted, so a re-run shortly after still finds it. Expired
+entries are dropped whenever the registry is read.
+
+Usage:
+    registry = get_cache_registry(work_dir)
+    name = registry.acquire(client, model=model, system_instruction=si,
+                            contents=[corpus], ttl_seconds=7200, label="translator")
+    ...
+    registry.release(client, name)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_PATH = Path("cache") / "gemini_caches.json"
+DEFAULT_RETAIN_MINUTES = 30
+
+# Entries this close to expiry are treated as expired: a request that starts
+# now must not find the cache gone halfway through.
+_EXPIRY_MARGIN_SECONDS = 60
+
+
+def _digest(value: Any) -> str:
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        value = repr(value)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def cache_key(
+    model: str,
+    system_instruction: Optional[str] = None,
+    contents: Optional[List[str]] = None,
+    tools: Any = None,
+    tool_config: Any = None,
+) -> str:
+    """Registry key of a cached content request."""
+    corpus = "\x00".join(contents) if contents else None
+    parts = [model, _digest(system_instruction), _digest(corpus), _digest(tools), _digest(tool_config)]
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+class ContextCacheRegistry:
+    """Registry of remote cached contents created for one volume."""
+
+    def __init__(self, work_dir: Path, enabled: bool = True, retain_minutes: int = DEFAULT_RETAIN_MINUTES):
+        self.path = Path(work_dir) / REGISTRY_PATH
+        self.enabled = enabled
+        self.retain_seconds = max(0, int(retain_minutes)) * 60
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Live entries; expired ones are dropped (Gemini deletes them itself)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        caches = data.get("caches") if isinstance(data, dict) else None
+        if not isinstance(caches, dict):
+            return {}
+        now = time.time()
+        return {
+            key: entry for key, entry in caches.items()
+            if isinstance(entry, dict) and entry.get("expires_at", 0) > now
+        }
+
+    def _save(self, caches: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "caches": caches}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"[CACHE-REGISTRY] Could not write {self.path}: {e}")
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Live entries by key."""
+        with self._lock:
+            return self._load()
+
+    def collect_garbage(self) -> int:
+        """Drop expired entries from the registry file. Returns how many were dropped."""
+        with self._lock:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    total = len(json.load(f).get("caches", {}))
+            except (OSError, ValueError, AttributeError):
+                return 0
+            caches = self._load()
+            if total != len(caches):
+                self._save(caches)
+            return total - len(caches)
+
+    # ------------------------------------------------------------------
+    # Cache lifecycle
+    # ------------------------------------------------------------------
+
+    def acquire(
+        self,
+        client,
+        *,
+        model: str,
+        system_instruction: Optional[str] = None,
+        contents: Optional[List[str]] = None,
+        ttl_seconds: int,
+        display_name: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+        tool_config: Optional[Any] = None,
+        label: str = "",
+    ) -> Optional[str]:
+        """
+        Name of a live cache for this request, reusing a registered one when
+        possible (its TTL is reset to `ttl_seconds`), creating it otherwise.
+        None if the cache could not be created.
+
+        Args:
+            client: pipeline.common.gemini_client.GeminiClient
+            label: Who asked for it (phase / purpose), recorded for lookup and logs
+        """
+        create_kwargs = dict(
+            model=model,
+            system_instruction=system_instruction,
+            contents=contents,
+            ttl_seconds=ttl_seconds,
+            display_name=display_name,
+            tools=tools,
+            tool_config=tool_config,
+        )
+        if not getattr(client, "enable_caching", True):
+            return None
+        if not self.enabled:
+            return client.create_cache(**create_kwargs)
+
+        key = cache_key(model, system_instruction, contents, tools, tool_config)
+        with self._lock:
+            caches = self._load()
+            entry = caches.get(key)
+            if entry and entry["expires_at"] > time.time() + _EXPIRY_MARGIN_SECONDS:
+                if client.update_cache_ttl(entry["name"], ttl_seconds):
+                    entry["expires_at"] = time.time() + ttl_seconds
+                    entry["reuse_count"] = entry.get("reuse_count", 0) + 1
+                    entry["label"] = label or entry.get("label", "")
+                    self._save(caches)
+                    logger.info(f"[CACHE-REGISTRY] Reusing {entry['name']} for {label or model} (TTL reset to {ttl_seconds}s)")
+                    return entry["name"]
+                logger.info(f"[CACHE-REGISTRY] Registered cache {entry['name']} is gone; creating a new one")
+            caches.pop(key, None)
+
+            name = client.create_cache(**create_kwargs)
+            if not name:
+                self._save(caches)
+                return None
+            caches[key] = {
+                "name": name,
+                "label": label,
+                "model": model,
+                "display_name": display_name,
+                "system_instruction_hash": _digest(system_instruction)[:16],
+                "corpus_hash": _digest("\x00".join(contents) if contents else None)[:16],
+                "corpus_chars": sum(len(text) for text in contents or ()),
+                "created_at": time.time(),
+                "expires_at": time.time() + ttl_seconds,
+                "reuse_count": 0,
+            }
+            self._save(caches)
+            return name
+
+    def find(self, label: str) -> Optional[str]:
+        """Name of the most recent live cache registered under `label`."""
+        live = [entry for entry in self.entries().values() if entry.get("label") == label]
+        if not live:
+            return None
+        return max(live, key=lambda entry: entry.get("created_at", 0))["name"]
+
+    def release(self, client, cache_name: Optional[str], retain_seconds: Optional[int] = None) -> None:
+        """
+        Done with `cache_name` for now: keep it for `retain_seconds` (default
+        `retain_minutes` from config) so a re-run can reuse it, or delete it
+        when that is 0 or the registry is disabled.
+        """
+        if not cache_name:
+            return
+        retain = self.retain_seconds if retain_seconds is None else max(0, int(retain_seconds))
+        if self.enabled and retain and client.update_cache_ttl(cache_name, retain):
+            self._set_expiry(cache_name, time.time() + retain)
+            logger.debug(f"[CACHE-REGISTRY] Retaining {cache_name} for {retain}s")
+            return
+        client.delete_cache(cache_name)
+        self._set_expiry(cache_name, None)
+
+    def _set_expiry(self, cache_name: str, expires_at: Optional[float]) -> None:
+        """Update (or, with None, remove) the entry holding `cache_name`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            caches = self._load()
+            for key, entry in list(caches.items()):
+                if entry.get("name") != cache_name:
+                    continue
+                if expires_at is None:
+                    del caches[key]
+                else:
+                    entry["expires_at"] = expires_at
+            self._save(caches)
+
+
+_registries: Dict[Path, ContextCacheRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_cache_registry(work_dir: Path) -> ContextCacheRegistry:
+    """Process-wide registry for a volume, configured from `gemini.cache_registry`."""
+    path = Path(work_dir).resolve()
+    with _registries_lock:
+        registry = _registries.get(path)
+        if registry is None:
+            cfg: Dict[str, Any] = {}
+            try:
+                from pipeline.config import get_config_section
+
+                cfg = get_config_section("gemini").get("cache_registry", {}) or {}
+            except Exception as e:
+                logger.debug(f"[CACHE-REGISTRY] Using defaults: {e}")
+            registry = ContextCacheRegistry(
+                path,
+                enabled=bool(cfg.get("enabled", True)),
+                retain_minutes=cfg.get("retain_minutes", DEFAULT_RETAIN_MINUTES),
+            )
+            _registries[path] = registry
+        return registry
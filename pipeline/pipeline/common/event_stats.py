@@ -0,0 +1,266 @@
+"""
+Event Stats - Throughput and cost reports from WORK/<volume>/events.jsonl.
+
+Aggregates the structured event stream (pipeline.common.event_stream) into:
+- per phase: wall time, API calls/errors, retries, tokens, rate-limit and
+  retry sleep, estimated cost
+- per model: the same API totals and cost
+- chapters: completed / failed / skipped, chapters per hour, p50 / p95 wall
+  time, slowest chapters and where their time went
+
+Cost uses `gemini.pricing` (USD per 1M tokens: input, cached_input, output).
+Gemini's prompt token count includes cached tokens, so uncached input is
+input - cached; thinking tokens are billed as output.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+API_TOTALS = (
+    "api_calls",
+    "api_errors",
+    "retries",
+    "input_tokens",
+    "cached_tokens",
+    "output_tokens",
+    "thinking_tokens",
+    "api_seconds",
+    "rate_wait_seconds",
+    "retry_wait_seconds",
+    "cost_usd",
+)
+
+
+def load_pricing() -> Dict[str, Dict[str, float]]:
+    """`gemini.pricing` from config.yaml (empty when unavailable)."""
+    try:
+        from pipeline.config import get_config_section
+
+        return dict((get_config_section("gemini") or {}).get("pricing", {}) or {})
+    except Exception:
+        return {}
+
+
+def model_price(model: Optional[str], pricing: Dict[str, Dict[str, float]]) -> Optional[Dict[str, float]]:
+    """Price entry for `model`: exact name, else the longest configured prefix."""
+    if not model or not pricing:
+        return None
+    name = model.split("/")[-1]
+    if name in pricing:
+        return pricing[name]
+    prefixes = [key for key in pricing if name.startswith(key)]
+    return pricing[max(prefixes, key=len)] if prefixes else None
+
+
+def call_cost(event: Dict[str, Any], pricing: Dict[str, Dict[str, float]]) -> float:
+    """Estimated USD cost of one api_call event (0 for unpriced models)."""
+    price = model_price(event.get("model"), pricing)
+    if not price:
+        return 0.0
+    input_tokens = event.get("input_tokens", 0) or 0
+    cached = min(event.get("cached_tokens", 0) or 0, input_tokens)
+    output = (event.get("output_tokens", 0) or 0) + (event.get("thinking_tokens", 0) or 0)
+    return (
+        (input_tokens - cached) * float(price.get("input", 0))
+        + cached * float(price.get("cached_input", price.get("input", 0)))
+        + output * float(price.get("output", 0))
+    ) / 1_000_000
+
+
+def select_runs(events: Iterable[Dict[str, Any]], run: str = "last") -> List[Dict[str, Any]]:
+    """Events of the last run ("last"), every run ("all") or one run id."""
+    events = list(events)
+    if run == "all":
+        return events
+    if run == "last":
+        runs = [event.get("run") for event in events if event.get("run")]
+        if not runs:
+            return events
+        run = runs[-1]
+    return [event for event in events if event.get("run") == run]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {name: 0 for name in API_TOTALS}
+
+
+def _add_api_event(totals: Dict[str, Any], event: Dict[str, Any], cost: float) -> None:
+    name = event["event"]
+    if name == "api_call":
+        totals["api_calls"] += 1
+        totals["api_seconds"] += event.get("latency_seconds", 0) or 0
+        totals["cost_usd"] += cost
+    elif name == "api_error":
+        totals["api_errors"] += 1
+        totals["api_seconds"] += event.get("latency_seconds", 0) or 0
+    elif name == "api_retry":
+        totals["retries"] += 1
+        totals["retry_wait_seconds"] += event.get("wait_seconds", 0) or 0
+    for field in ("input_tokens", "cached_tokens", "output_tokens", "thinking_tokens", "rate_wait_seconds"):
+        totals[field] += event.get(field, 0) or 0
+
+
+def aggregate(events: Iterable[Dict[str, Any]], pricing: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, Any]:
+    """Summarize events (already filtered to the runs of interest)."""
+    pricing = pricing or {}
+    phases: Dict[str, Dict[str, Any]] = {}
+    models: Dict[str, Dict[str, Any]] = {}
+    totals = _empty_totals()
+    runs = []
+    chapter_walls: Dict[str, float] = {}
+    chapter_details: Dict[str, Dict[str, Any]] = {}
+    status_counts = {"completed": 0, "failed": 0, "skipped": 0}
+    phase_bounds: Dict[tuple, List[float]] = {}
+    phase_walls: Dict[tuple, float] = {}
+
+    for event in events:
+        name = event.get("event")
+        phase = event.get("phase") or "unknown"
+        run = event.get("run")
+        if run and run not in runs:
+            runs.append(run)
+        phase_stats = phases.setdefault(phase, _empty_totals() | {"wall_seconds": 0.0})
+        key = (run, phase)
+        ts = event.get("ts")
+        if ts is not None:
+            bounds = phase_bounds.setdefault(key, [ts, ts])
+            bounds[0] = min(bounds[0], ts)
+            bounds[1] = max(bounds[1], ts)
+
+        if name in ("api_call", "api_error", "api_retry"):
+            cost = call_cost(event, pricing) if name == "api_call" else 0.0
+            model_stats = models.setdefault((event.get("model") or "unknown").split("/")[-1], _empty_totals())
+            for target in (phase_stats, model_stats, totals):
+                _add_api_event(target, event, cost)
+        elif name == "phase_end" and event.get("wall_seconds") is not None:
+            # CLI-measured wall time wins over the translator's own run_end
+            phase_walls[key] = event["wall_seconds"]
+        elif name == "run_end" and event.get("wall_seconds") is not None:
+            phase_walls.setdefault(key, event["wall_seconds"])
+        elif name == "chapter_end":
+            chapter = event.get("chapter", "?")
+            status = "completed" if event.get("status") == "completed" else "failed"
+            status_counts[status] += 1
+            if event.get("wall_seconds") is not None:
+                chapter_walls[chapter] = event["wall_seconds"]
+                chapter_details[chapter] = {
+                    "wall_seconds": event["wall_seconds"],
+                    "status": status,
+                    "api_seconds": event.get("api_seconds", 0),
+                    "rate_wait_seconds": event.get("rate_wait_seconds", 0),
+                    "retry_wait_seconds": event.get("retry_wait_seconds", 0),
+                    "retries": event.get("retries", 0),
+                    "output_tokens": event.get("output_tokens", 0),
+                }
+        elif name == "chapter_skip":
+            status_counts["skipped"] += 1
+
+    for (run, phase), bounds in phase_bounds.items():
+        wall = phase_walls.get((run, phase), bounds[1] - bounds[0])
+        phases[phase]["wall_seconds"] += wall
+
+    walls = list(chapter_walls.values())
+    translate_seconds = sum(phase_walls.get((run, "phase2"), 0) for run in runs) or sum(walls)
+    translated = status_counts["completed"]
+    chapter_time = {
+        field: round(sum(detail[field] or 0 for detail in chapter_details.values()), 3)
+        for field in ("api_seconds", "rate_wait_seconds", "retry_wait_seconds")
+    }
+    slowest = sorted(chapter_details.items(), key=lambda item: item[1]["wall_seconds"], reverse=True)[:5]
+
+    return {
+        "runs": runs,
+        "totals": _rounded(totals),
+        "phases": {phase: _rounded(stats) for phase, stats in phases.items()},
+        "models": {model: _rounded(stats) for model, stats in models.items()},
+        "chapters": {
+            **status_counts,
+            "chapters_per_hour": round(translated * 3600 / translate_seconds, 2) if translate_seconds else 0.0,
+            "wall_p50_seconds": round(percentile(walls, 50), 3),
+            "wall_p95_seconds": round(percentile(walls, 95), 3),
+            "wall_seconds": round(sum(walls), 3),
+            **chapter_time,
+            "slowest": [{"chapter": chapter, **detail} for chapter, detail in slowest],
+        },
+    }
+
+
+def _rounded(stats: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: round(value, 4 if key == "cost_usd" else 3) if isinstance(value, float) else value
+        for key, value in stats.items()
+    }
+
+
+def _duration(seconds: float) -> str:
+    seconds = int(round(seconds or 0))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
+
+
+def format_report(stats: Dict[str, Any], title: str = "") -> str:
+    """Plain-text report of `aggregate()` output."""
+    lines = []
+    if title:
+        lines.append(title)
+    lines.append(f"Runs: {', '.join(stats['runs']) or '-'}")
+
+    lines.append("")
+    lines.append(f"{'Phase':<12} {'Wall':>10} {'Calls':>6} {'Err':>4} {'Retry':>5} "
+                 f"{'Input':>11} {'Cached':>11} {'Output':>10} {'RateWait':>9} {'Cost $':>9}")
+    for phase, row in stats["phases"].items():
+        lines.append(
+            f"{phase:<12} {_duration(row['wall_seconds']):>10} {row['api_calls']:>6} {row['api_errors']:>4} "
+            f"{row['retries']:>5} {row['input_tokens']:>11,} {row['cached_tokens']:>11,} "
+            f"{row['output_tokens'] + row['thinking_tokens']:>10,} {_duration(row['rate_wait_seconds']):>9} "
+            f"{row['cost_usd']:>9.2f}"
+        )
+
+    if stats["models"]:
+        lines.append("")
+        lines.append(f"{'Model':<28} {'Calls':>6} {'Input':>11} {'Cached':>11} {'Output':>10} {'Cost $':>9}")
+        for model, row in stats["models"].items():
+            lines.append(
+                f"{model:<28} {row['api_calls']:>6} {row['input_tokens']:>11,} {row['cached_tokens']:>11,} "
+                f"{row['output_tokens'] + row['thinking_tokens']:>10,} {row['cost_usd']:>9.2f}"
+            )
+
+    totals = stats["totals"]
+    cache_share = totals["cached_tokens"] / totals["input_tokens"] * 100 if totals["input_tokens"] else 0.0
+    lines.append("")
+    lines.append(
+        f"Total: {totals['api_calls']} calls, {totals['retries']} retries, "
+        f"{cache_share:.0f}% of input tokens cached, est. ${totals['cost_usd']:.2f}"
+    )
+
+    chapters = stats["chapters"]
+    if chapters["completed"] or chapters["failed"] or chapters["skipped"]:
+        lines.append(
+            f"Chapters: {chapters['completed']} completed, {chapters['failed']} failed, "
+            f"{chapters['skipped']} skipped | {chapters['chapters_per_hour']:.1f}/hour | "
+            f"p50 {_duration(chapters['wall_p50_seconds'])}, p95 {_duration(chapters['wall_p95_seconds'])}"
+        )
+        if chapters["wall_seconds"]:
+            lines.append(
+                f"Chapter time: {_duration(chapters['api_seconds'])} in API calls, "
+                f"{_duration(chapters['rate_wait_seconds'])} rate-limit sleep, "
+                f"{_duration(chapters['retry_wait_seconds'])} retry backoff "
+                f"(of {_duration(chapters['wall_seconds'])} chapter wall time)"
+            )
+        for row in chapters["slowest"]:
+            lines.append(
+                f"  {row['chapter']:<24} {_duration(row['wall_seconds']):>9} {row['status']:<9} "
+                f"api {_duration(row['api_seconds'])}, rate wait {_duration(row['rate_wait_seconds'])}, "
+                f"{row['retries']} retries"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,284 @@
+"""
+Event Stream - Structured JSONL telemetry for every pipeline phase.
+
+Phases append one JSON object per line to WORK/<volume>/events.jsonl:
+
+    {"ts": 1760640000.12, "run": "20261016-101500-4242", "phase": "phase2",
+     "pid": 4242, "event": "api_call", "chapter": "chapter_03",
+     "model": "gemini-2.5-pro", "input_tokens": 41234, "cached_tokens": 38000,
+     "output_tokens": 6120, "latency_seconds": 48.2, "rate_wait_seconds": 1.5}
+
+Events:
+    phase_start / phase_end        emitted by the CLI around each phase subprocess
+    run_start / run_end            translator volume run (targets, completed, failed)
+    chapter_start / chapter_end    per chapter: status, wall time, tokens, retries,
+                                   rate-limit sleep (chapter_end carries the sums
+                                   of the chapter's API events)
+    chapter_skip                   chapter already translated
+    chapter_progress               streaming milestones (first output, checkpoints)
+    api_call / api_error / api_retry   every Gemini generate call (GeminiClient)
+
+API events are tagged with the chapter whose `chapter_scope()` is active in
+the calling thread (or the thread that submitted the work through
+ChapterScheduler). The CLI points phase subprocesses at the volume's file via
+MTL_EVENTS_FILE / MTL_EVENTS_PHASE / MTL_EVENTS_RUN, tails it for the Phase 2
+progress display, and `mtl stats` aggregates it (pipeline.common.event_stats).
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENTS_FILE = "events.jsonl"
+EVENTS_FILE_ENV = "MTL_EVENTS_FILE"
+EVENTS_PHASE_ENV = "MTL_EVENTS_PHASE"
+EVENTS_RUN_ENV = "MTL_EVENTS_RUN"
+
+# API event fields summed per chapter into chapter_end
+USAGE_FIELDS = (
+    "api_calls",
+    "api_errors",
+    "retries",
+    "input_tokens",
+    "cached_tokens",
+    "output_tokens",
+    "thinking_tokens",
+    "api_seconds",
+    "rate_wait_seconds",
+    "retry_wait_seconds",
+)
+
+_current_chapter: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("event_chapter", default=None)
+
+
+@contextmanager
+def chapter_scope(chapter_id: Optional[str]) -> Iterator[None]:
+    """Tag events emitted inside the block (in this thread/context) with `chapter_id`."""
+    token = _current_chapter.set(chapter_id)
+    try:
+        yield
+    finally:
+        _current_chapter.reset(token)
+
+
+def current_chapter() -> Optional[str]:
+    return _current_chapter.get()
+
+
+def new_run_id() -> str:
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+class EventStream:
+    """Thread-safe JSONL appender with per-chapter API usage totals."""
+
+    def __init__(self, path: Path, phase: str = "", run_id: Optional[str] = None):
+        self.path = Path(path)
+        self.phase = phase
+        self.run_id = run_id or new_run_id()
+        self._lock = threading.Lock()
+        self._usage: Dict[str, Dict[str, Any]] = {}
+        self._file = None
+
+    def emit(self, event: str, **fields: Any) -> Dict[str, Any]:
+        """Append one event. Never raises: telemetry must not fail a phase."""
+        record: Dict[str, Any] = {
+            "ts": round(time.time(), 3),
+            "run": self.run_id,
+            "phase": self.phase,
+            "pid": os.getpid(),
+            "event": event,
+        }
+        chapter = fields.pop("chapter", None) or current_chapter()
+        if chapter:
+            record["chapter"] = chapter
+        record.update({key: value for key, value in fields.items() if value is not None})
+        line = json.dumps(record, ensure_ascii=False, default=str)
+
+        with self._lock:
+            if chapter and event.startswith("api_"):
+                self._accumulate(chapter, record)
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(line + "\n")
+                self._file.flush()
+            except OSError as e:
+                logger.debug(f"[EVENTS] Could not write {self.path}: {e}")
+        return record
+
+    def _accumulate(self, chapter: str, record: Dict[str, Any]) -> None:
+        usage = self._usage.setdefault(chapter, {name: 0 for name in USAGE_FIELDS} | {"models": []})
+        event = record["event"]
+        if event == "api_call":
+            usage["api_calls"] += 1
+            usage["api_seconds"] += record.get("latency_seconds", 0)
+        elif event == "api_error":
+            usage["api_errors"] += 1
+            usage["api_seconds"] += record.get("latency_seconds", 0)
+        elif event == "api_retry":
+            usage["retries"] += 1
+            usage["retry_wait_seconds"] += record.get("wait_seconds", 0)
+        for name in ("input_tokens", "cached_tokens", "output_tokens", "thinking_tokens", "rate_wait_seconds"):
+            usage[name] += record.get(name, 0) or 0
+        model = record.get("model")
+        if model and model not in usage["models"]:
+            usage["models"].append(model)
+
+    def chapter_usage(self, chapter_id: str, pop: bool = True) -> Dict[str, Any]:
+        """Summed API usage of `chapter_id` since it was last popped."""
+        with self._lock:
+            usage = self._usage.pop(chapter_id, None) if pop else self._usage.get(chapter_id)
+        if usage is None:
+            return {name: 0 for name in USAGE_FIELDS} | {"models": []}
+        usage = dict(usage)
+        for name in ("api_seconds", "rate_wait_seconds", "retry_wait_seconds"):
+            usage[name] = round(usage[name], 3)
+        return usage
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_shared_stream: Optional[EventStream] = None
+_shared_stream_loaded = False
+_shared_stream_lock = threading.Lock()
+
+
+def events_enabled() -> bool:
+    try:
+        from pipeline.config import get_config_section
+
+        cfg = (get_config_section("logging") or {}).get("events", {}) or {}
+        return bool(cfg.get("enabled", True))
+    except Exception:
+        return True
+
+
+def get_event_stream() -> Optional[EventStream]:
+    """
+    Process-wide stream: the one opened by `open_event_stream`, else the
+    file named by MTL_EVENTS_FILE (set by the CLI), else None.
+    """
+    global _shared_stream, _shared_stream_loaded
+    with _shared_stream_lock:
+        if not _shared_stream_loaded:
+            _shared_stream_loaded = True
+            path = os.environ.get(EVENTS_FILE_ENV)
+            if path and events_enabled():
+                _shared_stream = EventStream(
+                    Path(path),
+                    phase=os.environ.get(EVENTS_PHASE_ENV, ""),
+                    run_id=os.environ.get(EVENTS_RUN_ENV) or None,
+                )
+        return _shared_stream
+
+
+def open_event_stream(work_dir: Path, phase: str) -> Optional[EventStream]:
+    """
+    Stream for a phase running on `work_dir`. Under the CLI this is the stream
+    it configured through the environment; standalone runs write to
+    WORK/<volume>/events.jsonl themselves. None when events are disabled.
+    """
+    global _shared_stream
+    stream = get_event_stream()
+    if stream is not None:
+        stream.phase = stream.phase or phase
+        return stream
+    if not events_enabled():
+        return None
+    with _shared_stream_lock:
+        if _shared_stream is None:
+            _shared_stream = EventStream(Path(work_dir) / EVENTS_FILE, phase=phase)
+        return _shared_stream
+
+
+def set_event_stream(stream: Optional[EventStream]) -> None:
+    """Replace the process-wide stream (tests, CLI overrides)."""
+    global _shared_stream, _shared_stream_loaded
+    with _shared_stream_lock:
+        if _shared_stream is not None and _shared_stream is not stream:
+            _shared_stream.close()
+        _shared_stream = stream
+        _shared_stream_loaded = True
+
+
+def emit(event: str, **fields: Any) -> None:
+    """Emit on the process-wide stream, if there is one."""
+    stream = get_event_stream()
+    if stream is not None:
+        stream.emit(event, **fields)
+
+
+def chapter_usage(chapter_id: str) -> Dict[str, Any]:
+    """Pop the summed API usage of `chapter_id` from the process-wide stream."""
+    stream = get_event_stream()
+    if stream is None:
+        return {}
+    return stream.chapter_usage(chapter_id)
+
+
+def read_events(path: Path) -> List[Dict[str, Any]]:
+    """All complete events in `path`; malformed or partial lines are skipped."""
+    events = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and "event" in record:
+                    events.append(record)
+    except OSError:
+        pass
+    return events
+
+
+class EventTail:
+    """Incremental reader of an events file that another process is appending to."""
+
+    def __init__(self, path: Path, from_end: bool = True):
+        self.path = Path(path)
+        self._offset = 0
+        if from_end:
+            try:
+                self._offset = self.path.stat().st_size
+            except OSError:
+                pass
+        self._partial = b""
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Events appended since the last poll."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except OSError:
+            return []
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        events = []
+        for line in lines:
+            try:
+                record = json.loads(line.decode("utf-8"))
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "event" in record:
+                events.append(record)
+        return events
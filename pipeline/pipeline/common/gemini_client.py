@@ -7,11 +7,15 @@ import time
 import logging
 import re
 import hashlib
+import threading
 import backoff
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass
 from google.genai import types
-from pipeline.common.genai_factory import create_genai_client, resolve_api_key, resolve_genai_backend
+from pipeline.common.event_stream import emit as emit_event
+from pipeline.common.genai_factory import get_shared_genai_client, resolve_api_key, resolve_genai_backend
+from pipeline.common.rate_limiter import get_rate_limiter, is_rate_limit_error
+from pipeline.common.token_estimator import get_token_estimator
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +29,81 @@ class GeminiResponse:
     cached_tokens: int = 0  # Track cached input tokens
     thinking_content: Optional[str] = None  # CoT/thinking parts from model
 
+def _emit_retry_event(details: Dict[str, Any]) -> None:
+    """backoff hook: one api_retry event per retried generate() call."""
+    args = details.get("args") or (None,)
+    model = details.get("kwargs", {}).get("model") or getattr(args[0], "model", None)
+    emit_event(
+        "api_retry",
+        model=model,
+        attempt=details.get("tries"),
+        wait_seconds=round(details.get("wait") or 0.0, 3),
+        error=str(details.get("exception", ""))[:300],
+    )
+
+
+def _retry_wait():
+    """
+    backoff wait generator for generate(): exponential (1, 2, 4, ... s),
+    except after a 429 the shared RateLimiter already turned into a cooldown.
+    The retry's own quota acquire waits that out, so sleeping here as well
+    would pay for every 429 twice.
+    """
+    error = yield
+    n = 0
+    while True:
+        if getattr(error, "rate_limiter_cooldown", False):
+            error = yield 0
+        else:
+            error = yield 2 ** n
+            n += 1
+
+
+def _mark_cooldown_handled(error: Exception) -> None:
+    """Flag a 429 that the shared RateLimiter has scheduled a cooldown for."""
+    try:
+        error.rate_limiter_cooldown = True
+    except AttributeError:
+        pass
+
+
+def is_fatal_api_error(error: Exception) -> bool:
+    """
+    Errors a retry cannot fix: 400 Bad Request and safety blocks (the
+    caller's safety fallback handles those).
+    """
+    message = str(error)
+    return (
+        ("400" in message and "429" not in message) or
+        "PROHIBITED_CONTENT" in message.upper() or
+        "FinishReason.SAFETY" in message or
+        "FinishReason.PROHIBITED_CONTENT" in message
+    )
+
+
+def retry_api_errors(giveup: Optional[Callable[[Exception], bool]] = None):
+    """
+    generate()'s retry policy as a decorator: up to 8 tries with exponential
+    backoff, giving up on is_fatal_api_error(). `giveup` adds further stop
+    conditions for callers that wrap their own API calls.
+    """
+    return backoff.on_exception(
+        _retry_wait,
+        Exception,
+        max_tries=8,
+        on_backoff=_emit_retry_event,
+        giveup=(lambda e: is_fatal_api_error(e) or giveup(e)) if giveup else is_fatal_api_error,
+    )
+
+
+def normalize_finish_reason(reason: Any) -> str:
+    """FinishReason enum/string -> bare name ("STOP", "MAX_TOKENS"); "UNKNOWN" if unset."""
+    if not reason:
+        return "UNKNOWN"
+    name = getattr(reason, "name", None) or str(reason)
+    return name.split(".")[-1].upper()
+
+
 class GeminiClient:
     _CACHE_DISPLAY_NAME_MAX_LEN = 128
 
@@ -36,13 +115,21 @@ class GeminiClient:
         backend: Optional[str] = None,
         project: Optional[str] = None,
         location: Optional[str] = None,
+        priority: str = "translation",
     ):
-        """Initialize Gemini client with optional context caching."""
+        """
+        Initialize Gemini client with optional context caching.
+
+        `priority` is the default rate-limit class for this client's calls
+        (translation, planning, metadata, summary, qc); see
+        pipeline.common.rate_limiter.PRIORITY_CLASSES.
+        """
         self.backend = resolve_genai_backend(backend)
         self.api_key = resolve_api_key(api_key=api_key, required=(self.backend == "developer"))
 
         self.model = model
-        self.client = create_genai_client(
+        self.priority = priority
+        self.client = get_shared_genai_client(
             api_key=self.api_key,
             backend=self.backend,
             project=project,
@@ -50,6 +137,8 @@ class GeminiClient:
         )
         self._last_request_time = 0
         self._rate_limit_delay = 6.0  # ~10 requests/min default
+        # Process-wide RPM/TPM limiter shared with every other client (None = fixed delay)
+        self._rate_limiter = get_rate_limiter()
 
         # Context caching support
         self.enable_caching = enable_caching
@@ -60,6 +149,7 @@ class GeminiClient:
         self._cache_created_at = None
         self._cache_ttl_minutes = 120  # Default 2 hour TTL
         self._cached_model = None  # Track which model the cache was created for
+        self._cache_lock = threading.RLock()  # Guards internal cache state across worker threads
     
     def _load_thinking_config(self) -> Dict[str, Any]:
         """Load thinking mode configuration from config.yaml."""
@@ -105,6 +195,15 @@ class GeminiClient:
         if requests_per_minute > 0:
             self._rate_limit_delay = 60.0 / requests_per_minute
 
+    def set_rate_limiter(self, limiter) -> None:
+        """
+        Override the shared RateLimiter for this client.
+
+        When set, generate() acquires from the limiter instead of sleeping
+        for the fixed per-client delay; None restores the fixed delay.
+        """
+        self._rate_limiter = limiter
+
     def set_cache_ttl(self, minutes: int):
         """Set cache TTL in minutes (max 120)."""
         self._cache_ttl_minutes = min(minutes, 120)
@@ -213,6 +312,20 @@ class GeminiClient:
             logger.warning(f"Failed to create cache (model={target_model}): {e}")
             return None
 
+    def update_cache_ttl(self, cache_name: str, ttl_seconds: int) -> bool:
+        """Reset a cache's TTL to `ttl_seconds` from now. False if the cache is gone."""
+        if not cache_name:
+            return False
+        try:
+            self.client.caches.update(
+                name=cache_name,
+                config=types.UpdateCachedContentConfig(ttl=f"{int(ttl_seconds)}s"),
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to update TTL of cache {cache_name}: {e}")
+            return False
+
     def delete_cache(self, cache_name: str) -> bool:
         """Delete a cache by resource name."""
         if not cache_name:
@@ -277,16 +390,38 @@ class GeminiClient:
 
     def clear_cache(self):
         """Clear cached content."""
-        if self._cached_content_name:
-            try:
-                logger.info(f"Clearing context cache: {self._cached_content_name}")
-                self.delete_cache(self._cached_content_name)
-            except Exception as e:
-                logger.warning(f"Failed to delete cache: {e}")
-            finally:
-                self._cached_content_name = None
-                self._cache_created_at = None
-                self._cached_model = None
+        with self._cache_lock:
+            if self._cached_content_name:
+                try:
+                    logger.info(f"Clearing context cache: {self._cached_content_name}")
+                    self.delete_cache(self._cached_content_name)
+                except Exception as e:
+                    logger.warning(f"Failed to delete cache: {e}")
+                finally:
+                    self._cached_content_name = None
+                    self._cache_created_at = None
+                    self._cached_model = None
+
+    def _resolve_internal_cache(self, system_instruction: Optional[str], target_model: str) -> Optional[str]:
+        """Reuse or (re)create the internal system-instruction cache for target_model."""
+        with self._cache_lock:
+            # Check if cache is valid for target model
+            if not self._is_cache_valid(target_model):
+                # Need to create new cache (only if system_instruction provided)
+                if system_instruction:
+                    # Clear old cache if model changed
+                    if self._cached_content_name and self._cached_model != target_model:
+                        logger.info(f"Model changed ({self._cached_model} -> {target_model}), clearing old cache...")
+                        self.clear_cache()
+                    
+                    # Create new cache for target model
+                    return self._create_cached_content(system_instruction, target_model)
+                return None
+
+            # Cache is valid - reuse it
+            cache_age = (time.time() - self._cache_created_at) / 60
+            logger.debug(f"Using existing context cache (age: {cache_age:.1f}m / {self._cache_ttl_minutes}m, model: {self._cached_model})")
+            return self._cached_content_name
 
     def warm_cache(self, system_instruction: str, model: str = None) -> bool:
         """Pre-warm cache with system instruction before first translation.
@@ -302,39 +437,161 @@ class GeminiClient:
             logger.debug("Cache warming skipped (caching disabled)")
             return False
             
-        if self._is_cache_valid(model):
-            logger.debug("Cache already valid, skipping warm-up")
-            return True
-            
-        target_model = model or self.model
-        cached_content_name = self._create_cached_content(system_instruction, target_model)
-        return cached_content_name is not None
+        with self._cache_lock:
+            if self._is_cache_valid(model):
+                logger.debug("Cache already valid, skipping warm-up")
+                return True
+                
+            target_model = model or self.model
+            cached_content_name = self._create_cached_content(system_instruction, target_model)
+            return cached_content_name is not None
+
+    def _wait_for_quota(self, target_model: str, estimated_tokens: int, priority: Optional[str]) -> float:
+        """Block until the call may be sent. Returns seconds spent waiting."""
+        if self._rate_limiter is not None:
+            return self._rate_limiter.acquire(
+                target_model,
+                tokens=estimated_tokens,
+                priority=priority or self.priority,
+            )
+        elapsed = time.time() - self._last_request_time
+        if elapsed < self._rate_limit_delay:
+            time.sleep(self._rate_limit_delay - elapsed)
+            return self._rate_limit_delay - elapsed
+        return 0.0
+
+    @staticmethod
+    def _usage_event_fields(usage: Any) -> Dict[str, int]:
+        """Token counts of a response's usage_metadata for api_call events."""
+        if not usage:
+            return {}
+        return {
+            "input_tokens": getattr(usage, "prompt_token_count", None) or 0,
+            "cached_tokens": getattr(usage, "cached_content_token_count", None) or 0,
+            "output_tokens": getattr(usage, "candidates_token_count", None) or 0,
+            "thinking_tokens": getattr(usage, "thoughts_token_count", None) or 0,
+        }
+
+    @staticmethod
+    def _estimate_request_tokens(prompt: Any, system_instruction: Optional[str]) -> int:
+        """Pre-call input token estimate for TPM budgeting (offline, see token_estimator)."""
+        text = prompt if isinstance(prompt, str) else str(prompt or "")
+        estimator = get_token_estimator()
+        return estimator.estimate(text) + estimator.estimate(system_instruction or "")
 
     def get_token_count(self, text: str) -> int:
-        """Count tokens for text."""
+        """
+        Count tokens for text with the API. Each result is stored as a
+        calibration sample for the offline estimator, which is also the
+        fallback when the call fails.
+        """
         try:
             response = self.client.models.count_tokens(
                 model=self.model,
                 contents=text
             )
+            get_token_estimator().record(text, response.total_tokens, model=self.model)
             return response.total_tokens
         except Exception as e:
             logger.warning(f"Failed to count tokens: {e}")
-            # Fallback estimation: ~4 chars per token
-            return len(text) // 4
+            return get_token_estimator().estimate(text)
 
-    @backoff.on_exception(
-        backoff.expo,
-        (Exception),
-        max_tries=8,
-        # Give up on 400 Bad Request and safety blocks (let safety_fallback handle)
-        giveup=lambda e: (
-            ("400" in str(e) and "429" not in str(e)) or
-            "PROHIBITED_CONTENT" in str(e).upper() or
-            "FinishReason.SAFETY" in str(e) or
-            "FinishReason.PROHIBITED_CONTENT" in str(e)
-        )
-    )
+    def _build_generate_config(
+        self,
+        system_instruction: Optional[str],
+        target_model: str,
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        max_output_tokens: int,
+        safety_settings: Optional[List[Any]],
+        cached_content: Optional[str],
+        force_new_session: bool,
+        tools: Optional[List[Any]],
+    ):
+        """
+        Build the GenerateContentConfig shared by generate() and generate_stream().
+
+        Returns:
+            (config, cached_content_name) where cached_content_name is the
+            cache actually used (external, internal or None).
+        """
+        if safety_settings is None:
+            safety_settings = [
+                types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="HARM_CATEGORY_CIVIC_INTEGRITY", threshold="BLOCK_NONE")
+            ]
+
+        # Context Caching Logic
+        cached_content_name = cached_content  # Use external cache if provided
+        
+        # AMNESIA PROTOCOL: force_new_session bypasses internal cache
+        if force_new_session:
+            logger.info("[AMNESIA] Forcing new session - bypassing internal cache")
+            cached_content_name = cached_content  # Only use external cache if provided
+        # Only create/use internal cache if no external cache provided and not forcing new session
+        elif not cached_content_name and self.enable_caching:
+            cached_content_name = self._resolve_internal_cache(system_instruction, target_model)
+        
+        elif cached_content:
+            logger.debug(f"Using external cached content: {cached_content}")
+
+        # Build config based on caching mode
+        if cached_content_name:
+            # Use cached content (system_instruction is in the cache)
+            cache_source = "external" if cached_content else "internal"
+            config_kwargs = dict(
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                max_output_tokens=max_output_tokens,
+                cached_content=cached_content_name,
+                safety_settings=safety_settings,
+                automatic_function_calling=None  # Disable AFC to prevent loops
+            )
+            # NOTE: tools/tool_config cannot be passed with cached_content.
+            # They must be provided at cache creation time.
+            if tools:
+                logger.debug(
+                    "Ignoring tools in generate() because cached_content is set; "
+                    "tools must be embedded in CachedContent."
+                )
+            config = types.GenerateContentConfig(**config_kwargs)
+            
+            # Add thinking config if enabled (works with cached content too)
+            thinking_config = self._get_thinking_config()
+            if thinking_config:
+                config.thinking_config = thinking_config
+                logger.debug(f"Thinking mode enabled with cached content (budget: -1)")
+            
+            logger.debug(f"Using {cache_source} cached system instruction: {cached_content_name}")
+        else:
+            # Standard mode (no caching or fallback)
+            config_kwargs = dict(
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                max_output_tokens=max_output_tokens,
+                system_instruction=system_instruction,
+                safety_settings=safety_settings,
+                automatic_function_calling=None  # Disable AFC to prevent loops
+            )
+            if tools:
+                config_kwargs["tools"] = tools
+            config = types.GenerateContentConfig(**config_kwargs)
+            
+            # Add thinking config if enabled
+            thinking_config = self._get_thinking_config()
+            if thinking_config:
+                config.thinking_config = thinking_config
+                logger.debug(f"Thinking mode enabled (budget: -1 dynamic)")
+
+        return config, cached_content_name
+
+    @retry_api_errors()
     def generate(
         self,
         prompt: str,
@@ -347,6 +604,7 @@ class GeminiClient:
         force_new_session: bool = False,
         generation_config: Dict[str, Any] = None,
         tools: Optional[List[Any]] = None,
+        priority: Optional[str] = None,
     ) -> GeminiResponse:
         """
         Generate content with retry logic, rate limiting, and optional context caching.
@@ -362,6 +620,7 @@ class GeminiClient:
             force_new_session: If True, ignores internal cache and starts fresh (for Amnesia Protocol)
             generation_config: Dict with temperature, top_p, top_k overrides
             tools: Optional Gemini tools (e.g., Google Search grounding)
+            priority: Rate-limit class override for this call (defaults to self.priority)
         """
         target_model = model or self.model
         
@@ -376,98 +635,22 @@ class GeminiClient:
             top_k = 40
 
         # Enforce rate limit
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._rate_limit_delay:
-            time.sleep(self._rate_limit_delay - elapsed)
-
-        if safety_settings is None:
-            safety_settings = [
-                types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="BLOCK_NONE"),
-                types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="BLOCK_NONE"),
-                types.SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
-                types.SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
-                types.SafetySetting(category="HARM_CATEGORY_CIVIC_INTEGRITY", threshold="BLOCK_NONE")
-            ]
+        estimated_tokens = self._estimate_request_tokens(prompt, None if cached_content else system_instruction)
+        rate_wait = self._wait_for_quota(target_model, estimated_tokens, priority)
 
         try:
-            # Context Caching Logic
-            cached_content_name = cached_content  # Use external cache if provided
-            
-            # AMNESIA PROTOCOL: force_new_session bypasses internal cache
-            if force_new_session:
-                logger.info("[AMNESIA] Forcing new session - bypassing internal cache")
-                cached_content_name = cached_content  # Only use external cache if provided
-            # Only create/use internal cache if no external cache provided and not forcing new session
-            elif not cached_content_name and self.enable_caching:
-                # Check if cache is valid for target model
-                if not self._is_cache_valid(target_model):
-                    # Need to create new cache (only if system_instruction provided)
-                    if system_instruction:
-                        # Clear old cache if model changed
-                        if self._cached_content_name and self._cached_model != target_model:
-                            logger.info(f"Model changed ({self._cached_model} -> {target_model}), clearing old cache...")
-                            self.clear_cache()
-                        
-                        # Create new cache for target model
-                        cached_content_name = self._create_cached_content(system_instruction, target_model)
-                else:
-                    # Cache is valid - reuse it
-                    cached_content_name = self._cached_content_name
-                    cache_age = (time.time() - self._cache_created_at) / 60
-                    logger.debug(f"Using existing context cache (age: {cache_age:.1f}m / {self._cache_ttl_minutes}m, model: {self._cached_model})")
-            
-            elif cached_content:
-                logger.debug(f"Using external cached content: {cached_content}")
-
-            # Build config based on caching mode
-            if cached_content_name:
-                # Use cached content (system_instruction is in the cache)
-                cache_source = "external" if cached_content else "internal"
-                config_kwargs = dict(
-                    temperature=temperature,
-                    top_p=top_p,
-                    top_k=top_k,
-                    max_output_tokens=max_output_tokens,
-                    cached_content=cached_content_name,
-                    safety_settings=safety_settings,
-                    automatic_function_calling=None  # Disable AFC to prevent loops
-                )
-                # NOTE: tools/tool_config cannot be passed with cached_content.
-                # They must be provided at cache creation time.
-                if tools:
-                    logger.debug(
-                        "Ignoring tools in generate() because cached_content is set; "
-                        "tools must be embedded in CachedContent."
-                    )
-                config = types.GenerateContentConfig(**config_kwargs)
-                
-                # Add thinking config if enabled (works with cached content too)
-                thinking_config = self._get_thinking_config()
-                if thinking_config:
-                    config.thinking_config = thinking_config
-                    logger.debug(f"Thinking mode enabled with cached content (budget: -1)")
-                
-                logger.debug(f"Using {cache_source} cached system instruction: {cached_content_name}")
-            else:
-                # Standard mode (no caching or fallback)
-                config_kwargs = dict(
-                    temperature=temperature,
-                    top_p=top_p,
-                    top_k=top_k,
-                    max_output_tokens=max_output_tokens,
-                    system_instruction=system_instruction,
-                    safety_settings=safety_settings,
-                    automatic_function_calling=None  # Disable AFC to prevent loops
-                )
-                if tools:
-                    config_kwargs["tools"] = tools
-                config = types.GenerateContentConfig(**config_kwargs)
-                
-                # Add thinking config if enabled
-                thinking_config = self._get_thinking_config()
-                if thinking_config:
-                    config.thinking_config = thinking_config
-                    logger.debug(f"Thinking mode enabled (budget: -1 dynamic)")
+            config, cached_content_name = self._build_generate_config(
+                system_instruction=system_instruction,
+                target_model=target_model,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                max_output_tokens=max_output_tokens,
+                safety_settings=safety_settings,
+                cached_content=cached_content,
+                force_new_session=force_new_session,
+                tools=tools,
+            )
 
             # Log API call with accurate cache status (check AFTER internal cache logic)
             logger.info(f"Calling Gemini API (model: {target_model}, cached: {bool(cached_content_name)})...")
@@ -490,6 +673,19 @@ class GeminiClient:
             input_tokens = usage.prompt_token_count if usage else 0
             output_tokens = usage.candidates_token_count if usage else 0
 
+            if self._rate_limiter is not None:
+                self._rate_limiter.report_success(target_model)
+                self._rate_limiter.record_usage(target_model, estimated_tokens, input_tokens or 0)
+            emit_event(
+                "api_call",
+                model=target_model,
+                priority=priority or self.priority,
+                latency_seconds=round(duration, 3),
+                rate_wait_seconds=round(rate_wait, 3),
+                finish_reason=finish_reason_str,
+                **self._usage_event_fields(usage),
+            )
+
             # Safely extract cached token count
             cached_tokens = 0
             if usage and hasattr(usage, 'cached_content_token_count'):
@@ -563,4 +759,153 @@ class GeminiClient:
 
         except Exception as e:
             logger.error(f"Gemini API error: {str(e)}")
+            rate_limited = is_rate_limit_error(e)
+            if self._rate_limiter is not None and rate_limited:
+                self._rate_limiter.report_rate_limited(target_model, e)
+                _mark_cooldown_handled(e)
+            emit_event(
+                "api_error",
+                model=target_model,
+                rate_wait_seconds=round(rate_wait, 3),
+                rate_limited=rate_limited,
+                error=str(e)[:300],
+            )
+            raise
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_instruction: str = None,
+        temperature: float = 0.7,
+        max_output_tokens: int = 65536,
+        model: str = None,
+        cached_content: str = None,
+        force_new_session: bool = False,
+        priority: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> GeminiResponse:
+        """
+        Streaming variant of generate().
+
+        Text parts are handed to `on_text` as they arrive; thought parts are
+        collected into thinking_content. There is no backoff retry here: a
+        stream that fails midway has already delivered part of its output, so
+        the caller decides whether to resume from what it received (see
+        retry_api_errors for failures before any output).
+
+        finish_reason is the normalized reason of the last chunk ("STOP",
+        "MAX_TOKENS", ...). A stream without any candidate means the prompt
+        itself was blocked and reports "BLOCKED" (or "BLOCKED_<reason>").
+        """
+        target_model = model or self.model
+
+        estimated_tokens = self._estimate_request_tokens(prompt, None if cached_content else system_instruction)
+        rate_wait = self._wait_for_quota(target_model, estimated_tokens, priority)
+
+        try:
+            config, cached_content_name = self._build_generate_config(
+                system_instruction=system_instruction,
+                target_model=target_model,
+                temperature=temperature,
+                top_p=0.95,
+                top_k=40,
+                max_output_tokens=max_output_tokens,
+                safety_settings=None,
+                cached_content=cached_content,
+                force_new_session=force_new_session,
+                tools=None,
+            )
+
+            logger.info(f"Streaming Gemini API (model: {target_model}, cached: {bool(cached_content_name)})...")
+            start_time = time.time()
+            text_parts: List[str] = []
+            thinking_parts: List[str] = []
+            usage = None
+            finish_reason = None
+            block_reason = None
+            saw_candidate = False
+            for chunk in self.client.models.generate_content_stream(
+                model=target_model,
+                contents=prompt,
+                config=config
+            ):
+                if chunk.usage_metadata:
+                    usage = chunk.usage_metadata
+                feedback = getattr(chunk, "prompt_feedback", None)
+                if feedback is not None and getattr(feedback, "block_reason", None):
+                    block_reason = feedback.block_reason
+                if not chunk.candidates:
+                    continue
+                saw_candidate = True
+                candidate = chunk.candidates[0]
+                if candidate.finish_reason:
+                    finish_reason = candidate.finish_reason
+                if not (candidate.content and candidate.content.parts):
+                    continue
+                for part in candidate.content.parts:
+                    if not getattr(part, 'text', None):
+                        continue
+                    if getattr(part, 'thought', False):
+                        thinking_parts.append(part.text)
+                        continue
+                    text_parts.append(part.text)
+                    if on_text is not None:
+                        on_text(part.text)
+
+            duration = time.time() - start_time
+            if saw_candidate:
+                finish_reason_str = normalize_finish_reason(finish_reason)
+            elif block_reason:
+                finish_reason_str = f"BLOCKED_{normalize_finish_reason(block_reason)}"
+            else:
+                finish_reason_str = "BLOCKED"
+            logger.info(f"Gemini stream finished in {duration:.2f}s (finish_reason: {finish_reason_str})")
+            self._last_request_time = time.time()
+
+            input_tokens = (usage.prompt_token_count or 0) if usage else 0
+            output_tokens = (usage.candidates_token_count or 0) if usage else 0
+            cached_tokens = (getattr(usage, 'cached_content_token_count', None) or 0) if usage else 0
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.report_success(target_model)
+                self._rate_limiter.record_usage(target_model, estimated_tokens, input_tokens)
+            emit_event(
+                "api_call",
+                model=target_model,
+                priority=priority or self.priority,
+                stream=True,
+                latency_seconds=round(duration, 3),
+                rate_wait_seconds=round(rate_wait, 3),
+                finish_reason=finish_reason_str,
+                **self._usage_event_fields(usage),
+            )
+
+            content = "".join(text_parts)
+            if not content:
+                logger.warning(f"Empty streamed response from Gemini. Reason: {finish_reason_str}")
+
+            return GeminiResponse(
+                content=content,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                finish_reason=finish_reason_str,
+                model=target_model,
+                cached_tokens=cached_tokens,
+                thinking_content="\n\n".join(thinking_parts) if thinking_parts else None
+            )
+
+        except Exception as e:
+            logger.error(f"Gemini stream error: {str(e)}")
+            rate_limited = is_rate_limit_error(e)
+            if self._rate_limiter is not None and rate_limited:
+                self._rate_limiter.report_rate_limited(target_model, e)
+                _mark_cooldown_handled(e)
+            emit_event(
+                "api_error",
+                model=target_model,
+                stream=True,
+                rate_wait_seconds=round(rate_wait, 3),
+                rate_limited=rate_limited,
+                error=str(e)[:300],
+            )
             raise
@@ -9,7 +9,8 @@ Supports dual-mode initialization:
 from __future__ import annotations
 
 import os
-from typing import Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 from google import genai
 
@@ -157,3 +158,40 @@ def create_genai_client(
         if key:
             return genai.Client(api_key=key)
         raise
+
+
+_shared_clients: Dict[Tuple[str, Optional[str], Optional[str], Optional[str]], genai.Client] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_genai_client(
+    *,
+    api_key: Optional[str] = None,
+    backend: Optional[str] = None,
+    project: Optional[str] = None,
+    location: Optional[str] = None,
+) -> genai.Client:
+    """
+    Return a process-wide google.genai.Client for the given credentials.
+
+    Reusing one client keeps a single HTTP connection pool per backend/key
+    instead of opening a new one for every wrapper instance.
+    """
+    resolved_backend = resolve_genai_backend(backend)
+    key = (
+        resolved_backend,
+        resolve_api_key(api_key=api_key, required=False),
+        project,
+        location,
+    )
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = create_genai_client(
+                api_key=api_key,
+                backend=resolved_backend,
+                project=project,
+                location=location,
+            )
+            _shared_clients[key] = client
+        return client
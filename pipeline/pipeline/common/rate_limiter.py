@@ -0,0 +1,407 @@
+"""
+Token-bucket rate limiting for Gemini API calls.
+
+A single bucket can be shared by every worker thread that talks to the same
+quota (e.g. concurrent chapter translations), replacing the fixed
+"sleep N seconds since last request" throttle of the individual clients.
+
+`RateLimiter` is the process-wide layer on top: one requests-per-minute and
+one tokens-per-minute bucket per model, priority classes so translation is
+served ahead of QC, and 429-aware adaptive backoff shared by every client.
+Use `get_rate_limiter()` to obtain the instance configured from
+`gemini.rate_limit.shared` in config.yaml.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lower rank is served first when several callers wait on the same model.
+PRIORITY_CLASSES: Dict[str, int] = {
+    "translation": 0,
+    "planning": 10,
+    "metadata": 10,
+    "summary": 20,
+    "qc": 30,
+}
+DEFAULT_PRIORITY = "translation"
+
+_RETRY_AFTER_PATTERNS = (
+    re.compile(r"retry[_ ]?delay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE),
+    re.compile(r"retry in (\d+(?:\.\d+)?)\s*s", re.IGNORECASE),
+    re.compile(r"retry[- ]after['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)", re.IGNORECASE),
+)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate_per_minute / 60`` per second up to
+    ``capacity``. ``acquire()`` blocks until enough tokens are available.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive (got {rate_per_minute})")
+        self.rate_per_second = float(rate_per_minute) / 60.0
+        self.capacity = float(capacity) if capacity and capacity > 0 else 1.0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        self.total_wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    def _delay_for(self, tokens: float) -> float:
+        """Seconds until `tokens` are available (0 if available now). Caller holds the lock."""
+        if self._tokens >= tokens:
+            return 0.0
+        return (tokens - self._tokens) / self.rate_per_second
+
+    def adjust(self, delta: float) -> None:
+        """Add (or, if negative, remove) tokens; the balance may go into debt."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self.capacity, self._tokens + delta)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if immediately available; never blocks."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until ``tokens`` are available and consume them.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        tokens = min(float(tokens), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                delay = self._delay_for(tokens)
+                if delay <= 0:
+                    self._tokens -= tokens
+                    self.total_wait_seconds += waited
+                    return waited
+            logger.debug(f"[RATE] Waiting {delay:.2f}s for token bucket")
+            self._sleep(delay)
+            waited += delay
+
+
+@dataclass
+class _ModelQuota:
+    """Per-model bucket pair plus adaptive-backoff state."""
+    requests: TokenBucket
+    tokens: Optional[TokenBucket]
+    base_rate_per_second: float
+    rate_factor: float = 1.0
+    cooldown_until: float = 0.0
+    rate_limited_streak: int = 0
+    waiters: List[Tuple[int, int]] = field(default_factory=list)
+    wait_seconds: float = 0.0
+    requests_granted: int = 0
+    rate_limited_count: int = 0
+
+
+class RateLimiter:
+    """
+    Process-wide Gemini quota manager.
+
+    Every model gets its own RPM bucket and (optionally) TPM bucket. Callers
+    waiting on the same model are queued by priority class, then FIFO.
+    A 429 from any client pauses the whole model for the server-advised
+    retry delay (or an exponential backoff) and halves its request rate;
+    successful calls restore the rate gradually.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 10,
+        tokens_per_minute: float = 0,
+        burst: float = 1,
+        model_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        base_backoff_seconds: float = 5.0,
+        max_backoff_seconds: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute or 0)
+        self.burst = float(burst or 1)
+        self.model_overrides = dict(model_overrides or {})
+        self.base_backoff_seconds = float(base_backoff_seconds)
+        self.max_backoff_seconds = float(max_backoff_seconds)
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition(threading.Lock())
+        self._quotas: Dict[str, _ModelQuota] = {}
+        self._sequence = itertools.count()
+
+    # ------------------------------------------------------------------
+    # Bucket management
+    # ------------------------------------------------------------------
+
+    def _quota_for(self, model: Optional[str]) -> _ModelQuota:
+        """Get or create the quota for `model`. Caller holds the condition lock."""
+        key = model or "default"
+        quota = self._quotas.get(key)
+        if quota is None:
+            override = self.model_overrides.get(key, {}) or {}
+            rpm = float(override.get("requests_per_minute", self.requests_per_minute))
+            tpm = float(override.get("tokens_per_minute", self.tokens_per_minute) or 0)
+            burst = float(override.get("burst", self.burst) or 1)
+            requests = TokenBucket(rpm, capacity=burst, clock=self._clock, sleep=self._sleep)
+            tokens = TokenBucket(tpm, capacity=tpm, clock=self._clock, sleep=self._sleep) if tpm > 0 else None
+            quota = _ModelQuota(
+                requests=requests,
+                tokens=tokens,
+                base_rate_per_second=requests.rate_per_second,
+            )
+            self._quotas[key] = quota
+        return quota
+
+    @staticmethod
+    def _priority_rank(priority: Optional[str]) -> int:
+        if priority is None:
+            priority = DEFAULT_PRIORITY
+        if isinstance(priority, int):
+            return priority
+        return PRIORITY_CLASSES.get(str(priority).lower(), PRIORITY_CLASSES["qc"])
+
+    def _reserve(self, quota: _ModelQuota, tokens: float, now: float) -> float:
+        """Consume one request (+tokens) if possible; return delay otherwise."""
+        if now < quota.cooldown_until:
+            return quota.cooldown_until - now
+
+        requests = quota.requests
+        requests._refill(now)
+        delay = requests._delay_for(1.0)
+        token_cost = 0.0
+        if quota.tokens is not None and tokens > 0:
+            token_cost = min(float(tokens), quota.tokens.capacity)
+            quota.tokens._refill(now)
+            delay = max(delay, quota.tokens._delay_for(token_cost))
+        if delay > 0:
+            return delay
+
+        requests._tokens -= 1.0
+        if quota.tokens is not None and token_cost:
+            quota.tokens._tokens -= token_cost
+        return 0.0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def acquire(self, model: Optional[str] = None, tokens: float = 0, priority: Optional[str] = None) -> float:
+        """
+        Block until `model` has quota for one request of ~`tokens` input tokens.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        ticket = (self._priority_rank(priority), next(self._sequence))
+        waited = 0.0
+        with self._cond:
+            quota = self._quota_for(model)
+            heapq.heappush(quota.waiters, ticket)
+        try:
+            while True:
+                with self._cond:
+                    if quota.waiters[0] != ticket:
+                        # Someone with higher priority (or earlier) is ahead.
+                        start = self._clock()
+                        self._cond.wait(timeout=0.5)
+                        waited += max(0.0, self._clock() - start)
+                        continue
+                    delay = self._reserve(quota, tokens, self._clock())
+                    if delay <= 0:
+                        heapq.heappop(quota.waiters)
+                        quota.wait_seconds += waited
+                        quota.requests_granted += 1
+                        self._cond.notify_all()
+                        return waited
+                logger.debug(f"[RATE] {model or 'default'}: waiting {delay:.2f}s for quota")
+                self._sleep(delay)
+                waited += delay
+        except BaseException:
+            with self._cond:
+                if ticket in quota.waiters:
+                    quota.waiters.remove(ticket)
+                    heapq.heapify(quota.waiters)
+                self._cond.notify_all()
+            raise
+
+    def record_usage(self, model: Optional[str], estimated_tokens: float, actual_tokens: float) -> None:
+        """Correct the TPM bucket once the real prompt token count is known."""
+        with self._cond:
+            quota = self._quota_for(model)
+        if quota.tokens is None:
+            return
+        delta = float(estimated_tokens or 0) - float(actual_tokens or 0)
+        if delta:
+            quota.tokens.adjust(delta)
+
+    def report_rate_limited(self, model: Optional[str], error: Any = None) -> float:
+        """
+        Register a 429/RESOURCE_EXHAUSTED for `model`.
+
+        Pauses all callers for that model and halves its request rate.
+
+        Returns:
+            The cooldown in seconds.
+        """
+        retry_after = parse_retry_after(error)
+        with self._cond:
+            quota = self._quota_for(model)
+            quota.rate_limited_streak += 1
+            quota.rate_limited_count += 1
+            if retry_after is None:
+                retry_after = self.base_backoff_seconds * (2 ** (quota.rate_limited_streak - 1))
+            cooldown = min(self.max_backoff_seconds, max(0.0, retry_after))
+            quota.cooldown_until = max(quota.cooldown_until, self._clock() + cooldown)
+            quota.rate_factor = max(0.1, quota.rate_factor * 0.5)
+            quota.requests.rate_per_second = quota.base_rate_per_second * quota.rate_factor
+            self._cond.notify_all()
+        logger.warning(
+            f"[RATE] 429 for {model or 'default'}: pausing {cooldown:.1f}s, "
+            f"rate x{quota.rate_factor:.2f}"
+        )
+        return cooldown
+
+    def report_success(self, model: Optional[str]) -> None:
+        """Additively restore the request rate after a successful call."""
+        with self._cond:
+            quota = self._quota_for(model)
+            quota.rate_limited_streak = 0
+            if quota.rate_factor < 1.0:
+                quota.rate_factor = min(1.0, quota.rate_factor + 0.1)
+                quota.requests.rate_per_second = quota.base_rate_per_second * quota.rate_factor
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model counters (granted requests, wait time, 429s, rate factor)."""
+        with self._cond:
+            return {
+                model: {
+                    "requests_granted": quota.requests_granted,
+                    "wait_seconds": round(quota.wait_seconds, 3),
+                    "rate_limited": quota.rate_limited_count,
+                    "rate_factor": quota.rate_factor,
+                }
+                for model, quota in self._quotas.items()
+            }
+
+
+def parse_retry_after(error: Any) -> Optional[float]:
+    """Extract a server-advised retry delay (seconds) from a 429 error, if any."""
+    if error is None:
+        return None
+    text = str(error)
+    for pattern in _RETRY_AFTER_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                continue
+    return None
+
+
+def is_rate_limit_error(error: Any) -> bool:
+    """True for 429 / quota-exhausted API errors."""
+    text = str(error).upper()
+    return "429" in text or "RESOURCE_EXHAUSTED" in text or "RATE LIMIT" in text
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+# Former effective rate of the common GeminiClient (6.0 s between calls per
+# instance); gemini.rate_limit.requests_per_minute is the legacy translator
+# client's own quota and is deliberately not inherited.
+DEFAULT_SHARED_RPM = 10
+# Lets the largest default worker pool (planner / Vision, 4) start together
+DEFAULT_SHARED_BURST = 4
+
+
+def _load_shared_config() -> Dict[str, Any]:
+    try:
+        from pipeline.config import get_config_section
+
+        rate_limit = (get_config_section("gemini") or {}).get("rate_limit", {}) or {}
+    except Exception:
+        rate_limit = {}
+    shared = rate_limit.get("shared", {}) or {}
+    return {
+        "enabled": bool(shared.get("enabled", True)),
+        "requests_per_minute": shared.get("requests_per_minute", DEFAULT_SHARED_RPM),
+        "tokens_per_minute": shared.get("tokens_per_minute", 0),
+        "burst": shared.get("burst", DEFAULT_SHARED_BURST),
+        "models": shared.get("models", {}) or {},
+        "base_backoff_seconds": rate_limit.get("retry_delay_seconds", 5),
+        "max_backoff_seconds": shared.get("max_backoff_seconds", 120),
+    }
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Process-wide limiter shared by every Gemini client.
+
+    Returns None when `gemini.rate_limit.shared.enabled` is false, in which
+    case clients fall back to their own per-instance throttling.
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            cfg = _load_shared_config()
+            if not cfg["enabled"]:
+                return None
+            _shared_limiter = RateLimiter(
+                requests_per_minute=cfg["requests_per_minute"],
+                tokens_per_minute=cfg["tokens_per_minute"],
+                burst=cfg["burst"],
+                model_overrides=cfg["models"],
+                base_backoff_seconds=cfg["base_backoff_seconds"],
+                max_backoff_seconds=cfg["max_backoff_seconds"],
+            )
+            logger.debug(
+                f"[RATE] Shared limiter: {cfg['requests_per_minute']} rpm, "
+                f"{cfg['tokens_per_minute'] or 'untracked'} tpm, "
+                f"{len(cfg['models'])} model override(s)"
+            )
+        return _shared_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Replace the process-wide limiter (tests, CLI overrides)."""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        _shared_limiter = limiter
@@ -0,0 +1,84 @@
+import json
+import time
+
+from pipeline.common.context_cache_registry import ContextCacheRegistry
+
+
+class _FakeCacheClient:
+    enable_caching = True
+
+    def __init__(self):
+        self.live = {}
+        self.created = 0
+
+    def create_cache(self, **kwargs):
+        self.created += 1
+        name = f"cachedContents/{self.created}"
+        self.live[name] = kwargs["ttl_seconds"]
+        return name
+
+    def update_cache_ttl(self, cache_name, ttl_seconds):
+        if cache_name not in self.live:
+            return False
+        self.live[cache_name] = ttl_seconds
+        return True
+
+    def delete_cache(self, cache_name):
+        return self.live.pop(cache_name, None) is not None
+
+
+def _acquire(registry, client, corpus="第一章\n本文", label="translator_volume"):
+    return registry.acquire(
+        client,
+        model="gemini-2.5-flash",
+        system_instruction="Translate.",
+        contents=[corpus],
+        ttl_seconds=7200,
+        label=label,
+    )
+
+
+def test_identical_request_reuses_cache_across_phases_and_runs(tmp_path):
+    client = _FakeCacheClient()
+    name = _acquire(ContextCacheRegistry(tmp_path), client, label="phase1.55_richmeta")
+    ContextCacheRegistry(tmp_path).release(client, name)
+    assert client.live[name] == 30 * 60
+
+    # A later phase (or re-run) with the same model/instruction/corpus extends it
+    rerun = ContextCacheRegistry(tmp_path)
+    assert _acquire(rerun, client) == name
+    assert client.created == 1
+    assert client.live[name] == 7200
+    assert rerun.find("translator_volume") == name
+
+    # A different corpus is a different cache
+    assert _acquire(rerun, client, corpus="第二章") != name
+    assert client.created == 2
+
+
+def test_cache_gone_remotely_is_recreated(tmp_path):
+    client = _FakeCacheClient()
+    registry = ContextCacheRegistry(tmp_path)
+    name = _acquire(registry, client)
+    client.live.clear()
+
+    new_name = _acquire(registry, client)
+    assert new_name != name
+    assert [entry["name"] for entry in registry.entries().values()] == [new_name]
+
+
+def test_expired_entries_are_collected_and_zero_retention_deletes(tmp_path):
+    client = _FakeCacheClient()
+    registry = ContextCacheRegistry(tmp_path, retain_minutes=0)
+    name = _acquire(registry, client)
+    registry.release(client, name)
+    assert name not in client.live
+    assert registry.entries() == {}
+
+    _acquire(registry, client, corpus="old")
+    data = json.loads(registry.path.read_text(encoding="utf-8"))
+    for entry in data["caches"].values():
+        entry["expires_at"] = time.time() - 1
+    registry.path.write_text(json.dumps(data), encoding="utf-8")
+    assert registry.collect_garbage() == 1
+    assert registry.entries() == {}
@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from pipeline.common.event_stats import aggregate, call_cost, select_runs
+from pipeline.common.event_stream import EventStream, EventTail, chapter_scope, read_events
+
+PRICING = {
+    "gemini-2.5-pro": {"input": 1.25, "cached_input": 0.31, "output": 10.0},
+    "gemini-2.5": {"input": 100.0, "cached_input": 100.0, "output": 100.0},
+}
+
+
+def test_events_are_appended_and_tailed_across_partial_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    stream = EventStream(path, phase="phase2", run_id="run-1")
+    tail = EventTail(path)
+    stream.emit("run_start", chapters=2, model=None)
+
+    events = tail.poll()
+    assert [e["event"] for e in events] == ["run_start"]
+    assert events[0]["run"] == "run-1" and events[0]["phase"] == "phase2"
+    assert "model" not in events[0]
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"event": "chapter_start", "chap')
+    assert tail.poll() == []
+    assert [e["event"] for e in read_events(path)] == ["run_start"]
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('ter": "ch01"}\n')
+    assert tail.poll() == [{"event": "chapter_start", "chapter": "ch01"}]
+    stream.close()
+
+
+def test_chapter_scope_tags_api_events_and_sums_usage(tmp_path):
+    stream = EventStream(tmp_path / "events.jsonl", phase="phase2", run_id="run-1")
+
+    def worker(chapter_id, calls):
+        with chapter_scope(chapter_id):
+            for _ in range(calls):
+                stream.emit("api_call", model="gemini-2.5-pro", input_tokens=1000, cached_tokens=600,
+                            output_tokens=200, latency_seconds=1.5, rate_wait_seconds=0.25)
+            stream.emit("api_retry", wait_seconds=2.0)
+
+    threads = [threading.Thread(target=worker, args=(f"ch{i}", i + 1)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stream.emit("api_call", model="gemini-2.5-flash", input_tokens=5)  # outside any chapter
+
+    usage = stream.chapter_usage("ch2")
+    assert usage["api_calls"] == 3 and usage["retries"] == 1
+    assert usage["input_tokens"] == 3000 and usage["cached_tokens"] == 1800
+    assert usage["api_seconds"] == 4.5 and usage["rate_wait_seconds"] == 0.75
+    assert usage["retry_wait_seconds"] == 2.0
+    assert usage["models"] == ["gemini-2.5-pro"]
+    assert stream.chapter_usage("ch2")["api_calls"] == 0  # popped
+
+    events = read_events(stream.path)
+    assert sum(1 for e in events if e.get("chapter") == "ch1") == 3  # 2 calls + 1 retry
+    assert "chapter" not in events[-1]
+    stream.close()
+
+
+def test_aggregate_reports_throughput_and_cost():
+    events = [
+        {"run": "old", "phase": "phase2", "event": "chapter_end", "chapter": "ch01", "status": "completed",
+         "wall_seconds": 999.0, "ts": 1.0},
+        {"run": "new", "phase": "phase2", "event": "run_start", "chapters": 3, "ts": 100.0},
+        {"run": "new", "phase": "phase2", "event": "api_call", "chapter": "ch01", "model": "models/gemini-2.5-pro",
+         "input_tokens": 1_000_000, "cached_tokens": 800_000, "output_tokens": 50_000, "thinking_tokens": 50_000,
+         "latency_seconds": 60.0, "rate_wait_seconds": 5.0, "ts": 160.0},
+        {"run": "new", "phase": "phase2", "event": "api_retry", "chapter": "ch02", "model": "gemini-2.5-pro",
+         "wait_seconds": 4.0, "ts": 170.0},
+        {"run": "new", "phase": "phase2", "event": "chapter_end", "chapter": "ch01", "status": "completed",
+         "wall_seconds": 60.0, "api_seconds": 60.0, "rate_wait_seconds": 5.0, "ts": 160.0},
+        {"run": "new", "phase": "phase2", "event": "chapter_end", "chapter": "ch02", "status": "failed",
+         "wall_seconds": 120.0, "retries": 1, "retry_wait_seconds": 4.0, "ts": 280.0},
+        {"run": "new", "phase": "phase2", "event": "chapter_skip", "chapter": "ch03", "ts": 100.0},
+        {"run": "new", "phase": "phase2", "event": "phase_end", "wall_seconds": 360.0, "ts": 460.0},
+    ]
+
+    assert [e["run"] for e in select_runs(events)] == ["new"] * 7
+    stats = aggregate(select_runs(events), PRICING)
+
+    # 200k uncached input, 800k cached input, 100k output+thinking on gemini-2.5-pro
+    expected_cost = (200_000 * 1.25 + 800_000 * 0.31 + 100_000 * 10.0) / 1_000_000
+    assert stats["totals"]["cost_usd"] == pytest.approx(expected_cost, abs=1e-4)
+    assert stats["models"]["gemini-2.5-pro"]["retries"] == 1
+    phase2 = stats["phases"]["phase2"]
+    assert phase2["wall_seconds"] == 360.0 and phase2["api_calls"] == 1 and phase2["retries"] == 1
+
+    chapters = stats["chapters"]
+    assert (chapters["completed"], chapters["failed"], chapters["skipped"]) == (1, 1, 1)
+    assert chapters["chapters_per_hour"] == 10.0
+    assert chapters["wall_p50_seconds"] == 60.0 and chapters["wall_p95_seconds"] == 120.0
+    assert chapters["slowest"][0]["chapter"] == "ch02"
+    assert chapters["retry_wait_seconds"] == 4.0
+
+
+def test_pricing_prefers_the_longest_matching_model_prefix():
+    event = {"model": "gemini-2.5-pro-001", "input_tokens": 1_000_000}
+    assert call_cost(event, PRICING) == pytest.approx(1.25)
+    assert call_cost({"model": "unknown", "input_tokens": 10}, PRICING) == 0.0
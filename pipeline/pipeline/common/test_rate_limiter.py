@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+
+import pytest
+
+import pipeline.common.gemini_client as gemini_client_module
+from pipeline.common.gemini_client import GeminiClient
+from pipeline.common.rate_limiter import RateLimiter, _load_shared_config, parse_retry_after
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_models_have_independent_request_buckets():
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_minute=6)
+
+    assert limiter.acquire("gemini-2.5-pro") == 0.0
+    assert limiter.acquire("gemini-2.5-flash") == 0.0
+    assert limiter.acquire("gemini-2.5-pro") == pytest.approx(10.0)
+    assert clock.sleeps == [pytest.approx(10.0)]
+
+
+def test_model_overrides_and_token_budget():
+    clock = _FakeClock()
+    limiter = _limiter(
+        clock,
+        requests_per_minute=60,
+        model_overrides={"flash": {"requests_per_minute": 600, "tokens_per_minute": 1200}},
+    )
+
+    assert limiter.acquire("flash", tokens=1000) == 0.0
+    # 1000 of 1200 TPM used: the next 1000-token call waits for 800 tokens (40s).
+    assert limiter.acquire("flash", tokens=1000) == pytest.approx(40.0)
+
+
+def test_record_usage_corrects_token_estimate():
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_minute=600, tokens_per_minute=1000, burst=5)
+
+    limiter.acquire("m", tokens=100)
+    limiter.record_usage("m", estimated_tokens=100, actual_tokens=900)
+
+    # Only 100 tokens left after the correction; 500 more need 24s of refill.
+    assert limiter.acquire("m", tokens=500) == pytest.approx(24.0)
+
+
+def test_rate_limited_pauses_model_and_recovers():
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_minute=60, burst=10)
+
+    cooldown = limiter.report_rate_limited("m", "429 RESOURCE_EXHAUSTED {'retryDelay': '12s'}")
+    assert cooldown == 12.0
+    assert limiter.acquire("m") == pytest.approx(12.0)
+    assert limiter.stats()["m"]["rate_factor"] == 0.5
+
+    limiter.report_success("m")
+    assert limiter.stats()["m"]["rate_factor"] == pytest.approx(0.6)
+
+
+def test_parse_retry_after_variants():
+    assert parse_retry_after("Please retry in 7.5s.") == 7.5
+    assert parse_retry_after('"retryDelay": "30s"') == 30.0
+    assert parse_retry_after("500 internal") is None
+
+
+class _FakeModels:
+    def __init__(self, failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    def generate_content(self, model, contents, config):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return SimpleNamespace(
+            candidates=[SimpleNamespace(finish_reason="STOP", content=None)],
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=12,
+                candidates_token_count=3,
+                cached_content_token_count=0,
+            ),
+            text="ok",
+        )
+
+
+def test_gemini_client_reports_429_to_shared_limiter(monkeypatch):
+    fake_models = _FakeModels([RuntimeError("429 RESOURCE_EXHAUSTED retry in 3s")])
+    monkeypatch.setattr(
+        gemini_client_module,
+        "get_shared_genai_client",
+        lambda **kwargs: SimpleNamespace(models=fake_models),
+    )
+    monkeypatch.setattr(gemini_client_module.GeminiClient, "_load_thinking_config", lambda self: {"enabled": False})
+    real_sleeps = []
+    monkeypatch.setattr("time.sleep", real_sleeps.append)
+
+    clock = _FakeClock()
+    limiter = _limiter(clock, requests_per_minute=600, burst=10)
+    client = GeminiClient(api_key="test", model="fake-model", enable_caching=False, backend="developer")
+    client.set_rate_limiter(limiter)
+
+    response = client.generate(prompt="hello", priority="qc")
+
+    assert response.content == "ok"
+    assert fake_models.calls == 2
+    stats = limiter.stats()["fake-model"]
+    assert stats["rate_limited"] == 1
+    assert stats["requests_granted"] == 2
+    assert 3.0 in clock.sleeps
+    # The limiter's cooldown replaces generate()'s own backoff sleep
+    assert not any(real_sleeps)
+
+
+def test_shared_rate_defaults_to_former_client_rate(monkeypatch):
+    # The legacy translator quota (2 rpm) must not throttle every phase
+    sections = {"gemini": {"rate_limit": {"requests_per_minute": 2, "shared": {"enabled": True}}}}
+    monkeypatch.setattr("pipeline.config.get_config_section", lambda name: sections.get(name, {}))
+    cfg = _load_shared_config()
+    assert cfg["requests_per_minute"] == 10
+    assert cfg["burst"] == 4
+
+    sections["gemini"]["rate_limit"]["shared"].update(requests_per_minute=15, burst=2)
+    cfg = _load_shared_config()
+    assert (cfg["requests_per_minute"], cfg["burst"]) == (15, 2)
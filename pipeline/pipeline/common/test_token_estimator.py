@@ -0,0 +1,60 @@
+import random
+
+from pipeline.common.token_estimator import FEATURES, TokenEstimator, bulk_features, text_features
+
+TEXTS = [
+    "",
+    "俺は行ったけど、彼女は来なかった。",
+    "「……そうか」\n\n　彼は小さく頷いた。",
+    "Hello, world! It's fine.\n",
+    "Tôi đã đi nhưng cô ấy không đến… Ừ, được rồi.",
+    "mixed 日本語 text — ok 😀",
+    "\n\n",
+]
+
+# A made-up tokenizer the estimator has to learn: ~0.7 tokens per kana/kanji,
+# ~1.1 per English word, ~1.5 per accented Vietnamese syllable
+TRUE_COEFFICIENTS = {
+    "cjk": 0.7, "latin": 0.05, "diacritic": 0.3, "words": 1.1,
+    "space": 0.0, "newline": 0.5, "punct": 0.8, "other": 1.0,
+}
+
+
+def _true_tokens(text):
+    return round(sum(TRUE_COEFFICIENTS[name] * f for name, f in zip(FEATURES, text_features(text))))
+
+
+def _passages(rng, count):
+    pool = TEXTS[1:] + ["The quick brown fox jumps over the lazy dog.", "Trời hôm nay đẹp quá, mình đi dạo nhé."]
+    return ["\n".join(rng.choice(pool) for _ in range(rng.randint(1, 30))) for _ in range(count)]
+
+
+def test_bulk_features_match_per_text_features():
+    assert bulk_features(TEXTS).astype(int).tolist() == [text_features(t) for t in TEXTS]
+    estimator = TokenEstimator()
+    assert estimator.estimate_many(TEXTS) == [estimator.estimate(t) for t in TEXTS]
+    assert estimator.estimate("") == 0
+
+
+def test_uncalibrated_estimate_matches_previous_heuristic():
+    estimator = TokenEstimator()
+    for text in TEXTS[:4] + TEXTS[5:]:  # everything but the Vietnamese line
+        ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+        assert estimator.estimate(text) == (len(text) - ascii_chars) + (ascii_chars + 3) // 4
+
+
+def test_calibration_is_persisted_and_within_a_few_percent(tmp_path):
+    rng = random.Random(7)
+    path = tmp_path / "token_calibration.json"
+    estimator = TokenEstimator(path)
+    training = _passages(rng, 60)
+    estimator.calibrate(training, [_true_tokens(t) for t in training], model="test")
+
+    reloaded = TokenEstimator(path)
+    assert reloaded.coefficients == estimator.coefficients
+    assert len(reloaded.samples) == 60
+
+    held_out = _passages(rng, 50)
+    errors = [abs(reloaded.estimate(t) - _true_tokens(t)) / _true_tokens(t) for t in held_out]
+    assert sum(errors) / len(errors) < 0.03
+    assert reloaded.mean_abs_error_pct() < 3
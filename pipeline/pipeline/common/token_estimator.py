@@ -0,0 +1,375 @@
+"""
+Token Estimator - Offline Gemini token counts for JP, EN and VN text.
+
+Chunking thresholds, cache-size checks and TPM budgeting need token counts
+many times per chapter. `count_tokens` is a network round trip, and the old
+heuristics (`len(text) // 4`, 0.7 x whitespace words) are far off for
+unspaced Japanese or diacritic-heavy Vietnamese.
+
+TokenEstimator is a linear model over per-script character counts:
+
+    cjk        kanji, kana, CJK punctuation, full-width forms
+    latin      Latin letters and digits (ASCII and accented)
+    diacritic  the accented / combining subset of `latin` (Vietnamese)
+    words      runs of Latin letters and digits
+    space      spaces and tabs
+    newline    line breaks
+    punct      ASCII punctuation and symbols
+    other      everything else (em dashes, ellipses, emoji, other scripts)
+
+The built-in coefficients reproduce the previous heuristics (one token per
+CJK character, four ASCII characters per token). Every real count_tokens
+result seen by GeminiClient.get_token_count is stored as a sample in
+`gemini.token_estimator.calibration_path`, and the coefficients are refit
+from those samples (relative least squares, regularised toward the built-in
+coefficients so scripts with no samples keep them).
+
+`estimate_many()` counts features for a whole batch of texts with one numpy
+pass over their codepoints (scripts/calibrate_token_estimator.py measures
+the fit against a volume).
+
+Usage:
+    from pipeline.common.token_estimator import get_token_estimator
+
+    tokens = get_token_estimator().estimate(text)
+    per_line = get_token_estimator().estimate_many(lines)
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FEATURES = ("cjk", "latin", "diacritic", "words", "space", "newline", "punct", "other")
+
+# Previous heuristics: CJK / non-ASCII ~1 token per character, ASCII ~4 characters per token
+DEFAULT_COEFFICIENTS = {
+    "cjk": 1.0,
+    "latin": 0.25,
+    "diacritic": 0.0,
+    "words": 0.0,
+    "space": 0.25,
+    "newline": 0.25,
+    "punct": 0.25,
+    "other": 1.0,
+}
+
+CALIBRATION_VERSION = 1
+DEFAULT_MAX_SAMPLES = 500
+MIN_FIT_SAMPLES = 8
+# Weight of the pull toward DEFAULT_COEFFICIENTS, relative to one sample
+_PRIOR_WEIGHT = 0.05
+
+# Character classes (inclusive codepoint ranges). Exclusive; unlisted codepoints are "other".
+_CJK = [
+    (0x3000, 0x30FF),      # CJK symbols & punctuation (incl. U+3000), hiragana, katakana
+    (0x31F0, 0x31FF),      # katakana phonetic extensions
+    (0x3400, 0x4DBF),      # CJK extension A
+    (0x4E00, 0x9FFF),      # CJK unified ideographs
+    (0xF900, 0xFAFF),      # CJK compatibility ideographs
+    (0xFF00, 0xFFEF),      # half-width / full-width forms
+    (0x20000, 0x2FA1F),    # CJK extensions B-F, compatibility supplement
+]
+_LATIN_ASCII = [(0x30, 0x39), (0x41, 0x5A), (0x61, 0x7A)]
+_LATIN_ACCENTED = [
+    (0xC0, 0xD6), (0xD8, 0xF6), (0xF8, 0x24F),   # Latin-1 letters, Latin Extended-A/B
+    (0x300, 0x36F),                              # combining diacritical marks
+    (0x1E00, 0x1EFF),                            # Latin Extended Additional (Vietnamese)
+]
+_SPACE = [(0x09, 0x09), (0x0B, 0x0D), (0x20, 0x20), (0xA0, 0xA0)]
+_NEWLINE = [(0x0A, 0x0A)]
+_PUNCT = [(0x21, 0x2F), (0x3A, 0x40), (0x5B, 0x60), (0x7B, 0x7E)]
+
+# Codepoint classes for the bulk path; feature columns are derived from them
+_CLS_OTHER, _CLS_CJK, _CLS_ASCII, _CLS_ACCENTED, _CLS_SPACE, _CLS_NEWLINE, _CLS_PUNCT = range(7)
+
+
+def _char_class(ranges) -> str:
+    def esc(cp: int) -> str:
+        return f"\\u{cp:04X}" if cp <= 0xFFFF else f"\\U{cp:08X}"
+    return "[" + "".join(esc(a) if a == b else f"{esc(a)}-{esc(b)}" for a, b in ranges) + "]"
+
+
+_RE_CJK = re.compile(_char_class(_CJK))
+_RE_LATIN = re.compile(_char_class(_LATIN_ASCII + _LATIN_ACCENTED))
+_RE_ACCENTED = re.compile(_char_class(_LATIN_ACCENTED))
+_RE_WORD = re.compile(_char_class(_LATIN_ASCII + _LATIN_ACCENTED) + "+")
+_RE_SPACE = re.compile(_char_class(_SPACE))
+_RE_PUNCT = re.compile(_char_class(_PUNCT))
+
+
+def _build_class_table():
+    """Sorted interval starts and their class, for np.searchsorted."""
+    ranges = (
+        [(a, b, _CLS_CJK) for a, b in _CJK]
+        + [(a, b, _CLS_ASCII) for a, b in _LATIN_ASCII]
+        + [(a, b, _CLS_ACCENTED) for a, b in _LATIN_ACCENTED]
+        + [(a, b, _CLS_SPACE) for a, b in _SPACE]
+        + [(a, b, _CLS_NEWLINE) for a, b in _NEWLINE]
+        + [(a, b, _CLS_PUNCT) for a, b in _PUNCT]
+    )
+    starts, classes = [0], [_CLS_OTHER]
+    for a, b, cls in sorted(ranges):
+        if starts[-1] == a:
+            classes[-1] = cls
+        else:
+            starts.append(a)
+            classes.append(cls)
+        starts.append(b + 1)
+        classes.append(_CLS_OTHER)
+    return starts, classes
+
+
+_TABLE_STARTS, _TABLE_CLASSES = _build_class_table()
+
+
+def text_features(text: str) -> List[int]:
+    """Feature counts of one text, in FEATURES order."""
+    latin = len(_RE_LATIN.findall(text))
+    cjk = len(_RE_CJK.findall(text))
+    space = len(_RE_SPACE.findall(text))
+    newline = text.count("\n")
+    punct = len(_RE_PUNCT.findall(text))
+    return [
+        cjk,
+        latin,
+        len(_RE_ACCENTED.findall(text)),
+        len(_RE_WORD.findall(text)),
+        space,
+        newline,
+        punct,
+        len(text) - cjk - latin - space - newline - punct,
+    ]
+
+
+def bulk_features(texts: Sequence[str]):
+    """Feature matrix (len(texts) x len(FEATURES)) from one pass over all codepoints."""
+    n = len(texts)
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=n)
+    codepoints = np.frombuffer("".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    table_starts = np.asarray(_TABLE_STARTS, dtype=np.int64)
+    table_classes = np.asarray(_TABLE_CLASSES, dtype=np.int64)
+    classes = table_classes[np.searchsorted(table_starts, codepoints, side="right") - 1]
+    owner = np.repeat(np.arange(n), lengths)
+
+    counts = np.bincount(owner * 7 + classes, minlength=n * 7).reshape(n, 7)
+
+    # A word starts at a Latin character whose predecessor (in the same text) is not one
+    is_latin = (classes == _CLS_ASCII) | (classes == _CLS_ACCENTED)
+    previous = np.zeros_like(is_latin)
+    previous[1:] = is_latin[:-1]
+    text_starts = np.cumsum(lengths) - lengths
+    previous[text_starts[lengths > 0]] = False
+    words = np.bincount(owner[is_latin & ~previous], minlength=n)
+
+    features = np.empty((n, len(FEATURES)), dtype=np.float64)
+    features[:, 0] = counts[:, _CLS_CJK]
+    features[:, 1] = counts[:, _CLS_ASCII] + counts[:, _CLS_ACCENTED]
+    features[:, 2] = counts[:, _CLS_ACCENTED]
+    features[:, 3] = words
+    features[:, 4] = counts[:, _CLS_SPACE]
+    features[:, 5] = counts[:, _CLS_NEWLINE]
+    features[:, 6] = counts[:, _CLS_PUNCT]
+    features[:, 7] = counts[:, _CLS_OTHER]
+    return features
+
+
+def fit_coefficients(samples: Sequence[Dict], prior: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Coefficients minimising the relative error over `samples` ({features, tokens}),
+    regularised toward `prior` (DEFAULT_COEFFICIENTS).
+    """
+    prior = prior or DEFAULT_COEFFICIENTS
+    prior_vec = np.array([prior[name] for name in FEATURES], dtype=np.float64)
+    rows = [s for s in samples if s.get("tokens", 0) > 0 and len(s.get("features", ())) == len(FEATURES)]
+    if not rows:
+        return dict(prior)
+
+    x = np.array([s["features"] for s in rows], dtype=np.float64)
+    y = np.array([s["tokens"] for s in rows], dtype=np.float64)
+    # Dividing each row by its token count turns absolute into relative error
+    x /= y[:, None]
+    y = np.ones_like(y)
+    # Regularise in units of a typical sample so the prior weight is scale-free
+    scale = np.maximum(np.abs(x).mean(axis=0), 1e-9)
+    reg = np.sqrt(_PRIOR_WEIGHT * len(rows)) * np.diag(scale)
+    a = np.vstack([x, reg])
+    b = np.concatenate([y, reg @ prior_vec])
+
+    # Refit without features that come out negative (tokens never cost less than nothing)
+    active = np.ones(len(FEATURES), dtype=bool)
+    coef = np.zeros(len(FEATURES))
+    for _ in range(len(FEATURES)):
+        coef[:] = 0.0
+        coef[active] = np.linalg.lstsq(a[:, active], b, rcond=None)[0]
+        negative = active & (coef < 0)
+        if not negative.any():
+            break
+        active &= ~negative
+    coef[~active] = 0.0
+    return {name: float(value) for name, value in zip(FEATURES, coef)}
+
+
+class TokenEstimator:
+    """Linear per-script token model, refit from stored count_tokens samples."""
+
+    def __init__(
+        self,
+        calibration_path: Optional[Path] = None,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        record_samples: bool = True,
+    ):
+        self.calibration_path = Path(calibration_path) if calibration_path else None
+        self.max_samples = max(MIN_FIT_SAMPLES, int(max_samples))
+        self.record_samples = record_samples and self.calibration_path is not None
+        self.coefficients: Dict[str, float] = dict(DEFAULT_COEFFICIENTS)
+        self.samples: List[Dict] = []
+        self._lock = threading.Lock()
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Estimation
+    # ------------------------------------------------------------------
+
+    def _vector(self) -> List[float]:
+        return [self.coefficients[name] for name in FEATURES]
+
+    def estimate(self, text: str) -> int:
+        """Estimated Gemini tokens of `text` (rounded up)."""
+        if not text:
+            return 0
+        total = sum(c * f for c, f in zip(self._vector(), text_features(text)))
+        return max(1, math.ceil(total - 1e-9))
+
+    def estimate_many(self, texts: Sequence[str]) -> List[int]:
+        """`estimate()` of each text, vectorized over the whole batch."""
+        texts = list(texts)
+        if not NUMPY_AVAILABLE or not texts:
+            return [self.estimate(text) for text in texts]
+        totals = bulk_features(texts) @ np.asarray(self._vector())
+        estimates = np.maximum(1, np.ceil(totals - 1e-9)).astype(np.int64)
+        estimates[np.fromiter((not t for t in texts), dtype=bool, count=len(texts))] = 0
+        return estimates.tolist()
+
+    # ------------------------------------------------------------------
+    # Calibration
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.calibration_path is None:
+            return
+        try:
+            with open(self.calibration_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != CALIBRATION_VERSION:
+            return
+        coefficients = data.get("coefficients") or {}
+        if set(coefficients) == set(FEATURES):
+            self.coefficients = {name: float(coefficients[name]) for name in FEATURES}
+        self.samples = [s for s in data.get("samples", []) if isinstance(s, dict)][-self.max_samples:]
+
+    def _save(self) -> None:
+        path = self.calibration_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": CALIBRATION_VERSION,
+                        "features": list(FEATURES),
+                        "coefficients": self.coefficients,
+                        "mean_abs_error_pct": self.mean_abs_error_pct(),
+                        "samples": self.samples,
+                    },
+                    f,
+                    indent=1,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"[TOKENS] Could not write {path}: {e}")
+
+    def calibrate(self, texts: Sequence[str], token_counts: Sequence[int], model: str = "") -> Dict[str, float]:
+        """Add (text, real token count) samples, refit and persist. Returns the coefficients."""
+        with self._lock:
+            for text, tokens in zip(texts, token_counts):
+                if text and tokens and tokens > 0:
+                    self.samples.append({
+                        "features": text_features(text),
+                        "tokens": int(tokens),
+                        "model": model,
+                        "at": round(time.time()),
+                    })
+            self.samples = self.samples[-self.max_samples:]
+            if NUMPY_AVAILABLE and len(self.samples) >= MIN_FIT_SAMPLES:
+                self.coefficients = fit_coefficients(self.samples)
+            if self.calibration_path is not None:
+                self._save()
+            return dict(self.coefficients)
+
+    def record(self, text: str, tokens: int, model: str = "") -> None:
+        """Store one real count_tokens result (GeminiClient.get_token_count)."""
+        if self.record_samples:
+            self.calibrate([text], [tokens], model=model)
+
+    def mean_abs_error_pct(self, samples: Optional[Sequence[Dict]] = None) -> Optional[float]:
+        """Mean absolute relative error of the current coefficients over `samples`, in percent."""
+        samples = self.samples if samples is None else samples
+        errors = []
+        vector = self._vector()
+        for sample in samples:
+            tokens = sample.get("tokens", 0)
+            if tokens > 0:
+                predicted = sum(c * f for c, f in zip(vector, sample["features"]))
+                errors.append(abs(predicted - tokens) / tokens)
+        return round(100.0 * sum(errors) / len(errors), 2) if errors else None
+
+
+_shared_estimator: Optional[TokenEstimator] = None
+_shared_estimator_lock = threading.Lock()
+
+
+def get_token_estimator() -> TokenEstimator:
+    """Process-wide estimator configured from `gemini.token_estimator`."""
+    global _shared_estimator
+    with _shared_estimator_lock:
+        if _shared_estimator is None:
+            calibration_path = None
+            cfg: Dict = {}
+            try:
+                from pipeline.config import PIPELINE_ROOT, get_config_section
+
+                cfg = (get_config_section("gemini") or {}).get("token_estimator", {}) or {}
+                calibration_path = Path(cfg.get("calibration_path", "cache/token_calibration.json"))
+                if not calibration_path.is_absolute():
+                    calibration_path = PIPELINE_ROOT / calibration_path
+            except Exception as e:
+                logger.debug(f"[TOKENS] Using built-in coefficients: {e}")
+            _shared_estimator = TokenEstimator(
+                calibration_path,
+                max_samples=cfg.get("max_samples", DEFAULT_MAX_SAMPLES),
+                record_samples=bool(cfg.get("record_samples", True)),
+            )
+        return _shared_estimator
+
+
+def set_token_estimator(estimator: Optional[TokenEstimator]) -> None:
+    """Replace the process-wide estimator (tests, CLI overrides); None reloads it from config."""
+    global _shared_estimator
+    with _shared_estimator_lock:
+        _shared_estimator = estimator
@@ -6,6 +6,7 @@ Extracts source EPUBs, parses metadata, converts chapters to markdown,
 and generates manifest.json for downstream agents.
 """
 
+import functools
 import json
 from pathlib import Path
 from datetime import datetime
@@ -19,8 +20,15 @@ from .spine_parser import SpineParser, Spine, SpineItem
 from .xhtml_to_markdown import XHTMLToMarkdownConverter, ConvertedChapter
 from .image_extractor import ImageExtractor, catalog_images
 from .ruby_extractor import extract_ruby_from_directory
+from .document_cache import XHTMLDocumentCache
 from .content_splitter import ContentSplitter, KodanshaSplitter
-from .config import get_volume_structure, get_work_dir, get_pre_toc_detection_config
+from .config import (
+    get_volume_structure,
+    get_work_dir,
+    get_pre_toc_detection_config,
+    get_document_cache_config,
+    get_conversion_config,
+)
 from .publisher_profiles.manager import get_profile_manager, PublisherProfile
 
 # Phase 1.55: Reference Validator
@@ -136,6 +144,10 @@ class LibrarianAgent:
         """
         self.work_base = Path(work_base) if work_base else get_work_dir()
         self.work_base.mkdir(parents=True, exist_ok=True)
+        # Parsed XHTML shared by every Phase 1 stage; replaced per volume in process_epub()
+        self.documents = XHTMLDocumentCache(get_document_cache_config()["max_documents"])
+        # Basename -> path for each content dir, used by _find_xhtml_file()
+        self._file_index: Dict[str, Dict[str, Path]] = {}
     
     def _create_metadata_en_template(
         self,
@@ -377,6 +389,9 @@ class LibrarianAgent:
         volume_id = extraction.volume_id
         work_dir = extraction.work_dir
         structure = get_volume_structure()
+        self.documents = XHTMLDocumentCache(get_document_cache_config()["max_documents"])
+        self._file_index = {}
+        self._content_file_index(extraction.content_dir, extraction.files)
 
         # Step 2: Parse metadata
         print("\n[STEP 2/5] Parsing metadata...")
@@ -473,8 +488,11 @@ class LibrarianAgent:
         converter = XHTMLToMarkdownConverter(
             remove_ruby=False,
             content_dir=extraction.content_dir,
-            exclude_image_matcher=lambda img_name: profile_manager.is_excluded_image(img_name, publisher_name),
+            # partial (not a lambda) so it can be shipped to conversion worker processes
+            exclude_image_matcher=functools.partial(profile_manager.is_excluded_image, publisher=publisher_name),
+            document_cache=self.documents,
         )
+        self._prefetch_conversions(converter, extraction.content_dir, spine)
 
         if use_spine_fallback:
             # Use spine-based chapter detection (for minimal-TOC publishers like Hifumi Shobo)
@@ -644,9 +662,15 @@ class LibrarianAgent:
         
         # Step 6: Extract ruby annotations (character names only)
         print("\n[STEP 6/6] Extracting ruby annotations...")
-        ruby_data = extract_ruby_from_directory(extraction.content_dir)
+        ruby_data = extract_ruby_from_directory(extraction.content_dir, document_cache=self.documents)
         names_count = len(ruby_data["names"])
         print(f"     Character Names: {names_count}")
+        doc_stats = self.documents.stats
+        print(
+            f"     XHTML parses: {doc_stats['parses']} "
+            f"(reused {doc_stats['hits'] + doc_stats['summary_hits']} times)"
+        )
+        self.documents.clear()
 
         # Build manifest
         print("\n[FINALIZING] Building manifest...")
@@ -723,6 +747,27 @@ class LibrarianAgent:
 
         return manifest
 
+    def _prefetch_conversions(
+        self,
+        converter: XHTMLToMarkdownConverter,
+        content_dir: Path,
+        spine: Spine,
+    ) -> None:
+        """Render spine files in worker processes ahead of the (serial) chapter assembly."""
+        conversion = get_conversion_config()
+        if conversion["max_workers"] <= 1 or len(spine.items) < conversion["min_files"]:
+            return
+        paths = []
+        for item in spine.items:
+            path = content_dir / item.href
+            if not path.exists():
+                path = self._find_xhtml_file(content_dir, Path(item.href).name)
+            if path is not None and path.suffix.lower() in ('.xhtml', '.html', '.htm'):
+                paths.append(path)
+        rendered = converter.prefetch(paths, conversion["max_workers"])
+        if rendered:
+            print(f"     Rendered {rendered} spine files with {conversion['max_workers']} worker processes")
+
     def _convert_chapters(
         self,
         content_dir: Path,
@@ -1209,14 +1254,14 @@ class LibrarianAgent:
                 if split_config and split_config.get("enabled", False):
                     # Check if this chapter exceeds token limit
                     splitter = ContentSplitter(
-                        max_tokens=split_config.get("max_tokens_per_chapter", 2000),
-                        min_tokens=split_config.get("min_part_tokens", 800),
+                        max_tokens=split_config.get("max_tokens_per_chapter", 40000),
+                        min_tokens=split_config.get("min_part_tokens", 15000),
                         scene_break_patterns=split_config.get("scene_break_patterns")
                     )
                     
                     estimated_tokens = splitter.estimate_tokens(full_content)
                     
-                    if estimated_tokens > split_config.get("max_tokens_per_chapter", 2000):
+                    if estimated_tokens > split_config.get("max_tokens_per_chapter", 40000):
                         # Split chapter into parts
                         parts = splitter.split_chapter(full_content)
                         print(f"     [SPLIT] Chapter exceeds {split_config['max_tokens_per_chapter']} tokens, splitting into {len(parts)} parts")
@@ -1483,23 +1528,16 @@ class LibrarianAgent:
         Returns:
             Detected chapter title or None
         """
-        from bs4 import BeautifulSoup
-
         try:
-            with open(xhtml_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            soup = BeautifulSoup(content, 'xml')
-            body = soup.find('body')
+            summary = self.documents.summary(xhtml_path)
 
-            if not body:
+            if not summary.has_body:
                 return None
 
             # Check headings first (h1, h2, h3)
             for tag in ['h1', 'h2', 'h3']:
-                heading = body.find(tag)
-                if heading:
-                    text = heading.get_text(strip=True)
+                text = summary.first_heading(tag)
+                if text is not None:
                     if text and len(text) > 0 and len(text) < 100:
                         # Check if it matches a chapter pattern
                         for pattern in title_patterns:
@@ -1510,9 +1548,7 @@ class LibrarianAgent:
                             return text
 
             # Check first few paragraphs for chapter markers
-            paragraphs = body.find_all('p', limit=5)
-            for p in paragraphs:
-                text = p.get_text(strip=True)
+            for text in summary.lead_paragraphs:
                 if not text:
                     continue
 
@@ -1531,24 +1567,20 @@ class LibrarianAgent:
         except Exception:
             return None
 
-    def _is_non_content_body(self, body, text: str) -> bool:
+    def _is_non_content_body(self, summary) -> bool:
         """
         Identify non-story XHTML pages (caution/credits/legal/colophon).
+
+        Args:
+            summary: DocumentSummary of the page
         """
-        if body is None:
+        if not summary.has_body:
             return False
 
-        body_classes = body.get('class', [])
-        if isinstance(body_classes, str):
-            class_set = {c.strip().lower() for c in body_classes.split() if c.strip()}
-        elif isinstance(body_classes, list):
-            class_set = {str(c).strip().lower() for c in body_classes if str(c).strip()}
-        else:
-            class_set = set()
-
-        if class_set.intersection(self.NON_CONTENT_BODY_CLASSES):
+        if summary.body_classes.intersection(self.NON_CONTENT_BODY_CLASSES):
             return True
 
+        text = summary.text
         normalized_text = ''.join((text or '').split())
         if not normalized_text:
             return False
@@ -1561,17 +1593,8 @@ class LibrarianAgent:
 
     def _is_non_content_xhtml_file(self, xhtml_path: Path) -> bool:
         """Classify a specific XHTML file as non-content front/end matter."""
-        from bs4 import BeautifulSoup
-
         try:
-            with open(xhtml_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            soup = BeautifulSoup(content, 'xml')
-            body = soup.find('body')
-            if not body:
-                return False
-            text = body.get_text(strip=True)
-            return self._is_non_content_body(body, text)
+            return self._is_non_content_body(self.documents.summary(xhtml_path))
         except Exception:
             return False
 
@@ -1585,27 +1608,21 @@ class LibrarianAgent:
         Returns:
             True if file has text content
         """
-        from bs4 import BeautifulSoup
-
         try:
-            with open(xhtml_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            soup = BeautifulSoup(content, 'xml')
-            body = soup.find('body')
+            summary = self.documents.summary(xhtml_path)
 
-            if not body:
+            if not summary.has_body:
                 return False
 
             # Check if body is just an SVG/image wrapper
-            if body.find('svg') and not body.get_text(strip=True):
+            if summary.has_svg and not summary.text:
                 return False
 
             # Get text content
-            text = body.get_text(strip=True)
+            text = summary.text
 
             # Skip non-story boilerplate pages (caution/credits/colophon/legal notices).
-            if self._is_non_content_body(body, text):
+            if self._is_non_content_body(summary):
                 return False
 
             # Need at least some text
@@ -1831,40 +1848,28 @@ class LibrarianAgent:
         Returns:
             True if file has meaningful story content
         """
-        from bs4 import BeautifulSoup
-        
         try:
-            with open(xhtml_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            summary = self.documents.summary(xhtml_path)
             
-            soup = BeautifulSoup(content, 'xml')
-            body = soup.find('body')
-            
-            if not body:
+            if not summary.has_body:
                 return False
             
             # Check if it's just an SVG image wrapper
-            if body.find('svg'):
-                text = body.get_text(strip=True)
-                if not text:
-                    return False  # Image-only page
+            if summary.has_svg and not summary.text:
+                return False  # Image-only page
             
             # Get text content
-            text = body.get_text(strip=True)
+            text = summary.text
 
             # Skip non-story boilerplate pages (caution/credits/colophon/legal notices).
-            if self._is_non_content_body(body, text):
+            if self._is_non_content_body(summary):
                 return False
 
             # Check if this is a TOC page (目次 = Table of Contents in Japanese)
             # TOC pages have "目次" and multiple internal chapter links
             if '目次' in text or 'Contents' in text or 'Table of Contents' in text:
-                # Count internal chapter links (href to other xhtml files)
-                anchors = body.find_all('a')
-                internal_links = [a for a in anchors if a.get('href', '').endswith('.xhtml') or '#' in a.get('href', '')]
-
-                # If we have 3+ internal chapter links, it's almost certainly a TOC
-                if len(internal_links) >= 3:
+                # If we have 3+ internal chapter links (href to other xhtml files), it's almost certainly a TOC
+                if summary.internal_link_count >= 3:
                     return False  # This is a TOC page, not story content
 
             # Get markers from config
@@ -1907,47 +1912,38 @@ class LibrarianAgent:
             if path.exists():
                 return path
 
-        # Search recursively
-        for path in content_dir.rglob(filename):
-            return path
+        # Search subdirectories through the per-volume basename index
+        return self._content_file_index(content_dir).get(filename)
+
+    def _content_file_index(self, content_dir: Path, files: Optional[List[Path]] = None) -> Dict[str, Path]:
+        """
+        Basename -> path for files under content_dir.
 
-        return None
+        Built once per content dir from the extractor's file list (or a single
+        walk when none is given) instead of an rglob per lookup.
+        """
+        key = str(content_dir)
+        index = self._file_index.get(key)
+        if index is None:
+            if files is None:
+                files = sorted(path for path in Path(content_dir).rglob("*") if path.is_file())
+            index = {}
+            for path in files:
+                try:
+                    Path(path).relative_to(content_dir)
+                except ValueError:
+                    continue
+                index.setdefault(Path(path).name, Path(path))
+            self._file_index[key] = index
+        return index
 
     def _extract_illustration_from_file(self, xhtml_path: Path) -> Optional[str]:
         """Extract illustration filename from an illustration-only XHTML file."""
+        # SVG <image> first, then <img> (see document_cache.summarize)
         try:
-            from bs4 import BeautifulSoup
-
-            with open(xhtml_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            soup = BeautifulSoup(content, 'xml')
-
-            # Check for SVG with image
-            svg = soup.find('svg')
-            if svg:
-                image = svg.find('image')
-                if image:
-                    # BeautifulSoup stores xlink:href as literal 'xlink:href' key
-                    href = (
-                        image.get('href') or
-                        image.get('xlink:href') or  # BeautifulSoup literal key
-                        image.get('{http://www.w3.org/1999/xlink}href', '')
-                    )
-                    if href:
-                        return Path(href).name
-
-            # Check for img tag
-            img = soup.find('img')
-            if img:
-                src = img.get('src', '')
-                if src:
-                    return Path(src).name
-
+            return self.documents.summary(xhtml_path).illustration_ref
         except Exception:
-            pass
-
-        return None
+            return None
 
     def _make_markdown_filename(self, xhtml_filename: str, index: int, part_suffix: str = "") -> str:
         """
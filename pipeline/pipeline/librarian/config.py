@@ -164,6 +164,54 @@ def get_pre_toc_detection_config() -> Dict[str, Any]:
     }
 
 
+def get_document_cache_config() -> Dict[str, Any]:
+    """
+    Parsed-XHTML cache shared by the Librarian stages.
+
+    Returns:
+        Dictionary with max_documents (parsed trees kept in the LRU; file
+        summaries are always kept).
+    """
+    config = load_config()
+    user_config = config.get("librarian", {}).get("document_cache", {})
+    return {
+        "max_documents": max(1, int(user_config.get("max_documents", 256))),
+    }
+
+
+def get_conversion_config() -> Dict[str, Any]:
+    """
+    XHTML -> Markdown conversion settings.
+
+    Returns:
+        Dictionary with max_workers (render processes, 1 = serial) and
+        min_files (volumes with fewer spine files always convert serially).
+    """
+    config = load_config()
+    user_config = config.get("librarian", {}).get("conversion", {})
+    return {
+        "max_workers": max(1, int(user_config.get("max_workers", 1))),
+        "min_files": max(2, int(user_config.get("min_files", 16))),
+    }
+
+
+def get_extraction_config() -> Dict[str, Any]:
+    """
+    EPUB extraction settings.
+
+    Returns:
+        Dictionary with materialize ("needed" writes only the OPF, container,
+        XHTML, NCX and image entries later phases read; "all" extracts the
+        whole archive).
+    """
+    config = load_config()
+    user_config = config.get("librarian", {}).get("extraction", {})
+    materialize = str(user_config.get("materialize", "needed")).strip().lower()
+    return {
+        "materialize": materialize if materialize in ("needed", "all") else "needed",
+    }
+
+
 # ============================================================================
 # METADATA EXTRACTION
 # ============================================================================
@@ -9,6 +9,8 @@ import re
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
+from pipeline.common.token_estimator import get_token_estimator
+
 
 @dataclass
 class ChapterPart:
@@ -27,16 +29,16 @@ class ContentSplitter:
     
     def __init__(
         self,
-        max_tokens: int = 2000,
-        min_tokens: int = 800,
+        max_tokens: int = 40000,
+        min_tokens: int = 15000,
         scene_break_patterns: Optional[List[str]] = None
     ):
         """
         Initialize content splitter.
         
         Args:
-            max_tokens: Maximum tokens per part (default: 2000)
-            min_tokens: Minimum tokens per part to avoid tiny splits (default: 800)
+            max_tokens: Maximum tokens per part (default: 40000)
+            min_tokens: Minimum tokens per part to avoid tiny splits (default: 15000)
             scene_break_patterns: Regex patterns for scene breaks
         """
         self.max_tokens = max_tokens
@@ -60,11 +62,10 @@ class ContentSplitter:
         """
         Estimate token count for Japanese text.
         
-        Rough heuristic: 1 token ≈ 0.7 words for Japanese
-        (More accurate than 1:1 due to multi-byte characters)
+        Uses the offline calibrated estimator; whitespace word counts are
+        meaningless for unspaced Japanese.
         """
-        words = len(re.findall(r'\S+', text))
-        return int(words * 0.7)
+        return get_token_estimator().estimate(text)
     
     def extract_illustrations(self, text: str) -> List[str]:
         """Extract illustration references from text."""
@@ -128,9 +129,7 @@ class ContentSplitter:
         current_start = 0
         current_tokens = 0
         
-        for idx, line in enumerate(lines):
-            line_tokens = self.estimate_tokens(line)
-            
+        for idx, line_tokens in enumerate(get_token_estimator().estimate_many(lines)):
             # Check if adding this line would exceed limit
             if current_tokens + line_tokens > self.max_tokens and current_tokens >= self.min_tokens:
                 # Look for nearest break point
@@ -236,8 +235,8 @@ class ContentSplitter:
 
 def split_large_chapter(
     content: str,
-    max_tokens: int = 2000,
-    min_tokens: int = 800,
+    max_tokens: int = 40000,
+    min_tokens: int = 15000,
     scene_break_patterns: Optional[List[str]] = None
 ) -> List[ChapterPart]:
     """
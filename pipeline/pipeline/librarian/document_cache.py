@@ -0,0 +1,175 @@
+"""
+Parse-once XHTML document cache for the Librarian.
+
+Phase 1 inspects every spine file several times (title detection, non-content
+checks, text-content checks, pre-TOC story detection, illustration lookup,
+markdown conversion, ruby extraction). XHTMLDocumentCache parses each file
+once with BeautifulSoup's lxml-backed 'xml' parser and shares the tree with
+every stage through a bounded LRU. It also keeps a small DocumentSummary per
+file (body text, image refs, headings, ...), which outlives tree eviction so
+the classification passes never re-parse.
+
+Cached trees are shared: callers must treat them as read-only (copy a Tag
+before modifying it, as RubyExtractor already does).
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DOCUMENTS = 256
+
+_HEADING_TAGS = ('h1', 'h2', 'h3')
+_LEAD_PARAGRAPHS = 5
+
+
+@dataclass(frozen=True)
+class DocumentSummary:
+    """Precomputed facts about one XHTML file."""
+    has_body: bool
+    text: str                                 # body.get_text(strip=True)
+    body_classes: FrozenSet[str]              # lower-cased <body class="...">
+    has_svg: bool                             # <body> contains an <svg>
+    headings: Tuple[Tuple[str, str], ...]     # (tag, stripped text) of h1-h3, document order
+    lead_paragraphs: Tuple[str, ...]          # stripped text of the first <p> elements
+    internal_link_count: int                  # <a href> to .xhtml files or #fragments
+    image_refs: Tuple[str, ...]               # basenames of <img src> / <svg><image href>, document order
+    illustration_ref: Optional[str]           # first <svg><image>, else first <img>
+
+    def first_heading(self, tag: str) -> Optional[str]:
+        return next((text for heading_tag, text in self.headings if heading_tag == tag), None)
+
+
+def _image_href(tag) -> str:
+    # BeautifulSoup stores xlink:href as the literal 'xlink:href' key
+    return (
+        tag.get('href') or
+        tag.get('xlink:href') or
+        tag.get('{http://www.w3.org/1999/xlink}href', '')
+    )
+
+
+def summarize(soup: BeautifulSoup) -> DocumentSummary:
+    """Build a DocumentSummary from a parsed document."""
+    illustration_ref = None
+    svg = soup.find('svg')
+    if svg:
+        image = svg.find('image')
+        href = _image_href(image) if image else ''
+        if href:
+            illustration_ref = Path(href).name
+    if illustration_ref is None:
+        img = soup.find('img')
+        if img and img.get('src', ''):
+            illustration_ref = Path(img.get('src', '')).name
+
+    image_refs = []
+    for tag in soup.find_all(['img', 'image']):
+        ref = tag.get('src', '') if tag.name == 'img' else _image_href(tag)
+        if ref:
+            image_refs.append(Path(ref).name)
+
+    body = soup.find('body')
+    if not body:
+        return DocumentSummary(
+            has_body=False, text='', body_classes=frozenset(), has_svg=False,
+            headings=(), lead_paragraphs=(), internal_link_count=0,
+            image_refs=tuple(image_refs), illustration_ref=illustration_ref,
+        )
+
+    body_classes = body.get('class', [])
+    if isinstance(body_classes, str):
+        body_classes = body_classes.split()
+    elif not isinstance(body_classes, list):
+        body_classes = []
+
+    internal_links = 0
+    for anchor in body.find_all('a'):
+        href = anchor.get('href', '')
+        if href.endswith('.xhtml') or '#' in href:
+            internal_links += 1
+
+    return DocumentSummary(
+        has_body=True,
+        text=body.get_text(strip=True),
+        body_classes=frozenset(str(c).strip().lower() for c in body_classes if str(c).strip()),
+        has_svg=body.find('svg') is not None,
+        headings=tuple(
+            (heading.name, heading.get_text(strip=True))
+            for heading in body.find_all(_HEADING_TAGS)
+        ),
+        lead_paragraphs=tuple(p.get_text(strip=True) for p in body.find_all('p', limit=_LEAD_PARAGRAPHS)),
+        internal_link_count=internal_links,
+        image_refs=tuple(image_refs),
+        illustration_ref=illustration_ref,
+    )
+
+
+class XHTMLDocumentCache:
+    """
+    Per-volume cache of parsed XHTML trees (bounded LRU) and their summaries.
+
+    Entries are keyed by resolved path and invalidated when the file's size
+    or mtime changes.
+    """
+
+    def __init__(self, max_documents: int = DEFAULT_MAX_DOCUMENTS):
+        self.max_documents = max(1, int(max_documents))
+        self._documents: "OrderedDict[str, Tuple[Tuple[int, int], BeautifulSoup]]" = OrderedDict()
+        self._summaries: Dict[str, Tuple[Tuple[int, int], DocumentSummary]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"parses": 0, "hits": 0, "summary_hits": 0, "evictions": 0}
+
+    @staticmethod
+    def _key(path: Path) -> Tuple[str, Tuple[int, int]]:
+        path = Path(path)
+        stat = path.stat()
+        return str(path.resolve()), (stat.st_size, stat.st_mtime_ns)
+
+    def soup(self, path: Path) -> BeautifulSoup:
+        """Parsed document for `path` (read-only; shared with other callers)."""
+        key, version = self._key(path)
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached and cached[0] == version:
+                self._documents.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'xml')
+
+        with self._lock:
+            self.stats["parses"] += 1
+            self._documents[key] = (version, soup)
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+                self.stats["evictions"] += 1
+        return soup
+
+    def summary(self, path: Path) -> DocumentSummary:
+        """Cached DocumentSummary for `path`."""
+        key, version = self._key(path)
+        with self._lock:
+            cached = self._summaries.get(key)
+            if cached and cached[0] == version:
+                self.stats["summary_hits"] += 1
+                return cached[1]
+
+        summary = summarize(self.soup(path))
+        with self._lock:
+            self._summaries[key] = (version, summary)
+        return summary
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._summaries.clear()
@@ -0,0 +1,174 @@
+"""
+Read-only view of an EPUB archive backed by the zip central directory.
+
+EPUBExtractor used to `extractall` every volume and then locate the OPF,
+content directory, images and cover by walking the extracted tree with
+`rglob`. EPUBArchive indexes entry names once (full name and basename),
+reads small documents such as container.xml and the OPF straight from the
+zip, and streams only the entries a caller asks for to disk.
+"""
+
+import fnmatch
+import posixpath
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote
+
+from lxml import etree
+
+CONTAINER_PATH = "META-INF/container.xml"
+
+_NS = {
+    'container': 'urn:oasis:names:tc:opendocument:xmlns:container',
+    'opf': 'http://www.idpf.org/2007/opf',
+}
+
+
+def _normalize(name: str) -> str:
+    return name.replace("\\", "/").lstrip("/")
+
+
+class EPUBArchive:
+    """
+    Name index over an open EPUB (zip) file.
+
+    Entry names are archive-relative POSIX paths ("item/xhtml/p-001.xhtml").
+    Raises zipfile.BadZipFile if `epub_path` is not a zip archive.
+    """
+
+    def __init__(self, epub_path: Path):
+        self.epub_path = Path(epub_path)
+        self._zip = zipfile.ZipFile(self.epub_path, 'r')
+        self._entries: Dict[str, zipfile.ZipInfo] = {}
+        self._by_basename: Dict[str, List[str]] = {}
+        for info in self._zip.infolist():
+            if info.is_dir():
+                continue
+            name = _normalize(info.filename)
+            self._entries[name] = info
+            self._by_basename.setdefault(posixpath.basename(name), []).append(name)
+        for names in self._by_basename.values():
+            names.sort()
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> "EPUBArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Index lookups
+    # ------------------------------------------------------------------
+
+    def names(self, prefix: str = "", pattern: Optional[str] = None) -> List[str]:
+        """Sorted entry names under `prefix`, optionally filtered by a basename glob."""
+        prefix = self._dir_prefix(prefix)
+        return sorted(
+            name for name in self._entries
+            if name.startswith(prefix)
+            and (pattern is None or fnmatch.fnmatchcase(posixpath.basename(name), pattern))
+        )
+
+    def exists(self, name: str) -> bool:
+        return _normalize(name) in self._entries
+
+    def is_dir(self, name: str) -> bool:
+        """True if any entry lives under directory `name` ("" is the archive root)."""
+        prefix = self._dir_prefix(name)
+        return any(entry.startswith(prefix) for entry in self._entries)
+
+    def find(self, basename: str, prefix: str = "") -> Optional[str]:
+        """First entry (in name order) with this basename under `prefix`."""
+        prefix = self._dir_prefix(prefix)
+        for name in self._by_basename.get(basename, ()):
+            if name.startswith(prefix):
+                return name
+        return None
+
+    def file_size(self, name: str) -> int:
+        return self._entries[_normalize(name)].file_size
+
+    @staticmethod
+    def _dir_prefix(name: str) -> str:
+        name = _normalize(name).rstrip("/")
+        return f"{name}/" if name and name != "." else ""
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def read_bytes(self, name: str) -> bytes:
+        return self._zip.read(self._entries[_normalize(name)])
+
+    def read_text(self, name: str, encoding: str = "utf-8") -> str:
+        return self.read_bytes(name).decode(encoding)
+
+    def rootfile(self) -> Optional[str]:
+        """OPF path declared in META-INF/container.xml, if present in the archive."""
+        if not self.exists(CONTAINER_PATH):
+            return None
+        try:
+            tree = etree.fromstring(self.read_bytes(CONTAINER_PATH))
+        except etree.XMLSyntaxError:
+            return None
+        rootfile = tree.find('.//container:rootfile', _NS)
+        if rootfile is None or not rootfile.get('full-path'):
+            return None
+        return _normalize(rootfile.get('full-path'))
+
+    def manifest(self, opf_name: str) -> List[Tuple[str, str, str]]:
+        """
+        OPF manifest items as (entry name, media-type, properties).
+
+        Hrefs are resolved against the OPF's directory; items that point
+        outside the archive are kept so callers can decide what to do.
+        """
+        try:
+            tree = etree.fromstring(self.read_bytes(opf_name))
+        except (KeyError, etree.XMLSyntaxError):
+            return []
+        base = posixpath.dirname(_normalize(opf_name))
+        items = []
+        for item in tree.iterfind('.//opf:manifest/opf:item', _NS):
+            href = item.get('href')
+            if not href:
+                continue
+            href = unquote(href.split('#', 1)[0])
+            name = posixpath.normpath(posixpath.join(base, href))
+            items.append((name, item.get('media-type', ''), item.get('properties', '')))
+        return items
+
+    # ------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------
+
+    def extract(self, name: str, dest: Path) -> Path:
+        """Stream one entry to `dest` (a file path)."""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with self._zip.open(self._entries[_normalize(name)]) as src, open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        return dest
+
+    def materialize(self, names: Iterable[str], dest_root: Path) -> List[Path]:
+        """
+        Stream the given entries under `dest_root`, keeping archive paths.
+
+        Unknown names and names that would escape `dest_root` are skipped.
+        Returns the written paths in name order.
+        """
+        dest_root = Path(dest_root)
+        written = []
+        for name in sorted(set(_normalize(n) for n in names)):
+            if name not in self._entries:
+                continue
+            parts = name.split("/")
+            if ".." in parts or Path(name).is_absolute() or ":" in parts[0]:
+                continue
+            written.append(self.extract(name, dest_root.joinpath(*parts)))
+        return written
@@ -3,15 +3,20 @@ EPUB Extractor - Unpacks EPUB archives to working directory.
 
 Language-agnostic extraction that handles various EPUB structures.
 Now uses PublisherProfileManager for publisher detection.
+
+The OPF, content directory, images and cover are located through the zip
+central directory (EPUBArchive); only the entries later phases read from
+disk are written to the volume's _epub_extracted/ tree.
 """
 
 import zipfile
 import hashlib
+import posixpath
 import shutil
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 from dataclasses import dataclass, field
 
 from .config import (
@@ -19,9 +24,11 @@ from .config import (
     OPF_FILENAMES,
     IMAGE_EXTENSIONS,
     COVER_PATTERNS,
+    get_extraction_config,
     get_volume_structure,
     get_work_dir,
 )
+from .epub_archive import EPUBArchive
 from .publisher_profiles.manager import PublisherProfileManager, get_profile_manager, PublisherProfile
 
 
@@ -40,6 +47,19 @@ class ExtractionResult:
     publisher_canonical: str = "Unknown"
     publisher_raw: str = ""
     publisher_profile: Optional[PublisherProfile] = None
+    # Files written under epub_root (the archive is not fully extracted)
+    files: List[Path] = field(default_factory=list)
+
+
+# Entries materialized besides images: everything the Librarian, Builder and
+# TOC/spine parsers open from disk. Stylesheets, fonts and scripts stay in the zip.
+MATERIALIZED_MEDIA_TYPES = {
+    'application/xhtml+xml',
+    'text/html',
+    'application/x-dtbncx+xml',
+    'application/oebps-package+xml',
+}
+MATERIALIZED_EXTENSIONS = {'.xhtml', '.html', '.htm', '.opf', '.ncx'}
 
 
 class EPUBExtractor:
@@ -168,11 +188,10 @@ class EPUBExtractor:
         for dir_path in volume_structure.values():
             (work_dir / dir_path).mkdir(parents=True, exist_ok=True)
 
-        # Extract EPUB
+        # Index the EPUB and materialize what later phases read
         epub_root = work_dir / volume_structure["epub_extracted"]
         try:
-            with zipfile.ZipFile(epub_path, 'r') as zf:
-                zf.extractall(epub_root)
+            archive = EPUBArchive(epub_path)
         except zipfile.BadZipFile as e:
             return ExtractionResult(
                 volume_id=volume_id,
@@ -184,37 +203,48 @@ class EPUBExtractor:
                 error=f"Invalid EPUB archive: {e}"
             )
 
-        # Find content directory
-        content_dir = self._find_content_dir(epub_root)
-        if content_dir is None:
-            return ExtractionResult(
-                volume_id=volume_id,
-                work_dir=work_dir,
-                epub_root=epub_root,
-                content_dir=Path(),
-                opf_path=Path(),
-                success=False,
-                error="Could not find EPUB content directory"
-            )
-
-        # Find OPF file
-        opf_path = self._find_opf(epub_root)
-        if opf_path is None:
-            return ExtractionResult(
-                volume_id=volume_id,
-                work_dir=work_dir,
-                epub_root=epub_root,
-                content_dir=content_dir,
-                opf_path=Path(),
-                success=False,
-                error="Could not find OPF file"
-            )
-
-        # Catalog images
-        images = self._catalog_images(content_dir)
-
-        # Copy cover image to assets
-        self._extract_cover(content_dir, work_dir / volume_structure["assets"])
+        with archive:
+            # Find content directory
+            content_name = self._find_content_dir(archive)
+            if content_name is None:
+                return ExtractionResult(
+                    volume_id=volume_id,
+                    work_dir=work_dir,
+                    epub_root=epub_root,
+                    content_dir=Path(),
+                    opf_path=Path(),
+                    success=False,
+                    error="Could not find EPUB content directory"
+                )
+            content_dir = epub_root / content_name
+
+            # Find OPF file
+            opf_name = self._find_opf(archive)
+            if opf_name is None:
+                return ExtractionResult(
+                    volume_id=volume_id,
+                    work_dir=work_dir,
+                    epub_root=epub_root,
+                    content_dir=content_dir,
+                    opf_path=Path(),
+                    success=False,
+                    error="Could not find OPF file"
+                )
+            opf_path = epub_root / opf_name
+
+            if get_extraction_config()["materialize"] == "all":
+                entries = archive.names()
+            else:
+                entries = self._select_entries(archive, opf_name, content_name)
+            files = archive.materialize(entries, epub_root)
+            content_dir.mkdir(parents=True, exist_ok=True)
+            total_entries = len(archive.names())
+
+            # Catalog images
+            images = self._catalog_images(archive, content_name, epub_root)
+
+            # Copy cover image to assets
+            self._extract_cover(archive, content_name, work_dir / volume_structure["assets"])
 
         # Detect publisher from OPF metadata using profile manager
         publisher_canonical, publisher_confidence, publisher_profile = self._detect_publisher(opf_path)
@@ -226,6 +256,7 @@ class EPUBExtractor:
         print(f"     Content dir: {content_dir.relative_to(work_dir)}")
         print(f"     OPF file: {opf_path.name}")
         print(f"     Images found: {len(images)}")
+        print(f"     Materialized: {len(files)}/{total_entries} archive entries")
 
         return ExtractionResult(
             volume_id=volume_id,
@@ -237,7 +268,8 @@ class EPUBExtractor:
             success=True,
             publisher_canonical=publisher_canonical,
             publisher_raw=publisher_raw,
-            publisher_profile=publisher_profile
+            publisher_profile=publisher_profile,
+            files=files,
         )
 
     def _generate_volume_id(self, epub_path: Path) -> str:
@@ -247,67 +279,57 @@ class EPUBExtractor:
         timestamp = datetime.now().strftime("%Y%m%d")
         return f"{name_part}_{timestamp}_{hash_part}"
 
-    def _find_content_dir(self, epub_root: Path) -> Optional[Path]:
-        """Find the main content directory in extracted EPUB."""
+    def _find_content_dir(self, archive: EPUBArchive) -> Optional[str]:
+        """Find the main content directory (archive-relative, "" for the root)."""
         # Check common directory names
         for candidate in EPUB_CONTENT_DIRS:
-            content_dir = epub_root / candidate
-            if content_dir.is_dir():
-                return content_dir
+            if archive.is_dir(candidate):
+                return candidate
 
         # Check container.xml for rootfile path
-        container_path = epub_root / "META-INF" / "container.xml"
-        if container_path.exists():
-            try:
-                from lxml import etree
-                tree = etree.parse(str(container_path))
-                ns = {'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
-                rootfile = tree.find('.//container:rootfile', ns)
-                if rootfile is not None:
-                    opf_path = rootfile.get('full-path')
-                    if opf_path:
-                        content_dir = epub_root / Path(opf_path).parent
-                        if content_dir.is_dir():
-                            return content_dir
-            except Exception:
-                pass
+        rootfile = archive.rootfile()
+        if rootfile:
+            content_name = posixpath.dirname(rootfile)
+            if archive.is_dir(content_name):
+                return content_name
 
         # Fallback: look for any directory containing .opf
-        for opf_file in epub_root.rglob("*.opf"):
-            return opf_file.parent
+        for opf_name in archive.names(pattern="*.opf"):
+            return posixpath.dirname(opf_name)
 
         return None
 
-    def _find_opf(self, epub_root: Path) -> Optional[Path]:
-        """Find the OPF (Open Packaging Format) file."""
+    def _find_opf(self, archive: EPUBArchive) -> Optional[str]:
+        """Find the OPF (Open Packaging Format) file (archive-relative)."""
         # Check container.xml first
-        container_path = epub_root / "META-INF" / "container.xml"
-        if container_path.exists():
-            try:
-                from lxml import etree
-                tree = etree.parse(str(container_path))
-                ns = {'container': 'urn:oasis:names:tc:opendocument:xmlns:container'}
-                rootfile = tree.find('.//container:rootfile', ns)
-                if rootfile is not None:
-                    opf_path = rootfile.get('full-path')
-                    if opf_path:
-                        full_path = epub_root / opf_path
-                        if full_path.exists():
-                            return full_path
-            except Exception:
-                pass
+        rootfile = archive.rootfile()
+        if rootfile and archive.exists(rootfile):
+            return rootfile
 
         # Fallback: find any .opf file
-        opf_files = list(epub_root.rglob("*.opf"))
-        if opf_files:
+        opf_names = archive.names(pattern="*.opf")
+        if opf_names:
             # Prefer known OPF filenames
-            for opf in opf_files:
-                if opf.name in OPF_FILENAMES:
-                    return opf
-            return opf_files[0]
+            for opf_name in opf_names:
+                if posixpath.basename(opf_name) in OPF_FILENAMES:
+                    return opf_name
+            return opf_names[0]
 
         return None
 
+    def _select_entries(self, archive: EPUBArchive, opf_name: str, content_name: str) -> List[str]:
+        """Archive entries to write to disk: container, OPF, manifest XHTML/NCX and all images."""
+        selected: Set[str] = {opf_name, "mimetype"}
+        selected.update(archive.names("META-INF"))
+        for name, media_type, _ in archive.manifest(opf_name):
+            if media_type in MATERIALIZED_MEDIA_TYPES or media_type.startswith("image/"):
+                selected.add(name)
+        # Unlisted content files are still picked up by suffix (image catalog, ruby scan, TOC fallback)
+        for name in archive.names(content_name):
+            if Path(name).suffix.lower() in IMAGE_EXTENSIONS | MATERIALIZED_EXTENSIONS:
+                selected.add(name)
+        return sorted(selected)
+
     def _get_raw_publisher_text(self, opf_path: Path) -> str:
         """Extract raw publisher text from OPF metadata."""
         try:
@@ -337,17 +359,17 @@ class EPUBExtractor:
         publisher_text = self._get_raw_publisher_text(opf_path)
         return self._profile_manager.detect_publisher(publisher_text)
 
-    def _catalog_images(self, content_dir: Path) -> List[Path]:
+    def _catalog_images(self, archive: EPUBArchive, content_name: str, epub_root: Path) -> List[Path]:
         """Find all image files in content directory."""
-        images = []
-
-        for ext in IMAGE_EXTENSIONS:
-            images.extend(content_dir.rglob(f"*{ext}"))
-            images.extend(content_dir.rglob(f"*{ext.upper()}"))
-
+        suffixes = tuple(IMAGE_EXTENSIONS) + tuple(ext.upper() for ext in IMAGE_EXTENSIONS)
+        images = [
+            epub_root / name
+            for name in archive.names(content_name)
+            if name.endswith(suffixes)
+        ]
         return sorted(set(images))
 
-    def _extract_cover(self, content_dir: Path, assets_dir: Path) -> Optional[Path]:
+    def _extract_cover(self, archive: EPUBArchive, content_name: str, assets_dir: Path) -> Optional[Path]:
         """Extract cover image to assets directory."""
         # Exclude allcover files (horizontal spreads, not single cover)
         def is_allcover(filename: str) -> bool:
@@ -356,26 +378,14 @@ class EPUBExtractor:
             return 'allcover' in lower_name
         
         for pattern in COVER_PATTERNS:
-            for cover_path in content_dir.rglob(pattern):
+            for cover_name in archive.names(content_name, pattern):
                 # Skip allcover files
-                if is_allcover(cover_path.name):
+                if is_allcover(posixpath.basename(cover_name)):
                     continue
-                dest = assets_dir / "cover.jpg"
-                shutil.copy2(cover_path, dest)
-                print(f"     Cover image: {cover_path.name}")
+                dest = archive.extract(cover_name, assets_dir / "cover.jpg")
+                print(f"     Cover image: {posixpath.basename(cover_name)}")
                 return dest
 
-        # Look in image subdirectories
-        image_dirs = ["image", "images", "Images", "img"]
-        for img_dir in image_dirs:
-            for pattern in COVER_PATTERNS:
-                cover_path = content_dir / img_dir / pattern
-                if cover_path.exists() and not is_allcover(cover_path.name):
-                    dest = assets_dir / "cover.jpg"
-                    shutil.copy2(cover_path, dest)
-                    print(f"     Cover image: {cover_path.name}")
-                    return dest
-
         return None
 
 
@@ -21,6 +21,7 @@ from dataclasses import dataclass, asdict, field
 from bs4 import BeautifulSoup, Tag
 from collections import Counter, defaultdict
 
+from .document_cache import XHTMLDocumentCache
 from .name_filters import load_filters, LoadedFilters
 
 logger = logging.getLogger(__name__)
@@ -100,7 +101,19 @@ class RubyExtractor:
         Returns:
             List of RubyEntry objects
         """
-        soup = BeautifulSoup(xhtml_content, 'xml')
+        return self.extract_from_soup(BeautifulSoup(xhtml_content, 'xml'), source_file)
+
+    def extract_from_soup(self, soup: BeautifulSoup, source_file: str) -> List[RubyEntry]:
+        """
+        Extract ruby entries from an already parsed document (the tree is not modified).
+
+        Args:
+            soup: Parsed XHTML document
+            source_file: Filename for tracking
+
+        Returns:
+            List of RubyEntry objects
+        """
         ruby_tags = soup.find_all('ruby')
 
         extracted = []
@@ -141,7 +154,7 @@ class RubyExtractor:
                 self._track_fragment(entry, source_file)
 
         # Also extract standalone katakana names (for fantasy LNs)
-        katakana_entries = self._extract_katakana_names(xhtml_content, source_file)
+        katakana_entries = self._extract_katakana_names(soup, source_file)
         extracted.extend(katakana_entries)
 
         return extracted
@@ -206,13 +219,12 @@ class RubyExtractor:
         self.fragmented_candidates[entry.ruby].contexts.append(entry.context)
         self.fragmented_candidates[entry.ruby].source_files.add(source_file)
 
-    def _extract_katakana_names(self, xhtml_content: str, source_file: str) -> List[RubyEntry]:
+    def _extract_katakana_names(self, soup: BeautifulSoup, source_file: str) -> List[RubyEntry]:
         """
         Extract standalone katakana character names (for fantasy/isekai light novels).
 
         Now more conservative to avoid false positives like イケメン, スマホ.
         """
-        soup = BeautifulSoup(xhtml_content, 'xml')
         body = soup.find('body')
 
         if not body:
@@ -564,12 +576,16 @@ class RubyExtractor:
         }
 
 
-def extract_ruby_from_directory(xhtml_dir: Path) -> Dict[str, List[Dict]]:
+def extract_ruby_from_directory(
+    xhtml_dir: Path,
+    document_cache: Optional[XHTMLDocumentCache] = None,
+) -> Dict[str, List[Dict]]:
     """
     Extract ruby entries from all XHTML files in directory.
 
     Args:
         xhtml_dir: Directory containing XHTML chapter files (searches recursively)
+        document_cache: Optional shared parsed-XHTML cache (reuses Librarian parses)
 
     Returns:
         Dict with 'names' list (deduplicated)
@@ -590,8 +606,11 @@ def extract_ruby_from_directory(xhtml_dir: Path) -> Dict[str, List[Dict]]:
         logger.debug(f"Extracting ruby from {xhtml_file.name}")
 
         try:
-            content = xhtml_file.read_text(encoding='utf-8')
-            entries = extractor.extract_from_xhtml(content, xhtml_file.name)
+            if document_cache is not None:
+                entries = extractor.extract_from_soup(document_cache.soup(xhtml_file), xhtml_file.name)
+            else:
+                content = xhtml_file.read_text(encoding='utf-8')
+                entries = extractor.extract_from_xhtml(content, xhtml_file.name)
 
             total_before += len(entries)
             extractor.entries.extend(entries)
@@ -0,0 +1,53 @@
+import os
+
+from pipeline.librarian.document_cache import XHTMLDocumentCache
+
+PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:xlink="http://www.w3.org/1999/xlink">
+<body class="p-text Caution-Page">
+<h2>第一章　出会い</h2>
+<p>「おはよう」</p>
+<p><a href="p-002.xhtml">next</a><a href="#note">note</a></p>
+<svg><image xlink:href="../image/i-001.jpg"/></svg>
+<p><img src="../image/gaiji.png"/></p>
+</body>
+</html>
+"""
+
+
+def test_summary_and_parse_once(tmp_path):
+    page = tmp_path / "p-001.xhtml"
+    page.write_text(PAGE, encoding="utf-8")
+    cache = XHTMLDocumentCache(max_documents=4)
+
+    summary = cache.summary(page)
+    assert cache.soup(page) is cache.soup(page)
+    assert cache.summary(page) is summary
+    assert cache.stats["parses"] == 1
+
+    assert summary.first_heading("h2") == "第一章　出会い"
+    assert summary.first_heading("h1") is None
+    assert summary.lead_paragraphs[0] == "「おはよう」"
+    assert summary.body_classes == {"p-text", "caution-page"}
+    assert summary.internal_link_count == 2
+    assert summary.image_refs == ("i-001.jpg", "gaiji.png")
+    assert summary.illustration_ref == "i-001.jpg"
+
+
+def test_changed_file_is_reparsed_and_lru_is_bounded(tmp_path):
+    pages = []
+    for i in range(3):
+        page = tmp_path / f"p-{i}.xhtml"
+        page.write_text(PAGE, encoding="utf-8")
+        pages.append(page)
+    cache = XHTMLDocumentCache(max_documents=2)
+
+    for page in pages:
+        cache.soup(page)
+    assert cache.stats["evictions"] == 1
+
+    pages[2].write_text(PAGE.replace("おはよう", "こんばんは"), encoding="utf-8")
+    stat = pages[2].stat()
+    os.utime(pages[2], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.summary(pages[2]).lead_paragraphs[0] == "「こんばんは」"
+    assert cache.stats["parses"] == 4
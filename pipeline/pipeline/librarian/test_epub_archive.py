@@ -0,0 +1,75 @@
+import zipfile
+
+from pipeline.librarian.epub_archive import EPUBArchive
+from pipeline.librarian.epub_extractor import EPUBExtractor
+
+CONTAINER = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+<rootfiles><rootfile full-path="item/standard.opf" media-type="application/oebps-package+xml"/></rootfiles>
+</container>
+"""
+
+OPF = """<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:publisher>SBクリエイティブ</dc:publisher></metadata>
+<manifest>
+<item id="p-001" href="xhtml/p-001.xhtml" media-type="application/xhtml+xml"/>
+<item id="cover" href="image/cover.jpg" media-type="image/jpeg"/>
+<item id="css" href="style/book-style.css" media-type="text/css"/>
+<item id="font" href="font/mincho.otf" media-type="font/otf"/>
+<item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
+</manifest>
+<spine><itemref idref="p-001"/></spine>
+</package>
+"""
+
+
+def _write_epub(path):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip")
+        zf.writestr("META-INF/container.xml", CONTAINER)
+        zf.writestr("item/standard.opf", OPF)
+        zf.writestr("item/toc.ncx", "<ncx/>")
+        zf.writestr("item/xhtml/p-001.xhtml", "<html/>")
+        zf.writestr("item/image/cover.jpg", b"\xff\xd8cover")
+        zf.writestr("item/image/i-001.jpg", b"\xff\xd8unlisted")
+        zf.writestr("item/style/book-style.css", "body {}")
+        zf.writestr("item/font/mincho.otf", b"font")
+        zf.writestr("../evil.xhtml", "<html/>")
+
+
+def test_archive_index(tmp_path):
+    epub = tmp_path / "book.epub"
+    _write_epub(epub)
+
+    with EPUBArchive(epub) as archive:
+        assert archive.rootfile() == "item/standard.opf"
+        assert archive.is_dir("item") and not archive.is_dir("OEBPS")
+        assert archive.find("p-001.xhtml") == "item/xhtml/p-001.xhtml"
+        assert archive.names("item/image", "*.jpg") == ["item/image/cover.jpg", "item/image/i-001.jpg"]
+        assert ("item/font/mincho.otf", "font/otf", "") in archive.manifest("item/standard.opf")
+        assert archive.materialize(["../evil.xhtml", "missing.xhtml"], tmp_path / "out") == []
+
+
+def test_extract_materializes_only_needed_entries(tmp_path):
+    epub = tmp_path / "book.epub"
+    _write_epub(epub)
+
+    result = EPUBExtractor(tmp_path / "WORK").extract(epub, "vol")
+
+    assert result.success
+    assert result.content_dir == result.epub_root / "item"
+    assert result.opf_path == result.epub_root / "item" / "standard.opf"
+    assert [p.name for p in result.images] == ["cover.jpg", "i-001.jpg"]
+    assert (result.work_dir / "assets" / "cover.jpg").read_bytes() == b"\xff\xd8cover"
+    assert sorted(str(p.relative_to(result.epub_root)) for p in result.files) == [
+        "META-INF/container.xml",
+        "item/image/cover.jpg",
+        "item/image/i-001.jpg",
+        "item/standard.opf",
+        "item/toc.ncx",
+        "item/xhtml/p-001.xhtml",
+        "mimetype",
+    ]
+    assert not (result.content_dir / "style").exists()
+    assert not (tmp_path / "WORK" / "vol" / "evil.xhtml").exists()
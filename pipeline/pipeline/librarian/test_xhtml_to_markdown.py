@@ -0,0 +1,57 @@
+import functools
+
+from pipeline.librarian.xhtml_to_markdown import XHTMLToMarkdownConverter, convert_all_chapters
+
+PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>p-{n}</title></head>
+<body>
+<h1>第{n}話</h1>
+<p><ruby>奏汰<rt>かなた</rt></ruby>は笑った。</p>
+<p>　</p>
+<p>◆</p>
+<p><img src="../image/i-{n}.jpg"/></p>
+<p><img src="../image/skip-{n}.png"/></p>
+<p>「また明日」</p>
+</body>
+</html>
+"""
+
+
+def _skip_images(name: str, prefix: str) -> bool:
+    return name.startswith(prefix)
+
+
+def test_prefetched_conversion_matches_serial(tmp_path):
+    files = []
+    for n in range(6):
+        path = tmp_path / f"p-{n:03d}.xhtml"
+        path.write_text(PAGE.format(n=n), encoding="utf-8")
+        files.append(path)
+    matcher = functools.partial(_skip_images, prefix="skip-")
+
+    serial = XHTMLToMarkdownConverter(remove_ruby=False, exclude_image_matcher=matcher)
+    parallel = XHTMLToMarkdownConverter(remove_ruby=False, exclude_image_matcher=matcher)
+    assert parallel.prefetch(files, max_workers=2) == len(files)
+
+    for path in files:
+        for title in ("", "Chapter"):
+            assert parallel.convert_file(path, title) == serial.convert_file(path, title)
+
+    # A file edited after prefetch is converted from disk again.
+    files[0].write_text(PAGE.format(n=99), encoding="utf-8")
+    assert "第99話" in parallel.convert_file(files[0]).content
+
+
+def test_convert_all_chapters_with_workers_writes_same_files(tmp_path):
+    content_dir = tmp_path / "xhtml"
+    content_dir.mkdir()
+    for n in range(4):
+        (content_dir / f"p-{n:03d}.xhtml").write_text(PAGE.format(n=n), encoding="utf-8")
+
+    serial = convert_all_chapters(content_dir, tmp_path / "serial")
+    parallel = convert_all_chapters(content_dir, tmp_path / "parallel", max_workers=2)
+
+    assert parallel == serial
+    for md in (tmp_path / "serial").iterdir():
+        assert (tmp_path / "parallel" / md.name).read_bytes() == md.read_bytes()
@@ -8,13 +8,18 @@ Language-agnostic conversion that handles:
 - Paragraph structure preservation
 """
 
+import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple, Callable
+from typing import List, Optional, Dict, Tuple, Callable, Sequence
 from dataclasses import dataclass, field
 from bs4 import BeautifulSoup, NavigableString, Tag
 
 from .config import REMOVE_RUBY_TAGS, SCENE_BREAK_MARKER
+from .document_cache import XHTMLDocumentCache
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -58,6 +63,7 @@ class XHTMLToMarkdownConverter:
         scene_break: str = "* * *",
         content_dir: Path = None,
         exclude_image_matcher: Optional[Callable[[str], bool]] = None,
+        document_cache: Optional[XHTMLDocumentCache] = None,
     ):
         """
         Initialize converter.
@@ -67,13 +73,17 @@ class XHTMLToMarkdownConverter:
             scene_break: Marker for scene breaks in output
             content_dir: Path to EPUB content directory (for image analysis)
             exclude_image_matcher: Optional callback to skip inline images by filename
+            document_cache: Optional shared parsed-XHTML cache used by convert_file()
         """
         self.remove_ruby = remove_ruby
         self.scene_break = scene_break
         self.content_dir = content_dir
         self.exclude_image_matcher = exclude_image_matcher
+        self.document_cache = document_cache
         # Per-file exclusions populated by raw XHTML header scan.
         self._runtime_excluded_images = set()
+        # Bodies rendered ahead of time by prefetch(): resolved path -> ((size, mtime_ns), rendered)
+        self._prefetched: Dict[str, Tuple[Tuple[int, int], "_RenderedDocument"]] = {}
 
     def _is_excluded_image(self, image_filename: str) -> bool:
         """Check whether an image should be excluded from markdown output."""
@@ -183,6 +193,16 @@ class XHTMLToMarkdownConverter:
         if not xhtml_path.exists():
             raise ValueError(f"XHTML file not found: {xhtml_path}")
 
+        prefetched = self._take_prefetched(xhtml_path)
+        if prefetched is not None:
+            extracted_title, markdown, illustrations = prefetched
+            return self._build_chapter(
+                xhtml_path.name, chapter_title or extracted_title, markdown, list(illustrations)
+            )
+
+        if self.document_cache is not None:
+            return self.convert_soup(self.document_cache.soup(xhtml_path), xhtml_path.name, chapter_title)
+
         with open(xhtml_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
 
@@ -200,12 +220,29 @@ class XHTMLToMarkdownConverter:
         Returns:
             ConvertedChapter with markdown content
         """
-        soup = BeautifulSoup(html_content, 'xml')
+        return self.convert_soup(BeautifulSoup(html_content, 'xml'), filename, chapter_title)
+
+    def convert_soup(self, soup: BeautifulSoup, filename: str = "", chapter_title: str = "") -> ConvertedChapter:
+        """
+        Convert an already parsed document to markdown (the tree is not modified).
+
+        Args:
+            soup: Parsed XHTML document
+            filename: Source filename for reference
+            chapter_title: Optional title override
 
+        Returns:
+            ConvertedChapter with markdown content
+        """
         # Extract title if not provided
         if not chapter_title:
             chapter_title = self._extract_title(soup)
 
+        markdown, illustrations = self._render_body(soup)
+        return self._build_chapter(filename, chapter_title, markdown, illustrations)
+
+    def _render_body(self, soup: BeautifulSoup) -> Tuple[str, List[str]]:
+        """Markdown body (without the title heading) and the illustrations it references."""
         # Find body or main content
         body = soup.find('body')
         if body is None:
@@ -223,8 +260,16 @@ class XHTMLToMarkdownConverter:
             self._runtime_excluded_images = set()
 
         # Clean up and format
-        markdown = self._clean_markdown(markdown_lines)
+        return self._clean_markdown(markdown_lines), illustrations
 
+    def _build_chapter(
+        self,
+        filename: str,
+        chapter_title: str,
+        markdown: str,
+        illustrations: List[str],
+    ) -> ConvertedChapter:
+        """Assemble a ConvertedChapter from a rendered body."""
         # Add title as heading if found
         if chapter_title:
             markdown = f"# {chapter_title}\n\n{markdown}"
@@ -245,6 +290,65 @@ class XHTMLToMarkdownConverter:
             paragraph_count=paragraph_count,
         )
 
+    def prefetch(self, xhtml_paths: Sequence[Path], max_workers: int) -> int:
+        """
+        Render markdown bodies for `xhtml_paths` in a process pool.
+
+        Later convert_file() calls for these files only add the chapter title,
+        so output is byte-identical to serial conversion. Files that fail to
+        render (or change on disk afterwards) are converted serially as usual.
+        The converter options, including exclude_image_matcher, must be
+        picklable for non-fork start methods; otherwise this falls back to
+        serial conversion.
+
+        Returns:
+            Number of files rendered ahead of time
+        """
+        paths: List[Path] = []
+        seen = set()
+        for path in xhtml_paths:
+            path = Path(path)
+            key = str(path.resolve())
+            if key not in seen and path.exists():
+                seen.add(key)
+                paths.append(path)
+        workers = min(max_workers, len(paths))
+        if workers <= 1:
+            return 0
+
+        options = (self.remove_ruby, self.scene_break, self.content_dir, self.exclude_image_matcher)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(options,),
+            ) as pool:
+                results = list(pool.map(_render_file, paths, chunksize=max(1, len(paths) // (workers * 4))))
+        except Exception as e:
+            logger.warning(f"[CONVERT] Parallel conversion unavailable ({e}); converting serially")
+            return 0
+
+        rendered = 0
+        for path, result in zip(paths, results):
+            if result is not None:
+                self._prefetched[str(path.resolve())] = result
+                rendered += 1
+        logger.debug(f"[CONVERT] Pre-rendered {rendered}/{len(paths)} files with {workers} processes")
+        return rendered
+
+    def _take_prefetched(self, xhtml_path: Path) -> Optional["_RenderedDocument"]:
+        """Prefetched render for `xhtml_path` if the file is unchanged since rendering."""
+        if not self._prefetched:
+            return None
+        entry = self._prefetched.get(str(xhtml_path.resolve()))
+        if entry is None:
+            return None
+        version, rendered = entry
+        stat = xhtml_path.stat()
+        if version != (stat.st_size, stat.st_mtime_ns):
+            return None
+        return rendered
+
     def _is_scene_break_icon(self, image_filename: str) -> bool:
         """
         Detect if an image is likely a scene break icon.
@@ -737,6 +841,37 @@ class XHTMLToMarkdownConverter:
         return text.strip()
 
 
+# (extracted title, markdown body, illustrations)
+_RenderedDocument = Tuple[str, str, Tuple[str, ...]]
+
+# Converter owned by each prefetch() worker process
+_worker_converter: Optional[XHTMLToMarkdownConverter] = None
+
+
+def _init_render_worker(options: Tuple) -> None:
+    global _worker_converter
+    remove_ruby, scene_break, content_dir, exclude_image_matcher = options
+    _worker_converter = XHTMLToMarkdownConverter(
+        remove_ruby=remove_ruby,
+        scene_break=scene_break,
+        content_dir=content_dir,
+        exclude_image_matcher=exclude_image_matcher,
+    )
+
+
+def _render_file(xhtml_path: Path) -> Optional[Tuple[Tuple[int, int], _RenderedDocument]]:
+    """Worker: ((size, mtime_ns), rendered document) for one file, or None on failure."""
+    try:
+        stat = xhtml_path.stat()
+        with open(xhtml_path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'xml')
+        markdown, illustrations = _worker_converter._render_body(soup)
+        title = _worker_converter._extract_title(soup)
+        return (stat.st_size, stat.st_mtime_ns), (title, markdown, tuple(illustrations))
+    except Exception:
+        return None
+
+
 def convert_xhtml_to_markdown(
     xhtml_path: Path,
     chapter_title: str = "",
@@ -763,7 +898,8 @@ def convert_all_chapters(
     content_dir: Path,
     output_dir: Path,
     chapter_order: Optional[List[str]] = None,
-    remove_ruby: bool = True
+    remove_ruby: bool = True,
+    max_workers: int = 1
 ) -> List[ConvertedChapter]:
     """
     Convert all XHTML chapters to markdown files.
@@ -773,6 +909,7 @@ def convert_all_chapters(
         output_dir: Directory to write markdown files
         chapter_order: Optional ordered list of chapter files
         remove_ruby: Whether to strip ruby tags
+        max_workers: Worker processes for rendering (1 = serial; output is identical)
 
     Returns:
         List of ConvertedChapter objects
@@ -793,6 +930,9 @@ def convert_all_chapters(
     else:
         xhtml_files = sorted(content_dir.glob("*.xhtml"))
 
+    if max_workers > 1:
+        converter.prefetch(xhtml_files, max_workers)
+
     results = []
     for xhtml_path in xhtml_files:
         try:
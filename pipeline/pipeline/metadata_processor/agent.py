@@ -335,7 +335,7 @@ class MetadataProcessor:
         logger.info(f"Using model: {model}")
 
         # Disable caching for metadata processor (only 1-2 API calls per volume, not worth overhead)
-        self.client = GeminiClient(model=model, enable_caching=False)
+        self.client = GeminiClient(model=model, enable_caching=False, priority="metadata")
         
         # Language-specific prompt
         prompt_filename = f"metadata_processor_prompt_{self.target_language}.xml"
@@ -31,6 +31,7 @@ try:
 except Exception:
     types = None
 
+from pipeline.common.context_cache_registry import get_cache_registry
 from pipeline.common.gemini_client import GeminiClient
 from pipeline.config import PIPELINE_ROOT, WORK_DIR, get_target_language
 
@@ -235,7 +236,7 @@ class RichMetadataCacheUpdater:
         self.schema_spec_path = PIPELINE_ROOT / "SCHEMA_V3.9_AGENT.md"
         self.target_language = target_language or get_target_language()
         self.metadata_key = f"metadata_{self.target_language}"
-        self.client = GeminiClient(model=self.MODEL_NAME, enable_caching=True)
+        self.client = GeminiClient(model=self.MODEL_NAME, enable_caching=True, priority="metadata")
         self.manifest: Dict[str, Any] = {}
         self.cache_only = cache_only
         self._chapter_text_cache: Optional[Dict[str, List[str]]] = None
@@ -299,12 +300,14 @@ class RichMetadataCacheUpdater:
             used_external_cache = False
             cache_error: Optional[str] = None
             try:
-                cache_name = self.client.create_cache(
+                cache_name = get_cache_registry(self.work_dir).acquire(
+                    self.client,
                     model=self.MODEL_NAME,
                     system_instruction=system_instruction,
                     contents=[full_volume_text],
                     ttl_seconds=self.CACHE_TTL_SECONDS,
                     display_name=f"{volume_id}_richmeta_cacheonly",
+                    label="phase1.55_richmeta",
                 )
                 if cache_name:
                     used_external_cache = True
@@ -322,7 +325,7 @@ class RichMetadataCacheUpdater:
                 )
             finally:
                 if cache_name:
-                    self.client.delete_cache(cache_name)
+                    get_cache_registry(self.work_dir).release(self.client, cache_name)
 
             metadata_snapshot = self._get_metadata_block()
             context_processor_stats = self._run_context_processors(
@@ -384,12 +387,14 @@ class RichMetadataCacheUpdater:
         cache_name = None
         used_external_cache = False
         try:
-            cache_name = self.client.create_cache(
+            cache_name = get_cache_registry(self.work_dir).acquire(
+                self.client,
                 model=self.MODEL_NAME,
                 system_instruction=system_instruction,
                 contents=[full_volume_text],
                 ttl_seconds=self.CACHE_TTL_SECONDS,
                 display_name=f"{volume_id}_richmeta",
+                label="phase1.55_richmeta",
             )
             if cache_name:
                 used_external_cache = True
@@ -423,7 +428,7 @@ class RichMetadataCacheUpdater:
             return False
         finally:
             if cache_name:
-                self.client.delete_cache(cache_name)
+                get_cache_registry(self.work_dir).release(self.client, cache_name)
 
         if not response or not response.content:
             logger.error("Gemini returned empty content for rich metadata update")
@@ -2274,13 +2279,15 @@ class RichMetadataCacheUpdater:
         response = None
         cache_name = None
         try:
-            cache_name = self.client.create_cache(
+            cache_name = get_cache_registry(self.work_dir).acquire(
+                self.client,
                 model=self.MODEL_NAME,
                 system_instruction=system_instruction,
                 contents=[full_volume_text],
                 ttl_seconds=self.CACHE_TTL_SECONDS,
                 display_name=display_name,
                 tools=tools,
+                label=f"phase1.55_{display_name}",
             )
             if cache_name:
                 response = self.client.generate(
@@ -2304,7 +2311,7 @@ class RichMetadataCacheUpdater:
             return None, f"call_failed: {str(e)[:240]}", None
         finally:
             if cache_name:
-                self.client.delete_cache(cache_name)
+                get_cache_registry(self.work_dir).release(self.client, cache_name)
 
         if not response or not response.content:
             return None, "empty_response", None
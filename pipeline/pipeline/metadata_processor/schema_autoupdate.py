@@ -72,7 +72,7 @@ class SchemaAutoUpdater:
         self.work_dir = work_dir
         self.manifest_path = work_dir / "manifest.json"
         self.schema_spec_path = PIPELINE_ROOT / "SCHEMA_V3.9_AGENT.md"
-        self.client = GeminiClient(model=self.MODEL_NAME, enable_caching=False)
+        self.client = GeminiClient(model=self.MODEL_NAME, enable_caching=False, priority="metadata")
 
     def apply(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -10,12 +10,15 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pipeline.config import WORK_DIR
+from pipeline.translator.chapter_scheduler import ChapterJob, ChapterScheduler
+from pipeline.translator.config import get_concurrency_config
 
 from .scene_planner import ScenePlanningAgent, ScenePlanningError
 
@@ -47,9 +50,11 @@ class Stage1PlannerRunner:
 
     @staticmethod
     def _save_manifest(manifest_path: Path, manifest: Dict[str, Any]) -> None:
-        with open(manifest_path, "w", encoding="utf-8") as f:
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(manifest, f, indent=2, ensure_ascii=False)
             f.write("\n")
+        os.replace(tmp_path, manifest_path)
 
     @staticmethod
     def _load_jp_text(work_dir: Path, source_file: str) -> str:
@@ -58,6 +63,15 @@ class Stage1PlannerRunner:
             raise FileNotFoundError(f"JP source file not found: {jp_path}")
         return jp_path.read_text(encoding="utf-8")
 
+    @staticmethod
+    def _resolve_workers(requested: Optional[int], planner: ScenePlanningAgent) -> int:
+        """Worker count from --workers or translation.concurrency.planner_workers."""
+        workers = max(1, int(requested or get_concurrency_config()["planner_workers"]))
+        if workers > 1 and getattr(planner.gemini, "_rate_limiter", None) is None:
+            logger.info("[PLAN] Shared rate limiter disabled; planning chapters serially")
+            return 1
+        return workers
+
     def run(
         self,
         *,
@@ -68,6 +82,7 @@ class Stage1PlannerRunner:
         temperature: float = 0.3,
         max_output_tokens: int = 65535,
         fail_on_partial: bool = False,
+        max_workers: Optional[int] = None,
     ) -> bool:
         logger.info("=" * 60)
         logger.info(f"STAGE 1 SCENE PLANNER - Volume: {volume_id}")
@@ -93,8 +108,8 @@ class Stage1PlannerRunner:
 
         generated = 0
         skipped = 0
-        failed = 0
-        errors: List[str] = []
+        failures: Dict[int, str] = {}
+        jobs: List[ChapterJob] = []
 
         for idx, chapter in enumerate(selected, 1):
             chapter_id = str(chapter.get("id", f"chapter_{idx:02d}")).strip() or f"chapter_{idx:02d}"
@@ -111,19 +126,38 @@ class Stage1PlannerRunner:
                 skipped += 1
                 continue
 
-            try:
-                jp_text = self._load_jp_text(work_dir, source_file)
-                logger.info(f"[PLAN] {chapter_id} ({source_file})")
-                plan = planner.generate_plan(chapter_id=chapter_id, japanese_text=jp_text, model=model)
-                planner.save_plan(plan, out_path)
-                chapter["scene_plan_file"] = f"PLANS/{out_path.name}"
-                generated += 1
-            except Exception as e:
-                failed += 1
-                msg = f"{chapter_id}: {e}"
-                errors.append(msg)
-                logger.error(f"[FAIL] {msg}")
+            jobs.append(ChapterJob(
+                index=idx,
+                chapter_id=chapter_id,
+                payload={"chapter": chapter, "source_file": source_file, "out_path": out_path},
+            ))
+
+        # Chapter plans are independent: workers only generate and write their own
+        # plan file; manifest entries are updated here on the calling thread.
+        def plan_chapter(job: ChapterJob) -> None:
+            source_file = job.payload["source_file"]
+            jp_text = self._load_jp_text(work_dir, source_file)
+            logger.info(f"[PLAN] {job.chapter_id} ({source_file})")
+            plan = planner.generate_plan(chapter_id=job.chapter_id, japanese_text=jp_text, model=model)
+            planner.save_plan(plan, job.payload["out_path"])
+
+        def record_plan(job: ChapterJob, outcome: Any) -> None:
+            nonlocal generated
+            if isinstance(outcome, Exception):
+                failures[job.index] = f"{job.chapter_id}: {outcome}"
+                logger.error(f"[FAIL] {failures[job.index]}")
+                return
+            job.payload["chapter"]["scene_plan_file"] = f"PLANS/{job.payload['out_path'].name}"
+            generated += 1
 
+        workers = 1
+        if jobs:
+            workers = min(self._resolve_workers(max_workers, planner), len(jobs))
+            logger.info(f"[PLAN] Planning {len(jobs)} chapter(s) with {workers} worker(s)")
+            ChapterScheduler(max_workers=workers).run(jobs, plan_chapter, record_plan)
+
+        failed = len(failures)
+        errors = [failures[index] for index in sorted(failures)]
         pipeline_state = manifest.setdefault("pipeline_state", {})
         planner_state = pipeline_state.setdefault("scene_planner", {})
         planner_state.update(
@@ -136,6 +170,7 @@ class Stage1PlannerRunner:
                 "model": model or DEFAULT_STAGE1_MODEL,
                 "temperature": temperature,
                 "max_output_tokens": max_output_tokens,
+                "workers": workers,
                 "updated_at": datetime.now(timezone.utc).isoformat(),
                 "errors": errors[:20],
             }
@@ -200,6 +235,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Exit non-zero when any chapter planning fails",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Chapters planned in parallel (default: translation.concurrency.planner_workers)",
+    )
     return parser
 
 
@@ -214,6 +255,7 @@ def main() -> None:
         temperature=args.temperature,
         max_output_tokens=args.max_output_tokens,
         fail_on_partial=args.fail_on_partial,
+        max_workers=args.workers,
     )
     sys.exit(0 if ok else 1)
 
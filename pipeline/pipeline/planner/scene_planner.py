@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
+import threading
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
@@ -103,7 +105,7 @@ class ScenePlanningAgent:
         self.model = model
         self.temperature = temperature
         self.max_output_tokens = max_output_tokens
-        self.gemini = gemini_client or GeminiClient(model=model, enable_caching=False)
+        self.gemini = gemini_client or GeminiClient(model=model, enable_caching=False, priority="planning")
         self.planning_prompt = self._build_planning_prompt()
 
     @staticmethod
@@ -660,9 +662,16 @@ class ScenePlanningAgent:
 
     @staticmethod
     def save_plan(plan: ScenePlan, output_path: Path) -> None:
+        """Write the plan atomically (temp file + rename) so readers never see a partial file."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(plan.to_dict(), f, indent=2, ensure_ascii=False)
+        tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(plan.to_dict(), f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
         logger.info(f"Saved scene plan: {output_path}")
 
     @staticmethod
@@ -1,6 +1,7 @@
 import json
 from dataclasses import dataclass
 
+from pipeline.planner import agent as planner_agent
 from pipeline.planner.scene_planner import ScenePlanningAgent
 
 
@@ -239,3 +240,49 @@ def test_generate_plan_infers_illustration_anchor_from_beat_and_alt_keys():
 
     assert plan.scenes[0].illustration_anchor is True
     assert plan.scenes[1].illustration_anchor is True
+
+
+def test_runner_plans_chapters_in_parallel_and_isolates_failures(tmp_path, monkeypatch):
+    payload = '{"scenes": [{"id": "S01", "beat_type": "setup", "start_paragraph": 1, "end_paragraph": 1}]}'
+
+    class _FlakyClient(_DummyGeminiClient):
+        _rate_limiter = object()  # looks like the shared limiter, so the runner goes parallel
+
+        def generate(self, **kwargs):
+            if "[P1] broken" in kwargs["prompt"]:
+                raise RuntimeError("boom")
+            return super().generate(**kwargs)
+
+    client = _FlakyClient(payload)
+
+    class _Planner(ScenePlanningAgent):
+        def __init__(self, **kwargs):
+            super().__init__(gemini_client=client, **kwargs)
+
+    monkeypatch.setattr(planner_agent, "ScenePlanningAgent", _Planner)
+
+    volume = tmp_path / "vol"
+    (volume / "JP").mkdir(parents=True)
+    chapters = []
+    for i in range(1, 6):
+        (volume / "JP" / f"CHAPTER_{i:02d}.md").write_text("broken" if i == 3 else f"text {i}", encoding="utf-8")
+        chapters.append({"id": f"chapter_{i:02d}", "source_file": f"CHAPTER_{i:02d}.md"})
+    (volume / "manifest.json").write_text(json.dumps({"chapters": chapters}), encoding="utf-8")
+
+    runner = planner_agent.Stage1PlannerRunner(work_base=tmp_path)
+    assert runner.run(volume_id="vol", max_workers=3)
+
+    manifest = json.loads((volume / "manifest.json").read_text(encoding="utf-8"))
+    state = manifest["pipeline_state"]["scene_planner"]
+    assert (state["generated_plans"], state["failed_plans"], state["workers"]) == (4, 1, 3)
+    assert state["errors"] == ["chapter_03: boom"]
+    assert [ch.get("scene_plan_file") for ch in manifest["chapters"]] == [
+        "PLANS/chapter_01_scene_plan.json",
+        "PLANS/chapter_02_scene_plan.json",
+        None,
+        "PLANS/chapter_04_scene_plan.json",
+        "PLANS/chapter_05_scene_plan.json",
+    ]
+    assert sorted(p.name for p in (volume / "PLANS").iterdir()) == [
+        f"chapter_0{i}_scene_plan.json" for i in (1, 2, 4, 5)
+    ]
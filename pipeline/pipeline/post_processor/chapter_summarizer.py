@@ -111,6 +111,7 @@ class ChapterSummarizationAgent:
                 max_output_tokens=2048,
                 model=self.model,
                 force_new_session=True,
+                priority="summary",
             )
             parsed = self._parse_summary_json(response.content or "")
             if not parsed:
@@ -35,6 +35,8 @@ except ImportError:
     CJKBlock = None
     CJKCharInfo = None
 
+from pipeline.post_processor.codepoint_index import LineIndex
+
 try:
     from pipeline.post_processor.multi_script_detector import (
         MultiScriptDetector, ScriptArtifact, ScriptFamily
@@ -145,7 +147,7 @@ class EnhancedCJKCleaner:
 
         # Initialize Gemini client for corrections
         if use_llm_correction and GeminiClient:
-            self.gemini_client = gemini_client or GeminiClient()
+            self.gemini_client = gemini_client or GeminiClient(priority="qc")
         else:
             self.gemini_client = None
 
@@ -272,21 +274,13 @@ class EnhancedCJKCleaner:
     def _detect_with_comprehensive_unicode(self, text: str) -> List[CJKArtifactV2]:
         """Detect artifacts using comprehensive Unicode detector."""
         artifacts = []
-        lines = text.split('\n')
-        cumulative_pos = 0
-
-        # Get all CJK characters in text
-        all_cjk = self.unicode_detector.detect_all_cjk(text)
-
-        for cjk_info in all_cjk:
-            # Find position in text
-            char_pos = text.find(cjk_info.char, cumulative_pos)
-            if char_pos == -1:
-                continue
+        line_index = LineIndex(text)
+        kanji_cache: Dict[str, Optional[Dict]] = {}  # one KanjiAPI request per distinct character
 
+        # Get all CJK characters in text, with their positions
+        for char_pos, cjk_info in self.unicode_detector.iter_cjk(text):
             # Find line number
-            line_num = text[:char_pos].count('\n') + 1
-            pos_in_line = char_pos - text[:char_pos].rfind('\n') - 1
+            line_num = line_index.line_number(char_pos)
 
             # Get context
             left = text[max(0, char_pos - 5):char_pos]
@@ -306,7 +300,9 @@ class EnhancedCJKCleaner:
             # KanjiAPI validation (optional enhancement)
             kanji_data = None
             if self.use_kanji_api:
-                kanji_data = KanjiValidator.lookup_kanji(cjk_info.char)
+                if cjk_info.char not in kanji_cache:
+                    kanji_cache[cjk_info.char] = KanjiValidator.lookup_kanji(cjk_info.char)
+                kanji_data = kanji_cache[cjk_info.char]
                 if kanji_data and kanji_data.get("is_common"):
                     # Reduce suspicion for common Japanese kanji
                     suspicion *= 0.5
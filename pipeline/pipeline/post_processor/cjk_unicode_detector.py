@@ -26,10 +26,16 @@ This ensures we catch Chinese characters that may appear in:
 - Vietnamese (legacy CJK characters)
 """
 
+import re
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from enum import Enum
 
+try:
+    from pipeline.post_processor.codepoint_index import CodepointTable, char_class
+except ImportError:  # imported as a top-level module (scripts/scan_cjk_comprehensive.py)
+    from codepoint_index import CodepointTable, char_class
+
 
 class CJKBlock(Enum):
     """Unicode CJK block definitions."""
@@ -83,12 +89,12 @@ class CJKBlock(Enum):
         """Identify which CJK block a character belongs to."""
         if not char:
             return None
+        return _BLOCK_TABLE.lookup(ord(char))
 
-        codepoint = ord(char)
-        for block in cls:
-            if block.contains(codepoint):
-                return block
-        return None
+
+# Codepoint -> CJKBlock lookup, and a character class matching any CJK block
+_BLOCK_TABLE: CodepointTable[CJKBlock] = CodepointTable((b.start, b.end, b) for b in CJKBlock)
+_CJK_CHAR_RE = re.compile(char_class(_BLOCK_TABLE.ranges()))
 
 
 @dataclass
@@ -119,6 +125,9 @@ class ComprehensiveCJKDetector:
     KATAKANA_RANGE = (0x30A0, 0x30FF)
     KATAKANA_PHONETIC_EXTENSIONS = (0x31F0, 0x31FF)
     HALFWIDTH_KATAKANA = (0xFF65, 0xFF9F)
+    KANA_PATTERN = re.compile(char_class([
+        HIRAGANA_RANGE, KATAKANA_RANGE, KATAKANA_PHONETIC_EXTENSIONS, HALFWIDTH_KATAKANA
+    ]))
 
     # Known Chinese-only characters (high suspicion in Japanese text)
     # These appear in Chinese but rarely/never in Japanese
@@ -178,24 +187,39 @@ class ComprehensiveCJKDetector:
         Returns:
             List of detected CJK characters with detailed info
         """
-        cjk_chars = []
+        return [info for _, info in self.iter_cjk(text)]
 
-        for char in text:
-            block = CJKBlock.identify_block(char)
-            if block:
-                codepoint = ord(char)
-                info = CJKCharInfo(
-                    char=char,
-                    codepoint=codepoint,
-                    unicode_name=self._get_unicode_name(char),
-                    block=block,
-                    is_common=char in self.COMMON_JAPANESE_KANJI,
-                    is_japanese_compatible=self._is_japanese_compatible(char, block),
-                    encoding_hints=self._get_encoding_hints(char, block)
-                )
-                cjk_chars.append(info)
+    def iter_cjk(self, text: str) -> Iterator[Tuple[int, CJKCharInfo]]:
+        """
+        Yield (position, info) for every CJK character in text.
 
-        return cjk_chars
+        A regex over the CJK blocks skips non-CJK runs; per-character details
+        are computed once per distinct character.
+        """
+        details: Dict[str, Tuple[CJKBlock, str, bool, bool, List[str]]] = {}
+
+        for match in _CJK_CHAR_RE.finditer(text):
+            char = match.group()
+            detail = details.get(char)
+            if detail is None:
+                block = _BLOCK_TABLE.lookup(ord(char))
+                detail = details[char] = (
+                    block,
+                    self._get_unicode_name(char),
+                    char in self.COMMON_JAPANESE_KANJI,
+                    self._is_japanese_compatible(char, block),
+                    self._get_encoding_hints(char, block),
+                )
+            block, unicode_name, is_common, is_japanese_compatible, encoding_hints = detail
+            yield match.start(), CJKCharInfo(
+                char=char,
+                codepoint=ord(char),
+                unicode_name=unicode_name,
+                block=block,
+                is_common=is_common,
+                is_japanese_compatible=is_japanese_compatible,
+                encoding_hints=list(encoding_hints)
+            )
 
     def calculate_suspicion(
         self,
@@ -274,15 +298,7 @@ class ComprehensiveCJKDetector:
         if not text:
             return False
 
-        for char in text:
-            cp = ord(char)
-            if (self.HIRAGANA_RANGE[0] <= cp <= self.HIRAGANA_RANGE[1] or
-                self.KATAKANA_RANGE[0] <= cp <= self.KATAKANA_RANGE[1] or
-                self.KATAKANA_PHONETIC_EXTENSIONS[0] <= cp <= self.KATAKANA_PHONETIC_EXTENSIONS[1] or
-                self.HALFWIDTH_KATAKANA[0] <= cp <= self.HALFWIDTH_KATAKANA[1]):
-                return True
-
-        return False
+        return self.KANA_PATTERN.search(text) is not None
 
     def _is_japanese_compatible(self, char: str, block: CJKBlock) -> bool:
         """
@@ -368,6 +384,7 @@ class ComprehensiveCJKDetector:
 
         # Count by block
         block_counts = {}
+        block_seen: Dict[str, Set[str]] = {}
         for info in all_cjk:
             block_name = info.block.block_name
             if block_name not in block_counts:
@@ -376,20 +393,24 @@ class ComprehensiveCJKDetector:
                     "characters": [],
                     "rarity": info.block.rarity
                 }
+                block_seen[block_name] = set()
             block_counts[block_name]["count"] += 1
-            if info.char not in block_counts[block_name]["characters"]:
+            if info.char not in block_seen[block_name]:
+                block_seen[block_name].add(info.char)
                 block_counts[block_name]["characters"].append(info.char)
 
-        # Calculate suspicion distribution
+        # Calculate suspicion distribution (context of each character's first occurrence)
         suspicion_scores = []
+        score_by_char: Dict[str, float] = {}
         for info in all_cjk:
-            # Find character in text for context
-            idx = text.find(info.char)
-            if idx >= 0:
+            score = score_by_char.get(info.char)
+            if score is None:
+                idx = text.find(info.char)
                 left = text[max(0, idx-5):idx]
                 right = text[idx+1:min(len(text), idx+6)]
                 score, _ = self.calculate_suspicion(info.char, left, right, info.block)
-                suspicion_scores.append(score)
+                score_by_char[info.char] = score
+            suspicion_scores.append(score)
 
         avg_suspicion = sum(suspicion_scores) / len(suspicion_scores) if suspicion_scores else 0
 
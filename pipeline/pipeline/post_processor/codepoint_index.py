@@ -0,0 +1,104 @@
+"""
+Codepoint and Line Lookup Tables
+================================
+
+Shared helpers for the CJK / multi-script leak detectors:
+
+- CodepointTable: array-backed bisect lookup from a codepoint to the value
+  of the Unicode range containing it (a CJKBlock, a ScriptFamily, ...),
+  replacing a linear scan over every range per character.
+- char_class(): a regex character class over codepoint ranges, so a
+  detector can `finditer` straight to the characters it cares about and
+  skip clean ASCII / Vietnamese runs in C.
+- LineIndex: line-start offsets of a text, built once, for O(log n)
+  position -> line number lookups instead of `text[:idx].count('\\n')`.
+"""
+
+import bisect
+import re
+from typing import Callable, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CodepointTable(Generic[T]):
+    """
+    Lookup table over (start, end, value) codepoint ranges (inclusive).
+
+    Where ranges overlap, the earliest one wins, matching a first-match
+    scan over the same list.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[int, int, T]]):
+        ranges = list(ranges)
+        bounds = sorted({start for start, _, _ in ranges} | {end + 1 for _, end, _ in ranges})
+
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._values: List[T] = []
+        for lo, hi in zip(bounds, bounds[1:]):
+            value = next((v for start, end, v in ranges if start <= lo and hi - 1 <= end), None)
+            if value is None:
+                continue
+            if self._values and self._values[-1] is value and self._ends[-1] + 1 == lo:
+                self._ends[-1] = hi - 1
+            else:
+                self._starts.append(lo)
+                self._ends.append(hi - 1)
+                self._values.append(value)
+
+    def lookup(self, codepoint: int) -> Optional[T]:
+        """Value of the range containing `codepoint`, or None."""
+        idx = bisect.bisect_right(self._starts, codepoint) - 1
+        if idx >= 0 and codepoint <= self._ends[idx]:
+            return self._values[idx]
+        return None
+
+    def ranges(self, predicate: Optional[Callable[[T], bool]] = None) -> List[Tuple[int, int]]:
+        """Disjoint, sorted (start, end) ranges whose value satisfies `predicate`."""
+        return [
+            (start, end)
+            for start, end, value in zip(self._starts, self._ends, self._values)
+            if predicate is None or predicate(value)
+        ]
+
+
+def _escape_codepoint(codepoint: int) -> str:
+    return f"\\u{codepoint:04X}" if codepoint <= 0xFFFF else f"\\U{codepoint:08X}"
+
+
+def char_class(ranges: Sequence[Tuple[int, int]], negate: bool = False) -> str:
+    """Regex character class matching the given inclusive codepoint ranges."""
+    parts = []
+    for start, end in ranges:
+        if start == end:
+            parts.append(_escape_codepoint(start))
+        else:
+            parts.append(f"{_escape_codepoint(start)}-{_escape_codepoint(end)}")
+    return f"[{'^' if negate else ''}{''.join(parts)}]"
+
+
+def codepoint_ranges(codepoints: Iterable[int]) -> List[Tuple[int, int]]:
+    """Collapse codepoints into sorted, disjoint (start, end) ranges."""
+    ranges: List[Tuple[int, int]] = []
+    for codepoint in sorted(set(codepoints)):
+        if ranges and ranges[-1][1] + 1 == codepoint:
+            ranges[-1] = (ranges[-1][0], codepoint)
+        else:
+            ranges.append((codepoint, codepoint))
+    return ranges
+
+
+class LineIndex:
+    """Line-start offsets of a text for fast position -> line lookups."""
+
+    def __init__(self, text: str):
+        self.starts: List[int] = [0] + [m.end() for m in re.finditer('\n', text)]
+
+    def line_number(self, position: int) -> int:
+        """1-based line number of `position` (same as text[:position].count('\\n') + 1)."""
+        return bisect.bisect_right(self.starts, position)
+
+    def line_start(self, position: int) -> int:
+        """Offset of the first character of the line containing `position`."""
+        return self.starts[bisect.bisect_right(self.starts, position) - 1]
@@ -33,8 +33,11 @@ Valid in Japanese text:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Optional, Set, Dict
 from enum import Enum
+import bisect
+import re
 import sys
 from pathlib import Path
 
@@ -46,6 +49,11 @@ except ImportError:
     ComprehensiveCJKDetector = None
     CJKBlock = None
 
+try:
+    from pipeline.post_processor.codepoint_index import CodepointTable, LineIndex, char_class, codepoint_ranges
+except ImportError:
+    from codepoint_index import CodepointTable, LineIndex, char_class, codepoint_ranges
+
 
 class ScriptFamily(Enum):
     """Unicode script families that may appear in text."""
@@ -142,12 +150,30 @@ class ScriptFamily(Enum):
         """Identify which script a character belongs to."""
         if not char:
             return None
+        return _SCRIPT_TABLE.lookup(ord(char))
+
+
+# Codepoint -> ScriptFamily lookup (first matching family wins, as before)
+_SCRIPT_TABLE: CodepointTable[ScriptFamily] = CodepointTable((s.start, s.end, s) for s in ScriptFamily)
+
+
+@lru_cache(maxsize=8)
+def _foreign_script_pattern(valid_ranges: Tuple[Tuple[int, int], ...]) -> "re.Pattern":
+    """
+    Character class of everything detect_all_foreign_scripts() reports:
+    characters of a suspicious script family that are not valid Japanese,
+    whitespace or control characters.
+    """
+    def is_valid(codepoint: int) -> bool:
+        return any(start <= codepoint <= end for start, end in valid_ranges)
 
-        codepoint = ord(char)
-        for script in cls:
-            if script.contains(codepoint):
-                return script
-        return None
+    codepoints = (
+        codepoint
+        for start, end in _SCRIPT_TABLE.ranges(lambda script: script.suspicious_in_japanese)
+        for codepoint in range(start, end + 1)
+        if not is_valid(codepoint) and codepoint >= 0x20 and not chr(codepoint).isspace()
+    )
+    return re.compile(char_class(codepoint_ranges(codepoints)))
 
 
 @dataclass
@@ -204,6 +230,8 @@ class MultiScriptDetector:
             use_cjk_detector: Whether to use comprehensive CJK detector
         """
         self.use_cjk_detector = use_cjk_detector
+        self._valid_pattern = re.compile(char_class(self.VALID_JAPANESE_RANGES))
+        self._foreign_run_pattern = re.compile(char_class(self.VALID_JAPANESE_RANGES, negate=True) + '+')
 
         # Initialize CJK detector
         if use_cjk_detector and ComprehensiveCJKDetector:
@@ -221,14 +249,7 @@ class MultiScriptDetector:
         Returns:
             True if valid in Japanese, False otherwise
         """
-        codepoint = ord(char)
-
-        # Check valid Japanese ranges
-        for start, end in self.VALID_JAPANESE_RANGES:
-            if start <= codepoint <= end:
-                return True
-
-        return False
+        return self._valid_pattern.fullmatch(char) is not None
 
     def detect_all_foreign_scripts(self, text: str) -> List[ScriptArtifact]:
         """
@@ -241,31 +262,29 @@ class MultiScriptDetector:
             List of foreign script artifacts
         """
         artifacts = []
-
-        # Process each character
-        for idx, char in enumerate(text):
-            # Skip valid Japanese characters
-            if self.is_valid_japanese(char):
-                continue
-
-            # Skip whitespace and control characters
-            if char.isspace() or ord(char) < 0x20:
-                continue
-
-            # Identify script
+        line_index = LineIndex(text)
+        runs: Optional[List[Tuple[int, int]]] = None
+        run_starts: List[int] = []
+
+        # Jump straight to suspicious foreign-script characters (skips valid
+        # Japanese, whitespace, control, unknown and non-suspicious scripts)
+        foreign_pattern = _foreign_script_pattern(tuple(self.VALID_JAPANESE_RANGES))
+        for match in foreign_pattern.finditer(text):
+            idx = match.start()
+            char = match.group()
             script = ScriptFamily.identify_script(char)
-            if not script:
-                continue  # Unknown/private use
 
-            # Skip if not suspicious
-            if not script.suspicious_in_japanese:
-                continue
+            # Runs of non-Japanese characters, for the consecutive/context factors
+            if runs is None:
+                runs = [m.span() for m in self._foreign_run_pattern.finditer(text)]
+                run_starts = [start for start, _ in runs]
+            run = runs[bisect.bisect_right(run_starts, idx) - 1]
 
             # Calculate suspicion
-            suspicion, reason = self._calculate_suspicion(char, text, idx, script)
+            suspicion, reason = self._calculate_suspicion(char, text, idx, script, run=run)
 
             # Find line number
-            line_num = text[:idx].count('\n') + 1
+            line_num = line_index.line_number(idx)
 
             # Extract sentence
             sentence, pos_in_sent = self._extract_sentence(text, idx)
@@ -295,7 +314,8 @@ class MultiScriptDetector:
         char: str,
         text: str,
         position: int,
-        script: ScriptFamily
+        script: ScriptFamily,
+        run: Optional[Tuple[int, int]] = None
     ) -> Tuple[float, str]:
         """
         Calculate suspicion score for a foreign character.
@@ -305,6 +325,8 @@ class MultiScriptDetector:
             text: Full text
             position: Position in text
             script: Identified script
+            run: (start, end) of the run of non-Japanese characters around
+                position, if already known
 
         Returns:
             Tuple of (suspicion_score 0-1, reason)
@@ -339,7 +361,10 @@ class MultiScriptDetector:
             reasons.append(f"{script.family} script (foreign)")
 
         # Factor 2: Multiple foreign characters in sequence (30% weight)
-        consecutive_foreign = self._count_consecutive_foreign(text, position)
+        if run is not None:
+            consecutive_foreign = run[1] - run[0]
+        else:
+            consecutive_foreign = self._count_consecutive_foreign(text, position)
         if consecutive_foreign >= 3:
             score += 0.30
             reasons.append(f"{consecutive_foreign} consecutive foreign chars")
@@ -348,11 +373,15 @@ class MultiScriptDetector:
             reasons.append(f"{consecutive_foreign} consecutive foreign chars")
 
         # Factor 3: No Japanese context nearby (20% weight)
-        left_context = text[max(0, position - 10):position]
-        right_context = text[position + 1:min(len(text), position + 11)]
-
-        has_japanese_left = any(self.is_valid_japanese(c) for c in left_context)
-        has_japanese_right = any(self.is_valid_japanese(c) for c in right_context)
+        left_start = max(0, position - 10)
+        right_end = min(len(text), position + 11)
+        if run is not None:
+            # Japanese context exists iff the foreign run ends inside the window
+            has_japanese_left = run[0] > left_start
+            has_japanese_right = run[1] < right_end
+        else:
+            has_japanese_left = any(self.is_valid_japanese(c) for c in text[left_start:position])
+            has_japanese_right = any(self.is_valid_japanese(c) for c in text[position + 1:right_end])
 
         if not has_japanese_left and not has_japanese_right:
             score += 0.20
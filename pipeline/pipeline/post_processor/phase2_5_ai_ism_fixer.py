@@ -20,13 +20,16 @@ Configuration:
 - Review threshold: 0.7-0.9
 """
 
+import bisect
 import json
 import re
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
+from modules.pattern_scanner import get_pattern_scanner
+
 logger = logging.getLogger(__name__)
 
 
@@ -100,6 +103,7 @@ class Phase25AIismFixer:
         # Separate high-confidence (auto-fix) from medium-confidence (flag)
         self.auto_fix_patterns = [p for p in self.patterns if p.get('confidence_threshold', 0) >= 0.95]
         self.review_patterns = [p for p in self.patterns if 0.7 <= p.get('confidence_threshold', 0) < 0.95]
+        self._scanner = get_pattern_scanner(p['pattern'] for p in self.patterns)
 
         logger.info(
             f"Phase 2.5 initialized: {len(self.auto_fix_patterns)} auto-fix, "
@@ -126,14 +130,21 @@ class Phase25AIismFixer:
 
         report = Phase25Report(chapter_id=chapter_id)
         fixed_text = original_text
+        present = self._present_patterns(fixed_text)
 
         # Step 1: Apply high-confidence auto-fixes
         for pattern_def in self.auto_fix_patterns:
+            if pattern_def['pattern'] not in present:
+                continue
+            text_before = fixed_text
             fixed_text, fixes = self._apply_pattern_fix(
                 text=fixed_text,
                 pattern_def=pattern_def,
                 auto_apply=True
             )
+            if fixed_text != text_before:
+                # A fix can introduce (or remove) a later pattern's trigger
+                present = self._present_patterns(fixed_text)
 
             if fixes:
                 report.fixes.extend(fixes)
@@ -146,6 +157,8 @@ class Phase25AIismFixer:
 
         # Step 2: Flag medium-confidence patterns for review
         for pattern_def in self.review_patterns:
+            if pattern_def['pattern'] not in present:
+                continue
             _, flags = self._apply_pattern_fix(
                 text=fixed_text,
                 pattern_def=pattern_def,
@@ -179,6 +192,10 @@ class Phase25AIismFixer:
 
         return report
 
+    def _present_patterns(self, text: str) -> Set[str]:
+        """Patterns that can match somewhere in `text` (one scanner pass)."""
+        return {self._scanner.patterns[idx] for idx in self._scanner.candidates(text)}
+
     def _apply_pattern_fix(
         self,
         text: str,
@@ -203,6 +220,7 @@ class Phase25AIismFixer:
 
         fixes: List[AIismFix] = []
         fixed_text = text
+        newlines: Optional[List[int]] = None
 
         # Find all matches
         for match in re.finditer(pattern, text, re.IGNORECASE):
@@ -210,7 +228,9 @@ class Phase25AIismFixer:
             position = match.start()
 
             # Calculate line number
-            line_number = text[:position].count('\n') + 1
+            if newlines is None:
+                newlines = [m.start() for m in re.finditer('\n', text)]
+            line_number = bisect.bisect_left(newlines, position) + 1
 
             # Get fix suggestion
             suggested_fix = fix_suggestions.get(matched_text.lower())
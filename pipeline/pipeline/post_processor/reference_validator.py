@@ -109,7 +109,7 @@ class ReferenceValidator:
         """
         if gemini_client is None:
             from pipeline.common.gemini_client import GeminiClient
-            self.gemini_client = GeminiClient(model=self.RESOLVE_MODEL)
+            self.gemini_client = GeminiClient(model=self.RESOLVE_MODEL, priority="qc")
 
             # Force high thinking level for deobfuscation
             thinking_cfg = dict(self.gemini_client.thinking_mode_config or {})
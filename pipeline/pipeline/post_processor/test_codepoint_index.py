@@ -0,0 +1,33 @@
+from pipeline.post_processor.cjk_unicode_detector import CJKBlock, ComprehensiveCJKDetector
+from pipeline.post_processor.codepoint_index import CodepointTable, LineIndex
+from pipeline.post_processor.multi_script_detector import MultiScriptDetector
+
+SAMPLE = "Cô ấy nói 意外と vui.\nThe Привет hero\n\n안녕 and ハードル here ・ end\nمرحبا"
+
+
+def test_table_first_range_wins_and_merges():
+    table = CodepointTable([(10, 20, "a"), (15, 30, "b"), (31, 40, "b")])
+
+    assert [table.lookup(cp) for cp in (9, 10, 20, 21, 40, 41)] == [None, "a", "a", "b", "b", None]
+    assert table.ranges() == [(10, 20), (21, 40)]
+
+
+def test_line_index_matches_counting_newlines():
+    index = LineIndex(SAMPLE)
+
+    for pos in range(len(SAMPLE)):
+        assert index.line_number(pos) == SAMPLE[:pos].count("\n") + 1
+        assert index.line_start(pos) == SAMPLE.rfind("\n", 0, pos) + 1
+
+
+def test_detectors_match_per_character_scan():
+    detector = ComprehensiveCJKDetector()
+    naive = [ch for ch in SAMPLE if CJKBlock.identify_block(ch) is not None]
+
+    assert [pos for pos, _ in detector.iter_cjk(SAMPLE)] == [i for i, ch in enumerate(SAMPLE) if ch in naive]
+    assert [info.char for info in detector.detect_all_cjk(SAMPLE)] == naive
+
+    script_detector = MultiScriptDetector()
+    found = {(hit.char, hit.line_number) for hit in script_detector.detect_all_foreign_scripts(SAMPLE)}
+    assert {("П", 2), ("안", 4), ("م", 5)} <= found
+    assert all(not script_detector.is_valid_japanese(ch) for ch, _ in found)
@@ -15,14 +15,27 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict, field
 
+from pipeline.common.context_cache_registry import get_cache_registry
+from pipeline.common.event_stream import chapter_scope, chapter_usage, emit as emit_event, open_event_stream
 from pipeline.common.gemini_client import GeminiClient
-from pipeline.translator.config import get_gemini_config, get_translation_config, get_model_name, get_fallback_model_name
+from pipeline.common.rate_limiter import RateLimiter
+from pipeline.translator.config import (
+    get_gemini_config,
+    get_translation_config,
+    get_model_name,
+    get_fallback_model_name,
+    get_rate_limit_config,
+    get_concurrency_config,
+    get_prefetch_config,
+)
 from pipeline.translator.prompt_loader import PromptLoader
 from pipeline.translator.context_manager import ContextManager
 from pipeline.translator.chapter_processor import ChapterProcessor, TranslationResult
+from pipeline.translator.chapter_scheduler import ChapterJob, ChapterScheduler
 from pipeline.translator.continuity_manager import detect_and_offer_continuity, ContinuityPackManager
 from pipeline.translator.per_chapter_workflow import PerChapterWorkflow
 from pipeline.translator.glossary_lock import GlossaryLock
+from pipeline.translator.guidance_prefetch import GuidancePrefetcher
 from pipeline.translator.series_bible import BibleController
 from pipeline.post_processor.chapter_summarizer import ChapterSummarizationAgent
 from pipeline.config import get_target_language, get_language_config, PIPELINE_ROOT
@@ -108,6 +121,8 @@ class TranslatorAgent:
         self.volume_cache_enabled = massive_cfg.get("enable_volume_cache", True)
         self.volume_cache_ttl_seconds = int(massive_cfg.get("volume_cache_ttl_seconds", 7200))
         self.volume_cache_name: Optional[str] = None
+        # chapter_id -> time its first translation attempt started (chapter_end events)
+        self._chapter_started: Dict[str, float] = {}
         self._volume_cache_stats: Dict[str, Any] = {}
         
         # Auto-detect enable_multimodal from config.yaml if not explicitly set
@@ -985,6 +1000,25 @@ class TranslatorAgent:
         except Exception as e:
             logger.warning(f"Cache pre-warming error: {e}. Will create cache during first chapter.")
 
+    def _prewarm_guidance_stores(self):
+        """
+        Open and warm the RAG guidance stores for this language once, before
+        chapters are dispatched; every chapter then reuses the warm stores.
+        """
+        try:
+            from modules.guidance_service import LANGUAGE_STORES, get_guidance_service
+
+            kinds = LANGUAGE_STORES.get(self.target_language, ())
+            if not kinds:
+                return
+            ready = get_guidance_service().warm(kinds)
+            logger.info(
+                "RAG guidance stores warmed: "
+                + ", ".join(f"{kind}={'ok' if ok else 'unavailable'}" for kind, ok in ready.items())
+            )
+        except Exception as e:
+            logger.warning(f"RAG guidance pre-warming error: {e}. Stores will open on first chapter.")
+
     def _create_volume_cache(
         self,
         chapter_configs: List[Dict[str, Any]],
@@ -1050,12 +1084,14 @@ class TranslatorAgent:
 
         try:
             target_model = model_name or get_model_name()
-            cache_name = self.client.create_cache(
+            cache_name = get_cache_registry(self.work_dir).acquire(
+                self.client,
                 model=target_model,
                 system_instruction=system_instruction,
                 contents=[full_volume_text],
                 ttl_seconds=self.volume_cache_ttl_seconds,
                 display_name=f"{self.manifest.get('volume_id', self.work_dir.name)}_full",
+                label="translator_volume",
             )
             if cache_name:
                 self._volume_cache_stats = {
@@ -1147,6 +1183,14 @@ class TranslatorAgent:
             
         total = len(target_chapters)
         logger.info(f"Targeting {total} chapters")
+        open_event_stream(self.work_dir, "phase2")
+        run_started = time.time()
+        emit_event(
+            "run_start",
+            chapters=total,
+            model=get_model_name(),
+            target_language=self.target_language,
+        )
         resolved_titles = self._resolve_prompt_titles(target_chapters)
 
         # Update pipeline state
@@ -1187,6 +1231,7 @@ class TranslatorAgent:
         output_dir = self.work_dir / output_dir_name
         output_dir.mkdir(exist_ok=True)
 
+        jobs: List[ChapterJob] = []
         for i, chapter in enumerate(target_chapters):
             chapter_id = chapter["id"]
             # File names from manifest
@@ -1213,251 +1258,46 @@ class TranslatorAgent:
                 # Check if file actually exists
                 if output_path.exists():
                     logger.info(f"Skipping completed chapter {chapter_id}")
+                    emit_event("chapter_skip", chapter=chapter_id)
                     success_count += 1
                     continue
 
-            # Get translated title from manifest (language-specific or fallback to EN)
-            title_key = f"title_{self.target_language}"
-            translated_title = resolved_titles.get(chapter_id)
-
-            logger.info(f"Translating [{i+1}/{total}] {chapter_id} to {self.language_name}...")
-
-            # Check for model override in chapter metadata
-            chapter_model = chapter.get("model")
-            if chapter_model:
-                logger.info(f"     [OVERRIDE] Using model: {chapter_model}")
-            
-            # Select cache for this chapter:
-            # 1) Volume-level full JP cache (preferred for massive LNs)
-            # 2) Continuity schema cache (legacy fallback)
-            cached_content_name = self.volume_cache_name
-            if self.enable_continuity and i > 0 and not cached_content_name:  # Not first chapter
-                try:
-                    cached_content_name = self.per_chapter_workflow.get_cache_for_chapter(i + 1)
-                    if cached_content_name:
-                        logger.info(f"     [CONTINUITY] Using cached schema from Chapter {i}")
-                except Exception as e:
-                    logger.warning(f"Could not load cached schema: {e}")
-            # === END CACHE CHECK ===
-
-            effective_cache_name = cached_content_name
-            default_model = get_model_name()
-            if chapter_model and chapter_model != default_model and cached_content_name:
-                logger.info(
-                    f"     [CACHE] Skipping cache for model override "
-                    f"({chapter_model} != {default_model})"
-                )
-                effective_cache_name = None
-
-            if i == 0:
-                if self.volume_cache_name and effective_cache_name:
-                    logger.info(
-                        "[CACHE VERIFY] Chapter translation will use external full-LN cache "
-                        "with embedded prompt instructions."
-                    )
-                elif effective_cache_name:
-                    logger.info("[CACHE VERIFY] Chapter translation will use cached prompt context.")
-                else:
-                    logger.warning("[CACHE VERIFY] Chapter translation running without cache.")
-
-            scene_plan = self._load_scene_plan_context(chapter)
-            result = self.processor.translate_chapter(
-                source_path,
-                output_path,
-                chapter_id,
-                en_title=translated_title,  # en_title param kept for backward compatibility
-                model_name=chapter_model,
-                cached_content=effective_cache_name,
-                volume_cache=effective_cache_name if self.volume_cache_name else None,
-                scene_plan=scene_plan,
+            jobs.append(ChapterJob(
+                index=i,
+                chapter_id=chapter_id,
+                payload={
+                    "chapter": chapter,
+                    "jp_file": jp_file,
+                    "source_path": source_path,
+                    "output_path": output_path,
+                    # Translated title (language-specific or fallback to EN)
+                    "translated_title": resolved_titles.get(chapter_id),
+                },
+            ))
+
+        if jobs:
+            self._prewarm_guidance_stores()
+
+        # Build guidance bundles for upcoming chapters while the current one translates
+        prefetch = get_prefetch_config()
+        if prefetch["lookahead"] and len(jobs) > 1:
+            self.processor.prefetcher = GuidancePrefetcher(
+                jobs,
+                self._prefetch_guidance_bundle,
+                lookahead=prefetch["lookahead"],
+                max_workers=prefetch["workers"],
             )
 
-            # Fallback to configured fallback model on failure (safety blocks, rate limits, etc)
-            if not result.success and not chapter_model:
-                fallback_model = get_fallback_model_name()
-                logger.warning(f"Translation failed, retrying with fallback model ({fallback_model})...")
-
-                # Clear cache since we're switching models (cache is model-specific)
-                if self.client.enable_caching:
-                    logger.info("Clearing cache before switching to fallback model...")
-                    self.client.clear_cache()
-
-                result = self.processor.translate_chapter(
-                    source_path,
-                    output_path,
-                    chapter_id,
-                    en_title=translated_title,
-                    model_name=fallback_model,
-                    cached_content=None,
-                    volume_cache=None,
-                    scene_plan=scene_plan,
-                )
-                if result.success:
-                    logger.info(f"     [FALLBACK] Successfully translated with {fallback_model}")
-                    # Save fallback model to manifest for tracking
-                    chapter["model"] = fallback_model
-            
-            # Update Log
-            log_entry = {
-                "chapter_id": chapter_id,
-                "input_tokens": result.input_tokens,
-                "output_tokens": result.output_tokens,
-                "success": result.success,
-                "error": result.error,
-                "quality": result.audit_result.to_dict() if result.audit_result else None
-            }
-            
-            # Remove old entry if exists
-            self.translation_log["chapters"] = [c for c in self.translation_log["chapters"] if c["chapter_id"] != chapter_id]
-            self.translation_log["chapters"].append(log_entry)
-            self._save_log()
-
-            if result.success:
-                chapter["translation_status"] = "completed"
-                # Use language-specific key (e.g., "vn_file" or "en_file")
-                file_key = f"{self.target_language}_file"
-                # Store the actual output filename (not the fallback variable)
-                chapter[file_key] = output_path.name  # e.g., "CHAPTER_01_EN.md"
-
-                translation_text = ""
-                try:
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        translation_text = f.read()
-                except Exception as e:
-                    logger.error(f"Failed reading translated chapter for post-processing: {e}")
-                
-                # === PER-CHAPTER WORKFLOW: Extract schema, review, cache ===
-                if self.enable_continuity:
-                    logger.info(f"\n{'─'*60}")
-                    logger.info(f"  Starting per-chapter schema workflow...")
-                    logger.info(f"{'─'*60}\n")
-                    
-                    try:
-                        if not translation_text.strip():
-                            logger.warning("Translated chapter text is empty; skipping continuity schema extraction")
-                        else:
-                            # Process chapter (extract, review, cache)
-                            workflow_success, cache_name = self.per_chapter_workflow.process_chapter(
-                                chapter_num=i + 1,  # 1-indexed chapter number
-                                chapter_id=chapter_id,
-                                translation_text=translation_text,
-                                skip_review=False  # User review required
-                            )
-
-                            if not workflow_success:
-                                logger.warning("Per-chapter workflow failed or was cancelled by user")
-                                # User cancelled - should we stop the pipeline?
-                                if input("\nContinue to next chapter anyway? (y/N): ").strip().lower() != 'y':
-                                    logger.info("Pipeline stopped by user")
-                                    break
-
-                            # Store cache info in chapter metadata
-                            if cache_name:
-                                chapter["schema_cache"] = cache_name
-                        
-                    except Exception as e:
-                        logger.error(f"Per-chapter workflow error: {e}")
-                        logger.warning("Continuing without schema extraction...")
-                else:
-                    logger.info(f"\n{'─'*60}")
-                    logger.info(f"  [CONTINUITY DISABLED] Skipping schema extraction")
-                    logger.info(f"{'─'*60}\n")
-                
-                # === END PER-CHAPTER WORKFLOW ===
-
-                # === CHAPTER SUMMARIZATION + CONTEXT UPDATE ===
-                chapter_num = self._resolve_chapter_number(
-                    chapter_id=chapter_id,
-                    source_filename=jp_file,
-                    fallback=i + 1,
-                )
-                context_title = (
-                    translated_title
-                    or chapter.get(f"title_{self.target_language}")
-                    or chapter.get("title_en")
-                    or chapter.get("title")
-                    or self._canonical_title_from_chapter_id(chapter_id)
-                    or chapter_id
-                )
-
-                if self.chapter_summarizer and translation_text.strip() and chapter_num is not None:
-                    summary_result = self.chapter_summarizer.summarize_chapter(
-                        chapter_id=chapter_id,
-                        chapter_num=chapter_num,
-                        chapter_title=context_title,
-                        translation_text=translation_text,
-                    )
-                    if summary_result.success:
-                        chapter["summary_file"] = (
-                            summary_result.summary_path.name
-                            if summary_result.summary_path else None
-                        )
-                        summary_data = summary_result.summary_data
-                        context_summary = self._build_context_summary_text(
-                            summary_data.get("plot_points", []),
-                            chapter_title=str(summary_data.get("title") or context_title),
-                        )
-                        self.context_manager.add_chapter_context(
-                            chapter_id=chapter_id,
-                            summary=context_summary,
-                            metadata={
-                                "chapter_num": summary_data.get("chapter_num"),
-                                "chapter_title": summary_data.get("title"),
-                                "emotional_tone": summary_data.get("emotional_tone"),
-                                "running_jokes": summary_data.get("running_jokes", []),
-                                "tone_shifts": summary_data.get("tone_shifts", []),
-                                "summary_file": chapter.get("summary_file"),
-                                "summarizer_model": summary_result.model,
-                                "summarizer_fallback": summary_result.used_fallback,
-                            },
-                            characters=summary_data.get("new_characters", []),
-                            plot_points=summary_data.get("plot_points", []),
-                        )
-                        logger.info(
-                            f"[CH-SUMMARY] Context updated for {chapter_id} "
-                            f"(fallback={summary_result.used_fallback})"
-                        )
-                    else:
-                        logger.warning(
-                            f"[CH-SUMMARY] Failed for {chapter_id}: {summary_result.error}; "
-                            "using minimal context entry."
-                        )
-                        self.context_manager.add_chapter_context(
-                            chapter_id=chapter_id,
-                            summary=context_title or "Translated chapter",
-                            metadata={"chapter_num": chapter_num, "summary_error": summary_result.error},
-                            plot_points=[],
-                            characters=[],
-                        )
-                else:
-                    self.context_manager.add_chapter_context(
-                        chapter_id=chapter_id,
-                        summary=context_title or "Translated chapter",
-                        metadata={"chapter_num": chapter_num, "summary_skipped": True},
-                        plot_points=[],
-                        characters=[],
-                    )
-                
-                success_count += 1
-                if result.warnings:
-                    logger.warning(
-                        f"{chapter_id} completed with {len(result.warnings)} warning(s): "
-                        f"{'; '.join(result.warnings[:3])}"
-                    )
-                logger.info(f"Completed {chapter_id}. Audit passed: {result.audit_result.passed if result.audit_result else 'N/A'}")
+        max_workers = self._resolve_translation_workers()
+        try:
+            if max_workers > 1 and len(jobs) > 1:
+                success_count += self._translate_jobs_concurrently(jobs, total, max_workers)
             else:
-                chapter["translation_status"] = "failed"
-                logger.error(f"Failed {chapter_id}: {result.error}")
-            
-            # Update manifest checkpoint
-            self._save_manifest()
-
-            # Rate limiting delay for TPM management
-            # With context caching, TPM usage is reduced by 87%, so only need short delay
-            if i < total - 1:
-                delay = 5 if self.client.enable_caching else 60
-                logger.info(f"Waiting {delay} seconds before next chapter (TPM management)...")
-                time.sleep(delay)
+                success_count += self._translate_jobs_serially(jobs, total)
+        finally:
+            if self.processor.prefetcher is not None:
+                self.processor.prefetcher.close()
+                self.processor.prefetcher = None
 
         # Final Status
         if success_count == total:
@@ -1489,17 +1329,483 @@ class TranslatorAgent:
             self.manifest["pipeline_state"]["translator"]["status"] = "partial"
             logger.warning(f"Volume translation PARTIAL ({success_count}/{total} completed)")
 
+        emit_event(
+            "run_end",
+            chapters=total,
+            completed=success_count,
+            failed=total - success_count,
+            wall_seconds=round(time.time() - run_started, 3),
+        )
         self._save_manifest()
 
         # Clean up context cache
         if self.client.enable_caching:
             if self.volume_cache_name:
-                logger.info(f"Clearing volume cache: {self.volume_cache_name}...")
-                self.client.delete_cache(self.volume_cache_name)
+                logger.info(f"Releasing volume cache: {self.volume_cache_name}...")
+                get_cache_registry(self.work_dir).release(self.client, self.volume_cache_name)
                 self.volume_cache_name = None
             logger.info("Clearing context cache...")
             self.client.clear_cache()
     
+    def _resolve_translation_workers(self) -> int:
+        """Resolve worker count for chapter translation (1 = serial)."""
+        concurrency = get_concurrency_config()
+        max_workers = concurrency["max_workers"]
+        if max_workers > 1 and self.enable_continuity:
+            logger.info(
+                "[SCHEDULER] Continuity schema workflow requires interactive review; "
+                "translating chapters serially."
+            )
+            return 1
+        return max_workers
+
+    def _translate_jobs_serially(self, jobs: List[ChapterJob], total: int) -> int:
+        """Translate chapters one at a time (original behavior). Returns success count."""
+        success_count = 0
+        for job in jobs:
+            with chapter_scope(job.chapter_id):
+                result = self._translate_chapter_job(job, total)
+                if not result.success and not job.payload["chapter"].get("model"):
+                    result = self._translate_chapter_fallback(job)
+
+                translation_text = ""
+                summary_result = None
+                stopped = False
+                if result.success:
+                    translation_text = self._read_translation_text(job)
+                    stopped = not self._run_per_chapter_workflow(job, translation_text)
+                    if not stopped:
+                        summary_result = self._summarize_chapter_job(job, translation_text)
+
+            completed = self._record_chapter_result(
+                job,
+                result,
+                translation_text=translation_text,
+                summary_result=summary_result,
+                update_context=not stopped,
+            )
+            if stopped:
+                break
+            if completed:
+                success_count += 1
+
+            # Rate limiting delay for TPM management
+            # With context caching, TPM usage is reduced by 87%, so only need short delay.
+            # The shared RateLimiter already paces every call, so skip the fixed sleep.
+            if job.index < total - 1 and self.client._rate_limiter is None:
+                delay = 5 if self.client.enable_caching else 60
+                logger.info(f"Waiting {delay} seconds before next chapter (TPM management)...")
+                time.sleep(delay)
+
+        return success_count
+
+    def _translate_jobs_concurrently(self, jobs: List[ChapterJob], total: int, max_workers: int) -> int:
+        """
+        Translate chapters on a bounded worker pool. Returns success count.
+
+        API pacing comes from the process-wide RateLimiter shared with the
+        summarizer and other clients.
+
+        Workers only translate and summarize; manifest, log and context
+        writes happen in `_record_chapter_result` on this thread. Chapters
+        that fail on the primary model are retried on the fallback model
+        serially after the pool drains, because switching models clears the
+        shared internal cache.
+        """
+        concurrency = get_concurrency_config()
+        shared_limiter = self.client._rate_limiter
+        if shared_limiter is None:
+            # Shared limiter disabled: the per-client fixed delay is not
+            # thread-aware, so throttle this run with a private limiter.
+            self.client.set_rate_limiter(RateLimiter(
+                requests_per_minute=get_rate_limit_config()["requests_per_minute"],
+                burst=max_workers,
+            ))
+
+        scheduler = ChapterScheduler(
+            max_workers=max_workers,
+            lookback=self.context_manager.lookback_chapters,
+            continuity_policy=concurrency["continuity_policy"],
+        )
+        logger.info(
+            f"[SCHEDULER] Translating {len(jobs)} chapters with {max_workers} workers "
+            f"(continuity={scheduler.continuity_policy}, lookback={scheduler.lookback})"
+        )
+
+        success_count = 0
+        deferred_fallback: List[ChapterJob] = []
+
+        def worker(job: ChapterJob) -> Dict[str, Any]:
+            with chapter_scope(job.chapter_id):
+                result = self._translate_chapter_job(job, total)
+                outcome = {"result": result, "translation_text": "", "summary_result": None}
+                if result.success:
+                    outcome["translation_text"] = self._read_translation_text(job)
+                    outcome["summary_result"] = self._summarize_chapter_job(job, outcome["translation_text"])
+                return outcome
+
+        def on_complete(job: ChapterJob, outcome: Any) -> None:
+            nonlocal success_count
+            if isinstance(outcome, Exception):
+                outcome = {
+                    "result": TranslationResult(False, job.payload["output_path"], error=str(outcome)),
+                    "translation_text": "",
+                    "summary_result": None,
+                }
+            result = outcome["result"]
+            if not result.success and not job.payload["chapter"].get("model"):
+                deferred_fallback.append(job)
+                return
+            if self._record_chapter_result(
+                job,
+                result,
+                translation_text=outcome["translation_text"],
+                summary_result=outcome["summary_result"],
+            ):
+                success_count += 1
+
+        try:
+            scheduler.run(jobs, worker, on_complete)
+        finally:
+            self.client.set_rate_limiter(shared_limiter)
+
+        for job in deferred_fallback:
+            with chapter_scope(job.chapter_id):
+                result = self._translate_chapter_fallback(job)
+                translation_text = ""
+                summary_result = None
+                if result.success:
+                    translation_text = self._read_translation_text(job)
+                    summary_result = self._summarize_chapter_job(job, translation_text)
+            if self._record_chapter_result(
+                job,
+                result,
+                translation_text=translation_text,
+                summary_result=summary_result,
+            ):
+                success_count += 1
+
+        return success_count
+
+    def _translate_chapter_job(self, job: ChapterJob, total: int) -> TranslationResult:
+        """Translate one chapter with the primary (or overridden) model."""
+        i = job.index
+        chapter = job.payload["chapter"]
+        chapter_id = job.chapter_id
+
+        logger.info(f"Translating [{i+1}/{total}] {chapter_id} to {self.language_name}...")
+
+        # Check for model override in chapter metadata
+        chapter_model = chapter.get("model")
+        self._chapter_started.setdefault(chapter_id, time.time())
+        emit_event(
+            "chapter_start",
+            chapter=chapter_id,
+            index=i + 1,
+            total=total,
+            model=chapter_model or get_model_name(),
+        )
+        if chapter_model:
+            logger.info(f"     [OVERRIDE] Using model: {chapter_model}")
+        
+        # Select cache for this chapter:
+        # 1) Volume-level full JP cache (preferred for massive LNs)
+        # 2) Continuity schema cache (legacy fallback)
+        cached_content_name = self.volume_cache_name
+        if self.enable_continuity and i > 0 and not cached_content_name:  # Not first chapter
+            try:
+                cached_content_name = self.per_chapter_workflow.get_cache_for_chapter(i + 1)
+                if cached_content_name:
+                    logger.info(f"     [CONTINUITY] Using cached schema from Chapter {i}")
+            except Exception as e:
+                logger.warning(f"Could not load cached schema: {e}")
+        # === END CACHE CHECK ===
+
+        effective_cache_name = cached_content_name
+        default_model = get_model_name()
+        if chapter_model and chapter_model != default_model and cached_content_name:
+            logger.info(
+                f"     [CACHE] Skipping cache for model override "
+                f"({chapter_model} != {default_model})"
+            )
+            effective_cache_name = None
+
+        if i == 0:
+            if self.volume_cache_name and effective_cache_name:
+                logger.info(
+                    "[CACHE VERIFY] Chapter translation will use external full-LN cache "
+                    "with embedded prompt instructions."
+                )
+            elif effective_cache_name:
+                logger.info("[CACHE VERIFY] Chapter translation will use cached prompt context.")
+            else:
+                logger.warning("[CACHE VERIFY] Chapter translation running without cache.")
+
+        scene_plan = self._load_scene_plan_context(chapter)
+        job.payload["scene_plan"] = scene_plan
+        if self.processor.prefetcher is not None:
+            self.processor.prefetcher.advance(chapter_id)
+        return self.processor.translate_chapter(
+            job.payload["source_path"],
+            job.payload["output_path"],
+            chapter_id,
+            en_title=job.payload["translated_title"],  # en_title param kept for backward compatibility
+            model_name=chapter_model,
+            cached_content=effective_cache_name,
+            volume_cache=effective_cache_name if self.volume_cache_name else None,
+            scene_plan=scene_plan,
+        )
+
+    def _prefetch_guidance_bundle(self, job: ChapterJob) -> None:
+        """Prefetch worker: prepare one upcoming chapter's guidance bundle."""
+        self.processor.prepare_guidance_bundle(
+            job.chapter_id,
+            job.payload["source_path"],
+            scene_plan=self._load_scene_plan_context(job.payload["chapter"]),
+        )
+
+    def _translate_chapter_fallback(self, job: ChapterJob) -> TranslationResult:
+        """Retry a failed chapter with the configured fallback model."""
+        # Fallback to configured fallback model on failure (safety blocks, rate limits, etc)
+        fallback_model = get_fallback_model_name()
+        logger.warning(f"Translation failed, retrying with fallback model ({fallback_model})...")
+
+        # Clear cache since we're switching models (cache is model-specific)
+        if self.client.enable_caching:
+            logger.info("Clearing cache before switching to fallback model...")
+            self.client.clear_cache()
+
+        result = self.processor.translate_chapter(
+            job.payload["source_path"],
+            job.payload["output_path"],
+            job.chapter_id,
+            en_title=job.payload["translated_title"],
+            model_name=fallback_model,
+            cached_content=None,
+            volume_cache=None,
+            scene_plan=job.payload.get("scene_plan"),
+        )
+        if result.success:
+            logger.info(f"     [FALLBACK] Successfully translated with {fallback_model}")
+            # Save fallback model to manifest for tracking
+            job.payload["chapter"]["model"] = fallback_model
+        return result
+
+    def _read_translation_text(self, job: ChapterJob) -> str:
+        try:
+            with open(job.payload["output_path"], 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception as e:
+            logger.error(f"Failed reading translated chapter for post-processing: {e}")
+            return ""
+
+    def _run_per_chapter_workflow(self, job: ChapterJob, translation_text: str) -> bool:
+        """
+        Run the interactive continuity schema workflow for a completed chapter.
+
+        Returns:
+            False if the user chose to stop the pipeline, True otherwise.
+        """
+        # === PER-CHAPTER WORKFLOW: Extract schema, review, cache ===
+        if not self.enable_continuity:
+            logger.info(f"\n{'─'*60}")
+            logger.info(f"  [CONTINUITY DISABLED] Skipping schema extraction")
+            logger.info(f"{'─'*60}\n")
+            return True
+
+        logger.info(f"\n{'─'*60}")
+        logger.info(f"  Starting per-chapter schema workflow...")
+        logger.info(f"{'─'*60}\n")
+        
+        try:
+            if not translation_text.strip():
+                logger.warning("Translated chapter text is empty; skipping continuity schema extraction")
+                return True
+
+            # Process chapter (extract, review, cache)
+            workflow_success, cache_name = self.per_chapter_workflow.process_chapter(
+                chapter_num=job.index + 1,  # 1-indexed chapter number
+                chapter_id=job.chapter_id,
+                translation_text=translation_text,
+                skip_review=False  # User review required
+            )
+
+            if not workflow_success:
+                logger.warning("Per-chapter workflow failed or was cancelled by user")
+                # User cancelled - should we stop the pipeline?
+                if input("\nContinue to next chapter anyway? (y/N): ").strip().lower() != 'y':
+                    logger.info("Pipeline stopped by user")
+                    return False
+
+            # Store cache info in chapter metadata
+            if cache_name:
+                job.payload["chapter"]["schema_cache"] = cache_name
+            
+        except Exception as e:
+            logger.error(f"Per-chapter workflow error: {e}")
+            logger.warning("Continuing without schema extraction...")
+        # === END PER-CHAPTER WORKFLOW ===
+        return True
+
+    def _chapter_context_title(self, job: ChapterJob) -> str:
+        chapter = job.payload["chapter"]
+        return (
+            job.payload["translated_title"]
+            or chapter.get(f"title_{self.target_language}")
+            or chapter.get("title_en")
+            or chapter.get("title")
+            or self._canonical_title_from_chapter_id(job.chapter_id)
+            or job.chapter_id
+        )
+
+    def _chapter_number(self, job: ChapterJob) -> Optional[int]:
+        return self._resolve_chapter_number(
+            chapter_id=job.chapter_id,
+            source_filename=job.payload["jp_file"],
+            fallback=job.index + 1,
+        )
+
+    def _summarize_chapter_job(self, job: ChapterJob, translation_text: str):
+        """Run the chapter summarizer (network call; safe on worker threads)."""
+        chapter_num = self._chapter_number(job)
+        if not (self.chapter_summarizer and translation_text.strip() and chapter_num is not None):
+            return None
+        return self.chapter_summarizer.summarize_chapter(
+            chapter_id=job.chapter_id,
+            chapter_num=chapter_num,
+            chapter_title=self._chapter_context_title(job),
+            translation_text=translation_text,
+        )
+
+    def _record_chapter_result(
+        self,
+        job: ChapterJob,
+        result: TranslationResult,
+        translation_text: str = "",
+        summary_result: Any = None,
+        update_context: bool = True,
+    ) -> bool:
+        """
+        Write translation log, manifest status and T3 context for one chapter.
+
+        Must only be called from the thread driving translate_volume.
+
+        Returns:
+            True if the chapter completed successfully.
+        """
+        chapter = job.payload["chapter"]
+        chapter_id = job.chapter_id
+        output_path = job.payload["output_path"]
+
+        # Update Log
+        log_entry = {
+            "chapter_id": chapter_id,
+            "input_tokens": result.input_tokens,
+            "output_tokens": result.output_tokens,
+            "success": result.success,
+            "error": result.error,
+            "quality": result.audit_result.to_dict() if result.audit_result else None
+        }
+        
+        # Remove old entry if exists
+        self.translation_log["chapters"] = [c for c in self.translation_log["chapters"] if c["chapter_id"] != chapter_id]
+        self.translation_log["chapters"].append(log_entry)
+        self._save_log()
+
+        completed = False
+        if result.success:
+            chapter["translation_status"] = "completed"
+            # Use language-specific key (e.g., "vn_file" or "en_file")
+            file_key = f"{self.target_language}_file"
+            # Store the actual output filename (not the fallback variable)
+            chapter[file_key] = output_path.name  # e.g., "CHAPTER_01_EN.md"
+
+            if update_context:
+                self._update_chapter_context(job, translation_text, summary_result)
+                completed = True
+                if result.warnings:
+                    logger.warning(
+                        f"{chapter_id} completed with {len(result.warnings)} warning(s): "
+                        f"{'; '.join(result.warnings[:3])}"
+                    )
+                logger.info(f"Completed {chapter_id}. Audit passed: {result.audit_result.passed if result.audit_result else 'N/A'}")
+        else:
+            chapter["translation_status"] = "failed"
+            logger.error(f"Failed {chapter_id}: {result.error}")
+
+        started = self._chapter_started.pop(chapter_id, None)
+        emit_event(
+            "chapter_end",
+            chapter=chapter_id,
+            status="completed" if completed else "failed",
+            wall_seconds=round(time.time() - started, 3) if started else None,
+            error=None if completed else (result.error or "")[:300],
+            **chapter_usage(chapter_id),
+        )
+        
+        # Update manifest checkpoint
+        self._save_manifest()
+        return completed
+
+    def _update_chapter_context(self, job: ChapterJob, translation_text: str, summary_result: Any) -> None:
+        # === CHAPTER SUMMARIZATION + CONTEXT UPDATE ===
+        chapter = job.payload["chapter"]
+        chapter_id = job.chapter_id
+        chapter_num = self._chapter_number(job)
+        context_title = self._chapter_context_title(job)
+
+        if summary_result is not None:
+            if summary_result.success:
+                chapter["summary_file"] = (
+                    summary_result.summary_path.name
+                    if summary_result.summary_path else None
+                )
+                summary_data = summary_result.summary_data
+                context_summary = self._build_context_summary_text(
+                    summary_data.get("plot_points", []),
+                    chapter_title=str(summary_data.get("title") or context_title),
+                )
+                self.context_manager.add_chapter_context(
+                    chapter_id=chapter_id,
+                    summary=context_summary,
+                    metadata={
+                        "chapter_num": summary_data.get("chapter_num"),
+                        "chapter_title": summary_data.get("title"),
+                        "emotional_tone": summary_data.get("emotional_tone"),
+                        "running_jokes": summary_data.get("running_jokes", []),
+                        "tone_shifts": summary_data.get("tone_shifts", []),
+                        "summary_file": chapter.get("summary_file"),
+                        "summarizer_model": summary_result.model,
+                        "summarizer_fallback": summary_result.used_fallback,
+                    },
+                    characters=summary_data.get("new_characters", []),
+                    plot_points=summary_data.get("plot_points", []),
+                )
+                logger.info(
+                    f"[CH-SUMMARY] Context updated for {chapter_id} "
+                    f"(fallback={summary_result.used_fallback})"
+                )
+            else:
+                logger.warning(
+                    f"[CH-SUMMARY] Failed for {chapter_id}: {summary_result.error}; "
+                    "using minimal context entry."
+                )
+                self.context_manager.add_chapter_context(
+                    chapter_id=chapter_id,
+                    summary=context_title or "Translated chapter",
+                    metadata={"chapter_num": chapter_num, "summary_error": summary_result.error},
+                    plot_points=[],
+                    characters=[],
+                )
+        else:
+            self.context_manager.add_chapter_context(
+                chapter_id=chapter_id,
+                summary=context_title or "Translated chapter",
+                metadata={"chapter_num": chapter_num, "summary_skipped": True},
+                plot_points=[],
+                characters=[],
+            )
+
     def generate_report(self) -> TranslationReport:
         """Generate a summary report of the translation."""
         log_chapters = self.translation_log.get("chapters", [])
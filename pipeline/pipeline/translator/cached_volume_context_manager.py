@@ -20,6 +20,9 @@ import logging
 import hashlib
 from datetime import datetime, timedelta
 
+from pipeline.common.context_cache_registry import get_cache_registry
+from pipeline.common.token_estimator import get_token_estimator
+
 logger = logging.getLogger(__name__)
 
 
@@ -205,16 +208,8 @@ class CachedVolumeContextManager:
         return True
 
     def _estimate_token_count(self, content: str) -> int:
-        """Estimate/measure token count for cache eligibility checks."""
-        if not content:
-            return 0
-        try:
-            if hasattr(self.gemini_client, "get_token_count"):
-                return int(self.gemini_client.get_token_count(content))
-        except Exception:
-            pass
-        # Fallback estimate (~4 chars/token for JP+EN markdown mixed text).
-        return max(1, len(content) // 4)
+        """Offline token estimate for cache eligibility checks (no count_tokens call)."""
+        return get_token_estimator().estimate(content)
 
     def _create_gemini_cache(self, cache_name: str, content: str) -> Optional[Dict[str, Any]]:
         """
@@ -232,11 +227,13 @@ class CachedVolumeContextManager:
             return None
 
         model_name = getattr(self.gemini_client, "model", "gemini-2.5-flash")
-        cache_resource_name = self.gemini_client.create_cache(
+        cache_resource_name = get_cache_registry(self.work_dir).acquire(
+            self.gemini_client,
             model=model_name,
             contents=[content],
             ttl_seconds=3600,
             display_name=cache_name,
+            label="volume_context",
         )
         if not cache_resource_name:
             return None
@@ -275,15 +272,18 @@ class CachedVolumeContextManager:
             return False
 
         try:
-            # Update local metadata
             current_expires = datetime.fromisoformat(self.cache_metadata['cache_expires_at'])
             new_expires = current_expires + timedelta(hours=hours)
+            ttl_seconds = int((new_expires - datetime.now()).total_seconds())
+            if not self.gemini_client.update_cache_ttl(cache_name, ttl_seconds):
+                logger.warning(f"Cache {cache_name} could not be extended; it will be recreated on next use")
+                self.cache_metadata['volume_cache_name'] = None
+                self._save_cache_metadata()
+                return False
+
             self.cache_metadata['cache_expires_at'] = new_expires.isoformat()
             self._save_cache_metadata()
 
-            # Update Gemini cache TTL (requires SDK call)
-            # cache.update(ttl=datetime.timedelta(hours=hours))
-
             logger.info(f"Cache TTL extended by {hours} hours (new expiry: {new_expires})")
             return True
         except Exception as e:
@@ -5,29 +5,45 @@ Handles the translation of a single chapter using Gemini and RAG context.
 
 import re
 import json
+import time
+import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
-from pipeline.common.gemini_client import GeminiClient
+from pipeline.common.event_stream import emit as emit_event
+from pipeline.common.gemini_client import GeminiClient, GeminiResponse, is_fatal_api_error, retry_api_errors
 from pipeline.translator.prompt_loader import PromptLoader
 from pipeline.translator.context_manager import ContextManager
 from pipeline.translator.quality_metrics import QualityMetrics, AuditResult
 from pipeline.translator.config import (
     get_generation_params,
     get_model_name,
+    get_prefetch_config,
     get_safety_settings,
     get_translation_config,
 )
 from pipeline.translator.scene_break_formatter import SceneBreakFormatter
 from pipeline.translator.chunk_merger import ChunkMerger
+from pipeline.translator.chunk_planner import estimate_source_tokens, plan_chunks
+from pipeline.translator.chapter_scheduler import ChapterJob, ChapterScheduler
+from pipeline.translator.stream_checkpoint import StreamCheckpoint, resume_tail
 from pipeline.translator.glossary_lock import GlossaryLock
+from pipeline.translator.guidance_prefetch import (
+    BUNDLE_SUBDIR,
+    GUIDANCE_BUNDLE_VERSION,
+    SECTION_NAMES,
+    GuidanceBundleStore,
+    GuidancePrefetcher,
+)
+from pipeline.translator.prompt_cache import fingerprint
 from pipeline.translator.volume_context_integration import VolumeContextIntegration
 from pipeline.post_processor.vn_cjk_cleaner import VietnameseCJKCleaner
 from pipeline.config import PIPELINE_ROOT
 from modules.gap_integration import GapIntegrationEngine
+from modules.guidance_service import LANGUAGE_STORES, rag_file
 # RTASCalculator disabled (2026-02-10): Direct manifest reading instead
 # from modules.rtas_calculator import RTASCalculator, VoiceSettings
 
@@ -41,6 +57,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Phase 1.55 context offload caches in WORK/<volume>/.context
+PHASE155_CACHE_FILES = {
+    "character_registry": "character_registry.json",
+    "cultural_glossary": "cultural_glossary.json",
+    "timeline_map": "timeline_map.json",
+    "idiom_transcreation_cache": "idiom_transcreation_cache.json",
+}
+
 @dataclass
 class TranslationResult:
     success: bool
@@ -119,9 +143,31 @@ class ChapterProcessor:
         self.chunk_threshold_chars = int(massive_cfg.get("chunk_threshold_chars", 60000))
         self.chunk_threshold_bytes = int(massive_cfg.get("chunk_threshold_bytes", 120000))
         self.target_chunk_chars = int(massive_cfg.get("target_chunk_chars", 45000))
+        # Adaptive chunking: token-estimated split on scene breaks, chunks translated concurrently
+        adaptive_cfg = massive_cfg.get("adaptive", {})
+        self.adaptive_chunking_enabled = bool(adaptive_cfg.get("enabled", False))
+        self.adaptive_token_threshold = int(adaptive_cfg.get("token_threshold", 40000))
+        self.adaptive_target_chunk_tokens = int(adaptive_cfg.get("target_chunk_tokens", 15000))
+        self.adaptive_max_parallel_chunks = max(1, int(adaptive_cfg.get("max_parallel_chunks", 3)))
+        self.chunk_context_tail_chars = int(adaptive_cfg.get("context_tail_chars", 1200))
+
+        # Streaming generation: checkpoint paragraphs as they arrive, resume instead of regenerating
+        streaming_cfg = translation_config.get("streaming", {})
+        self.streaming_enabled = bool(streaming_cfg.get("enabled", False))
+        self.stream_max_resumes = max(0, int(streaming_cfg.get("max_resumes", 2)))
+        self.stream_resume_tail_chars = int(streaming_cfg.get("resume_tail_chars", 3000))
+        self.stream_progress_every = max(1, int(streaming_cfg.get("progress_every_paragraphs", 25)))
 
         self.glossary_lock: Optional[GlossaryLock] = None
 
+        # Pre-translation guidance bundles (prefetched, persisted per chapter)
+        prefetch_cfg = get_prefetch_config()
+        self.guidance_bundles = GuidanceBundleStore(
+            (work_dir or self.context_manager.work_dir) / BUNDLE_SUBDIR,
+            persist=prefetch_cfg["persist"],
+        )
+        self.prefetcher: Optional[GuidancePrefetcher] = None  # Set by agent per run
+
         # RTAS Calculator - DISABLED (2026-02-10)
         # Bypass RTAS calculation, read contraction rates directly from manifest
         self.rtas_calculator = None  # Disabled
@@ -518,6 +564,7 @@ This document contains the internal reasoning process that Gemini used while tra
         volume_cache: Optional[str] = None,
         scene_plan: Optional[Dict[str, Any]] = None,
         allow_chunking: bool = True,
+        preceding_source: Optional[str] = None,
     ) -> TranslationResult:
         """
         Translate a single chapter file.
@@ -532,6 +579,7 @@ This document contains the internal reasoning process that Gemini used while tra
             volume_cache: Optional alias for cached_content (volume-level cache)
             scene_plan: Optional Stage 1 scene scaffold from PLANS/{chapter}_scene_plan.json
             allow_chunking: If False, force direct translation without chunk splitting
+            preceding_source: Source text just before this one (chunk context, not translated)
         """
         try:
             effective_cache = volume_cache or cached_content
@@ -570,262 +618,47 @@ This document contains the internal reasoning process that Gemini used while tra
                     cached_content=effective_cache,
                     scene_plan=scene_plan,
                 )
+            if allow_chunking and not self.smart_chunking_enabled and self.adaptive_chunking_enabled:
+                source_tokens = estimate_source_tokens(source_text)
+                if source_tokens >= self.adaptive_token_threshold:
+                    logger.info(
+                        f"[CHUNK] {chapter_id} is ~{source_tokens} source tokens "
+                        f"(threshold {self.adaptive_token_threshold}). Using adaptive chunked translation."
+                    )
+                    return self._translate_chapter_in_chunks(
+                        source_path=source_path,
+                        output_path=output_path,
+                        chapter_id=chapter_id,
+                        source_text=source_text,
+                        en_title=en_title,
+                        model_name=model_name,
+                        cached_content=effective_cache,
+                        scene_plan=scene_plan,
+                        adaptive=True,
+                    )
             if allow_chunking and not self.smart_chunking_enabled and is_massive:
                 logger.info(
                     f"[CHUNK] Smart chunking disabled; processing {chapter_id} as single chapter "
                     f"({len(source_text)} chars, {source_bytes} bytes)"
                 )
             
-            # === GAP ANALYSIS (Pre-Translation) ===
-            gap_flags = None
-            if self.enable_gap_analysis and self.gap_analyzer:
-                try:
-                    logger.info(f"[GAP] Running pre-translation gap analysis on {chapter_id}...")
-                    gap_report = self.gap_analyzer.analyze_chapter_pre_translation(
-                        chapter_id=chapter_id,
-                        jp_lines=source_text.split('\n'),
-                        en_lines=None  # Pre-translation, no EN output yet
-                    )
-                    
-                    if gap_report:
-                        gap_a_count = len(gap_report.gap_a_flags)
-                        gap_b_count = len(gap_report.gap_b_flags)
-                        gap_c_count = len(gap_report.gap_c_flags)
-                        total_gaps = gap_a_count + gap_b_count + gap_c_count
-                        
-                        if total_gaps > 0:
-                            logger.info(f"[GAP] Detected {total_gaps} gaps: A={gap_a_count}, B={gap_b_count}, C={gap_c_count}")
-                            gap_flags = {
-                                'gap_a': gap_report.gap_a_flags,
-                                'gap_b': gap_report.gap_b_flags,
-                                'gap_c': gap_report.gap_c_flags
-                            }
-                        else:
-                            logger.debug(f"[GAP] No gaps detected in {chapter_id}")
-                except Exception as e:
-                    logger.warning(f"[GAP] Gap analysis failed: {e}")
-                    logger.warning("[GAP] Continuing without gap guidance")
-            # === END GAP ANALYSIS ===
-
-            # === DIALECT DETECTION (v1.0 - 2026-02-01) ===
-            dialect_guidance = None
-            if DIALECT_DETECTION_AVAILABLE and detect_chapter_dialects:
-                try:
-                    logger.debug(f"[DIALECT] Scanning {chapter_id} for regional dialects...")
-                    has_dialects, dialect_text = detect_chapter_dialects(source_text, chapter_id)
-                    
-                    if has_dialects:
-                        logger.info(f"[DIALECT] Regional dialect(s) detected in {chapter_id}")
-                        dialect_guidance = dialect_text
-                    else:
-                        logger.debug(f"[DIALECT] No regional dialects detected in {chapter_id}")
-                except Exception as e:
-                    logger.warning(f"[DIALECT] Detection failed: {e}")
-                    logger.warning("[DIALECT] Continuing without dialect guidance")
-            # === END DIALECT DETECTION ===
+            # === PRE-TRANSLATION GUIDANCE ===
+            # Gap analysis, dialect detection, RAG lookups, visual context and
+            # scene/offload blocks; prefetched or reused from a previous run
+            # when the inputs are unchanged.
+            if self.prefetcher is not None:
+                self.prefetcher.wait(chapter_id)
+            guidance_bundle = self._guidance_bundle(chapter_id, source_text, scene_plan)
+            guidance_sections = guidance_bundle["sections"]
+            visual_guidance = guidance_sections.get("visual") or None
+            illustration_ids = guidance_bundle.get("illustration_ids", [])
+            # === END PRE-TRANSLATION GUIDANCE ===
 
             # Strip JP title if present (usually the first H1)
             # We preserve the original title for audit but send the rest to LLM
-            source_content_only = source_text
-            jp_title_match = re.match(r'^#\s*(.*?)\n+', source_text)
-            if jp_title_match:
-                source_content_only = source_text[jp_title_match.end():].strip()
-                logger.info(f"Stripped JP title for translation: {jp_title_match.group(1)}")
-
-            # === Kanji Disambiguation (Sino-Vietnamese Vector Search) ===
-            # Extract kanji compounds and query vector store for Vietnamese guidance
-            # Now with Context-Aware Disambiguation using surrounding sentences
-            sino_vn_guidance = None
-            context_str = ""  # Initialize early for kanji disambiguation (populated later at line 204)
-            if self.target_language in ['vi', 'vn']:  # Only for Vietnamese translations
-                try:
-                    from modules.kanji_extractor import extract_unique_compounds
-                    from modules.sino_vietnamese_store import SinoVietnameseStore
-                    
-                    logger.debug(f"[KANJI] Extracting kanji compounds for Sino-Vietnamese lookup...")
-                    
-                    # Extract top 30 most frequent kanji compounds (2-4 characters)
-                    kanji_terms = extract_unique_compounds(
-                        source_content_only, 
-                        min_length=2, 
-                        max_length=4,
-                        top_n=30
-                    )
-                    
-                    if kanji_terms:
-                        logger.debug(f"[KANJI] Found {len(kanji_terms)} kanji compounds: {kanji_terms[:5]}...")
-                        
-                        # Query vector store for disambiguation guidance
-                        # Now with CONTEXT-AWARE DISAMBIGUATION
-                        store = SinoVietnameseStore()
-                        
-                        # Extract first 3 sentences as context hint
-                        sentences = re.split(r'[。！？\n]', source_content_only)
-                        context_sentences = [s.strip() for s in sentences[:5] if s.strip()]
-                        context_hint = '。'.join(context_sentences[:3])
-                        
-                        # Get previous chapter context if available
-                        prev_context = ""
-                        if context_str:
-                            # Extract relevant context from continuity
-                            prev_context = context_str[:500] if len(context_str) > 500 else context_str
-                        
-                        sino_vn_guidance = store.get_bulk_guidance(
-                            terms=kanji_terms,
-                            genre=self.book_genre,  # v2: extracted from manifest
-                            max_per_term=2,
-                            min_confidence=0.68,
-                            context=context_hint,  # Current chapter context
-                            prev_context=prev_context,  # Previous chapter context
-                            use_external_dict=True  # Enable external dictionary fallback
-                        )
-                        
-                        high_conf = len(sino_vn_guidance.get("high_confidence", []))
-                        medium_conf = len(sino_vn_guidance.get("medium_confidence", []))
-                        external_count = len(sino_vn_guidance.get("external_dict", []))
-                        lookup_stats = sino_vn_guidance.get("lookup_stats", {})
-                        
-                        logger.info(f"[KANJI] Sino-Vietnamese guidance: {high_conf} high, {medium_conf} medium, {external_count} external")
-                        logger.debug(f"[KANJI] Lookup stats: direct={lookup_stats.get('direct_hits', 0)}, vector={lookup_stats.get('vector_hits', 0)}, external={lookup_stats.get('external_hits', 0)}")
-                    else:
-                        logger.debug(f"[KANJI] No kanji compounds found in chapter")
-                        
-                except Exception as e:
-                    logger.warning(f"[KANJI] Sino-Vietnamese lookup failed: {e}")
-                    logger.warning("[KANJI] Continuing without kanji disambiguation")
-                    sino_vn_guidance = None
-
-            # === English Grammar Pattern Detection (Vector Search) ===
-            # Detect Japanese grammar patterns and query vector store for natural English equivalents
-            en_pattern_guidance = None
-            if self.target_language == 'en':  # English translations only
-                try:
-                    from modules.grammar_pattern_detector import detect_grammar_patterns
-                    from modules.english_pattern_store import EnglishPatternStore
-
-                    logger.debug(f"[GRAMMAR] Detecting Japanese patterns for natural English phrasing...")
-
-                    # Detect grammar patterns (けど, が, も, etc.)
-                    detected_patterns = detect_grammar_patterns(
-                        source_content_only,
-                        top_n=15,  # Top 15 most relevant patterns
-                        include_line_numbers=True
-                    )
-
-                    if detected_patterns:
-                        logger.debug(f"[GRAMMAR] Found {len(detected_patterns)} patterns")
-
-                        # Query vector store for natural English equivalents
-                        store = EnglishPatternStore()
-
-                        # Extract first 5 sentences as context hint
-                        sentences = re.split(r'[。！？\n]', source_content_only)
-                        context_sentences = [s.strip() for s in sentences[:5] if s.strip()]
-                        context_hint = '。'.join(context_sentences[:3])
-
-                        # Get previous chapter context if available
-                        prev_context = ""
-                        if context_str:
-                            # Extract relevant context from continuity
-                            prev_context = context_str[:500] if len(context_str) > 500 else context_str
-
-                        en_pattern_guidance = store.get_bulk_guidance(
-                            patterns=detected_patterns,
-                            context=context_hint,
-                            max_per_pattern=2,
-                            min_confidence=0.75
-                        )
-
-                        high_conf = len(en_pattern_guidance.get("high_confidence", []))
-                        medium_conf = len(en_pattern_guidance.get("medium_confidence", []))
-                        lookup_stats = en_pattern_guidance.get("lookup_stats", {})
-
-                        logger.info(f"[GRAMMAR] English pattern guidance: {high_conf} high, {medium_conf} medium")
-                        logger.debug(f"[GRAMMAR] Lookup stats: patterns_queried={lookup_stats.get('patterns_queried', 0)}")
-                    else:
-                        logger.debug(f"[GRAMMAR] No grammar patterns detected in chapter")
-
-                except Exception as e:
-                    logger.warning(f"[GRAMMAR] Pattern detection failed: {e}")
-                    logger.warning("[GRAMMAR] Continuing without grammar pattern guidance")
-                    en_pattern_guidance = None
-
-            # === Vietnamese Grammar Pattern Detection (Vector Search) ===
-            # Detect Japanese grammar patterns and query vector store for natural Vietnamese equivalents
-            vn_pattern_guidance = None
-            if self.target_language == 'vn':  # Vietnamese translations only
-                try:
-                    from modules.grammar_pattern_detector import detect_grammar_patterns
-                    from modules.vietnamese_pattern_store import VietnamesePatternStore
-
-                    logger.debug(f"[VN-GRAMMAR] Detecting Japanese patterns for natural Vietnamese phrasing...")
-
-                    # Detect grammar patterns (same JP detector, VN-specific store)
-                    detected_patterns = detect_grammar_patterns(
-                        source_content_only,
-                        top_n=15,
-                        include_line_numbers=True
-                    )
-
-                    if detected_patterns:
-                        logger.debug(f"[VN-GRAMMAR] Found {len(detected_patterns)} patterns")
-
-                        # Query VN vector store for natural Vietnamese equivalents
-                        vn_store = VietnamesePatternStore()
-
-                        # Extract first 5 sentences as context hint
-                        sentences = re.split(r'[。！？\n]', source_content_only)
-                        context_sentences = [s.strip() for s in sentences[:5] if s.strip()]
-                        context_hint = '。'.join(context_sentences[:3])
-
-                        vn_pattern_guidance = vn_store.get_bulk_guidance(
-                            patterns=detected_patterns,
-                            context=context_hint,
-                            max_per_pattern=2,
-                            min_confidence=0.70
-                        )
-
-                        high_conf = len(vn_pattern_guidance.get("high_confidence", []))
-                        medium_conf = len(vn_pattern_guidance.get("medium_confidence", []))
-                        lookup_stats = vn_pattern_guidance.get("lookup_stats", {})
-
-                        logger.info(f"[VN-GRAMMAR] Vietnamese pattern guidance: {high_conf} high, {medium_conf} medium")
-                        logger.debug(f"[VN-GRAMMAR] Lookup stats: patterns_queried={lookup_stats.get('patterns_queried', 0)}, neg_penalties={lookup_stats.get('neg_penalties_applied', 0)}")
-                    else:
-                        logger.debug(f"[VN-GRAMMAR] No grammar patterns detected in chapter")
-
-                except Exception as e:
-                    logger.warning(f"[VN-GRAMMAR] Pattern detection failed: {e}")
-                    logger.warning("[VN-GRAMMAR] Continuing without Vietnamese grammar pattern guidance")
-                    vn_pattern_guidance = None
-
-            # === MULTIMODAL VISUAL CONTEXT ===
-            visual_guidance = None
-            illustration_ids = []  # Track for thought logging
-            if self.enable_multimodal and self.visual_cache:
-                try:
-                    from modules.multimodal.segment_classifier import extract_all_illustration_ids
-                    from modules.multimodal.prompt_injector import build_chapter_visual_guidance
-
-                    illustration_ids = extract_all_illustration_ids(source_content_only)
-                    if illustration_ids:
-                        cache_manifest = self.visual_cache.get_manifest()
-                        if not isinstance(cache_manifest, dict):
-                            cache_manifest = {}
-                        visual_guidance = build_chapter_visual_guidance(
-                            illustration_ids, self.visual_cache,
-                            manifest=cache_manifest
-                        )
-                        if visual_guidance:
-                            logger.info(f"[MULTIMODAL] Injecting visual context for {len(illustration_ids)} illustration(s)")
-                        else:
-                            logger.debug(f"[MULTIMODAL] No cached context found for illustrations: {illustration_ids}")
-                    else:
-                        logger.debug(f"[MULTIMODAL] No illustration markers found in {chapter_id}")
-                except Exception as e:
-                    logger.warning(f"[MULTIMODAL] Visual context extraction failed: {e}")
-                    logger.warning("[MULTIMODAL] Continuing without visual context")
-            # === END MULTIMODAL ===
+            source_content_only, jp_title = self._split_source_title(source_text)
+            if jp_title is not None:
+                logger.info(f"Stripped JP title for translation: {jp_title}")
 
             # 2. Build Prompt
             # Skip rebuilding system instruction if cache is available
@@ -870,14 +703,9 @@ This document contains the internal reasoning process that Gemini used while tra
                 source_content_only,
                 context_str,
                 en_title,
-                sino_vn_guidance=sino_vn_guidance,
-                gap_flags=gap_flags,
-                dialect_guidance=dialect_guidance,  # v1.0 - Dialect detection
-                en_pattern_guidance=en_pattern_guidance,  # English grammar patterns
-                vn_pattern_guidance=vn_pattern_guidance,  # Vietnamese grammar patterns
-                visual_guidance=visual_guidance,
-                scene_plan=scene_plan,
+                guidance_sections=guidance_sections,  # Pre-translation guidance bundle
                 volume_context=volume_context_text,  # Phase 1.2 - Volume-level context
+                preceding_source=preceding_source,
             )
             logger.debug(f"[VERBOSE] User prompt length: {len(user_prompt)} characters")
             
@@ -886,14 +714,24 @@ This document contains the internal reasoning process that Gemini used while tra
             # Note regarding model: gemini_client usually handles model in init or call
             # We pass system_instruction separately as per new API patterns
             # If we have cached_content from previous chapter, pass it for continuity
-            response = self.client.generate(
-                prompt=user_prompt,
-                system_instruction=system_instruction,
-                temperature=self.gen_params.get("temperature", 0.7),
-                max_output_tokens=self.gen_params.get("max_output_tokens", 65536),
-                model=model_name or self.model_name,
-                cached_content=effective_cache  # Inject cached schema for continuity
-            )
+            if self.streaming_enabled:
+                response = self._generate_streaming(
+                    chapter_id=chapter_id,
+                    source_text=source_text,
+                    user_prompt=user_prompt,
+                    system_instruction=system_instruction,
+                    model_name=model_name or self.model_name,
+                    cached_content=effective_cache,
+                )
+            else:
+                response = self.client.generate(
+                    prompt=user_prompt,
+                    system_instruction=system_instruction,
+                    temperature=self.gen_params.get("temperature", 0.7),
+                    max_output_tokens=self.gen_params.get("max_output_tokens", 65536),
+                    model=model_name or self.model_name,
+                    cached_content=effective_cache  # Inject cached schema for continuity
+                )
             logger.debug(
                 f"[VERBOSE] Gemini response received. "
                 f"finish_reason={response.finish_reason}, "
@@ -1112,6 +950,506 @@ This document contains the internal reasoning process that Gemini used while tra
             logger.exception(f"Translation failed for {chapter_id}")
             return TranslationResult(False, output_path, error=str(e))
 
+    def _split_source_title(self, source_text: str) -> Tuple[str, Optional[str]]:
+        """Source without its JP title (usually the first H1), and that title."""
+        jp_title_match = re.match(r'^#\s*(.*?)\n+', source_text)
+        if not jp_title_match:
+            return source_text, None
+        return source_text[jp_title_match.end():].strip(), jp_title_match.group(1)
+
+    def _needs_chunking(self, source_text: str) -> bool:
+        """Whether translate_chapter() splits this source into chunks."""
+        if self.smart_chunking_enabled:
+            return (
+                len(source_text) >= self.chunk_threshold_chars
+                or len(source_text.encode("utf-8")) >= self.chunk_threshold_bytes
+            )
+        return (
+            self.adaptive_chunking_enabled
+            and estimate_source_tokens(source_text) >= self.adaptive_token_threshold
+        )
+
+    def _guidance_bundle_key(
+        self,
+        chapter_id: str,
+        source_text: str,
+        scene_plan: Optional[Dict[str, Any]],
+    ) -> str:
+        """Hash of everything a chapter's guidance bundle is built from."""
+        inputs: List[Any] = [
+            GUIDANCE_BUNDLE_VERSION,
+            chapter_id,
+            source_text,
+            scene_plan,
+            self.target_language,
+            self.book_genre,
+            bool(self.enable_gap_analysis and self.gap_analyzer),
+            bool(self.enable_multimodal and self.visual_cache),
+            Path(__file__),
+        ]
+        for kind in LANGUAGE_STORES.get(self.target_language, ()):
+            inputs.append(rag_file(kind))
+        context_dir = self.context_manager.work_dir / ".context"
+        for name in PHASE155_CACHE_FILES:
+            inputs.append(context_dir / name)
+        if self.enable_multimodal and self.visual_cache:
+            inputs.append(Path(self.visual_cache.cache_path))
+        return fingerprint(*inputs)
+
+    def prepare_guidance_bundle(
+        self,
+        chapter_id: str,
+        source_path: Path,
+        scene_plan: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Build and store a chapter's guidance bundle ahead of translation (prefetch)."""
+        with open(source_path, 'r', encoding='utf-8') as f:
+            source_text = f.read()
+        # Chunked chapters build a bundle per chunk instead
+        if self._needs_chunking(source_text):
+            return
+        self._guidance_bundle(chapter_id, source_text, scene_plan)
+
+    def _guidance_bundle(
+        self,
+        chapter_id: str,
+        source_text: str,
+        scene_plan: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Guidance bundle for a chapter: prefetched or persisted if its inputs
+        are unchanged, built now otherwise.
+        """
+        key = self._guidance_bundle_key(chapter_id, source_text, scene_plan)
+        bundle = self.guidance_bundles.get(chapter_id, key)
+        if bundle is not None:
+            logger.info(f"[PREFETCH] Using prepared guidance bundle for {chapter_id}")
+            return bundle
+        bundle = self._build_guidance_bundle(chapter_id, source_text, scene_plan)
+        # Failed lookups are retried by the next run instead of being persisted
+        self.guidance_bundles.put(chapter_id, key, bundle, persist=not bundle["failed_steps"])
+        return bundle
+
+    def _build_guidance_bundle(
+        self,
+        chapter_id: str,
+        source_text: str,
+        scene_plan: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Run the pre-translation analyses for one chapter and format their
+        prompt blocks. Depends only on the source, the scene plan and
+        volume-level caches, so it is safe to run ahead on a prefetch thread.
+        """
+        failed_steps: List[str] = []  # A bundle with failed steps is not persisted
+
+        # === GAP ANALYSIS (Pre-Translation) ===
+        gap_flags = None
+        if self.enable_gap_analysis and self.gap_analyzer:
+            try:
+                logger.info(f"[GAP] Running pre-translation gap analysis on {chapter_id}...")
+                gap_report = self.gap_analyzer.analyze_chapter_pre_translation(
+                    chapter_id=chapter_id,
+                    jp_lines=source_text.split('\n'),
+                    en_lines=None  # Pre-translation, no EN output yet
+                )
+                
+                if gap_report:
+                    gap_a_count = len(gap_report.gap_a_flags)
+                    gap_b_count = len(gap_report.gap_b_flags)
+                    gap_c_count = len(gap_report.gap_c_flags)
+                    total_gaps = gap_a_count + gap_b_count + gap_c_count
+                    
+                    if total_gaps > 0:
+                        logger.info(f"[GAP] Detected {total_gaps} gaps: A={gap_a_count}, B={gap_b_count}, C={gap_c_count}")
+                        gap_flags = {
+                            'gap_a': gap_report.gap_a_flags,
+                            'gap_b': gap_report.gap_b_flags,
+                            'gap_c': gap_report.gap_c_flags
+                        }
+                    else:
+                        logger.debug(f"[GAP] No gaps detected in {chapter_id}")
+            except Exception as e:
+                logger.warning(f"[GAP] Gap analysis failed: {e}")
+                logger.warning("[GAP] Continuing without gap guidance")
+                failed_steps.append("gap")
+        # === END GAP ANALYSIS ===
+
+        # === DIALECT DETECTION (v1.0 - 2026-02-01) ===
+        dialect_guidance = None
+        if DIALECT_DETECTION_AVAILABLE and detect_chapter_dialects:
+            try:
+                logger.debug(f"[DIALECT] Scanning {chapter_id} for regional dialects...")
+                has_dialects, dialect_text = detect_chapter_dialects(source_text, chapter_id)
+                
+                if has_dialects:
+                    logger.info(f"[DIALECT] Regional dialect(s) detected in {chapter_id}")
+                    dialect_guidance = dialect_text
+                else:
+                    logger.debug(f"[DIALECT] No regional dialects detected in {chapter_id}")
+            except Exception as e:
+                logger.warning(f"[DIALECT] Detection failed: {e}")
+                logger.warning("[DIALECT] Continuing without dialect guidance")
+                failed_steps.append("dialect")
+        # === END DIALECT DETECTION ===
+
+        source_content_only, _ = self._split_source_title(source_text)
+
+        # === Kanji Disambiguation (Sino-Vietnamese Vector Search) ===
+        # Extract kanji compounds and query vector store for Vietnamese guidance
+        # Now with Context-Aware Disambiguation using surrounding sentences
+        sino_vn_guidance = None
+        if self.target_language in ['vi', 'vn']:  # Only for Vietnamese translations
+            try:
+                from modules.kanji_extractor import extract_unique_compounds
+                from modules.guidance_service import SINO_VN, get_guidance_service
+                
+                logger.debug(f"[KANJI] Extracting kanji compounds for Sino-Vietnamese lookup...")
+                
+                # Extract top 30 most frequent kanji compounds (2-4 characters)
+                kanji_terms = extract_unique_compounds(
+                    source_content_only, 
+                    min_length=2, 
+                    max_length=4,
+                    top_n=30
+                )
+                
+                if kanji_terms:
+                    logger.debug(f"[KANJI] Found {len(kanji_terms)} kanji compounds: {kanji_terms[:5]}...")
+                    
+                    # Extract first 3 sentences as context hint
+                    sentences = re.split(r'[。！？\n]', source_content_only)
+                    context_sentences = [s.strip() for s in sentences[:5] if s.strip()]
+                    context_hint = '。'.join(context_sentences[:3])
+                    
+                    
+                    # Query the warm Sino-VN store for disambiguation guidance
+                    # Now with CONTEXT-AWARE DISAMBIGUATION
+                    sino_vn_guidance = get_guidance_service().get_bulk_guidance(
+                        SINO_VN,
+                        terms=kanji_terms,
+                        genre=self.book_genre,  # v2: extracted from manifest
+                        max_per_term=2,
+                        min_confidence=0.68,
+                        context=context_hint,  # Current chapter context
+                        use_external_dict=True  # Enable external dictionary fallback
+                    )
+                    
+                    high_conf = len(sino_vn_guidance.get("high_confidence", []))
+                    medium_conf = len(sino_vn_guidance.get("medium_confidence", []))
+                    external_count = len(sino_vn_guidance.get("external_dict", []))
+                    lookup_stats = sino_vn_guidance.get("lookup_stats", {})
+                    
+                    logger.info(f"[KANJI] Sino-Vietnamese guidance: {high_conf} high, {medium_conf} medium, {external_count} external")
+                    logger.debug(f"[KANJI] Lookup stats: direct={lookup_stats.get('direct_hits', 0)}, vector={lookup_stats.get('vector_hits', 0)}, external={lookup_stats.get('external_hits', 0)}")
+                else:
+                    logger.debug(f"[KANJI] No kanji compounds found in chapter")
+                    
+            except Exception as e:
+                logger.warning(f"[KANJI] Sino-Vietnamese lookup failed: {e}")
+                logger.warning("[KANJI] Continuing without kanji disambiguation")
+                failed_steps.append("sino_vn")
+                sino_vn_guidance = None
+
+        # === English Grammar Pattern Detection (Vector Search) ===
+        # Detect Japanese grammar patterns and query vector store for natural English equivalents
+        en_pattern_guidance = None
+        if self.target_language == 'en':  # English translations only
+            try:
+                from modules.grammar_pattern_detector import detect_grammar_patterns
+                from modules.guidance_service import EN_PATTERNS, get_guidance_service
+
+                logger.debug(f"[GRAMMAR] Detecting Japanese patterns for natural English phrasing...")
+
+                # Detect grammar patterns (けど, が, も, etc.)
+                detected_patterns = detect_grammar_patterns(
+                    source_content_only,
+                    top_n=15,  # Top 15 most relevant patterns
+                    include_line_numbers=True
+                )
+
+                if detected_patterns:
+                    logger.debug(f"[GRAMMAR] Found {len(detected_patterns)} patterns")
+
+                    # Extract first 5 sentences as context hint
+                    sentences = re.split(r'[。！？\n]', source_content_only)
+                    context_sentences = [s.strip() for s in sentences[:5] if s.strip()]
+                    context_hint = '。'.join(context_sentences[:3])
+
+
+                    # Query the warm English store for natural English equivalents
+                    en_pattern_guidance = get_guidance_service().get_bulk_guidance(
+                        EN_PATTERNS,
+                        patterns=detected_patterns,
+                        context=context_hint,
+                        max_per_pattern=2,
+                        min_confidence=0.75
+                    )
+
+                    high_conf = len(en_pattern_guidance.get("high_confidence", []))
+                    medium_conf = len(en_pattern_guidance.get("medium_confidence", []))
+                    lookup_stats = en_pattern_guidance.get("lookup_stats", {})
+
+                    logger.info(f"[GRAMMAR] English pattern guidance: {high_conf} high, {medium_conf} medium")
+                    logger.debug(f"[GRAMMAR] Lookup stats: patterns_queried={lookup_stats.get('patterns_queried', 0)}")
+                else:
+                    logger.debug(f"[GRAMMAR] No grammar patterns detected in chapter")
+
+            except Exception as e:
+                logger.warning(f"[GRAMMAR] Pattern detection failed: {e}")
+                logger.warning("[GRAMMAR] Continuing without grammar pattern guidance")
+                failed_steps.append("en_patterns")
+                en_pattern_guidance = None
+
+        # === Vietnamese Grammar Pattern Detection (Vector Search) ===
+        # Detect Japanese grammar patterns and query vector store for natural Vietnamese equivalents
+        vn_pattern_guidance = None
+        if self.target_language == 'vn':  # Vietnamese translations only
+            try:
+                from modules.grammar_pattern_detector import detect_grammar_patterns
+                from modules.guidance_service import VN_PATTERNS, get_guidance_service
+
+                logger.debug(f"[VN-GRAMMAR] Detecting Japanese patterns for natural Vietnamese phrasing...")
+
+                # Detect grammar patterns (same JP detector, VN-specific store)
+                detected_patterns = detect_grammar_patterns(
+                    source_content_only,
+                    top_n=15,
+                    include_line_numbers=True
+                )
+
+                if detected_patterns:
+                    logger.debug(f"[VN-GRAMMAR] Found {len(detected_patterns)} patterns")
+
+                    # Extract first 5 sentences as context hint
+                    sentences = re.split(r'[。！？\n]', source_content_only)
+                    context_sentences = [s.strip() for s in sentences[:5] if s.strip()]
+                    context_hint = '。'.join(context_sentences[:3])
+
+                    # Query the warm VN store for natural Vietnamese equivalents
+                    vn_pattern_guidance = get_guidance_service().get_bulk_guidance(
+                        VN_PATTERNS,
+                        patterns=detected_patterns,
+                        context=context_hint,
+                        max_per_pattern=2,
+                        min_confidence=0.70
+                    )
+
+                    high_conf = len(vn_pattern_guidance.get("high_confidence", []))
+                    medium_conf = len(vn_pattern_guidance.get("medium_confidence", []))
+                    lookup_stats = vn_pattern_guidance.get("lookup_stats", {})
+
+                    logger.info(f"[VN-GRAMMAR] Vietnamese pattern guidance: {high_conf} high, {medium_conf} medium")
+                    logger.debug(f"[VN-GRAMMAR] Lookup stats: patterns_queried={lookup_stats.get('patterns_queried', 0)}, neg_penalties={lookup_stats.get('neg_penalties_applied', 0)}")
+                else:
+                    logger.debug(f"[VN-GRAMMAR] No grammar patterns detected in chapter")
+
+            except Exception as e:
+                logger.warning(f"[VN-GRAMMAR] Pattern detection failed: {e}")
+                logger.warning("[VN-GRAMMAR] Continuing without Vietnamese grammar pattern guidance")
+                failed_steps.append("vn_patterns")
+                vn_pattern_guidance = None
+
+        # === MULTIMODAL VISUAL CONTEXT ===
+        visual_guidance = None
+        illustration_ids = []  # Track for thought logging
+        if self.enable_multimodal and self.visual_cache:
+            try:
+                from modules.multimodal.segment_classifier import extract_all_illustration_ids
+                from modules.multimodal.prompt_injector import build_chapter_visual_guidance
+
+                illustration_ids = extract_all_illustration_ids(source_content_only)
+                if illustration_ids:
+                    cache_manifest = self.visual_cache.get_manifest()
+                    if not isinstance(cache_manifest, dict):
+                        cache_manifest = {}
+                    visual_guidance = build_chapter_visual_guidance(
+                        illustration_ids, self.visual_cache,
+                        manifest=cache_manifest
+                    )
+                    if visual_guidance:
+                        logger.info(f"[MULTIMODAL] Injecting visual context for {len(illustration_ids)} illustration(s)")
+                    else:
+                        logger.debug(f"[MULTIMODAL] No cached context found for illustrations: {illustration_ids}")
+                else:
+                    logger.debug(f"[MULTIMODAL] No illustration markers found in {chapter_id}")
+            except Exception as e:
+                logger.warning(f"[MULTIMODAL] Visual context extraction failed: {e}")
+                logger.warning("[MULTIMODAL] Continuing without visual context")
+                failed_steps.append("visual")
+        # === END MULTIMODAL ===
+
+        return {
+            "sections": self._format_guidance_sections(
+                chapter_id,
+                sino_vn_guidance=sino_vn_guidance,
+                gap_flags=gap_flags,
+                dialect_guidance=dialect_guidance,
+                en_pattern_guidance=en_pattern_guidance,
+                vn_pattern_guidance=vn_pattern_guidance,
+                visual_guidance=visual_guidance,
+                scene_plan=scene_plan,
+            ),
+            "illustration_ids": illustration_ids,
+            "failed_steps": failed_steps,
+        }
+
+    def _generate_streaming(
+        self,
+        chapter_id: str,
+        source_text: str,
+        user_prompt: str,
+        system_instruction: Optional[str],
+        model_name: str,
+        cached_content: Optional[str],
+    ) -> GeminiResponse:
+        """
+        Stream a chapter translation with paragraph checkpoints.
+
+        Complete paragraphs are written to temp/stream/{chapter_id}.partial.md
+        as they arrive. Errors before a stream produces any output are
+        retried with GeminiClient.generate's backoff policy. A stream that
+        fails midway or stops early (e.g. MAX_TOKENS) is resumed from the
+        last complete paragraph with a continuation prompt, up to
+        `stream_max_resumes` times; a checkpoint left by an earlier run of
+        the same source and model is picked up the same way. The checkpoint
+        is removed once the chapter finishes.
+        """
+        key_source = "\0".join([source_text, model_name, self.target_language])
+        checkpoint = StreamCheckpoint(
+            self.context_manager.work_dir / "temp" / "stream" / f"{chapter_id}.partial.md",
+            key=hashlib.sha256(key_source.encode("utf-8")).hexdigest(),
+        )
+        if checkpoint.load():
+            logger.info(
+                f"[STREAM] {chapter_id}: resuming from checkpoint "
+                f"({checkpoint.paragraphs} paragraphs already translated)"
+            )
+            emit_event("chapter_progress", chapter=chapter_id, stage="resumed", paragraphs=checkpoint.paragraphs)
+
+        started = time.time()
+        first_output: List[float] = []
+        progress_mark = [checkpoint.paragraphs // self.stream_progress_every]
+        attempt_output = [False]
+
+        def on_text(text: str) -> None:
+            attempt_output[0] = True
+            if not first_output:
+                first_output.append(time.time() - started)
+                logger.info(f"[STREAM] {chapter_id}: first output after {first_output[0]:.1f}s")
+                emit_event(
+                    "chapter_progress",
+                    chapter=chapter_id,
+                    stage="first_output",
+                    seconds=round(first_output[0], 3),
+                )
+            if checkpoint.feed(text):
+                mark = checkpoint.paragraphs // self.stream_progress_every
+                if mark > progress_mark[0]:
+                    progress_mark[0] = mark
+                    logger.info(f"[STREAM] {chapter_id}: {checkpoint.paragraphs} paragraphs checkpointed")
+                    emit_event(
+                        "chapter_progress",
+                        chapter=chapter_id,
+                        stage="checkpoint",
+                        paragraphs=checkpoint.paragraphs,
+                    )
+
+        # Failures before any output: same retries as generate(), not a resume
+        @retry_api_errors(giveup=lambda e: attempt_output[0])
+        def open_stream(prompt: str, model: str) -> GeminiResponse:
+            attempt_output[0] = False
+            return self.client.generate_stream(
+                prompt=prompt,
+                system_instruction=system_instruction,
+                temperature=self.gen_params.get("temperature", 0.7),
+                max_output_tokens=self.gen_params.get("max_output_tokens", 65536),
+                model=model,
+                cached_content=cached_content,
+                on_text=on_text,
+            )
+
+        input_tokens = output_tokens = cached_tokens = 0
+        thinking_parts: List[str] = []
+        finish_reason = "UNKNOWN"
+        for attempt in range(self.stream_max_resumes + 1):
+            prompt = user_prompt
+            if checkpoint.committed:
+                checkpoint.begin_resume()
+                prompt = self._build_resume_prompt(user_prompt, checkpoint.committed)
+            try:
+                response = open_stream(prompt, model=model_name)
+            except Exception as e:
+                checkpoint.discard_pending()
+                if not attempt_output[0] or attempt >= self.stream_max_resumes or is_fatal_api_error(e):
+                    raise
+                logger.warning(
+                    f"[STREAM] {chapter_id}: stream failed ({e}); resuming after "
+                    f"{checkpoint.paragraphs} checkpointed paragraphs"
+                )
+                time.sleep(min(2 ** attempt, 30))
+                continue
+
+            input_tokens += response.input_tokens
+            output_tokens += response.output_tokens
+            cached_tokens += response.cached_tokens
+            if response.thinking_content:
+                thinking_parts.append(response.thinking_content)
+            finish_reason = response.finish_reason
+
+            upper_reason = finish_reason.upper()
+            if any(marker in upper_reason for marker in ("SAFETY", "PROHIBITED", "BLOCK")):
+                # Leave the checkpoint for inspection; report the block like a non-streamed call.
+                return GeminiResponse(
+                    content="",
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    finish_reason=finish_reason,
+                    model=response.model,
+                    cached_tokens=cached_tokens,
+                )
+            if finish_reason == "STOP" or attempt >= self.stream_max_resumes:
+                break
+            checkpoint.discard_pending()
+            logger.warning(
+                f"[STREAM] {chapter_id}: stream ended early (finish_reason={finish_reason}); "
+                f"resuming after {checkpoint.paragraphs} checkpointed paragraphs"
+            )
+
+        content = checkpoint.text()
+        if finish_reason != "STOP":
+            logger.warning(
+                f"[STREAM] {chapter_id}: keeping truncated output after "
+                f"{self.stream_max_resumes} resume(s) (finish_reason={finish_reason})"
+            )
+        logger.info(
+            f"[STREAM] {chapter_id}: stream done in {time.time() - started:.1f}s "
+            f"(first output {first_output[0] if first_output else 0.0:.1f}s)"
+        )
+        checkpoint.clear()
+        return GeminiResponse(
+            content=content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            finish_reason=finish_reason,
+            model=model_name,
+            cached_tokens=cached_tokens,
+            thinking_content="\n\n".join(thinking_parts) if thinking_parts else None,
+        )
+
+    def _build_resume_prompt(self, user_prompt: str, committed: str) -> str:
+        """Original prompt plus an instruction to continue after the last checkpointed paragraphs."""
+        tail = resume_tail(committed, self.stream_resume_tail_chars) or ""
+        return (
+            f"{user_prompt}\n\n"
+            "<!-- RESUME: PARTIAL TRANSLATION ALREADY SAVED -->\n"
+            "Your previous response for this chapter was cut off. Everything up to and including "
+            "the paragraphs below is already translated and saved. Continue the translation from "
+            "the next source paragraph after them, in the same voice and formatting. Do not repeat "
+            "these paragraphs, do not restart the chapter and do not output the chapter title again.\n\n"
+            f"LAST SAVED PARAGRAPHS:\n{tail}\n"
+        )
+
     def _translate_chapter_in_chunks(
         self,
         source_path: Path,
@@ -1122,15 +1460,30 @@ This document contains the internal reasoning process that Gemini used while tra
         model_name: Optional[str],
         cached_content: Optional[str],
         scene_plan: Optional[Dict[str, Any]] = None,
+        adaptive: bool = False,
     ) -> TranslationResult:
-        """Translate massive chapters via resumable chunk JSON flow."""
+        """
+        Translate massive chapters via resumable chunk JSON flow.
+
+        adaptive=True splits on scene breaks by estimated source tokens and
+        translates pending chunks concurrently, each with the tail of the
+        previous chunk's source as context. Otherwise chunks run serially and
+        stop at the first failure.
+        """
         try:
             source_content_only = source_text
             jp_title_match = re.match(r'^#\s*(.*?)\n+', source_text)
             if jp_title_match:
                 source_content_only = source_text[jp_title_match.end():].strip()
 
-            chunks = self._split_large_chapter(source_content_only)
+            if adaptive:
+                chunks = plan_chunks(
+                    source_content_only,
+                    self.adaptive_target_chunk_tokens,
+                    self.chunk_context_tail_chars,
+                )
+            else:
+                chunks = self._split_large_chapter(source_content_only)
             if not chunks:
                 return TranslationResult(False, output_path, error="Chunk splitter produced no chunks")
 
@@ -1138,42 +1491,71 @@ This document contains the internal reasoning process that Gemini used while tra
             temp_dir = self.context_manager.work_dir / "temp" / "chunks"
             temp_dir.mkdir(parents=True, exist_ok=True)
 
+            # Chunk JSONs from an earlier run with a different split cannot be merged.
+            for stale in temp_dir.glob(f"{chapter_id}_chunk_*.json"):
+                payload = self._load_chunk_payload(stale)
+                if not payload or payload.get("total_chunks") != total_chunks:
+                    stale.unlink(missing_ok=True)
+
             total_input_tokens = 0
             total_output_tokens = 0
+            pending: List[ChapterJob] = []
 
             for idx, chunk in enumerate(chunks, start=1):
                 chunk_json_path = temp_dir / f"{chapter_id}_chunk_{idx:03d}.json"
                 chunk_payload = self._load_chunk_payload(chunk_json_path)
-                if chunk_payload and chunk_payload.get("content"):
+                if (
+                    chunk_payload
+                    and chunk_payload.get("content")
+                    and chunk_payload.get("source_line_range") == [chunk["line_start"], chunk["line_end"]]
+                ):
                     logger.info(f"[CHUNK] Reusing existing chunk JSON {idx}/{total_chunks} for {chapter_id}")
                     total_input_tokens += int(chunk_payload.get("tokens_in", 0))
                     total_output_tokens += int(chunk_payload.get("tokens_out", 0))
                     continue
+                pending.append(ChapterJob(
+                    index=idx,
+                    chapter_id=f"{chapter_id}_chunk_{idx:03d}",
+                    payload={"chunk": chunk, "json_path": chunk_json_path},
+                ))
 
-                chunk_source_path = temp_dir / f"{chapter_id}_chunk_{idx:03d}_JP.md"
-                chunk_output_path = temp_dir / f"{chapter_id}_chunk_{idx:03d}_EN.md"
+            def translate_chunk(job: ChapterJob) -> TranslationResult:
+                chunk = job.payload["chunk"]
+                chunk_source_path = temp_dir / f"{job.chapter_id}_JP.md"
+                chunk_output_path = temp_dir / f"{job.chapter_id}_EN.md"
                 chunk_source_path.write_text(str(chunk["content"]).strip() + "\n", encoding="utf-8")
+                job.payload["paths"] = (chunk_source_path, chunk_output_path)
 
-                chunk_result = self.translate_chapter(
+                return self.translate_chapter(
                     source_path=chunk_source_path,
                     output_path=chunk_output_path,
-                    chapter_id=f"{chapter_id}_chunk_{idx:03d}",
+                    chapter_id=job.chapter_id,
                     en_title=None,
                     model_name=model_name,
                     cached_content=cached_content,
                     volume_cache=None,
                     scene_plan=None,  # Chunk-level ranges differ from full chapter scene plan.
                     allow_chunking=False,
+                    preceding_source=chunk.get("context_before") or None,
                 )
+
+            failures: List[str] = []
+
+            def record_chunk(job: ChapterJob, chunk_result: Any) -> None:
+                nonlocal total_input_tokens, total_output_tokens
+                idx = job.index
+                if isinstance(chunk_result, Exception):
+                    chunk_result = TranslationResult(False, output_path, error=str(chunk_result))
+                total_input_tokens += chunk_result.input_tokens
+                total_output_tokens += chunk_result.output_tokens
                 if not chunk_result.success:
-                    return TranslationResult(
-                        False,
-                        output_path,
-                        input_tokens=total_input_tokens + chunk_result.input_tokens,
-                        output_tokens=total_output_tokens + chunk_result.output_tokens,
-                        error=f"Chunk {idx}/{total_chunks} failed: {chunk_result.error}",
-                    )
+                    failures.append(f"Chunk {idx}/{total_chunks} failed: {chunk_result.error}")
+                    if not adaptive:
+                        scheduler.stop()
+                    return
 
+                chunk = job.payload["chunk"]
+                chunk_source_path, chunk_output_path = job.payload["paths"]
                 translated_chunk = chunk_output_path.read_text(encoding="utf-8").strip()
                 chunk_payload = {
                     "chapter_id": chapter_id,
@@ -1188,18 +1570,36 @@ This document contains the internal reasoning process that Gemini used while tra
                     "tokens_out": chunk_result.output_tokens,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
-                with chunk_json_path.open("w", encoding="utf-8") as f:
+                with job.payload["json_path"].open("w", encoding="utf-8") as f:
                     json.dump(chunk_payload, f, ensure_ascii=False, indent=2)
 
-                total_input_tokens += chunk_result.input_tokens
-                total_output_tokens += chunk_result.output_tokens
-
                 try:
                     chunk_source_path.unlink()
                     chunk_output_path.unlink()
                 except Exception:
                     pass
 
+            max_workers = self.adaptive_max_parallel_chunks if adaptive else 1
+            if max_workers > 1 and getattr(self.client, "_rate_limiter", None) is None:
+                logger.info("[CHUNK] Shared rate limiter disabled; translating chunks serially")
+                max_workers = 1
+            scheduler = ChapterScheduler(max_workers=min(max_workers, max(1, len(pending))))
+            if pending:
+                logger.info(
+                    f"[CHUNK] Translating {len(pending)}/{total_chunks} chunk(s) of {chapter_id} "
+                    f"with {scheduler.max_workers} worker(s)"
+                )
+                scheduler.run(pending, translate_chunk, record_chunk)
+
+            if failures:
+                return TranslationResult(
+                    False,
+                    output_path,
+                    input_tokens=total_input_tokens,
+                    output_tokens=total_output_tokens,
+                    error="; ".join(failures),
+                )
+
             merger = ChunkMerger(self.context_manager.work_dir)
             merge_result = merger.merge_chapter(chapter_id, output_filename=output_path.name)
             merged_content = merge_result.output_path.read_text(encoding="utf-8")
@@ -1604,12 +2004,7 @@ This document contains the internal reasoning process that Gemini used while tra
         Files are optional and translation remains functional when missing.
         """
         context_dir = self.context_manager.work_dir / ".context"
-        cache_files = {
-            "character_registry": context_dir / "character_registry.json",
-            "cultural_glossary": context_dir / "cultural_glossary.json",
-            "timeline_map": context_dir / "timeline_map.json",
-            "idiom_transcreation_cache": context_dir / "idiom_transcreation_cache.json",
-        }
+        cache_files = {key: context_dir / name for key, name in PHASE155_CACHE_FILES.items()}
 
         payload: Dict[str, Any] = {"_idiom_by_chapter": {}}
         loaded = 0
@@ -1852,8 +2247,22 @@ This document contains the internal reasoning process that Gemini used while tra
         visual_guidance: Optional[str] = None,  # Multimodal visual context
         scene_plan: Optional[Dict[str, Any]] = None,  # Stage 1 scene planner output
         volume_context: Optional[str] = None,  # Phase 1.2 - Volume-level context
+        preceding_source: Optional[str] = None,  # Chunked translation - previous chunk's source tail
+        guidance_sections: Optional[Dict[str, str]] = None,  # Prepared bundle; replaces the guidance kwargs
     ) -> str:
         """Construct the user message part of the prompt."""
+        if guidance_sections is None:
+            guidance_sections = self._format_guidance_sections(
+                chapter_id,
+                sino_vn_guidance=sino_vn_guidance,
+                gap_flags=gap_flags,
+                dialect_guidance=dialect_guidance,
+                en_pattern_guidance=en_pattern_guidance,
+                vn_pattern_guidance=vn_pattern_guidance,
+                visual_guidance=visual_guidance,
+                scene_plan=scene_plan,
+            )
+
         # Build base prompt
         base_prompt = self.prompt_loader.build_translation_prompt(
             source_text=source_text,
@@ -1864,37 +2273,32 @@ This document contains the internal reasoning process that Gemini used while tra
         )
         
         # Inject Sino-Vietnamese guidance if available (Vietnamese translations only)
-        if sino_vn_guidance and sino_vn_guidance.get("high_confidence"):
-            guidance_section = self._format_sino_vietnamese_guidance(sino_vn_guidance)
+        if guidance_sections.get("sino_vn"):
             # Insert guidance before the source text
-            base_prompt = f"{base_prompt}\n\n{guidance_section}"
+            base_prompt = f"{base_prompt}\n\n{guidance_sections['sino_vn']}"
         
         # Inject Gap Analysis guidance if available (Week 2-3 integration)
-        if gap_flags:
-            gap_guidance = self._format_gap_guidance(gap_flags)
-            if gap_guidance:
-                base_prompt = f"{base_prompt}\n\n{gap_guidance}"
+        if guidance_sections.get("gap"):
+            base_prompt = f"{base_prompt}\n\n{guidance_sections['gap']}"
         
         # Inject Dialect Detection guidance if available (v1.0 - 2026-02-01)
-        if dialect_guidance:
-            base_prompt = f"{base_prompt}\n\n{dialect_guidance}"
+        if guidance_sections.get("dialect"):
+            base_prompt = f"{base_prompt}\n\n{guidance_sections['dialect']}"
 
         # Inject English grammar pattern guidance if available (English translations only)
-        if en_pattern_guidance and en_pattern_guidance.get("high_confidence"):
-            pattern_section = self._format_english_pattern_guidance(en_pattern_guidance)
+        if guidance_sections.get("en_patterns"):
             # Insert guidance before the source text
-            base_prompt = f"{base_prompt}\n\n{pattern_section}"
+            base_prompt = f"{base_prompt}\n\n{guidance_sections['en_patterns']}"
 
         # Inject Vietnamese grammar pattern guidance if available (Vietnamese translations only)
-        if vn_pattern_guidance and vn_pattern_guidance.get("high_confidence"):
-            vn_pattern_section = self._format_vietnamese_pattern_guidance(vn_pattern_guidance)
+        if guidance_sections.get("vn_patterns"):
             # Insert guidance before the source text
-            base_prompt = f"{base_prompt}\n\n{vn_pattern_section}"
+            base_prompt = f"{base_prompt}\n\n{guidance_sections['vn_patterns']}"
 
         # Inject multimodal visual context if available
-        if visual_guidance:
+        if guidance_sections.get("visual"):
             from modules.multimodal.prompt_injector import MULTIMODAL_STRICT_SUFFIX
-            base_prompt = f"{base_prompt}\n\n{visual_guidance}\n{MULTIMODAL_STRICT_SUFFIX}"
+            base_prompt = f"{base_prompt}\n\n{guidance_sections['visual']}\n{MULTIMODAL_STRICT_SUFFIX}"
 
         # === VOLUME CONTEXT INJECTION (Phase 1.2) ===
         # Per Gemini best practices: "context before query"
@@ -1906,7 +2310,7 @@ This document contains the internal reasoning process that Gemini used while tra
         # === END VOLUME CONTEXT ===
 
         # Inject Stage 2 scene/rhythm scaffold before source text section.
-        stage2_scene_guidance = self._format_stage2_scene_guidance(scene_plan)
+        stage2_scene_guidance = guidance_sections.get("stage2_scene")
         if stage2_scene_guidance:
             marker = "<!-- SOURCE TEXT TO TRANSLATE -->"
             if marker in base_prompt:
@@ -1919,7 +2323,7 @@ This document contains the internal reasoning process that Gemini used while tra
                 base_prompt = f"{stage2_scene_guidance}\n\n{base_prompt}"
 
         # Inject Phase 1.55 context offload co-processor guidance.
-        p155_context_guidance = self._format_phase155_context_guidance(chapter_id, scene_plan)
+        p155_context_guidance = guidance_sections.get("phase155")
         if p155_context_guidance:
             marker = "<!-- SOURCE TEXT TO TRANSLATE -->"
             if marker in base_prompt:
@@ -1931,6 +2335,21 @@ This document contains the internal reasoning process that Gemini used while tra
             else:
                 base_prompt = f"{p155_context_guidance}\n\n{base_prompt}"
 
+        # Inject preceding source for chunked translation (context only, already translated elsewhere).
+        if preceding_source:
+            preceding_block = (
+                "<!-- PRECEDING SOURCE (CONTEXT ONLY) -->\n"
+                "The Japanese text below comes immediately before the passage to translate and is "
+                "translated separately. Use it only for continuity (speakers, tense, scene state). "
+                "Do NOT translate or repeat it.\n\n"
+                f"{preceding_source}"
+            )
+            marker = "<!-- SOURCE TEXT TO TRANSLATE -->"
+            if marker in base_prompt:
+                base_prompt = base_prompt.replace(marker, f"{preceding_block}\n\n{marker}", 1)
+            else:
+                base_prompt = f"{base_prompt}\n\n{preceding_block}"
+
         # Inject RTAS character voice settings (English translations only)
         rtas_guidance = self._format_rtas_guidance()
         if rtas_guidance:
@@ -1938,6 +2357,33 @@ This document contains the internal reasoning process that Gemini used while tra
 
         return base_prompt
     
+    def _format_guidance_sections(
+        self,
+        chapter_id: str,
+        sino_vn_guidance: Optional[Dict] = None,
+        gap_flags: Optional[Dict] = None,
+        dialect_guidance: Optional[str] = None,
+        en_pattern_guidance: Optional[Dict] = None,
+        vn_pattern_guidance: Optional[Dict] = None,
+        visual_guidance: Optional[str] = None,
+        scene_plan: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, str]:
+        """Formatted guidance blocks for _build_user_prompt ("" when absent)."""
+        sections = dict.fromkeys(SECTION_NAMES, "")
+        if sino_vn_guidance and sino_vn_guidance.get("high_confidence"):
+            sections["sino_vn"] = self._format_sino_vietnamese_guidance(sino_vn_guidance)
+        if gap_flags:
+            sections["gap"] = self._format_gap_guidance(gap_flags)
+        sections["dialect"] = dialect_guidance or ""
+        if en_pattern_guidance and en_pattern_guidance.get("high_confidence"):
+            sections["en_patterns"] = self._format_english_pattern_guidance(en_pattern_guidance)
+        if vn_pattern_guidance and vn_pattern_guidance.get("high_confidence"):
+            sections["vn_patterns"] = self._format_vietnamese_pattern_guidance(vn_pattern_guidance)
+        sections["visual"] = visual_guidance or ""
+        sections["stage2_scene"] = self._format_stage2_scene_guidance(scene_plan) or ""
+        sections["phase155"] = self._format_phase155_context_guidance(chapter_id, scene_plan) or ""
+        return sections
+
     def _format_sino_vietnamese_guidance(self, guidance: Dict[str, Any]) -> str:
         """Format Sino-Vietnamese guidance for prompt injection."""
         lines = ["## Sino-Vietnamese Term Guidance", ""]
@@ -0,0 +1,134 @@
+"""
+Concurrent Chapter Scheduler.
+
+Dispatches chapter translations to a bounded thread pool while keeping all
+bookkeeping (manifest, translation log, context summaries) on the calling
+thread. Chapters share only read-only state (the volume cache), so the pool
+is limited by API quota rather than by data dependencies - except for the
+T3 lookback context, which the scheduler can honour via `continuity_policy`.
+
+Continuity policies:
+    relaxed - dispatch in manifest order without waiting. Each chapter sees
+              the summaries of earlier chapters that are already complete
+              (from this run or a previous one); the full-volume JP cache
+              still carries source continuity.
+    strict  - a chapter waits until the `lookback` chapters before it in this
+              run have completed, so T3 summaries are always present. Only
+              chapters whose predecessors are already done (e.g. re-running a
+              handful of failed chapters) run in parallel.
+"""
+
+import contextvars
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+CONTINUITY_POLICIES = ("relaxed", "strict")
+
+
+@dataclass
+class ChapterJob:
+    """One unit of scheduled work."""
+    index: int  # Position in the run's target chapter list
+    chapter_id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+class ChapterScheduler:
+    """
+    Bounded-concurrency dispatcher for chapter jobs.
+
+    `worker(job)` runs on a pool thread. `on_complete(job, outcome)` runs on
+    the thread that called `run()`, one job at a time and in completion
+    order, so it may write shared files without extra locking. `outcome` is
+    the worker's return value, or the exception it raised.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        lookback: int = 0,
+        continuity_policy: str = "relaxed",
+    ):
+        if continuity_policy not in CONTINUITY_POLICIES:
+            raise ValueError(
+                f"Unknown continuity_policy {continuity_policy!r} "
+                f"(expected one of {', '.join(CONTINUITY_POLICIES)})"
+            )
+        self.max_workers = max(1, int(max_workers))
+        self.lookback = max(0, int(lookback))
+        self.continuity_policy = continuity_policy
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Stop dispatching new jobs; in-flight jobs still complete."""
+        self._stop.set()
+
+    def _dependencies(self, jobs: Sequence[ChapterJob]) -> Dict[int, Set[int]]:
+        """Map job.index -> indices of in-run jobs it must wait for."""
+        deps: Dict[int, Set[int]] = {job.index: set() for job in jobs}
+        if self.continuity_policy != "strict" or self.lookback == 0:
+            return deps
+        in_run = {job.index for job in jobs}
+        for job in jobs:
+            deps[job.index] = {
+                idx for idx in range(job.index - self.lookback, job.index)
+                if idx in in_run
+            }
+        return deps
+
+    def run(
+        self,
+        jobs: Sequence[ChapterJob],
+        worker: Callable[[ChapterJob], Any],
+        on_complete: Callable[[ChapterJob, Any], None],
+    ) -> List[ChapterJob]:
+        """
+        Run all jobs and return the ones that were never dispatched
+        (non-empty only if `stop()` was called).
+        """
+        pending: List[ChapterJob] = sorted(jobs, key=lambda j: j.index)
+        deps = self._dependencies(pending)
+        done: Set[int] = set()
+        in_flight: Dict[Future, ChapterJob] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="chapter",
+        ) as pool:
+            while pending or in_flight:
+                # Fill free slots with ready jobs, earliest chapter first.
+                if not self._stop.is_set():
+                    for job in list(pending):
+                        if len(in_flight) >= self.max_workers:
+                            break
+                        if deps[job.index] <= done:
+                            pending.remove(job)
+                            logger.debug(f"[SCHEDULER] Dispatching {job.chapter_id}")
+                            # Workers inherit the caller's context (event_stream chapter scope)
+                            in_flight[pool.submit(contextvars.copy_context().run, worker, job)] = job
+
+                if not in_flight:
+                    if pending and not self._stop.is_set():
+                        # Unsatisfiable dependencies cannot occur for indices
+                        # within the run, but never spin forever.
+                        logger.error(
+                            f"[SCHEDULER] {len(pending)} job(s) blocked on unmet dependencies"
+                        )
+                    break
+
+                finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in sorted(finished, key=lambda f: in_flight[f].index):
+                    job = in_flight.pop(future)
+                    error = future.exception()
+                    outcome = error if error is not None else future.result()
+                    if error is not None:
+                        logger.error(f"[SCHEDULER] Worker for {job.chapter_id} raised: {error}")
+                    done.add(job.index)
+                    on_complete(job, outcome)
+
+        return pending
@@ -0,0 +1,111 @@
+"""
+Chunk planner for adaptive massive-chapter translation.
+
+Splits a Japanese chapter into chunks of roughly `target_tokens` estimated
+source tokens, preferring scene breaks as boundaries and falling back to
+line (paragraph) boundaries inside scenes that are too large on their own.
+Each chunk carries the tail of the previous chunk's source so chunks can be
+translated concurrently while still seeing what came just before them.
+
+Chunk dicts use the same keys as ChapterProcessor._split_large_chapter plus
+`context_before`, so ChunkMerger and the chunk JSON payloads are unchanged.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+from pipeline.common.token_estimator import get_token_estimator
+from pipeline.translator.scene_break_formatter import SceneBreakFormatter
+
+# Japanese source markers not covered by SceneBreakFormatter (full-width ＊, ◎, mixed runs)
+_JP_SCENE_BREAK = re.compile(r'^[\s　]*[＊*◇◆◎☆★※](?:[\s　]*[＊*◇◆◎☆★※])*[\s　]*$')
+
+
+def estimate_source_tokens(text: str) -> int:
+    """Offline Gemini token estimate for Japanese source text (see token_estimator)."""
+    return get_token_estimator().estimate(text)
+
+
+def is_scene_break_line(line: str) -> bool:
+    return bool(SceneBreakFormatter.SCENE_BREAK_PATTERN.match(line) or _JP_SCENE_BREAK.match(line))
+
+
+def _tail(lines: List[str], max_chars: int) -> str:
+    """Last whole lines of `lines` totalling at most `max_chars` characters."""
+    kept: List[str] = []
+    total = 0
+    for line in reversed(lines):
+        if kept and total + len(line) + 1 > max_chars:
+            break
+        kept.append(line)
+        total += len(line) + 1
+    return "\n".join(reversed(kept)).strip()[-max_chars:] if max_chars > 0 else ""
+
+
+def plan_chunks(source_text: str, target_tokens: int, context_tail_chars: int = 0) -> List[Dict[str, Any]]:
+    """
+    Split `source_text` into translation chunks.
+
+    Args:
+        source_text: Chapter body (without the H1 title)
+        target_tokens: Estimated source tokens per chunk
+        context_tail_chars: Characters of preceding source attached to each chunk
+
+    Returns:
+        List of {content, line_start, line_end, scene_break_before,
+        scene_break_after, context_before}; line numbers are 1-based and
+        inclusive.
+    """
+    lines = source_text.splitlines()
+    if not lines:
+        return []
+
+    # Scenes start at each scene-break line (the break stays with the scene it opens).
+    starts = [0] + [i for i, line in enumerate(lines) if i > 0 and is_scene_break_line(line)]
+    ends = starts[1:] + [len(lines)]
+
+    # Packing units: whole scenes, or single lines of scenes larger than a chunk.
+    # Each unit is (start, end, tokens, tokens of the scene it opens or 0).
+    units: List[Tuple[int, int, int, int]] = []
+    all_line_tokens = [tokens + 1 for tokens in get_token_estimator().estimate_many(lines)]
+    for start, end in zip(starts, ends):
+        line_tokens = all_line_tokens[start:end]
+        scene_tokens = sum(line_tokens)
+        if scene_tokens <= target_tokens:
+            units.append((start, end, scene_tokens, scene_tokens))
+        else:
+            units.extend(
+                (start + i, start + i + 1, tokens, scene_tokens if i == 0 else 0)
+                for i, tokens in enumerate(line_tokens)
+            )
+
+    spans: List[Tuple[int, int]] = []
+    span_start, span_tokens = units[0][0], 0
+    for start, end, tokens, scene_tokens in units:
+        overflow = span_tokens + tokens > target_tokens
+        # Cut at a scene break rather than mid-scene when the chunk is already half full.
+        scene_cut = scene_tokens and span_tokens + scene_tokens > target_tokens and span_tokens * 2 >= target_tokens
+        if span_tokens and (overflow or scene_cut):
+            spans.append((span_start, start))
+            span_start, span_tokens = start, 0
+        span_tokens += tokens
+    spans.append((span_start, len(lines)))
+
+    chunks: List[Dict[str, Any]] = []
+    previous_lines: List[str] = []
+    for start, end in spans:
+        chunk_lines = lines[start:end]
+        content = "\n".join(chunk_lines).strip()
+        if not content:
+            continue
+        non_empty = [line for line in chunk_lines if line.strip()]
+        chunks.append({
+            "content": content,
+            "line_start": start + 1,
+            "line_end": end,
+            "scene_break_before": is_scene_break_line(non_empty[0]),
+            "scene_break_after": is_scene_break_line(non_empty[-1]),
+            "context_before": _tail(previous_lines, context_tail_chars) if chunks else "",
+        })
+        previous_lines = chunk_lines
+    return chunks
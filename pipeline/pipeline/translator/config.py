@@ -130,6 +130,22 @@ def get_rate_limit_config() -> Dict[str, Any]:
     }
 
 
+def get_concurrency_config() -> Dict[str, Any]:
+    """
+    Get concurrent chapter translation settings.
+
+    max_workers: parallel chapter translations (1 = serial, original behavior)
+    continuity_policy: 'relaxed' or 'strict' T3 lookback ordering
+    planner_workers: parallel Stage 1 scene plans (Phase 1.7)
+    """
+    concurrency = get_translation_config().get("concurrency", {})
+    return {
+        "max_workers": max(1, int(concurrency.get("max_workers", 1))),
+        "continuity_policy": concurrency.get("continuity_policy", "relaxed"),
+        "planner_workers": max(1, int(concurrency.get("planner_workers", 1))),
+    }
+
+
 def get_caching_config() -> Dict[str, Any]:
     """Get caching configuration."""
     gemini_conf = get_gemini_config()
@@ -140,6 +156,31 @@ def get_caching_config() -> Dict[str, Any]:
     }
 
 
+def get_prompt_cache_config() -> Dict[str, Any]:
+    """Get on-disk prompt section / system instruction cache settings."""
+    prompt_cache = get_translation_config().get("prompt_cache", {})
+    return {
+        "enabled": prompt_cache.get("enabled", True),
+        "path": prompt_cache.get("path", "cache/prompts"),
+    }
+
+
+def get_prefetch_config() -> Dict[str, Any]:
+    """
+    Get pre-translation guidance prefetch settings.
+
+    lookahead: upcoming chapters whose guidance bundles are built in the background (0 = off)
+    workers: background threads building bundles
+    persist: keep bundles in WORK/<volume>/cache/guidance for re-runs
+    """
+    prefetch = get_translation_config().get("prefetch", {})
+    return {
+        "lookahead": max(0, int(prefetch.get("lookahead", 2))),
+        "workers": max(1, int(prefetch.get("workers", 1))),
+        "persist": bool(prefetch.get("persist", True)),
+    }
+
+
 def is_name_consistency_enabled() -> bool:
     """Check if character name consistency is enforced."""
     config = get_translation_config()
@@ -3,8 +3,10 @@ Context Manager for Translation Continuity.
 Maintains cross-chapter context for consistent translation.
 """
 
+import bisect
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict, field
@@ -61,6 +63,10 @@ class ContextManager:
         self.lookback_chapters = get_lookback_chapters()
         self.enforce_names = is_name_consistency_enabled()
 
+        # Concurrent chapter translation reads context while completed
+        # chapters are being recorded.
+        self._lock = threading.RLock()
+
     def _load_json(self, path: Path, default: Any) -> Any:
         """Load JSON file or return default."""
         if path.exists():
@@ -112,6 +118,10 @@ class ContextManager:
         Returns:
             Formatted context string for injection into translation prompt.
         """
+        with self._lock:
+            return self._build_context_prompt(chapter_id)
+
+    def _build_context_prompt(self, chapter_id: str) -> str:
         parts = []
 
         # 1. Character Name Registry
@@ -159,12 +169,10 @@ class ContextManager:
         # Assumes chapter IDs are sortable (e.g., chapter_01, chapter_02)
         sorted_ids = sorted(self.chapter_summaries.keys())
 
-        # Find position of current chapter
-        try:
-            current_idx = sorted_ids.index(current_chapter_id)
-        except ValueError:
-            # Current chapter not in summaries yet, use all previous
-            current_idx = len(sorted_ids)
+        # Find position of current chapter. Only chapters sorting before it
+        # count as "previous" - with concurrent translation, later chapters
+        # may already have summaries when this one is dispatched.
+        current_idx = bisect.bisect_left(sorted_ids, current_chapter_id)
 
         # Get previous N chapters
         start_idx = max(0, current_idx - self.lookback_chapters)
@@ -201,19 +209,20 @@ class ContextManager:
             metadata=metadata or {}
         )
 
-        self.chapter_summaries[chapter_id] = context
-        self._save_chapter_summaries()
+        with self._lock:
+            self.chapter_summaries[chapter_id] = context
+            self._save_chapter_summaries()
 
-        # Update global registries if new entries provided
-        if characters:
-            for char in characters:
-                if char not in self.name_registry:
-                    # Character without explicit translation - store as-is
-                    logger.debug(f"New character noted: {char}")
+            # Update global registries if new entries provided
+            if characters:
+                for char in characters:
+                    if char not in self.name_registry:
+                        # Character without explicit translation - store as-is
+                        logger.debug(f"New character noted: {char}")
 
-        if terms:
-            self.glossary.update(terms)
-            self._save_json(self.glossary_path, self.glossary)
+            if terms:
+                self.glossary.update(terms)
+                self._save_json(self.glossary_path, self.glossary)
 
         logger.debug(f"Added context for {chapter_id}")
 
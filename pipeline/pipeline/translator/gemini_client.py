@@ -9,7 +9,8 @@ import re
 import hashlib
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-from pipeline.common.genai_factory import create_genai_client, resolve_api_key, resolve_genai_backend
+from pipeline.common.genai_factory import get_shared_genai_client, resolve_api_key, resolve_genai_backend
+from pipeline.common.rate_limiter import get_rate_limiter, is_rate_limit_error
 
 from .config import (
     get_model_name,
@@ -65,6 +66,7 @@ class GeminiClient:
         backend: Optional[str] = None,
         project: Optional[str] = None,
         location: Optional[str] = None,
+        priority: str = "translation",
     ):
         """
         Initialize Gemini client.
@@ -72,6 +74,7 @@ class GeminiClient:
         Args:
             api_key: API key override. If not provided, resolves GOOGLE_API_KEY
                     then GEMINI_API_KEY (legacy fallback).
+            priority: Rate-limit class for the shared limiter (translation, qc, ...).
         """
         self.backend = resolve_genai_backend(backend)
         try:
@@ -90,6 +93,8 @@ class GeminiClient:
         # Rate limiting state
         self._request_timestamps: List[float] = []
         self._last_request_time: float = 0
+        self.priority = priority
+        self._rate_limiter = get_rate_limiter()  # Shared with pipeline.common.gemini_client
         
         # Thinking mode configuration
         self.thinking_mode_config = self._load_thinking_config()
@@ -104,7 +109,7 @@ class GeminiClient:
         try:
             from google.genai import types
 
-            self._client = create_genai_client(
+            self._client = get_shared_genai_client(
                 api_key=self.api_key,
                 backend=self.backend,
                 project=self._project,
@@ -178,8 +183,12 @@ class GeminiClient:
 
         return settings
 
-    def _wait_for_rate_limit(self):
+    def _wait_for_rate_limit(self, estimated_tokens: int = 0):
         """Wait if necessary to respect rate limits."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self.model_name, tokens=estimated_tokens, priority=self.priority)
+            return
+
         rpm = self.rate_limit_config['requests_per_minute']
         now = time.time()
 
@@ -227,11 +236,12 @@ class GeminiClient:
         """
         from google.genai import types
 
-        self._wait_for_rate_limit()
-
+        estimated_tokens = (len(prompt) + len(system_instruction or "")) // 4
         max_retries = self.rate_limit_config['retry_attempts']
 
         for attempt in range(max_retries):
+            # Every attempt (including retries) draws from the shared quota
+            self._wait_for_rate_limit(estimated_tokens)
             try:
                 # Build generation config
                 gen_config = types.GenerateContentConfig(
@@ -294,6 +304,10 @@ class GeminiClient:
                     input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0) or 0
                     output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0) or 0
 
+                if self._rate_limiter is not None:
+                    self._rate_limiter.report_success(self.model_name)
+                    self._rate_limiter.record_usage(self.model_name, estimated_tokens, input_tokens)
+
                 return GeminiResponse(
                     content=content,
                     input_tokens=input_tokens,
@@ -312,6 +326,12 @@ class GeminiClient:
                 # Rate limit errors
                 if '429' in error_str or 'rate' in error_str or 'quota' in error_str:
                     if attempt < max_retries - 1:
+                        if self._rate_limiter is not None and is_rate_limit_error(e):
+                            # Shared limiter pauses every client on this model;
+                            # the next _wait_for_rate_limit() honours the cooldown.
+                            delay = self._rate_limiter.report_rate_limited(self.model_name, e)
+                            print(f"[GEMINI] Rate limited, retry {attempt + 1}/{max_retries} after {delay:.1f}s cooldown...")
+                            continue
                         delay = self._exponential_backoff(attempt)
                         print(f"[GEMINI] Rate limited, retry {attempt + 1}/{max_retries} in {delay:.1f}s...")
                         time.sleep(delay)
@@ -7,9 +7,10 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+from modules.fuzzy_name_index import FuzzyNameIndex
 
 
 @dataclass
@@ -43,6 +44,7 @@ class GlossaryLock:
     """
 
     _NAME_TOKEN_RE = re.compile(r"\b[A-Z][a-z]+(?:[-'][A-Za-z]+)?\b")
+    _MIN_SIMILARITY = 0.82
     _STOP_WORDS = {
         "The",
         "This",
@@ -86,6 +88,7 @@ class GlossaryLock:
                 )
 
         self._canonical_names = {self._normalize(name): name for name in self.locked_names.values()}
+        self._name_index = FuzzyNameIndex(self._canonical_names)
         self._locked = True
 
     def _load_from_manifest(self) -> Dict[str, str]:
@@ -149,6 +152,7 @@ class GlossaryLock:
 
         issues: List[GlossaryIssue] = []
         seen_pairs: Set[str] = set()
+        closest_cache: Dict[str, Tuple[Optional[str], float]] = {}
 
         for token in self._NAME_TOKEN_RE.findall(text):
             if len(token) < 4 or token in self._STOP_WORDS:
@@ -158,8 +162,10 @@ class GlossaryLock:
             if token_norm in self._canonical_names:
                 continue
 
-            closest_name, score = self._closest_locked_name(token_norm)
-            if closest_name and score >= 0.82:
+            if token_norm not in closest_cache:
+                closest_cache[token_norm] = self._closest_locked_name(token_norm)
+            closest_name, score = closest_cache[token_norm]
+            if closest_name:
                 dedupe_key = f"{token_norm}:{self._normalize(closest_name)}"
                 if dedupe_key in seen_pairs:
                     continue
@@ -176,16 +182,11 @@ class GlossaryLock:
         return ValidationReport(issues=issues)
 
     def _closest_locked_name(self, token_norm: str) -> tuple[Optional[str], float]:
-        best_name: Optional[str] = None
-        best_score = 0.0
-
-        for normalized, canonical in self._canonical_names.items():
-            score = SequenceMatcher(None, token_norm, normalized).ratio()
-            if score > best_score:
-                best_score = score
-                best_name = canonical
-
-        return best_name, best_score
+        """Best-matching locked name at or above _MIN_SIMILARITY, else (None, 0.0)."""
+        normalized, score = self._name_index.closest_by_ratio(token_norm, self._MIN_SIMILARITY)
+        if normalized is None:
+            return None, 0.0
+        return self._canonical_names[normalized], score
 
     @staticmethod
     def _normalize(name: str) -> str:
@@ -0,0 +1,156 @@
+"""
+Pre-translation guidance bundles and their prefetcher.
+
+Before each Gemini call ChapterProcessor runs gap analysis, dialect
+detection, kanji / grammar-pattern RAG lookups, visual context lookup and the
+Stage 2 / Phase 1.55 formatters. None of it depends on earlier translations,
+so it can be done ahead of time:
+
+  - GuidanceBundleStore keeps each chapter's bundle (the formatted guidance
+    blocks `_build_user_prompt` injects) in memory and, when persistence is
+    on, as WORK/<volume>/cache/guidance/<chapter_id>.json with the hash of
+    every input. A re-run with unchanged inputs reuses the bundle as is.
+  - GuidancePrefetcher builds the bundles of the next `lookahead` chapters on
+    a background pool while the current chapter's generate call is in
+    flight. A chapter whose prefetch has not started yet is cancelled and
+    built inline instead of queueing behind it.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from pipeline.translator.chapter_scheduler import ChapterJob
+
+logger = logging.getLogger(__name__)
+
+# Bump when the bundle layout or a guidance formatter changes its output.
+GUIDANCE_BUNDLE_VERSION = 1
+
+BUNDLE_SUBDIR = Path("cache") / "guidance"
+
+# Guidance blocks of a bundle, in prompt injection order
+SECTION_NAMES = (
+    "sino_vn",
+    "gap",
+    "dialect",
+    "en_patterns",
+    "vn_patterns",
+    "visual",
+    "stage2_scene",
+    "phase155",
+)
+
+
+class GuidanceBundleStore:
+    """Per-chapter guidance bundles, in memory and optionally on disk."""
+
+    def __init__(self, bundle_dir: Optional[Path], persist: bool = True):
+        self.bundle_dir = Path(bundle_dir) if bundle_dir else None
+        self.persist = persist and self.bundle_dir is not None
+        self._memory: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, chapter_id: str) -> Path:
+        safe_id = re.sub(r"[^\w.-]", "_", chapter_id)
+        return self.bundle_dir / f"{safe_id}.json"
+
+    def get(self, chapter_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """Bundle for `chapter_id` built from inputs hashing to `key`, if any."""
+        with self._lock:
+            cached = self._memory.get(chapter_id)
+        if cached and cached[0] == key:
+            return cached[1]
+        if not self.persist:
+            return None
+        try:
+            with open(self._path(chapter_id), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("key") != key:
+            return None
+        bundle = record.get("bundle")
+        if not isinstance(bundle, dict):
+            return None
+        with self._lock:
+            self._memory[chapter_id] = (key, bundle)
+        return bundle
+
+    def put(self, chapter_id: str, key: str, bundle: Dict[str, Any], persist: bool = True) -> None:
+        with self._lock:
+            self._memory[chapter_id] = (key, bundle)
+        if not (self.persist and persist):
+            return
+        path = self._path(chapter_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "bundle": bundle}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"[PREFETCH] Could not write {path}: {e}")
+
+
+class GuidancePrefetcher:
+    """
+    Builds guidance bundles for upcoming chapters on a small thread pool.
+
+    `prepare(job)` builds and stores one chapter's bundle; its result is not
+    used, callers read the bundle from the GuidanceBundleStore afterwards.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[ChapterJob],
+        prepare: Callable[[ChapterJob], Any],
+        lookahead: int = 2,
+        max_workers: int = 1,
+    ):
+        self._jobs = list(jobs)
+        self._positions = {job.chapter_id: pos for pos, job in enumerate(self._jobs)}
+        self._prepare = prepare
+        self.lookahead = max(0, lookahead)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="guidance-prefetch",
+        )
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def advance(self, chapter_id: str) -> None:
+        """`chapter_id` is starting: queue the `lookahead` chapters after it."""
+        position = self._positions.get(chapter_id)
+        if position is None:
+            return
+        with self._lock:
+            for job in self._jobs[position + 1:position + 1 + self.lookahead]:
+                if job.chapter_id not in self._futures:
+                    self._futures[job.chapter_id] = self._executor.submit(self._run, job)
+
+    def _run(self, job: ChapterJob) -> None:
+        try:
+            self._prepare(job)
+        except Exception as e:
+            logger.warning(f"[PREFETCH] Guidance prefetch failed for {job.chapter_id}: {e}")
+
+    def wait(self, chapter_id: str) -> None:
+        """
+        Wait for an in-flight prefetch of `chapter_id`. A prefetch that has
+        not started is cancelled; the caller builds the bundle itself.
+        """
+        with self._lock:
+            future = self._futures.get(chapter_id)
+        if future is None or future.cancel():
+            return
+        future.result()
+
+    def close(self) -> None:
+        """Drop queued prefetches and release the pool (running ones finish)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,155 @@
+"""
+On-disk cache for PromptLoader output.
+
+Two levels:
+  - Sections: each formatted injection block (kanji_difficult, grammar RAG,
+    literacy techniques, style guide, ...) keyed by the content hash of its
+    inputs plus PROMPT_FORMAT_VERSION. An edit to one source file only
+    re-formats the section built from it.
+  - Instructions: the fully assembled system instruction keyed by target
+    language, genre, publisher, series bible hash and the fingerprint of every
+    file and volume input that feeds it, so an unchanged volume skips prompt
+    construction entirely.
+
+File hashes are memoized per (path, size, mtime) for the life of the process.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pipeline.config import PIPELINE_ROOT
+from pipeline.translator.config import get_prompt_cache_config
+
+logger = logging.getLogger(__name__)
+
+# Bump when any PromptLoader._format_* method changes its output.
+PROMPT_FORMAT_VERSION = 1
+
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+_file_digests_lock = threading.Lock()
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's content ("missing" if it does not exist)."""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return "missing"
+    key = str(path.resolve())
+    with _file_digests_lock:
+        cached = _file_digests.get(key)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    with _file_digests_lock:
+        _file_digests[key] = (stat.st_size, stat.st_mtime_ns, digest)
+    return digest
+
+
+def data_digest(value: Any) -> str:
+    """sha256 of a JSON-serializable value (key order independent)."""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Combined hash of cache inputs: Paths by file content, everything else by value."""
+    digest = hashlib.sha256(str(PROMPT_FORMAT_VERSION).encode("ascii"))
+    for part in parts:
+        token = file_digest(part) if isinstance(part, Path) else data_digest(part)
+        digest.update(b"\0")
+        digest.update(token.encode("ascii"))
+    return digest.hexdigest()
+
+
+class PromptCache:
+    """Content-addressed text store for prompt sections and assembled instructions."""
+
+    def __init__(self, cache_dir: Path, enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.stats = {"section_hits": 0, "section_misses": 0, "instruction_hits": 0, "instruction_misses": 0}
+
+    def _path(self, kind: str, name: str, key: str) -> Path:
+        return self.cache_dir / kind / f"{name}-{key[:40]}.txt"
+
+    def _read(self, path: Path) -> Optional[str]:
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"[PROMPT-CACHE] Could not write {path}: {e}")
+
+    def section(self, name: str, inputs: Tuple[Any, ...], build: Callable[[], str]) -> str:
+        """
+        Formatted section `name`, rebuilt only when `inputs` change.
+
+        Args:
+            name: Section name (also the cache file prefix)
+            inputs: Everything the formatter output depends on (Paths are hashed by content)
+            build: Formatter producing the section text on a miss
+        """
+        if not self.enabled:
+            return build()
+        path = self._path("sections", name, fingerprint(name, *inputs))
+        cached = self._read(path)
+        if cached is not None:
+            self.stats["section_hits"] += 1
+            logger.debug(f"[PROMPT-CACHE] Section hit: {name}")
+            return cached
+        self.stats["section_misses"] += 1
+        text = build()
+        self._write(path, text)
+        return text
+
+    def get_instruction(self, name: str, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        cached = self._read(self._path("instructions", name, key))
+        self.stats["instruction_hits" if cached is not None else "instruction_misses"] += 1
+        return cached
+
+    def put_instruction(self, name: str, key: str, text: str) -> None:
+        if self.enabled:
+            self._write(self._path("instructions", name, key), text)
+
+
+_prompt_cache: Optional[PromptCache] = None
+_prompt_cache_lock = threading.Lock()
+
+
+def get_prompt_cache() -> PromptCache:
+    """Process-wide prompt cache configured from translation.prompt_cache."""
+    global _prompt_cache
+    with _prompt_cache_lock:
+        if _prompt_cache is None:
+            conf = get_prompt_cache_config()
+            cache_dir = Path(conf["path"])
+            if not cache_dir.is_absolute():
+                cache_dir = PIPELINE_ROOT / cache_dir
+            _prompt_cache = PromptCache(cache_dir, enabled=conf["enabled"])
+        return _prompt_cache
+
+
+def set_prompt_cache(cache: Optional[PromptCache]) -> None:
+    """Replace the process-wide prompt cache (None re-reads config on next use)."""
+    global _prompt_cache
+    with _prompt_cache_lock:
+        _prompt_cache = cache
@@ -6,14 +6,16 @@ Supports multi-language configuration (EN, VN, etc.)
 """
 
 import os
+import re
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List, Any, Union
+from typing import Callable, Dict, Optional, Tuple, List, Any, Union
 from pipeline.translator.config import (
     get_master_prompt_path, get_modules_directory, get_genre_prompt_path
 )
 from pipeline.config import get_target_language, get_language_config, PIPELINE_ROOT
+from pipeline.translator.prompt_cache import fingerprint, get_prompt_cache
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +98,7 @@ class PromptLoader:
         self._bible_prompt = None  # Series Bible categorized prompt block
         self._bible_world_directive = None  # World setting one-liner for top-of-prompt
         self._bible_glossary_keys = set()  # JP keys covered by bible (for glossary dedup)
+        self._prompt_cache = get_prompt_cache()  # On-disk formatted sections + assembled instructions
         
         # Style guide paths (experimental - Vietnamese only for now)
         self.style_guides_dir = PIPELINE_ROOT / 'style_guides'
@@ -800,6 +803,16 @@ class PromptLoader:
         logger.debug("[VERBOSE] Building system instruction...")
         import time
         start_time = time.time()
+
+        instruction_name, instruction_key = self._instruction_fingerprint(genre)
+        cached_instruction = self._prompt_cache.get_instruction(instruction_name, instruction_key)
+        if cached_instruction is not None:
+            elapsed_ms = (time.time() - start_time) * 1000
+            logger.info(
+                f"System instruction loaded from prompt cache: "
+                f"{len(cached_instruction.encode('utf-8')) / 1024:.1f}KB in {elapsed_ms:.0f}ms"
+            )
+            return cached_instruction
         
         logger.debug("[VERBOSE] Loading master prompt...")
         master_prompt = self.load_master_prompt(genre)
@@ -874,7 +887,10 @@ class PromptLoader:
         # Inject kanji_difficult.json (Tier 1)
         if kanji_data and "kanji_difficult.json" in final_prompt:
             kanji_entries = kanji_data.get('kanji_entries', [])
-            kanji_formatted = self._format_kanji_for_injection(kanji_entries, genre)
+            kanji_formatted = self._format_section(
+                "kanji_difficult", (self.kanji_difficult_path, genre),
+                lambda: self._format_kanji_for_injection(kanji_entries, genre)
+            )
             kanji_size_kb = len(kanji_formatted.encode('utf-8')) / 1024
             
             logger.info(f"Injecting kanji_difficult.json: {len(kanji_entries)} entries ({kanji_size_kb:.1f}KB)")
@@ -884,7 +900,10 @@ class PromptLoader:
 
         # Inject cjk_prevention_schema_vn.json (Tier 1)
         if cjk_prevention_data and "cjk_prevention_schema_vn.json" in final_prompt:
-            cjk_formatted = self._format_cjk_prevention_for_injection(cjk_prevention_data)
+            cjk_formatted = self._format_section(
+                "cjk_prevention", (self.cjk_prevention_path,),
+                lambda: self._format_cjk_prevention_for_injection(cjk_prevention_data)
+            )
             cjk_size_kb = len(cjk_formatted.encode('utf-8')) / 1024
             
             logger.info(f"Injecting cjk_prevention_schema_vn.json: CJK prevention rules ({cjk_size_kb:.1f}KB)")
@@ -894,7 +913,10 @@ class PromptLoader:
         
         # Inject anti_ai_ism_patterns.json (Tier 1 - v3.5)
         if anti_ai_ism_data and "anti_ai_ism_patterns.json" in final_prompt:
-            anti_ai_ism_formatted = self._format_anti_ai_ism_for_injection(anti_ai_ism_data)
+            anti_ai_ism_formatted = self._format_section(
+                "anti_ai_ism", (self.anti_ai_ism_path,),
+                lambda: self._format_anti_ai_ism_for_injection(anti_ai_ism_data)
+            )
             anti_ai_ism_size_kb = len(anti_ai_ism_formatted.encode('utf-8')) / 1024
             
             # Count patterns
@@ -911,7 +933,10 @@ class PromptLoader:
 
         # Inject english_grammar_rag.json (Tier 1 - EN only, natural idioms)
         if english_grammar_rag_data and "english_grammar_rag.json" in final_prompt:
-            english_grammar_formatted = self._format_english_grammar_rag_for_injection(english_grammar_rag_data)
+            english_grammar_formatted = self._format_section(
+                "english_grammar_rag", (self.english_grammar_rag_path,),
+                lambda: self._format_english_grammar_rag_for_injection(english_grammar_rag_data)
+            )
             grammar_size_kb = len(english_grammar_formatted.encode('utf-8')) / 1024
             
             # Count patterns
@@ -926,7 +951,10 @@ class PromptLoader:
             anti_ai_ism_injected.append('english_grammar_rag.json (Tier 1)')
         elif english_grammar_rag_data:
             # Auto-append if placeholder not found (fallback for prompts without placeholder)
-            english_grammar_formatted = self._format_english_grammar_rag_for_injection(english_grammar_rag_data)
+            english_grammar_formatted = self._format_section(
+                "english_grammar_rag", (self.english_grammar_rag_path,),
+                lambda: self._format_english_grammar_rag_for_injection(english_grammar_rag_data)
+            )
             grammar_size_kb = len(english_grammar_formatted.encode('utf-8')) / 1024
             
             pattern_categories = english_grammar_rag_data.get('pattern_categories', {})
@@ -939,8 +967,11 @@ class PromptLoader:
 
         # Inject english_grammar_validation_t1.json (Tier 1 - EN only, rhythm/literal/repetition guardrails)
         if english_grammar_validation_t1_data and "english_grammar_validation_t1.json" in final_prompt:
-            english_validation_formatted = self._format_english_grammar_validation_t1_for_injection(
-                english_grammar_validation_t1_data
+            english_validation_formatted = self._format_section(
+                "english_grammar_validation_t1", (self.english_grammar_validation_t1_path,),
+                lambda: self._format_english_grammar_validation_t1_for_injection(
+                    english_grammar_validation_t1_data
+                )
             )
             validation_size_kb = len(english_validation_formatted.encode('utf-8')) / 1024
 
@@ -963,8 +994,11 @@ class PromptLoader:
             anti_ai_ism_injected.append('english_grammar_validation_t1.json (Tier 1)')
         elif english_grammar_validation_t1_data:
             # Auto-append if placeholder not found (fallback for prompts without placeholder)
-            english_validation_formatted = self._format_english_grammar_validation_t1_for_injection(
-                english_grammar_validation_t1_data
+            english_validation_formatted = self._format_section(
+                "english_grammar_validation_t1", (self.english_grammar_validation_t1_path,),
+                lambda: self._format_english_grammar_validation_t1_for_injection(
+                    english_grammar_validation_t1_data
+                )
             )
             validation_size_kb = len(english_validation_formatted.encode('utf-8')) / 1024
             categories = english_grammar_validation_t1_data.get('validation_categories', {})
@@ -984,7 +1018,10 @@ class PromptLoader:
 
         # Inject vietnamese_grammar_rag.json (Tier 1 - VN only, anti-AI-ism + particle system)
         if vietnamese_grammar_rag_data and "vietnamese_grammar_rag.json" in final_prompt:
-            vietnamese_grammar_formatted = self._format_vietnamese_grammar_rag_for_injection(vietnamese_grammar_rag_data)
+            vietnamese_grammar_formatted = self._format_section(
+                "vietnamese_grammar_rag", (self.vietnamese_grammar_rag_path,),
+                lambda: self._format_vietnamese_grammar_rag_for_injection(vietnamese_grammar_rag_data)
+            )
             grammar_size_kb = len(vietnamese_grammar_formatted.encode('utf-8')) / 1024
             
             # Count patterns
@@ -1002,7 +1039,10 @@ class PromptLoader:
             anti_ai_ism_injected.append('vietnamese_grammar_rag.json (Tier 1)')
         elif vietnamese_grammar_rag_data:
             # Auto-append if placeholder not found (fallback for prompts without placeholder)
-            vietnamese_grammar_formatted = self._format_vietnamese_grammar_rag_for_injection(vietnamese_grammar_rag_data)
+            vietnamese_grammar_formatted = self._format_section(
+                "vietnamese_grammar_rag", (self.vietnamese_grammar_rag_path,),
+                lambda: self._format_vietnamese_grammar_rag_for_injection(vietnamese_grammar_rag_data)
+            )
             grammar_size_kb = len(vietnamese_grammar_formatted.encode('utf-8')) / 1024
             
             sentence_ai_isms = len(vietnamese_grammar_rag_data.get('sentence_structure_ai_isms', {}).get('patterns', []))
@@ -1019,9 +1059,13 @@ class PromptLoader:
 
         # Inject literacy_techniques.json (Tier 1 - language-agnostic narrative techniques)
         if literacy_techniques_data and "literacy_techniques.json" in final_prompt:
-            literacy_formatted = self._format_literacy_techniques_for_injection(
-                literacy_techniques_data,
-                english_grammar_validation_t1_data
+            literacy_formatted = self._format_section(
+                "literacy_techniques",
+                (self.literacy_techniques_path, self.english_grammar_validation_t1_path),
+                lambda: self._format_literacy_techniques_for_injection(
+                    literacy_techniques_data,
+                    english_grammar_validation_t1_data
+                )
             )
             literacy_size_kb = len(literacy_formatted.encode('utf-8')) / 1024
 
@@ -1038,9 +1082,13 @@ class PromptLoader:
             injected_count += 1
         elif literacy_techniques_data:
             # Auto-append if placeholder not found (fallback for prompts without placeholder)
-            literacy_formatted = self._format_literacy_techniques_for_injection(
-                literacy_techniques_data,
-                english_grammar_validation_t1_data
+            literacy_formatted = self._format_section(
+                "literacy_techniques",
+                (self.literacy_techniques_path, self.english_grammar_validation_t1_path),
+                lambda: self._format_literacy_techniques_for_injection(
+                    literacy_techniques_data,
+                    english_grammar_validation_t1_data
+                )
             )
             literacy_size_kb = len(literacy_formatted.encode('utf-8')) / 1024
 
@@ -1080,7 +1128,10 @@ class PromptLoader:
 
         # Inject hard anti-AI-ism policy at TOP (prompt-time enforcement only, no post-healing)
         if anti_ai_ism_data and self.target_language in ['en', 'english']:
-            hard_policy = self._format_hard_anti_ai_ism_policy(anti_ai_ism_data, self._semantic_metadata)
+            hard_policy = self._format_section(
+                "hard_anti_ai_ism_policy", (self.anti_ai_ism_path, self._semantic_metadata),
+                lambda: self._format_hard_anti_ai_ism_policy(anti_ai_ism_data, self._semantic_metadata)
+            )
             if hard_policy:
                 final_prompt = f"<!-- HARD ANTI-AI-ISM POLICY -->\n{hard_policy}\n\n{final_prompt}"
                 logger.info("✓ Injected hard anti-AI-ism policy block at TOP of system instruction")
@@ -1130,7 +1181,10 @@ class PromptLoader:
         
         # Inject semantic metadata into system instruction (Enhanced v2.1)
         if self._semantic_metadata:
-            semantic_injection = self._format_semantic_metadata(self._semantic_metadata)
+            semantic_injection = self._format_section(
+                "semantic_metadata", (self._semantic_metadata,),
+                lambda: self._format_semantic_metadata(self._semantic_metadata)
+            )
             # Replace placeholder in master prompt
             if "SEMANTIC_METADATA_PLACEHOLDER" in final_prompt:
                 final_prompt = final_prompt.replace("SEMANTIC_METADATA_PLACEHOLDER", semantic_injection)
@@ -1142,7 +1196,10 @@ class PromptLoader:
         
         # Inject style guide into system instruction (EXPERIMENTAL - Vietnamese only)
         if self._style_guide and self.target_language in ['vi', 'vn']:
-            style_guide_injection = self._format_style_guide(self._style_guide)
+            style_guide_injection = self._format_section(
+                "style_guide", (self._style_guide,),
+                lambda: self._format_style_guide(self._style_guide)
+            )
             # Replace placeholder in master prompt
             if "STYLE_GUIDE_PLACEHOLDER" in final_prompt:
                 final_prompt = final_prompt.replace("STYLE_GUIDE_PLACEHOLDER", style_guide_injection)
@@ -1152,9 +1209,67 @@ class PromptLoader:
                 final_prompt += f"\n\n<!-- VIETNAMESE STYLE GUIDE (Experimental) -->\n{style_guide_injection}\n"
                 logger.info(f"✓ [EXPERIMENTAL] Vietnamese style guide appended ({len(style_guide_injection)} chars)")
 
+        self._prompt_cache.put_instruction(instruction_name, instruction_key, final_prompt)
         return final_prompt
+
+    def _format_section(self, name: str, inputs: Tuple[Any, ...], build: Callable[[], str]) -> str:
+        """
+        Formatted injection block, memoized on disk by the content hash of its
+        inputs (source file paths and/or in-memory data) plus formatter version.
+        """
+        return self._prompt_cache.section(f"{self.target_language}_{name}", inputs, build)
+
+    def _instruction_sources(self, genre: str = None) -> List[Any]:
+        """Every file or value the assembled system instruction depends on."""
+        sources: List[Any] = []
+
+        if self._master_prompt_cache:
+            sources.append(self._master_prompt_cache)
+        else:
+            sources.append(get_genre_prompt_path(genre, self.target_language) if genre else self.prompts_path)
+
+        module_files = sorted(self.modules_dir.glob("*.md")) if self.modules_dir.exists() else []
+        sources.append([p.name for p in module_files])
+        sources.extend(module_files)
+
+        if self.reference_dir and self.reference_dir.exists():
+            reference_files = sorted(p for p in self.reference_dir.iterdir() if p.is_file())
+            sources.append([p.name for p in reference_files])
+            sources.extend(reference_files)
+            sources.append(self.lang_config.get('reference_modules', []))
+
+        for path in (
+            self.reference_index_path,
+            self.kanji_difficult_path,
+            self.cjk_prevention_path,
+            self.anti_ai_ism_path,
+            self.english_grammar_rag_path,
+            self.english_grammar_validation_t1_path,
+            self.vietnamese_grammar_rag_path,
+            self.literacy_techniques_path,
+        ):
+            sources.append(path)
+
+        sources.append(self._glossary)
+        sources.append(sorted(self._bible_glossary_keys))
+        sources.append(self._semantic_metadata)
+        sources.append(self._style_guide)
+        return sources
+
+    def _instruction_fingerprint(self, genre: str = None) -> Tuple[str, str]:
+        """
+        Cache name and key for the assembled system instruction:
+        (language, genre, publisher, bible hash) + all source fingerprints.
+        """
+        publisher = (self._style_guide or {}).get('_metadata', {}).get('publisher')
+        bible_hash = fingerprint(self._bible_prompt, self._bible_world_directive)
+        key = fingerprint(
+            self.target_language, genre, publisher, bible_hash, *self._instruction_sources(genre)
+        )
+        name = re.sub(r'[^A-Za-z0-9_.-]', '_', f"{self.target_language}_{genre or 'default'}")
+        return name, key
     
-    def _format_semantic_metadata(self, metadata: Dict[str, Any]) -> str:
+    def _format_semantic_metadata(self, metadata: Dict[str, Any]) -> str:
         """
         Format semantic metadata for prompt injection.
         
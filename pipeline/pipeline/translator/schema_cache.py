@@ -8,6 +8,9 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from pipeline.common.context_cache_registry import get_cache_registry
 
 try:
     from pipeline.common.genai_factory import create_genai_client
@@ -75,13 +78,34 @@ class SchemaCacheManager:
             logger.info(f"  TTL: {ttl_hours} hour(s)")
             logger.info(f"  Context size: ~{len(context)} chars")
             
-            cache = self.client.caches.create(
-                model=model,
-                display_name=cache_name,
-                system_instruction=system_instruction,
-                contents=[context],
-                ttl=f'{ttl_hours * 3600}s'  # Convert to seconds
-            )
+            if hasattr(self.client, "update_cache_ttl"):
+                # Shared GeminiClient: go through the volume's cache registry
+                name = get_cache_registry(work_dir).acquire(
+                    self.client,
+                    model=model,
+                    system_instruction=system_instruction,
+                    contents=[context],
+                    ttl_seconds=ttl_hours * 3600,
+                    display_name=cache_name,
+                    label=f"continuity_schema_ch{snapshot.chapter_num + 1:02d}",
+                )
+                if not name:
+                    return None
+                cache = SimpleNamespace(
+                    name=name,
+                    model=model,
+                    expire_time=datetime.now().astimezone() + timedelta(hours=ttl_hours),
+                )
+            else:
+                cache = self.client.caches.create(
+                    model=model,
+                    config={
+                        "display_name": cache_name,
+                        "system_instruction": system_instruction,
+                        "contents": [context],
+                        "ttl": f'{ttl_hours * 3600}s',  # Convert to seconds
+                    },
+                )
             
             self.current_cache = cache
             
@@ -132,16 +156,27 @@ class SchemaCacheManager:
     
     def invalidate_cache(self, cache_name: str):
         """Delete a cache."""
-        if genai is None or not cache_name:
+        if not cache_name:
             return
         
         try:
             self._ensure_client()
-            self.client.caches.delete(name=cache_name)
+            if hasattr(self.client, "delete_cache"):
+                self._registry_release(cache_name)
+            else:
+                self.client.caches.delete(name=cache_name)
             logger.info(f"✓ Invalidated cache: {cache_name}")
         except Exception as e:
             logger.warning(f"Could not delete cache {cache_name}: {e}")
     
+    def _registry_release(self, cache_name: str):
+        """Delete `cache_name` and drop it from the registry of the volume that owns it."""
+        if self.cache_metadata_path is not None:
+            work_dir = self.cache_metadata_path.parent.parent
+            get_cache_registry(work_dir).release(self.client, cache_name, retain_seconds=0)
+        else:
+            self.client.delete_cache(cache_name)
+    
     def _build_context_from_schema(self, snapshot: ChapterSnapshot) -> str:
         """Build context string from schema snapshot."""
         lines = []
@@ -104,7 +104,7 @@ class SchemaExtractor:
         
         # Initialize Gemini client for semantic extraction
         # Use gemini-2.5-flash for fast schema extraction (Phase 1.5 optimization)
-        self.gemini_client = GeminiClient(model="gemini-2.5-flash", enable_caching=False)
+        self.gemini_client = GeminiClient(model="gemini-2.5-flash", enable_caching=False, priority="summary")
         
         # Load manifest for volume metadata
         manifest_path = work_dir / "manifest.json"
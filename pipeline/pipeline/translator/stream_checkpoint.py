@@ -0,0 +1,140 @@
+"""
+Paragraph checkpoints for streamed chapter translation.
+
+ChapterProcessor feeds streamed text into a StreamCheckpoint, which appends
+each completed paragraph (text up to a blank line) to `<chapter>.partial.md`
+and records progress in a `<chapter>.partial.json` sidecar. If the stream
+fails or is truncated, the committed paragraphs are kept and the chapter is
+resumed from the last complete paragraph instead of being regenerated; the
+checkpoint also survives a process restart as long as its key (a hash of the
+chapter source and model) still matches.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PARAGRAPH_BREAK = "\n\n"
+
+
+class StreamCheckpoint:
+    """Append-only on-disk record of the complete paragraphs received so far."""
+
+    def __init__(self, path: Path, key: str):
+        self.path = Path(path)
+        self.meta_path = self.path.with_suffix(".json")
+        self.key = key
+        self.committed = ""
+        self.pending = ""
+        self.paragraphs = 0
+        self._echo: Optional[str] = None
+
+    def load(self) -> str:
+        """Restore committed text from disk if the checkpoint matches `key`; discard it otherwise."""
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(self.path, "r", encoding="utf-8", newline="") as f:
+                text = f.read()
+        except (OSError, ValueError):
+            self.clear()
+            return ""
+        if meta.get("key") != self.key or len(text) < meta.get("chars", 0):
+            self.clear()
+            return ""
+        # Drop anything written after the last sidecar update.
+        self.committed = text[:meta.get("chars", 0)]
+        self.paragraphs = meta.get("paragraphs", 0)
+        self.pending = ""
+        return self.committed
+
+    def feed(self, text: str) -> int:
+        """Buffer streamed text; returns the number of paragraphs newly written to disk."""
+        self.pending += text
+        cut = self.pending.rfind(PARAGRAPH_BREAK)
+        if cut < 0:
+            return 0
+        complete, self.pending = self.pending[:cut + len(PARAGRAPH_BREAK)], self.pending[cut + len(PARAGRAPH_BREAK):]
+        if not complete.strip():
+            return 0
+        if self._echo is not None:
+            head, sep, rest = complete.lstrip("\n").partition(PARAGRAPH_BREAK)
+            if head.strip() == self._echo:
+                complete = rest
+            self._echo = None
+        added = sum(1 for p in complete.split(PARAGRAPH_BREAK) if p.strip())
+        if not added:
+            return 0
+        self._append(complete, added)
+        return added
+
+    def discard_pending(self) -> None:
+        """Forget the incomplete trailing paragraph (after a failed or truncated stream)."""
+        self.pending = ""
+
+    def begin_resume(self) -> None:
+        """
+        Prepare for a continuation stream.
+
+        Models sometimes echo the last committed paragraph before continuing;
+        if the continuation's first paragraph repeats it, it is dropped.
+        """
+        self.pending = ""
+        paragraphs = [p for p in self.committed.split(PARAGRAPH_BREAK) if p.strip()]
+        self._echo = paragraphs[-1].strip() if paragraphs else None
+
+    def text(self) -> str:
+        return self.committed + self.pending
+
+    def _append(self, text: str, paragraphs: int) -> None:
+        self.committed += text
+        self.paragraphs += paragraphs
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8", newline="") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path = self.meta_path.with_name(f"{self.meta_path.name}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "key": self.key,
+                    "chars": len(self.committed),
+                    "paragraphs": self.paragraphs,
+                    "updated_at": time.time(),
+                }, f)
+            os.replace(tmp_path, self.meta_path)
+        except OSError as e:
+            # Keep streaming in memory; only the resume-after-restart guarantee is lost.
+            logger.warning(f"[STREAM] Could not write checkpoint {self.path}: {e}")
+
+    def clear(self) -> None:
+        for path in (self.path, self.meta_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"[STREAM] Could not remove checkpoint {path}: {e}")
+        self.committed = ""
+        self.pending = ""
+        self.paragraphs = 0
+        self._echo = None
+
+
+def resume_tail(committed: str, max_chars: int) -> Optional[str]:
+    """Last whole paragraphs of `committed` totalling at most `max_chars` (at least one paragraph)."""
+    paragraphs = [p for p in committed.split(PARAGRAPH_BREAK) if p.strip()]
+    if not paragraphs:
+        return None
+    kept = [paragraphs.pop()]
+    total = len(kept[0])
+    while paragraphs and total + len(paragraphs[-1]) + 2 <= max_chars:
+        kept.append(paragraphs.pop())
+        total += len(kept[-1]) + 2
+    return PARAGRAPH_BREAK.join(reversed(kept))
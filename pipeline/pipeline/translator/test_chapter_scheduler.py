@@ -0,0 +1,85 @@
+import threading
+import time
+
+from pipeline.common.rate_limiter import TokenBucket
+from pipeline.translator.chapter_scheduler import ChapterJob, ChapterScheduler
+
+
+def _jobs(count):
+    return [ChapterJob(index=i, chapter_id=f"chapter_{i + 1:02d}") for i in range(count)]
+
+
+def test_relaxed_policy_runs_chapters_in_parallel():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def worker(job):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return job.chapter_id
+
+    completed = []
+    scheduler = ChapterScheduler(max_workers=4, lookback=2, continuity_policy="relaxed")
+    leftover = scheduler.run(_jobs(8), worker, lambda job, outcome: completed.append(outcome))
+
+    assert leftover == []
+    assert sorted(completed) == [f"chapter_{i:02d}" for i in range(1, 9)]
+    assert peak > 1
+
+
+def test_strict_policy_waits_for_lookback_predecessors():
+    finished = set()
+    violations = []
+
+    def worker(job):
+        for idx in range(max(0, job.index - 1), job.index):
+            if idx not in finished:
+                violations.append((job.index, idx))
+        time.sleep(0.01)
+        return job.index
+
+    scheduler = ChapterScheduler(max_workers=3, lookback=1, continuity_policy="strict")
+    scheduler.run(_jobs(5), worker, lambda job, outcome: finished.add(outcome))
+
+    assert violations == []
+    assert finished == {0, 1, 2, 3, 4}
+
+
+def test_worker_exception_is_passed_to_on_complete():
+    def worker(job):
+        if job.index == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    outcomes = {}
+    ChapterScheduler(max_workers=2).run(
+        _jobs(3), worker, lambda job, outcome: outcomes.__setitem__(job.index, outcome)
+    )
+
+    assert outcomes[0] == "ok"
+    assert isinstance(outcomes[1], RuntimeError)
+
+
+def test_token_bucket_blocks_when_empty():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate_per_minute=60, capacity=2, clock=lambda: now[0], sleep=sleep)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    waited = bucket.acquire()
+
+    assert waited == 1.0
+    assert sleeps == [1.0]
+    assert not bucket.try_acquire()
@@ -0,0 +1,46 @@
+from pipeline.translator.chunk_planner import estimate_source_tokens, is_scene_break_line, plan_chunks
+
+
+def _chapter():
+    return "\n".join(
+        ["あ" * 200] * 50
+        + ["◆"] + ["い" * 100] * 30 + [""]
+        + ["＊＊＊"] + ["う" * 300] * 100
+    )
+
+
+def test_chunks_cover_every_line_in_order():
+    text = _chapter()
+    lines = text.splitlines()
+    chunks = plan_chunks(text, target_tokens=5000)
+
+    assert len(chunks) > 1
+    assert chunks[0]["line_start"] == 1 and chunks[-1]["line_end"] == len(lines)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert nxt["line_start"] == prev["line_end"] + 1
+    assert "\n".join("\n".join(lines[c["line_start"] - 1:c["line_end"]]) for c in chunks) == text
+    assert all(estimate_source_tokens(c["content"]) <= 5000 for c in chunks)
+
+
+def test_half_full_chunk_is_cut_at_scene_break():
+    chunks = plan_chunks(_chapter(), target_tokens=5000)
+    starts = [c["line_start"] for c in chunks]
+
+    assert 83 in starts  # the ＊＊＊ line opens a chunk instead of joining the previous one
+    assert chunks[starts.index(83)]["scene_break_before"]
+    assert 51 not in starts  # a nearly empty chunk is not cut just to honour ◆
+
+
+def test_each_chunk_carries_previous_source_tail():
+    text = "\n".join(f"{i:03d}" + "文" * 50 for i in range(40))
+    chunks = plan_chunks(text, target_tokens=600, context_tail_chars=120)
+
+    assert chunks[0]["context_before"] == ""
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert 0 < len(nxt["context_before"]) <= 120
+        assert prev["content"].endswith(nxt["context_before"])
+
+
+def test_scene_break_markers():
+    assert all(is_scene_break_line(m) for m in ["◆", "＊＊＊", "* * *", "　◇　◇　◇", "★"])
+    assert not any(is_scene_break_line(m) for m in ["・・・", "「＊」", "あ", ""])
@@ -0,0 +1,74 @@
+import threading
+
+from modules.guidance_service import EN_PATTERNS, GuidanceService, set_guidance_service
+from pipeline.translator.chapter_scheduler import ChapterJob
+from pipeline.translator.guidance_prefetch import GuidancePrefetcher
+from pipeline.translator.test_stage2_scene_scaffold import _build_processor
+
+SOURCE = "# 第一章\n\n俺は行ったけど、彼女は来なかった。でも、それでいい。"
+GUIDANCE = {
+    "high_confidence": [
+        {"japanese_structure": "けど", "english_pattern": "but", "natural_example": "I went, but she didn't."}
+    ]
+}
+
+
+class _PatternStore:
+    def warm(self):
+        pass
+
+    def get_bulk_guidance(self, **kwargs):
+        return GUIDANCE
+
+
+def test_bundle_is_persisted_and_matches_direct_prompt(tmp_path, monkeypatch):
+    set_guidance_service(GuidanceService({EN_PATTERNS: _PatternStore}))
+    try:
+        processor = _build_processor(tmp_path)
+        bundle = processor._guidance_bundle("chapter_01", SOURCE, None)
+        assert bundle["failed_steps"] == []
+
+        # A new run with the same inputs reads the bundle back instead of rebuilding it
+        rerun = _build_processor(tmp_path)
+        monkeypatch.setattr(rerun, "_build_guidance_bundle", lambda *args: 1 / 0)
+        assert rerun._guidance_bundle("chapter_01", SOURCE, None) == bundle
+        assert rerun._guidance_bundle_key("chapter_01", SOURCE + "。", None) != (
+            rerun._guidance_bundle_key("chapter_01", SOURCE, None)
+        )
+
+        body, _ = processor._split_source_title(SOURCE)
+        from_bundle = processor._build_user_prompt(
+            "chapter_01", body, "", "Chapter 1", guidance_sections=bundle["sections"]
+        )
+        direct = processor._build_user_prompt(
+            "chapter_01", body, "", "Chapter 1", en_pattern_guidance=GUIDANCE
+        )
+        assert from_bundle == direct
+        assert "I went, but she didn't." in direct
+    finally:
+        set_guidance_service(None)
+
+
+def test_prefetcher_runs_ahead_and_cancels_unstarted_work():
+    jobs = [ChapterJob(index=i, chapter_id=f"ch{i}") for i in range(4)]
+    release = threading.Event()
+    started = threading.Event()
+    prepared = []
+
+    def prepare(job):
+        started.set()
+        release.wait(5)
+        prepared.append(job.chapter_id)
+
+    prefetcher = GuidancePrefetcher(jobs, prepare, lookahead=2, max_workers=1)
+    try:
+        prefetcher.advance("ch0")
+        started.wait(5)
+        # ch2 is still queued behind ch1: the caller builds it instead
+        prefetcher.wait("ch2")
+        prefetcher.wait("ch3")
+        release.set()
+        prefetcher.wait("ch1")
+        assert prepared == ["ch1"]
+    finally:
+        prefetcher.close()
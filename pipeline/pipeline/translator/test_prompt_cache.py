@@ -0,0 +1,52 @@
+import pytest
+
+from pipeline.translator.prompt_cache import PromptCache, set_prompt_cache
+from pipeline.translator.prompt_loader import PromptLoader
+
+
+@pytest.fixture
+def prompt_cache(tmp_path):
+    cache = PromptCache(tmp_path / "prompts")
+    set_prompt_cache(cache)
+    yield cache
+    set_prompt_cache(None)
+
+
+def test_section_reformats_only_when_its_source_changes(tmp_path):
+    cache = PromptCache(tmp_path / "prompts")
+    source_a, source_b = tmp_path / "a.json", tmp_path / "b.json"
+    source_a.write_text("1", encoding="utf-8")
+    source_b.write_text("1", encoding="utf-8")
+    calls = []
+
+    def build(name):
+        calls.append(name)
+        return f"formatted {name}\r\n"
+
+    for _ in range(2):
+        assert cache.section("a", (source_a,), lambda: build("a")) == "formatted a\r\n"
+        cache.section("b", (source_b, {"genre": "romcom"}), lambda: build("b"))
+    source_b.write_text("2", encoding="utf-8")
+    cache.section("a", (source_a,), lambda: build("a"))
+    cache.section("b", (source_b, {"genre": "romcom"}), lambda: build("b"))
+    cache.section("b", (source_b, {"genre": "fantasy"}), lambda: build("b"))
+
+    assert calls == ["a", "b", "b", "b"]
+
+
+def test_cached_system_instruction_matches_fresh_build(prompt_cache):
+    set_prompt_cache(PromptCache(prompt_cache.cache_dir, enabled=False))
+    expected = PromptLoader(target_language="en").build_system_instruction()
+    set_prompt_cache(prompt_cache)
+
+    first = PromptLoader(target_language="en").build_system_instruction()
+    second = PromptLoader(target_language="en").build_system_instruction()
+
+    loader = PromptLoader(target_language="en")
+    loader.set_glossary({"如月": "Kisaragi"})
+    with_glossary = loader.build_system_instruction()
+
+    assert first == second == expected
+    assert prompt_cache.stats["instruction_hits"] == 1
+    assert prompt_cache.stats["instruction_misses"] == 2
+    assert with_glossary.endswith("  如月 = Kisaragi\n")
@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+import pytest
+
+import pipeline.common.gemini_client as gemini_client_module
+from pipeline.common.gemini_client import GeminiClient, GeminiResponse, normalize_finish_reason
+from pipeline.translator.chapter_processor import ChapterProcessor
+from pipeline.translator.stream_checkpoint import StreamCheckpoint, resume_tail
+
+
+def test_only_complete_paragraphs_reach_disk(tmp_path):
+    checkpoint = StreamCheckpoint(tmp_path / "ch01.partial.md", key="k")
+    for piece in ["# Title\n", "\nFirst para", "graph.\n\nSecond", " one.\n\nThird (cut"]:
+        checkpoint.feed(piece)
+
+    assert checkpoint.paragraphs == 3
+    assert (tmp_path / "ch01.partial.md").read_text(encoding="utf-8") == "# Title\n\nFirst paragraph.\n\nSecond one.\n\n"
+    assert checkpoint.text().endswith("Third (cut")
+
+    restored = StreamCheckpoint(tmp_path / "ch01.partial.md", key="k")
+    assert restored.load() == "# Title\n\nFirst paragraph.\n\nSecond one.\n\n"
+    assert restored.paragraphs == 3
+    assert StreamCheckpoint(tmp_path / "ch01.partial.md", key="other").load() == ""
+    assert not (tmp_path / "ch01.partial.md").exists()
+
+
+def test_resume_drops_echoed_last_paragraph(tmp_path):
+    checkpoint = StreamCheckpoint(tmp_path / "ch01.partial.md", key="k")
+    checkpoint.feed("One.\n\nTwo.\n\nThr")
+    checkpoint.discard_pending()
+    checkpoint.begin_resume()
+    checkpoint.feed("\nTwo.\n\nThree.\n\nFour.")
+
+    assert checkpoint.text() == "One.\n\nTwo.\n\nThree.\n\nFour."
+    assert resume_tail(checkpoint.committed, 12) == "Two.\n\nThree."
+
+
+class _FlakyStreamClient:
+    """generate_stream stand-in: each script entry is an exception (raised after
+    streaming its `partial` text, if any) or the text of a finished response."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.prompts = []
+
+    def generate_stream(self, prompt, on_text=None, model=None, **kwargs):
+        self.prompts.append(prompt)
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            if getattr(step, "partial", None):
+                on_text(step.partial)
+            raise step
+        on_text(step)
+        return GeminiResponse(
+            content=step, input_tokens=10, output_tokens=5, finish_reason="STOP", model=model, cached_tokens=0
+        )
+
+
+def _streaming_processor(tmp_path, client, max_resumes):
+    processor = object.__new__(ChapterProcessor)
+    processor.client = client
+    processor.context_manager = SimpleNamespace(work_dir=tmp_path)
+    processor.target_language = "en"
+    processor.gen_params = {}
+    processor.stream_max_resumes = max_resumes
+    processor.stream_resume_tail_chars = 200
+    processor.stream_progress_every = 25
+    return processor
+
+
+def _generate(processor):
+    return processor._generate_streaming("ch01", "source", "PROMPT", None, "model", None)
+
+
+def test_errors_before_output_are_retried_without_spending_resumes(tmp_path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    client = _FlakyStreamClient([RuntimeError("503 UNAVAILABLE")] * 3 + ["One.\n\nTwo."])
+
+    response = _generate(_streaming_processor(tmp_path, client, max_resumes=0))
+
+    assert response.content == "One.\n\nTwo."
+    assert client.prompts == ["PROMPT"] * 4
+
+
+def test_mid_stream_failure_resumes_and_fatal_errors_stop(tmp_path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    cut = RuntimeError("connection reset")
+    cut.partial = "One.\n\nTwo.\n\nTh"
+    client = _FlakyStreamClient([cut, "Three."])
+
+    response = _generate(_streaming_processor(tmp_path, client, max_resumes=1))
+
+    assert response.content == "One.\n\nTwo.\n\nThree."
+    assert "LAST SAVED PARAGRAPHS" in client.prompts[1]
+
+    client = _FlakyStreamClient([RuntimeError("400 INVALID_ARGUMENT")])
+    with pytest.raises(RuntimeError):
+        _generate(_streaming_processor(tmp_path, client, max_resumes=2))
+    assert len(client.prompts) == 1
+
+
+def test_blocked_prompt_stream_reports_blocked(monkeypatch):
+    chunks = [SimpleNamespace(
+        usage_metadata=None,
+        candidates=None,
+        prompt_feedback=SimpleNamespace(block_reason=SimpleNamespace(name="PROHIBITED_CONTENT")),
+    )]
+    models = SimpleNamespace(generate_content_stream=lambda **kwargs: iter(chunks))
+    monkeypatch.setattr(gemini_client_module, "get_shared_genai_client", lambda **kwargs: SimpleNamespace(models=models))
+    monkeypatch.setattr(GeminiClient, "_load_thinking_config", lambda self: {"enabled": False})
+    client = GeminiClient(api_key="test", model="fake-model", enable_caching=False, backend="developer")
+    client.set_rate_limiter(None)
+    client._rate_limit_delay = 0
+
+    response = client.generate_stream(prompt="hello")
+
+    assert response.content == ""
+    assert response.finish_reason == "BLOCKED_PROHIBITED_CONTENT"
+    assert normalize_finish_reason("FinishReason.STOP") == "STOP"
+    assert normalize_finish_reason(None) == "UNKNOWN"
@@ -0,0 +1,93 @@
+"""
+Calibrate the offline token estimator against Gemini count_tokens.
+
+Samples passages from the JP / EN / VN chapter files of one or more volumes,
+counts them with the API, stores them as calibration samples
+(gemini.token_estimator.calibration_path) and refits the coefficients.
+A held-out quarter of the new samples is used to report the error before and
+after the refit.
+
+Usage:
+    python scripts/calibrate_token_estimator.py WORK/<volume> [WORK/<volume> ...]
+    python scripts/calibrate_token_estimator.py WORK/<volume> --samples 60 --model gemini-2.5-flash
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.common.gemini_client import GeminiClient
+from pipeline.common.token_estimator import get_token_estimator, text_features
+from pipeline.translator.config import get_model_name
+
+LANGUAGE_DIRS = ("JP", "EN", "VN")
+
+
+def sample_passages(volume_dirs, per_language: int, rng: random.Random):
+    """Random runs of 1-40 consecutive paragraphs from each language's chapters."""
+    passages = []
+    for lang in LANGUAGE_DIRS:
+        paragraphs = []
+        for volume_dir in volume_dirs:
+            for path in sorted((Path(volume_dir) / lang).glob("*.md")):
+                text = path.read_text(encoding="utf-8")
+                paragraphs.append([p for p in text.split("\n\n") if p.strip()])
+        paragraphs = [p for p in paragraphs if p]
+        for _ in range(per_language if paragraphs else 0):
+            chapter = rng.choice(paragraphs)
+            length = rng.randint(1, min(40, len(chapter)))
+            start = rng.randint(0, len(chapter) - length)
+            passages.append((lang, "\n\n".join(chapter[start:start + length])))
+    return passages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the offline token estimator")
+    parser.add_argument("volumes", nargs="+", help="Volume work directories (containing JP/, EN/, VN/)")
+    parser.add_argument("--samples", type=int, default=40, help="Passages per language (default: 40)")
+    parser.add_argument("--model", default=None, help="Model whose tokenizer to count with (default: translation model)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    passages = sample_passages(args.volumes, args.samples, random.Random(args.seed))
+    if not passages:
+        print("No chapter files found under JP/, EN/ or VN/")
+        sys.exit(1)
+
+    client = GeminiClient(model=args.model or get_model_name(), enable_caching=False)
+    counted = []
+    for lang, text in passages:
+        try:
+            response = client.client.models.count_tokens(model=client.model, contents=text)
+        except Exception as e:
+            print(f"count_tokens failed ({lang}, {len(text)} chars): {e}")
+            continue
+        counted.append((lang, text, response.total_tokens))
+    print(f"Counted {len(counted)} passages with {client.model}")
+
+    holdout = counted[::4]
+    training = [item for i, item in enumerate(counted) if i % 4]
+    estimator = get_token_estimator()
+
+    def report(label):
+        for lang in LANGUAGE_DIRS:
+            samples = [
+                {"features": text_features(text), "tokens": tokens}
+                for item_lang, text, tokens in holdout if item_lang == lang
+            ]
+            error = estimator.mean_abs_error_pct(samples)
+            if error is not None:
+                print(f"  {label:6s} {lang}: {error:.2f}% mean abs error ({len(samples)} held-out passages)")
+
+    report("before")
+    estimator.calibrate([text for _, text, _ in training], [tokens for _, _, tokens in training], model=client.model)
+    report("after")
+    print(f"Coefficients: {estimator.coefficients}")
+    print(f"Saved to {estimator.calibration_path}")
+
+
+if __name__ == "__main__":
+    main()
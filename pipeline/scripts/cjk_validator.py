@@ -14,10 +14,15 @@ import re
 import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
 
 class Severity(Enum):
     ERROR = "error"
@@ -36,6 +41,35 @@ class ValidationIssue:
     suggestion: str = ""
 
 
+def _requires_char(parsed, is_gate_char) -> bool:
+    """
+    True if every match of a parsed regex consumes a character accepted by
+    `is_gate_char` (a codepoint predicate). Conservative: unknown constructs
+    count as "not required".
+    """
+    for op, av in parsed:
+        if op is sre_parse.LITERAL and is_gate_char(av):
+            return True
+        if op is sre_parse.IN:
+            if all(
+                (kind is sre_parse.LITERAL and is_gate_char(value))
+                or (kind is sre_parse.RANGE and all(is_gate_char(c) for c in range(value[0], value[1] + 1)))
+                for kind, value in av
+            ):
+                return True
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            min_count, _, sub = av
+            if min_count >= 1 and _requires_char(sub, is_gate_char):
+                return True
+        elif op is sre_parse.SUBPATTERN:
+            if _requires_char(av[-1], is_gate_char):
+                return True
+        elif op is sre_parse.BRANCH:
+            if all(_requires_char(branch, is_gate_char) for branch in av[1]):
+                return True
+    return False
+
+
 class CJKValidator:
     """Validates Vietnamese text for CJK character leaks."""
     
@@ -59,6 +93,12 @@ class CJKValidator:
         ]
         self.cjk_pattern = re.compile(f"[{''.join(cjk_ranges)}]")
         
+        # Any configured range, whatever its severity: lines without one of
+        # these characters are skipped by every pattern that needs one
+        self.gate_pattern = re.compile(
+            f"[{''.join(r['range'] for r in self.config['character_ranges'].values())}]"
+        )
+        
         # Allowed context patterns
         self.allowed_patterns = [
             re.compile(ctx['pattern'])
@@ -74,16 +114,34 @@ class CJKValidator:
                         self.leak_patterns.append({
                             'regex': re.compile(pattern_def['pattern']),
                             'type': pattern_def['description'],
-                            'severity': Severity(pattern_def['severity'])
+                            'severity': Severity(pattern_def['severity']),
+                            'gated': self._needs_gate_char(pattern_def['pattern']),
                         })
     
-    def _is_in_allowed_context(self, text: str, match_start: int, match_end: int) -> bool:
+    def _needs_gate_char(self, pattern: str) -> bool:
+        """True if every match of `pattern` contains a character of gate_pattern."""
+        try:
+            parsed = sre_parse.parse(pattern)
+        except re.error:
+            return False
+        if parsed.state.flags & re.IGNORECASE:
+            return False
+        return _requires_char(parsed, lambda cp: self.gate_pattern.match(chr(cp)) is not None)
+    
+    def _allowed_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Spans of every allowed-context match in `text`."""
+        return [
+            allowed_match.span()
+            for allowed_pattern in self.allowed_patterns
+            for allowed_match in allowed_pattern.finditer(text)
+        ]
+    
+    def _is_in_allowed_context(self, text: str, match_start: int, match_end: int,
+                               spans: Optional[List[Tuple[int, int]]] = None) -> bool:
         """Check if CJK character is in an allowed context."""
-        for allowed_pattern in self.allowed_patterns:
-            for allowed_match in allowed_pattern.finditer(text):
-                if allowed_match.start() <= match_start and match_end <= allowed_match.end():
-                    return True
-        return False
+        if spans is None:
+            spans = self._allowed_spans(text)
+        return any(start <= match_start and match_end <= end for start, end in spans)
     
     def validate_text(self, text: str, file_path: Path = None) -> List[ValidationIssue]:
         """Validate a text string for CJK leaks."""
@@ -95,10 +153,14 @@ class CJKValidator:
             if not line.strip() or line.strip().startswith('#'):
                 continue
             
+            # Clean ASCII / Vietnamese lines can only hit ungated leak patterns
+            has_cjk = self.gate_pattern.search(line) is not None
+            allowed_spans = self._allowed_spans(line) if has_cjk else None
+            
             # Check for CJK characters
-            for match in self.cjk_pattern.finditer(line):
+            for match in (self.cjk_pattern.finditer(line) if has_cjk else ()):
                 # Check if in allowed context
-                if self._is_in_allowed_context(line, match.start(), match.end()):
+                if self._is_in_allowed_context(line, match.start(), match.end(), allowed_spans):
                     continue
                 
                 # Get character info
@@ -121,8 +183,10 @@ class CJKValidator:
             
             # Check for specific leak patterns
             for pattern_def in self.leak_patterns:
+                if pattern_def['gated'] and not has_cjk:
+                    continue
                 for match in pattern_def['regex'].finditer(line):
-                    if not self._is_in_allowed_context(line, match.start(), match.end()):
+                    if not self._is_in_allowed_context(line, match.start(), match.end(), allowed_spans):
                         issue = ValidationIssue(
                             file_path=file_path or Path("unknown"),
                             line_number=line_num,
@@ -33,6 +33,8 @@ Usage:
   mtl.py multimodal [volume_id]          # Run Phase 1.6 + Phase 2 with multimodal (visual translation)
   mtl.py phase4 [volume_id]              # Run Phase 4 (interactive if no ID)
   mtl.py status <volume_id>              # Check pipeline status
+  mtl.py stats <volume_id>               # Throughput / token / cost report (last run)
+  mtl.py stats <volume_id> --run all     # Aggregate every recorded run (--json for raw numbers)
   mtl.py list                            # List all volumes
   mtl.py metadata <volume_id>            # Inspect metadata and schema
   mtl.py bible list                      # List all linked series bibles
@@ -116,6 +118,8 @@ import subprocess
 import re
 import os
 import hashlib
+import queue
+import threading
 import time
 
 # Import CJK validator for quality control
@@ -124,6 +128,16 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 from scripts.cjk_validator import CJKValidator
 from pipeline.cli.ui import ModernCLIUI
+from pipeline.common.event_stream import (
+    EVENTS_FILE,
+    EVENTS_FILE_ENV,
+    EVENTS_PHASE_ENV,
+    EVENTS_RUN_ENV,
+    EventStream,
+    EventTail,
+    events_enabled,
+    new_run_id,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -152,6 +166,8 @@ class PipelineController:
         self.work_dir.mkdir(parents=True, exist_ok=True)
         self.verbose = verbose
         self.ui = ModernCLIUI(mode=ui_mode, no_color=no_color)
+        # One run id per CLI invocation groups every phase's events in events.jsonl
+        self.events_run_id = new_run_id()
 
     def _ui_header(self, title: str, subtitle: str = "") -> None:
         """Print a consistent v5.2 CLI header."""
@@ -665,7 +681,39 @@ class PipelineController:
         logger.info(f"│  Failed:            {failed:<5}                                    │")
         logger.info("└─────────────────────────────────────────────────────────────┘")
 
-    def _run_command(self, cmd: list, description: str) -> bool:
+    def _phase_event_stream(self, volume_id: Optional[str], phase: Optional[str]) -> Optional[EventStream]:
+        """CLI-side event stream for a phase subprocess (WORK/<volume>/events.jsonl)."""
+        if not volume_id or not phase or not events_enabled():
+            return None
+        return EventStream(self.work_dir / volume_id / EVENTS_FILE, phase=phase, run_id=self.events_run_id)
+
+    def _run_command(
+        self,
+        cmd: list,
+        description: str,
+        volume_id: Optional[str] = None,
+        phase: Optional[str] = None,
+    ) -> bool:
+        """Run a phase command, bracketed by phase_start/phase_end events when a volume is known."""
+        events = self._phase_event_stream(volume_id, phase)
+        if events is not None:
+            events.emit("phase_start", description=description)
+        started = time.monotonic()
+        success = False
+        try:
+            success = self._run_subprocess(cmd, description, self._get_env(events))
+        finally:
+            if events is not None:
+                events.emit(
+                    "phase_end",
+                    description=description,
+                    status="completed" if success else "failed",
+                    wall_seconds=round(time.monotonic() - started, 3),
+                )
+                events.close()
+        return success
+
+    def _run_subprocess(self, cmd: list, description: str, env: Dict[str, str]) -> bool:
         """Run a command with verbosity control."""
         if self.verbose:
             try:
@@ -673,7 +721,7 @@ class PipelineController:
                     cmd,
                     check=True,
                     capture_output=False,
-                    env=self._get_env()
+                    env=env
                 )
                 return True
             except subprocess.CalledProcessError as e:
@@ -688,7 +736,7 @@ class PipelineController:
                         cmd,
                         check=True,
                         capture_output=True,
-                        env=self._get_env()
+                        env=env
                     )
                 elapsed = time.monotonic() - started
                 self.ui.print_success(f"{description} completed ({elapsed:.1f}s)")
@@ -708,7 +756,7 @@ class PipelineController:
                 cmd,
                 check=True,
                 capture_output=True,
-                env=self._get_env()
+                env=env
             )
             print(f"\r✅ {description} Completed    ")
             return True
@@ -720,20 +768,25 @@ class PipelineController:
                 print("\n--- STDERR ---\n" + e.stderr.decode())
             return False
 
-    def _run_phase2_command_with_progress(self, cmd: list, expected_total: int = 1) -> bool:
-        """Run translator command with live chapter progress in rich mode."""
-        if self.verbose or not self.ui.rich_enabled:
-            return self._run_command(cmd, "Phase 2 (Translator)")
-
-        target_re = re.compile(r"Targeting\s+(\d+)\s+chapters")
-        start_re = re.compile(r"Translating\s+\[(\d+)/(\d+)\]\s+(\S+)\s+to")
-        complete_re = re.compile(r"Completed\s+([^.\s]+)\.")
-        failed_re = re.compile(r"Failed\s+([^:\s]+):")
-        skip_re = re.compile(r"Skipping completed chapter\s+(\S+)")
+    def _run_phase2_command_with_progress(
+        self,
+        cmd: list,
+        expected_total: int = 1,
+        volume_id: Optional[str] = None,
+    ) -> bool:
+        """Run translator command with live chapter progress (from the event stream) in rich mode."""
+        events = None
+        if not self.verbose and self.ui.rich_enabled:
+            events = self._phase_event_stream(volume_id, "phase2")
+        if events is None:
+            return self._run_command(cmd, "Phase 2 (Translator)", volume_id=volume_id, phase="phase2")
 
         seen_terminal = set()
         line_tail: deque[str] = deque(maxlen=60)
+        lines: "queue.Queue[str]" = queue.Queue()
+        tail = EventTail(events.path)
         started = time.monotonic()
+        events.emit("phase_start", description="Phase 2 (Translator)")
 
         process = subprocess.Popen(
             cmd,
@@ -741,56 +794,49 @@ class PipelineController:
             stderr=subprocess.STDOUT,
             text=True,
             bufsize=1,
-            env=self._get_env(),
+            env=self._get_env(events),
         )
 
-        with self.ui.chapter_progress("Phase 2 Chapters", total=max(expected_total, 1)) as tracker:
+        def pump_output() -> None:
             for raw_line in iter(process.stdout.readline, ''):
                 line = raw_line.rstrip("\n")
-                if not line:
-                    continue
-                line_tail.append(line)
-
-                target_match = target_re.search(line)
-                if target_match:
-                    tracker.set_total(int(target_match.group(1)))
-
-                start_match = start_re.search(line)
-                if start_match:
-                    index = int(start_match.group(1))
-                    total = int(start_match.group(2))
-                    chapter_id = start_match.group(3)
-                    tracker.set_total(total)
-                    tracker.start(chapter_id, index=index, total=total)
-
-                complete_match = complete_re.search(line)
-                if complete_match:
-                    chapter_id = complete_match.group(1)
-                    if chapter_id not in seen_terminal:
-                        tracker.complete(chapter_id)
-                        seen_terminal.add(chapter_id)
-
-                failed_match = failed_re.search(line)
-                if failed_match:
-                    chapter_id = failed_match.group(1)
-                    if chapter_id not in seen_terminal:
-                        tracker.fail(chapter_id)
-                        seen_terminal.add(chapter_id)
-
-                skip_match = skip_re.search(line)
-                if skip_match:
-                    chapter_id = skip_match.group(1)
-                    if chapter_id not in seen_terminal:
-                        tracker.skip(chapter_id)
-                        seen_terminal.add(chapter_id)
-
-                if "[ERROR]" in line or "Volume translation" in line:
-                    logger.info(line)
-
+                if line:
+                    lines.put(line)
             process.stdout.close()
+
+        reader = threading.Thread(target=pump_output, name="phase2-output", daemon=True)
+        reader.start()
+
+        with self.ui.chapter_progress("Phase 2 Chapters", total=max(expected_total, 1)) as tracker:
+            while True:
+                finished = not reader.is_alive()
+                while True:
+                    try:
+                        line = lines.get_nowait()
+                    except queue.Empty:
+                        break
+                    line_tail.append(line)
+                    if "[ERROR]" in line or "Volume translation" in line:
+                        logger.info(line)
+
+                for event in tail.poll():
+                    if event.get("run") == events.run_id and event.get("phase") == "phase2":
+                        self._apply_progress_event(tracker, event, seen_terminal)
+
+                if finished:
+                    break
+                reader.join(timeout=0.25)
+
             return_code = process.wait()
 
         elapsed = time.monotonic() - started
+        events.emit(
+            "phase_end",
+            description="Phase 2 (Translator)",
+            status="completed" if return_code == 0 else "failed",
+            wall_seconds=round(elapsed, 3),
+        )
+        events.close()
         if return_code == 0:
             self.ui.print_success(f"Phase 2 (Translator) completed ({elapsed:.1f}s)")
             return True
@@ -802,8 +848,43 @@ class PipelineController:
                 logger.error(tail_line)
         return False
 
-    def _get_env(self) -> Dict[str, str]:
-        """Get environment with updated PYTHONPATH."""
+    @staticmethod
+    def _apply_progress_event(tracker, event: Dict[str, Any], seen_terminal: set) -> None:
+        """Map one translator event onto the chapter progress tracker."""
+        name = event.get("event")
+        chapter_id = event.get("chapter")
+
+        if name == "run_start" and event.get("chapters"):
+            tracker.set_total(int(event["chapters"]))
+            return
+        if not chapter_id:
+            return
+
+        if name == "chapter_start":
+            total = event.get("total")
+            if total:
+                tracker.set_total(int(total))
+            tracker.start(chapter_id, index=event.get("index"), total=total)
+        elif name == "chapter_end" and chapter_id not in seen_terminal:
+            if event.get("status") == "completed":
+                tracker.complete(chapter_id)
+            else:
+                tracker.fail(chapter_id)
+            seen_terminal.add(chapter_id)
+        elif name == "chapter_skip" and chapter_id not in seen_terminal:
+            tracker.skip(chapter_id)
+            seen_terminal.add(chapter_id)
+        elif name == "chapter_progress" and chapter_id not in seen_terminal:
+            stage = event.get("stage")
+            if stage == "first_output":
+                tracker.stream(chapter_id, f"first output after {event.get('seconds', 0):.1f}s")
+            elif stage == "checkpoint":
+                tracker.stream(chapter_id, f"{event.get('paragraphs', 0)} paragraphs checkpointed")
+            elif stage == "resumed":
+                tracker.stream(chapter_id, "resuming")
+
+    def _get_env(self, events: Optional[EventStream] = None) -> Dict[str, str]:
+        """Get environment with updated PYTHONPATH (and the phase's event stream, if any)."""
         env = os.environ.copy()
         # Add project root to PYTHONPATH to ensure 'pipeline' module is found
         pythonpath = env.get("PYTHONPATH", "")
@@ -820,6 +901,10 @@ class PipelineController:
         if self.verbose:
             logger.info(f"[DEBUG] PROJECT_ROOT: {PROJECT_ROOT}")
             logger.info(f"[DEBUG] Updated PYTHONPATH: {env['PYTHONPATH']}")
+        if events is not None:
+            env[EVENTS_FILE_ENV] = str(events.path)
+            env[EVENTS_PHASE_ENV] = events.phase
+            env[EVENTS_RUN_ENV] = events.run_id
         return env
     
     
@@ -1264,7 +1349,7 @@ class PipelineController:
         
         logger.info(f"Target Language: {target_lang.upper()}")
         
-        if self._run_command(cmd, "Phase 1 (Librarian)"):
+        if self._run_command(cmd, "Phase 1 (Librarian)", volume_id=volume_id, phase="phase1"):
             logger.info("✓ Phase 1 completed successfully")
             self._log_phase1_confirmation(volume_id)
             return True
@@ -1359,7 +1444,7 @@ class PipelineController:
             if parent_candidate and not ignore_sequel:
                 cmd.append("--sequel-mode")
         
-        if self._run_command(cmd, "Phase 1.5 (Metadata)"):
+        if self._run_command(cmd, "Phase 1.5 (Metadata)", volume_id=volume_id, phase="phase1.5"):
             logger.info("✓ Phase 1.5 completed successfully")
             self._log_phase1_5_confirmation(volume_id)
             return True
@@ -1383,7 +1468,7 @@ class PipelineController:
             "--volume", volume_id
         ]
 
-        if self._run_command(cmd, "Phase 1.55 (Rich Metadata Cache)"):
+        if self._run_command(cmd, "Phase 1.55 (Rich Metadata Cache)", volume_id=volume_id, phase="phase1.55"):
             logger.info("✓ Phase 1.55 completed successfully")
             self._log_phase1_55_confirmation(volume_id)
             return True
@@ -1413,7 +1498,7 @@ class PipelineController:
             "--cache-only",
         ]
 
-        if self._run_command(cmd, "Phase 1.55 (Cache-Only)"):
+        if self._run_command(cmd, "Phase 1.55 (Cache-Only)", volume_id=volume_id, phase="phase1.55"):
             logger.info("✓ Phase 1.55 cache-only prep completed successfully")
             self._log_phase1_55_confirmation(volume_id)
             return True
@@ -1616,6 +1701,7 @@ class PipelineController:
             logger.info(f"  Total illustrations: {stats.get('total', 0)}")
             logger.info(f"  Already cached:      {stats.get('cached', 0)}")
             logger.info(f"  Newly analyzed:      {stats.get('generated', 0)}")
+            logger.info(f"  Reused (same art):   {stats.get('deduplicated', 0)}")
             logger.info(f"  Safety blocked:      {stats.get('blocked', 0)}")
 
             self._log_phase1_6_confirmation(volume_id)
@@ -1668,7 +1754,7 @@ class PipelineController:
         if force:
             cmd.append("--force")
 
-        if self._run_command(cmd, "Phase 1.7 (Scene Planner)"):
+        if self._run_command(cmd, "Phase 1.7 (Scene Planner)", volume_id=volume_id, phase="phase1.7"):
             latest_manifest = self.load_manifest(volume_id) or {}
             planner_state = latest_manifest.get("pipeline_state", {}).get("scene_planner", {})
             if planner_state.get("status") == "partial":
@@ -1707,7 +1793,7 @@ class PipelineController:
             "--cache-only",
         ]
 
-        if self._run_command(cmd, "Phase 1.7 Co-Processor (Cache-Only)"):
+        if self._run_command(cmd, "Phase 1.7 Co-Processor (Cache-Only)", volume_id=volume_id, phase="phase1.7"):
             logger.info("✓ Phase 1.7 Co-Processor completed successfully")
             self._log_phase1_55_confirmation(volume_id)
             return True
@@ -1926,7 +2012,7 @@ class PipelineController:
         if enable_multimodal:
             cmd.append("--enable-multimodal")
 
-        if self._run_phase2_command_with_progress(cmd, expected_total=expected_total):
+        if self._run_phase2_command_with_progress(cmd, expected_total=expected_total, volume_id=volume_id):
             logger.info("✓ Phase 2 completed successfully")
             
             # Run CJK validation automatically after translation
@@ -2024,7 +2110,7 @@ class PipelineController:
         if output_name:
             cmd.extend(["--output", output_name])
         
-        if self._run_command(cmd, "Phase 4 (Builder)"):
+        if self._run_command(cmd, "Phase 4 (Builder)", volume_id=volume_id, phase="phase4"):
             logger.info("✓ Phase 4 completed successfully")
             return True
         return False
@@ -2488,6 +2574,27 @@ class PipelineController:
                 logger.info(f"Next: mtl.py phase3 {volume_id}")
             else:
                 logger.info(f"Next: mtl.py phase4 {volume_id}")
+
+    def show_stats(self, volume_id: str, run: str = "last", as_json: bool = False) -> bool:
+        """Throughput and cost report from the volume's events.jsonl."""
+        from pipeline.common.event_stats import aggregate, format_report, load_pricing, select_runs
+        from pipeline.common.event_stream import read_events
+
+        events_path = self.work_dir / volume_id / EVENTS_FILE
+        events = select_runs(read_events(events_path), run=run)
+        if not events:
+            logger.error(f"No events recorded for {volume_id} ({events_path})")
+            return False
+
+        stats = aggregate(events, load_pricing())
+        if as_json:
+            print(json.dumps(stats, indent=2, ensure_ascii=False))
+            return True
+
+        self._ui_header("Pipeline Stats", f"Volume: {volume_id}")
+        for line in format_report(stats).splitlines():
+            logger.info(line)
+        return True
     
     def run_cleanup(self, volume_id: str, dry_run: bool = False) -> bool:
         """